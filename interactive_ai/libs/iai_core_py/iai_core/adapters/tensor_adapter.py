@@ -1,5 +1,7 @@
 """This module contains the implementation of the TensorAdapter"""
 
+import io
+
 import numpy as np
 
 # Copyright (C) 2022-2025 Intel Corporation
@@ -45,3 +47,46 @@ class TensorAdapter(TensorAdapterInterface):
         Return the consumed storage (in bytes) of the entity
         """
         return self.repo_adapter.get_object_size(filename=self.binary_filename)
+
+
+class PackedTensorAdapter(TensorAdapter):
+    """
+    TensorAdapter for a tensor stored in a packed tensor container, i.e. a binary file holding the uncompressed
+    ('.npy' format) arrays of many tensors back to back.
+
+    Only the byte range of the tensor is read from the container.
+
+    :param data_source: Binary repo storing the container
+    :param binary_filename: Filename of the container
+    :param shape: Shape of the tensor
+    :param offset: Position of the tensor data within the container, in bytes
+    :param length: Size of the tensor data, in bytes
+    """
+
+    def __init__(
+        self, data_source: TensorBinaryRepo, binary_filename: str, shape: tuple[int, ...], offset: int, length: int
+    ) -> None:
+        super().__init__(data_source=data_source, binary_filename=binary_filename, shape=shape)
+        self.offset = offset
+        self.length = length
+
+    def __eq__(self, other: object):
+        if not isinstance(other, PackedTensorAdapter):
+            return False
+        return super().__eq__(other) and self.offset == other.offset and self.length == other.length
+
+    @property
+    def numpy(self) -> np.ndarray:
+        if self.repo_adapter is None or self.binary_filename is None:
+            raise ValueError("This tensor adapter has no container filename, nor a data source to fetch the data")
+        data = self.repo_adapter.get_range_by_filename(
+            filename=self.binary_filename, offset=self.offset, length=self.length
+        )
+        return np.load(io.BytesIO(data), allow_pickle=False)
+
+    @property
+    def size_on_storage(self) -> int:
+        """
+        Return the consumed storage (in bytes) of the entity
+        """
+        return self.length
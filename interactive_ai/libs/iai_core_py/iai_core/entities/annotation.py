@@ -6,12 +6,13 @@
 import datetime
 import itertools
 from enum import Enum
+from operator import attrgetter
 
 from bson import ObjectId
 
 from iai_core.entities.label import Label
 from iai_core.entities.scored_label import ScoredLabel
-from iai_core.entities.shapes import Rectangle, Shape
+from iai_core.entities.shapes import Rectangle, Shape, ShapeCenterIndex
 from iai_core.utils.constants import DEFAULT_USER_NAME
 from iai_core.utils.time_utils import now
 
@@ -176,12 +177,28 @@ class AnnotationScene(PersistentEntity):
         if invalid_task_ids is None:
             invalid_task_ids = []
         self.invalid_for_task_ids: list[ID] = invalid_task_ids
+        self._shape_center_index: ShapeCenterIndex | None = None
 
     @property
     def shapes(self) -> list[Shape]:
         """Returns all shapes that are inside the annotations of the AnnotationScene."""
         return [annotation.shape for annotation in self.annotations]
 
+    def get_shape_center_index(self) -> ShapeCenterIndex:
+        """Returns the spatial index on the centers of the annotation shapes.
+
+        The index is built on first use and reused until the annotations or their shapes are replaced, so that
+        looking up the annotations in many regions of interest of the same scene does not test every shape each time.
+
+        :return: ShapeCenterIndex whose positions are the ones of the annotations in the scene
+        """
+        shapes = list(map(attrgetter("shape"), self.annotations))
+        index = self._shape_center_index
+        if index is None or not index.is_valid_for(shapes):
+            index = ShapeCenterIndex(shapes)
+            self._shape_center_index = index
+        return index
+
     def contains_any(self, labels: list[Label]) -> bool:
         """Checks whether the annotation contains any labels in the input parameter.
 
@@ -320,6 +337,12 @@ class AnnotationScene(PersistentEntity):
     def __hash__(self):
         return hash(str(self))
 
+    def __getstate__(self) -> dict:
+        # The spatial index is a cache that can be rebuilt, no need to copy or serialize it
+        state = self.__dict__.copy()
+        state["_shape_center_index"] = None
+        return state
+
 
 class NullAnnotationScene(AnnotationScene):
     """Represents 'AnnotationScene not found'"""
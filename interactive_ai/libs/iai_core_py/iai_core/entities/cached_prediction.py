@@ -0,0 +1,105 @@
+"""This module implements the CachedPrediction entity"""
+
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from collections.abc import Sequence
+
+from iai_core.entities.annotation import Annotation
+from iai_core.entities.metadata import IMetadata
+from iai_core.entities.shapes import Rectangle
+from iai_core.utils.shape_factory import ShapeFactory
+
+from geti_types import ID, MediaIdentifierEntity, NullMediaIdentifier, PersistentEntity
+
+FULL_BOX_ROI_KEY = "full_box"
+
+
+class CachedPrediction(PersistentEntity):
+    """
+    Prediction of a model for a media (or a region of it), stored to be reused by later inferences
+    of the same model on the same input.
+
+    :param id_: ID of the cached prediction
+    :param model_id: ID of the model that generated the prediction
+    :param label_schema_id: ID of the label schema of the model at inference time
+    :param media_identifier: identifier of the media the inference ran on
+    :param roi_key: key of the region of interest the inference ran on, see :meth:`roi_key_for`
+    :param media_height: height of the media in pixels
+    :param media_width: width of the media in pixels
+    :param annotations: predicted annotations, relative to the region of interest
+    :param metadata: metadata generated by the inference (e.g. feature vector, active score)
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        id_: ID,
+        model_id: ID,
+        label_schema_id: ID,
+        media_identifier: MediaIdentifierEntity,
+        roi_key: str,
+        media_height: int,
+        media_width: int,
+        annotations: Sequence[Annotation],
+        metadata: Sequence[IMetadata],
+        ephemeral: bool = True,
+    ) -> None:
+        super().__init__(id_=id_, ephemeral=ephemeral)
+        self.model_id = model_id
+        self.label_schema_id = label_schema_id
+        self.media_identifier = media_identifier
+        self.roi_key = roi_key
+        self.media_height = media_height
+        self.media_width = media_width
+        self.annotations = list(annotations)
+        self.metadata = list(metadata)
+
+    @property
+    def key(self) -> tuple[MediaIdentifierEntity, str]:
+        """Key identifying the input of the prediction for a given model and label schema"""
+        return self.media_identifier, self.roi_key
+
+    @staticmethod
+    def roi_key_for(roi: Annotation | None) -> str:
+        """
+        Compute the key of a region of interest from its geometry.
+
+        The key does not depend on the ID of the ROI annotation, which changes for instance every time
+        a full-box ROI is regenerated. Inference crops the bounding box of the ROI, so two ROIs with the
+        same bounding box share the same key.
+
+        :param roi: region of interest, or None for the full media
+        :return: key of the ROI
+        """
+        if roi is None or Rectangle.is_full_box(roi.shape):
+            return FULL_BOX_ROI_KEY
+        box = ShapeFactory.shape_as_rectangle(roi.shape)
+        return f"{box.x1:.6f},{box.y1:.6f},{box.x2:.6f},{box.y2:.6f}"
+
+    def __repr__(self) -> str:
+        return (
+            f"CachedPrediction({self.id_}, model_id='{self.model_id}', label_schema_id='{self.label_schema_id}', "
+            f"media_identifier='{self.media_identifier}', roi_key='{self.roi_key}', "
+            f"num_annotations={len(self.annotations)}, num_metadata={len(self.metadata)})"
+        )
+
+
+class NullCachedPrediction(CachedPrediction):
+    """Representation of a 'CachedPrediction not found'"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            id_=ID(),
+            model_id=ID(),
+            label_schema_id=ID(),
+            media_identifier=NullMediaIdentifier(),
+            roi_key="",
+            media_height=0,
+            media_width=0,
+            annotations=[],
+            metadata=[],
+            ephemeral=False,
+        )
+
+    def __repr__(self) -> str:
+        return "NullCachedPrediction()"
@@ -239,14 +239,23 @@ class DatasetItem(PersistentEntity):
         """
         result = []
         relevant_label_ids = {label.id_ for label in labels if label.id_ not in self.ignored_label_ids}
-        for annotation in self.annotation_scene.annotations:
-            if self.roi.shape.contains_center(annotation.shape) and relevant_label_ids.intersection(
-                annotation.get_label_ids(include_empty=False)
-            ):
+        for annotation in self._get_annotations_with_center_in_roi():
+            if relevant_label_ids.intersection(annotation.get_label_ids(include_empty=False)):
                 result.append(annotation)
 
         return result
 
+    def _get_annotations_with_center_in_roi(self) -> list[Annotation]:
+        """
+        Returns the annotations of the scene whose shape center is located in the ROI, in their original order.
+
+        The lookup uses the spatial index of the annotation scene, which is shared by all the dataset items
+        (i.e. ROIs) of the scene.
+        """
+        annotations = self.annotation_scene.annotations
+        index = self.annotation_scene.get_shape_center_index()
+        return [annotations[i] for i in index.get_indices_of_centers_in(self.roi.shape)]
+
     @property
     def width(self) -> int:
         """The width of the dataset item, taking into account the ROI."""
@@ -298,15 +307,14 @@ class DatasetItem(PersistentEntity):
             # Fast path for the case where we do not need to change the shapes
             annotations = self.annotation_scene.annotations
         else:
-            # Todo: improve speed. This is O(n) for n shapes. CVS-156947
             roi_as_box = ShapeFactory.shape_as_rectangle(self.roi.shape)
 
             label_ids_set = set(label_ids) if label_ids is not None else set()
 
-            for annotation in self.annotation_scene.annotations:
-                if not is_full_box and not self.roi.shape.contains_center(annotation.shape):
-                    continue
-
+            candidate_annotations = (
+                self.annotation_scene.annotations if is_full_box else self._get_annotations_with_center_in_roi()
+            )
+            for annotation in candidate_annotations:
                 shape_labels = annotation.get_labels(include_empty)
 
                 check_labels = False
@@ -325,9 +333,9 @@ class DatasetItem(PersistentEntity):
                     # Create a denormalized copy of the shape.
                     shape = annotation.shape.denormalize_wrt_roi_shape(roi_as_box)
                 else:
-                    # Also create a copy of the shape, so that we can safely modify the labels
-                    # without tampering with the original shape.
-                    shape = copy.deepcopy(annotation.shape)
+                    # Create a shallow copy of the shape: the shapes are never modified in place, so the copy can
+                    # share the coordinates with the original shape, while replacing them does not affect it.
+                    shape = copy.copy(annotation.shape)
 
                 annotations.append(
                     Annotation(
@@ -7,7 +7,7 @@ import copy
 import logging
 from collections.abc import Sequence
 from enum import Enum
-from typing import Any, cast
+from typing import Any
 
 from bson import ObjectId
 
@@ -76,6 +76,8 @@ class LabelGroup:
         self.labels = sorted(labels, key=natural_sort_label_id)
         self.name = name
         self.group_type = group_type
+        # Number of labels removed from the group, used by the label schema to detect that its label map is stale
+        self.removed_labels_count = 0
 
     @property
     def minimum_label_id(self) -> ID:
@@ -90,6 +92,7 @@ class LabelGroup:
         """
         if label in self.labels:
             self.labels.remove(label)
+            self.removed_labels_count += 1
 
     def is_single_label(self) -> bool:
         """Returns True if the label group only contains one label.
@@ -120,6 +123,13 @@ class LabelTree(MultiDiGraph):
         super().__init__()
 
         self.__topological_order_cache: list[Label] | None = None
+        self.__ancestors_cache: dict[Label, list[Label]] = {}
+        self.__descendants_cache: dict[Label, list[Label]] = {}
+
+    def set_graph(self, graph: Any) -> None:
+        """Set the underlying NetworkX graph."""
+        super().set_graph(graph)
+        self.clear_topological_cache()
 
     def add_edge(self, node1: Label, node2: Label, edge_value: Any = None) -> None:
         """Add edge between two nodes in the tree.
@@ -146,13 +156,19 @@ class LabelTree(MultiDiGraph):
         super().remove_node(node)
         self.clear_topological_cache()
 
+    def remove_edges(self, node1: Label, node2: Label) -> None:
+        """Remove the edges between two nodes of the tree."""
+        super().remove_edges(node1, node2)
+        self.clear_topological_cache()
+
     @property
     def num_labels(self) -> int:
         """Return the number of labels in the tree."""
         return self.num_nodes()
 
     def clear_topological_cache(self) -> None:
-        """Clear the internal cache of the list of labels sorted in topological order.
+        """Clear the internal caches of the list of labels sorted in topological order
+        and of the ancestors and descendants of the labels.
 
         This function should be called if the topology of the graph has changed to
             prevent the cache from being stale.
@@ -160,6 +176,8 @@ class LabelTree(MultiDiGraph):
             methods provided by this class.
         """
         self.__topological_order_cache = None
+        self.__ancestors_cache = {}
+        self.__descendants_cache = {}
 
     def get_labels_in_topological_order(self) -> list[Label]:
         """Return a list of the labels in this graph sorted in topological order.
@@ -195,8 +213,15 @@ class LabelTree(MultiDiGraph):
         return list(self._graph.predecessors(parent))  # pylint: disable=no-member
 
     def get_descendants(self, parent: Label) -> list[Label]:
-        """Returns descendants (children and children of children, etc.) of `parent`."""
-        return self.descendants(parent)
+        """Returns descendants (children and children of children, etc.) of `parent`.
+
+        To avoid performance issues, the descendants of each label are cached.
+        """
+        descendants = self.__descendants_cache.get(parent)
+        if descendants is None:
+            descendants = self.descendants(parent)
+            self.__descendants_cache[parent] = descendants
+        return list(descendants)
 
     def get_siblings(self, label: Label) -> list[Label]:
         """Returns the siblings of a label."""
@@ -208,13 +233,21 @@ class LabelTree(MultiDiGraph):
         return siblings
 
     def get_ancestors(self, label: Label) -> list[Label]:
-        """Returns ancestors of `label`, including self."""
-        result = []
-        parent: Label | None = label
-        while parent is not None:
-            result.append(parent)
-            parent = self.get_parent(parent)
-        return result
+        """Returns ancestors of `label`, including self.
+
+        To avoid performance issues, the ancestors of each label are cached; the ancestors
+        of a label are built on top of the cached ones of its closest cached ancestor.
+        """
+        uncached_path: list[Label] = []
+        node: Label | None = label
+        while node is not None and node not in self.__ancestors_cache:
+            uncached_path.append(node)
+            node = self.get_parent(node)
+        ancestors = self.__ancestors_cache[node] if node is not None else []
+        for node in reversed(uncached_path):
+            ancestors = [node, *ancestors]
+            self.__ancestors_cache[node] = ancestors
+        return list(ancestors)
 
     def subgraph(self, labels: Sequence[Label]) -> "LabelTree":
         """Return the subgraph containing the given labels."""
@@ -272,6 +305,10 @@ class LabelSchema(PersistentEntity):
         )
         self._project_id = project_id if project_id is not None else ID()
         self.__deleted_label_ids = deleted_label_ids or []
+        # Map of the labels by ID; the key is used to detect that it is stale. The labels are not indexed by name,
+        # because they can be renamed in place.
+        self.__label_index_key: tuple[int, ...] | None = None
+        self.__labels_by_id: dict[ID, Label] = {}
 
     @property
     def project_id(self) -> ID:
@@ -313,6 +350,7 @@ class LabelSchema(PersistentEntity):
         if len(self.get_all_labels()) - 1 <= len(label_ids):
             raise LabelDeletionException("Cannot delete all labels. At least two labels must remain.")
         self.__deleted_label_ids = label_ids
+        self.clear_label_index()
 
     def get_labels(self, include_empty: bool) -> list[Label]:
         """
@@ -426,6 +464,7 @@ class LabelSchema(PersistentEntity):
         for group in self._groups:
             if group.name == group_name:
                 group.labels += labels
+                self.clear_label_index()
                 break
         else:
             raise LabelGroupDoesNotExistException(f"group with name '{group_name}' does not exist, cannot add")
@@ -488,6 +527,28 @@ class LabelSchema(PersistentEntity):
             for label in task_top_level_labels:
                 self.add_child(previous_trainable_task_labels[0], label)
 
+    def clear_label_index(self) -> None:
+        """Clear the internal map of the labels by ID.
+
+        This function should be called if labels are removed from the groups directly,
+            to prevent the map from being stale.
+        Note that it is automatically called when modifying the labels through the
+            methods provided by this class, and that the map is also rebuilt after
+            `LabelGroup.remove_label` and when a label is not found in it.
+        """
+        self.__label_index_key = None
+
+    def __refresh_label_index(self, force: bool = False) -> None:
+        """Build the map of the labels by ID, unless it is up to date."""
+        key = tuple(group.removed_labels_count for group in self._groups)
+        if self.__label_index_key == key and not force:
+            return
+        labels_by_id: dict[ID, Label] = {}
+        for label in self.get_all_labels():
+            labels_by_id.setdefault(label.id_, label)
+        self.__labels_by_id = labels_by_id
+        self.__label_index_key = key
+
     def get_label_by_id(self, label_id: ID) -> Label | None:
         """
         Find the Label with the given ID within the schema.
@@ -495,10 +556,12 @@ class LabelSchema(PersistentEntity):
         :param label_id: ID of the label to search
         :return: Label if found, None otherwise
         """
-        label = next(
-            (cast("Label", label) for label in self.get_all_labels() if label.id_ == label_id),
-            None,
-        )
+        self.__refresh_label_index()
+        label = self.__labels_by_id.get(label_id)
+        if label is None:
+            # The label may have been added to a group directly
+            self.__refresh_label_index(force=True)
+            label = self.__labels_by_id.get(label_id)
         if label is None:
             logger.warning(f"Label with ID {label_id} not found in label schema.")
         return label
@@ -511,7 +574,7 @@ class LabelSchema(PersistentEntity):
         :return: Label if found, None otherwise
         """
         return next(
-            (cast("Label", label) for label in self.get_labels(include_empty=True) if label.name == label_name),
+            (label for label in self.get_labels(include_empty=True) if label.name == label_name),
             None,
         )
 
@@ -557,6 +620,7 @@ class LabelSchema(PersistentEntity):
         """
         if label_group not in self._groups:
             self._groups.append(label_group)
+            self.clear_label_index()
 
     def get_children(self, parent: Label) -> list[Label]:
         """Return a list of the children of the passed parent Label."""
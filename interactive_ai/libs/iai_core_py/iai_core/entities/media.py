@@ -4,10 +4,13 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import abc
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE, THUMBNAIL_VARIANT_SIZES
+
 from geti_types import MediaIdentifierEntity
 
 
@@ -85,6 +88,49 @@ class MediaPreprocessing:
         self.message = message
 
 
+THUMBNAIL_VARIANT_EXTENSIONS = (ImageExtensions.JPG, ImageExtensions.WEBP)
+
+
+def thumbnail_variant_filename(thumbnail_filename: str, size: int, extension: ImageExtensions) -> str:
+    """
+    Get the filename of a variant of a media thumbnail.
+
+    The JPEG variant of the default size is the thumbnail itself, so its filename is returned unchanged;
+    the other variants are named after the thumbnail, e.g. '<media_id>_thumbnail_128.webp'.
+
+    :param thumbnail_filename: Filename of the (default) thumbnail of the media
+    :param size: Size of the variant, in pixels
+    :param extension: Image format of the variant
+    :return: Filename of the thumbnail variant
+    """
+    if size == DEFAULT_THUMBNAIL_SIZE and extension == ImageExtensions.JPG:
+        return thumbnail_filename
+    return f"{os.path.splitext(thumbnail_filename)[0]}_{size}{extension.value}"
+
+
+def thumbnail_filename_prefix(thumbnail_filename: str) -> str:
+    """
+    Get the prefix shared by the filenames of a media thumbnail and of all its variants, e.g. '<media_id>_thumbnail'
+
+    :param thumbnail_filename: Filename of the (default) thumbnail of the media
+    :return: Prefix of the filenames of the thumbnail and its variants
+    """
+    return os.path.splitext(thumbnail_filename)[0]
+
+
+def select_thumbnail_variant_size(requested_size: int) -> int:
+    """
+    Select the smallest thumbnail variant that is at least as large as the requested size,
+    or the largest variant if none is large enough.
+
+    :param requested_size: Size at which the thumbnail is displayed, in pixels
+    :return: Size of the thumbnail variant to serve
+    """
+    return min(
+        (size for size in THUMBNAIL_VARIANT_SIZES if size >= requested_size), default=max(THUMBNAIL_VARIANT_SIZES)
+    )
+
+
 class Media(metaclass=abc.ABCMeta):
     """
     Media entities represent images, videos and video_frames.
@@ -8,5 +8,16 @@ from .keypoint import Keypoint
 from .polygon import Point, Polygon
 from .rectangle import Rectangle
 from .shape import GeometryException, Shape, ShapeType
+from .spatial_index import ShapeCenterIndex
 
-__all__ = ["Ellipse", "GeometryException", "Keypoint", "Point", "Polygon", "Rectangle", "Shape", "ShapeType"]
+__all__ = [
+    "Ellipse",
+    "GeometryException",
+    "Keypoint",
+    "Point",
+    "Polygon",
+    "Rectangle",
+    "Shape",
+    "ShapeCenterIndex",
+    "ShapeType",
+]
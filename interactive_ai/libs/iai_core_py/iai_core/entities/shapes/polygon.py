@@ -130,6 +130,13 @@ class Polygon(Shape):
         """Returns hash of the Polygon object."""
         return hash(str(self))
 
+    def __copy__(self) -> "Polygon":
+        """Returns a copy of the polygon with its own list of points; the points themselves are shared."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.points = list(self.points)
+        return clone
+
     def normalize_wrt_roi_shape(self, roi_shape: Rectangle) -> "Polygon":
         """Transforms from the `roi` coordinate system to the normalized coordinate system.
 
@@ -0,0 +1,51 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module implements the spatial index on the centers of a collection of shapes."""
+
+import operator
+from collections.abc import Sequence
+
+import numpy as np
+from shapely import STRtree
+
+from .shape import Shape
+
+
+class ShapeCenterIndex:
+    """Spatial index on the centers of a collection of shapes.
+
+    The centers are computed once, the same way as in Shape.contains_center, and stored in a R-tree, so that
+    finding the shapes whose center lies in a region takes a tree query instead of one geometric test per shape.
+
+    The index refers to the shape objects it is built for. The shapes are never modified in place, so the index
+    remains valid as long as the same shape objects are indexed, which can be checked with `is_valid_for`.
+
+    :param shapes: Shapes to index
+    """
+
+    def __init__(self, shapes: Sequence[Shape]) -> None:
+        self._shapes = tuple(shapes)
+        self._tree = STRtree([shape._as_shapely_polygon().centroid for shape in self._shapes])
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def is_valid_for(self, shapes: Sequence[Shape]) -> bool:
+        """Checks whether the index is built for the given shapes, in the same order.
+
+        :param shapes: Shapes to compare with the indexed ones
+        :return: True if the shapes are the same objects as the indexed ones, False otherwise
+        """
+        return len(shapes) == len(self._shapes) and all(map(operator.is_, shapes, self._shapes))
+
+    def get_indices_of_centers_in(self, region: Shape) -> list[int]:
+        """Returns the positions of the shapes whose center is located in the region.
+
+        The result is the same as checking `region.contains_center(shape)` for each indexed shape.
+
+        :param region: Shape of the region
+        :return: Positions of the matching shapes, in increasing order
+        """
+        indices = self._tree.query(region._as_shapely_polygon(), predicate="contains")
+        return np.sort(indices).tolist()
@@ -22,6 +22,7 @@ from .metadata_repo import MetadataRepo
 from .model_repo import ModelRepo
 from .model_storage_repo import ModelStorageRepo
 from .model_test_result_repo import ModelTestResultRepo
+from .prediction_cache_repo import PredictionCacheRepo
 from .project_repo import ProjectRepo
 from .suspended_annotation_scenes_repo import SuspendedAnnotationScenesRepo
 from .task_node_repo import TaskNodeRepo
@@ -47,6 +48,7 @@ __all__ = [
     "ModelRepo",
     "ModelStorageRepo",
     "ModelTestResultRepo",
+    "PredictionCacheRepo",
     "ProjectRepo",
     "SuspendedAnnotationScenesRepo",
     "TaskNodeRepo",
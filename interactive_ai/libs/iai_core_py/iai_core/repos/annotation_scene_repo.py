@@ -3,7 +3,7 @@
 
 """This module implements the repository for annotation entities"""
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from functools import partial
 from typing import Any, cast
 
@@ -18,6 +18,7 @@ from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.annotation_mapper import AnnotationSceneToMongo
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 from iai_core.repos.mappers.mongodb_mappers.media_mapper import MediaIdentifierToMongo
+from iai_core.utils.iteration import MAX_CHUNK_SIZE, grouper
 
 from geti_types import (
     ID,
@@ -39,6 +40,7 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
     """
 
     collection_name = "annotation_scene"
+    identity_mapped = True
 
     def __init__(
         self,
@@ -463,6 +465,40 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
         cursor = self.aggregate_read(pipeline)
         return self.cursor_wrapper(cursor)
 
+    def get_all_non_empty_by_kind(
+        self,
+        *,
+        kind: AnnotationSceneKind,
+        chunk_size: int = MAX_CHUNK_SIZE,
+    ) -> Iterator[list[AnnotationScene]]:
+        """
+        Get the latest annotations of the given type that contain at least one annotation, in chunks.
+
+        The latest scene of each media is selected in the database by ID only, discarding the empty ones;
+        the full documents are then loaded one chunk at a time, so that the memory needed by the caller
+        is bounded by the chunk size rather than by the number of annotated media.
+
+        :param kind: Type of annotations to consider (user annotation vs prediction)
+        :param chunk_size: Maximum number of annotation scenes per chunk
+        :return: Iterator over lists of at most 'chunk_size' annotation scenes
+        """
+        pipeline: list[dict] = [
+            {"$match": {"kind": kind.name}},
+            {"$sort": {"media_identifier": -1, "creation_date": 1}},
+            {
+                "$group": {
+                    "_id": "$media_identifier",
+                    "scene_id": {"$last": "$_id"},
+                    "num_annotations": {"$last": {"$size": "$annotations"}},
+                }
+            },
+            {"$match": {"num_annotations": {"$gt": 0}}},
+            {"$project": {"_id": 0, "scene_id": 1}},
+        ]
+        scene_ids = (doc["scene_id"] for doc in self.aggregate_read(pipeline))
+        for scene_ids_chunk in grouper(scene_ids, chunk_size=chunk_size):
+            yield list(self.get_all(extra_filter={"_id": {"$in": scene_ids_chunk}}))
+
     def get_all_by_kind_and_labels(
         self, kind: AnnotationSceneKind, label_ids: list[ID], only_latest: bool = True
     ) -> CursorIterator[AnnotationScene]:
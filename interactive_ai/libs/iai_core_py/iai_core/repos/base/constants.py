@@ -11,3 +11,4 @@ MODEL_STORAGE_ID_FIELD_NAME = "model_storage_id"
 PROJECT_ID_FIELD_NAME = "project_id"
 ORGANIZATION_ID_FIELD_NAME = "organization_id"
 WORKSPACE_ID_FIELD_NAME = "workspace_id"
+VERSION_FIELD_NAME = "version"
@@ -0,0 +1,123 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Request-scoped identity map for the session-based repos"""
+
+import logging
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from iai_core.utils.feature_flags import FeatureFlagProvider
+
+from geti_types import PersistentEntity
+
+logger = logging.getLogger(__name__)
+
+FEATURE_FLAG_REQUEST_IDENTITY_MAP = "FEATURE_FLAG_REQUEST_IDENTITY_MAP"
+
+
+class IdentityMap:
+    """
+    Identity map holding the entities loaded or saved during a unit of work (typically a request).
+
+    While an identity map is bound to the context (see identity_map_context), the repos that opt in with
+    'identity_mapped = True' serve get_by_id from the map, so that the same entity is fetched from the database
+    at most once per request, even through freshly constructed repos. Entities are keyed by collection,
+    repo scope (organization, workspace, project, ...) and ID; save() stores the saved instance and delete
+    operations evict the affected entries.
+
+    The map also counts the duplicate reads by ID, i.e. the documents fetched more than once in the same unit
+    of work by any repo, to help find the remaining N+1 access patterns.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple, PersistentEntity] = {}
+        self._read_keys: set[tuple] = set()
+        self.hits: Counter[str] = Counter()
+        self.duplicate_reads: Counter[str] = Counter()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether the request-scoped identity map is enabled"""
+        return FeatureFlagProvider.is_enabled(FEATURE_FLAG_REQUEST_IDENTITY_MAP)
+
+    def get(self, key: tuple) -> PersistentEntity | None:
+        """
+        Get an entity from the map
+
+        :param key: Identity key of the entity (collection name, repo scope, ID)
+        :return: The entity, or None if it is not in the map
+        """
+        entity = self._entities.get(key)
+        if entity is not None:
+            self.hits[key[0]] += 1
+        return entity
+
+    def put(self, key: tuple, entity: PersistentEntity) -> None:
+        """
+        Store a loaded or saved entity in the map
+
+        :param key: Identity key of the entity (collection name, repo scope, ID)
+        :param entity: Entity to store
+        """
+        self._entities[key] = entity
+
+    def record_read(self, key: tuple) -> None:
+        """
+        Record that a document is fetched from the database, counting it as duplicate if it was already fetched
+
+        :param key: Identity key of the document (collection name, repo scope, ID)
+        """
+        if key in self._read_keys:
+            self.duplicate_reads[key[0]] += 1
+        else:
+            self._read_keys.add(key)
+
+    def evict(self, key: tuple) -> None:
+        """
+        Remove an entity from the map
+
+        :param key: Identity key of the entity (collection name, repo scope, ID)
+        """
+        self._entities.pop(key, None)
+
+    def evict_scope(self, collection_name: str, scope: tuple) -> None:
+        """
+        Remove all the entities of a collection within a repo scope from the map
+
+        :param collection_name: Name of the collection
+        :param scope: Scope of the repo, as found in the identity keys
+        """
+        for key in [key for key in self._entities if key[0] == collection_name and key[1] == scope]:
+            del self._entities[key]
+
+
+CTX_IDENTITY_MAP_VAR: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
+
+@contextmanager
+def identity_map_context(name: str = "unit of work") -> Iterator[IdentityMap]:
+    """
+    Context manager binding a new identity map to the current context.
+
+    On exit, the duplicate reads are logged at debug level.
+
+    :param name: Name of the unit of work (e.g. the request path), used in the logs
+    :return: the identity map
+    """
+    identity_map = IdentityMap()
+    token = CTX_IDENTITY_MAP_VAR.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        CTX_IDENTITY_MAP_VAR.reset(token)
+        if identity_map.duplicate_reads:
+            logger.debug(
+                "%d duplicate reads in %s: %s (served from the identity map: %s)",
+                identity_map.duplicate_reads.total(),
+                name,
+                dict(identity_map.duplicate_reads),
+                dict(identity_map.hits),
+            )
@@ -24,7 +24,14 @@ from pymongo.cursor import Cursor
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 
-from .constants import ID_FIELD_NAME, LOCATION_FIELD_NAME, ORGANIZATION_ID_FIELD_NAME, WORKSPACE_ID_FIELD_NAME
+from .constants import (
+    ID_FIELD_NAME,
+    LOCATION_FIELD_NAME,
+    ORGANIZATION_ID_FIELD_NAME,
+    VERSION_FIELD_NAME,
+    WORKSPACE_ID_FIELD_NAME,
+)
+from .identity_map import CTX_IDENTITY_MAP_VAR
 from .mongo_connector import MongoConnector
 from geti_types import CTX_SESSION_VAR, ID, PersistentEntity, Session, make_session
 
@@ -59,6 +66,13 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
     :param missing_session_policy: Policy to determine the repo behavior when no session information is available
     """
 
+    # If True, the documents hold a version stamp which is incremented every time the entity is saved,
+    # so that cached entities can be validated by reading only that field (see VersionedEntityCache)
+    versioned: bool = False
+    # If True, get_by_id is served from the identity map bound to the current request, if any (see IdentityMap).
+    # Only repos whose documents are exclusively modified through save() and delete operations should opt in.
+    identity_mapped: bool = False
+
     def __init__(
         self,
         collection_name: str,
@@ -238,11 +252,12 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
         doc.update(self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE))
         self._collection.update_one(
             {"_id": IDToMongo.forward(instance.id_)},
-            {"$set": doc},
+            self._save_update(doc),
             upsert=True,
             session=mongodb_session,
         )
         instance.mark_as_persisted()
+        self._put_in_identity_map(instance)
 
     def save_many(
         self,
@@ -276,17 +291,46 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
         for doc in docs:
             doc.update(query_filter)
 
-        update_operations = [UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in docs]
+        update_operations = [UpdateOne({"_id": doc["_id"]}, self._save_update(doc), upsert=True) for doc in docs]
         self._collection.bulk_write(update_operations, session=mongodb_session)
 
         for instance in instances:
             instance.mark_as_persisted()
+            self._put_in_identity_map(instance)
+
+    def _save_update(self, doc: dict) -> dict:
+        """
+        Build the update operation that saves a serialized entity, bumping its version stamp if the repo is versioned
+
+        :param doc: Serialized entity
+        :return: Update operation
+        """
+        update: dict = {"$set": doc}
+        if self.versioned:
+            update["$inc"] = {VERSION_FIELD_NAME: 1}
+        return update
+
+    def _identity_scope(self) -> tuple:
+        """Scope of the repo, as used in the keys of the identity map"""
+        scope = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        return tuple(sorted((key, str(value)) for key, value in scope.items()))
+
+    def _identity_key(self, id_: ID) -> tuple:
+        """Key of an entity in the identity map"""
+        return self._collection_name, self._identity_scope(), id_
+
+    def _put_in_identity_map(self, instance: PersistedEntityT) -> None:
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is not None and self.identity_mapped:
+            identity_map.put(self._identity_key(instance.id_), instance)
 
     def get_by_id(self, id_: ID) -> PersistedEntityT:
         """
         Get an entity by ID.
 
         The entity must be visible considering the scope (filters) enforced by the repo.
+        If the repo is identity-mapped and an identity map is bound to the current request,
+        the entity is fetched from the database only the first time it is requested.
 
         :param id_: ID of the entity to fetch
         :return: Found entity, or its null placeholder in case of no match
@@ -294,6 +338,28 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
         if id_ == ID():
             return self.null_object
 
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is None:
+            return self._load_by_id(id_)
+
+        key = self._identity_key(id_)
+        if self.identity_mapped:
+            mapped_entity = identity_map.get(key)
+            if mapped_entity is not None:
+                return cast("PersistedEntityT", mapped_entity)
+        identity_map.record_read(key)
+        entity = self._load_by_id(id_)
+        if self.identity_mapped and not isinstance(entity, type(self.null_object)):
+            identity_map.put(key, entity)
+        return entity
+
+    def _load_by_id(self, id_: ID) -> PersistedEntityT:
+        """
+        Load an entity by ID from the database.
+
+        :param id_: ID of the entity to fetch
+        :return: Found entity, or its null placeholder in case of no match
+        """
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
         query["_id"] = IDToMongo.forward(id_)
         doc: dict | None = self._collection.find_one(query)
@@ -466,6 +532,10 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
         if id_ == ID():
             return False
 
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is not None:
+            identity_map.evict(self._identity_key(id_))
+
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
         query["_id"] = IDToMongo.forward(id_)
         result = self._collection.delete_one(query)
@@ -480,6 +550,10 @@ class SessionBasedRepo(Generic[PersistedEntityT], metaclass=abc.ABCMeta):
             which depends on the repo type.
         :return: True if any DB document was matched and deleted, False otherwise
         """
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is not None:
+            identity_map.evict_scope(collection_name=self._collection_name, scope=self._identity_scope())
+
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
         if extra_filter is not None:
             query.update(extra_filter)
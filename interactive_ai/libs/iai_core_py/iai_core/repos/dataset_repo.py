@@ -117,6 +117,7 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
         dataset_item: DatasetItem,
         already_saved_scenes_ids: set[ID] | None = None,
         mongodb_session: ClientSession | None = None,
+        skip_persisted_scenes: bool = False,
     ) -> None:
         """
         Store the members of the DatasetItem in their respective repositories
@@ -126,6 +127,8 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
             scenes that have been already saved, so will be skipped by this function.
             The set is updated in-place so it can be reused for subsequent calls.
         :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        :param skip_persisted_scenes: If True, the annotation scene is saved only if
+            it is not persisted yet
         """
         # Metadata items are immutable so save them only if not stored to DB yet
         for metadata_item_adapter in dataset_item.metadata_adapters:
@@ -135,6 +138,8 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
                     self.metadata_repo.save(metadata_item, mongodb_session=mongodb_session)
 
         # It is not necessary to save the annotation if it was already saved (e.g. referenced by another dataset item)
+        if skip_persisted_scenes and not dataset_item.annotation_scene.ephemeral:
+            return
         annotation_scene_id = dataset_item.annotation_scene.id_
         if already_saved_scenes_ids is None or annotation_scene_id not in already_saved_scenes_ids:
             self.annotation_scene_repo.save(dataset_item.annotation_scene, mongodb_session=mongodb_session)
@@ -218,6 +223,33 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
 
         super().save_many(instances, mongodb_session=mongodb_session)
 
+    def save_many_copy_on_write(
+        self,
+        instances: Sequence[DatasetItem],
+        mongodb_session: ClientSession | None = None,
+    ) -> None:
+        """
+        Save multiple DatasetItems that share their annotations and metadata with the
+        items of another dataset, for example the copies of the items of a task dataset.
+
+        The annotation scenes and metadata already stored in the DB are referenced by
+        the saved items as they are, without being written again: only the ones that
+        are not persisted yet (e.g. replaced with a modified copy) are saved.
+
+        :param instances: DatasetItem objects to save
+        :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        """
+        already_saved_scenes_ids: set[ID] = set()
+        for instance in instances:
+            self._save_annotations_and_metadata_for_item(
+                instance,
+                already_saved_scenes_ids=already_saved_scenes_ids,
+                mongodb_session=mongodb_session,
+                skip_persisted_scenes=True,
+            )
+
+        super().save_many(instances, mongodb_session=mongodb_session)
+
     def save_many(
         self,
         instances: Sequence[DatasetItem],
@@ -510,6 +542,7 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         instance: Dataset,
         deepsave: bool,
         mongodb_session: ClientSession | None = None,
+        copy_on_write: bool = False,
     ) -> None:
         if not instance.ephemeral and not instance.mutable:
             raise ValueError(f"Cannot save non-mutable dataset with id `{instance.id_}` twice")
@@ -517,7 +550,9 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         dataset_item_repo = self.get_dataset_item_repo(instance.id_)
         dataset_items = tuple(instance)
         if dataset_items:
-            if deepsave:
+            if copy_on_write:
+                dataset_item_repo.save_many_copy_on_write(instances=dataset_items, mongodb_session=mongodb_session)
+            elif deepsave:
                 dataset_item_repo.save_many_deep(instances=dataset_items, mongodb_session=mongodb_session)
             else:
                 dataset_item_repo.save_many_shallow(instances=dataset_items, mongodb_session=mongodb_session)
@@ -561,6 +596,21 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
         """
         self.__save(instance, deepsave=True, mongodb_session=mongodb_session)
 
+    def save_snapshot(self, instance: Dataset, mongodb_session: ClientSession | None = None) -> None:
+        """
+        Save a dataset whose items are copies of the items of another dataset, such as
+        the training dataset created from the current items of a task dataset.
+
+        The items are saved with the state they have in the snapshot (e.g. subset and
+        ignored labels), while the annotation scenes and metadata they reference are
+        shared with the source dataset: only the ones which are not persisted yet are
+        saved, so the cost does not depend on the size of the annotations.
+
+        :param instance: Dataset to save
+        :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        """
+        self.__save(instance, deepsave=False, mongodb_session=mongodb_session, copy_on_write=True)
+
     def save(self, instance: Dataset, mongodb_session: ClientSession | None = None) -> None:
         warnings.warn(
             "DatasetRepo.save() is deprecated; please use more explicit alternatives "
@@ -577,18 +627,38 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
     ) -> None:
         raise NotImplementedError("Saving multiple datasets at once is not supported yet.")
 
-    def add_items_to_dataset(self, dataset_id: ID, dataset_items: Sequence[DatasetItem]) -> None:
+    def save_without_items(self, instance: Dataset, mongodb_session: ClientSession | None = None) -> None:
+        """
+        Save the document of a dataset, but not its items.
+
+        This method is meant to be used together with DatasetRepo.add_items_to_dataset()
+        to persist a large dataset incrementally: the items are saved one chunk at a
+        time as they are created, then the dataset itself is saved without writing
+        the items again.
+
+        :param instance: Dataset to save
+        :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        """
+        if not instance.ephemeral and not instance.mutable:
+            raise ValueError(f"Cannot save non-mutable dataset with id `{instance.id_}` twice")
+        super().save(instance, mongodb_session=mongodb_session)
+
+    def add_items_to_dataset(self, dataset_id: ID, dataset_items: Sequence[DatasetItem], deep: bool = False) -> None:
         """
         Adds a list of dataset items to a dataset
 
         :param dataset_id: ID of the Dataset to add the items to
         :param dataset_items: List of DatasetItems to add to the dataset
+        :param deep: If True, also save the annotations and metadata referenced by the items
         :raises ValueError: if the input sequence of items is empty
         """
         if not dataset_items:
             raise ValueError("No items to add")
         dataset_item_repo = self.get_dataset_item_repo(dataset_id)
-        dataset_item_repo.save_many_shallow(instances=dataset_items)
+        if deep:
+            dataset_item_repo.save_many_deep(instances=dataset_items)
+        else:
+            dataset_item_repo.save_many_shallow(instances=dataset_items)
 
     def get_items_from_dataset(self, dataset_id: ID, dataset_item_ids: Sequence[ID]) -> CursorIterator[DatasetItem]:
         """
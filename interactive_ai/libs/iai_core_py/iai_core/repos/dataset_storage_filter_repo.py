@@ -3,7 +3,7 @@
 
 """This module implements the repos for dataset storage filtering"""
 
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from random import shuffle
 from typing import Any
 
@@ -213,6 +213,22 @@ class DatasetStorageFilterRepo(DatasetStorageBasedSessionRepo[DatasetStorageFilt
         docs = self._collection.find(filter=data_filter, projection=["media_identifier.frame_index"])
         return {doc["media_identifier"]["frame_index"] for doc in docs}
 
+    def get_annotated_media_identifiers_and_states(self) -> Iterator[tuple[MediaIdentifierEntity, AnnotationState]]:
+        """
+        Iterate over the images and video frames whose media annotation state is not NONE.
+
+        :return: Iterator over tuples containing the media identifier and its media annotation state
+        """
+        data_filter: dict[str, Any] = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        data_filter["media_annotation_state"] = {"$nin": [AnnotationState.NONE.name, None]}
+        data_filter["media_identifier.type"] = {"$ne": "video"}
+        docs = self._collection.find(filter=data_filter, projection=["media_identifier", "media_annotation_state"])
+        for doc in docs:
+            yield (
+                MediaIdentifierToMongo.backward(doc["media_identifier"]),
+                AnnotationState[doc["media_annotation_state"]],
+            )
+
     def get_media_identifiers_by_annotation_state(
         self, annotation_state: AnnotationState, sample_size: int = 10000
     ) -> list[MediaIdentifierEntity]:
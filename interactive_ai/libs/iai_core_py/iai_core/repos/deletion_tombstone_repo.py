@@ -0,0 +1,226 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Deletion tombstone repo"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from cachetools import cached
+from cachetools.keys import hashkey
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.collection import Collection
+
+from .base.mongo_connector import MongoConnector
+from geti_types import ID
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DeletionTombstone:
+    """
+    Marker of a project or dataset storage whose deletion has been requested but not completed yet
+
+    id_                 ID of the tombstone
+    organization_id     ID of the organization owning the deleted entity
+    workspace_id        ID of the workspace owning the deleted entity
+    project_id          ID of the deleted project, or of the project containing the deleted dataset storage
+    dataset_storage_id  ID of the deleted dataset storage, None if the whole project is deleted
+    created_at          time of the deletion request
+    stage               name of the deletion stage in progress, None if the deletion has not started yet
+    deleted_documents   number of documents deleted so far
+    deleted_objects     number of binary objects deleted so far
+    """
+
+    id_: ID
+    organization_id: ID
+    workspace_id: ID
+    project_id: ID
+    dataset_storage_id: ID | None
+    created_at: datetime
+    stage: str | None = None
+    deleted_documents: int = 0
+    deleted_objects: int = 0
+
+
+class DeletionTombstoneRepo:
+    """
+    Repo for the deletion tombstones.
+
+    A tombstone is processed by one worker at a time: the worker acquires a lease on it, which has to be renewed
+    periodically while the deletion progresses. If the worker dies, the lease expires and the tombstone can be
+    acquired by another worker, which resumes the deletion from the persisted stage.
+    """
+
+    collection_name = "deletion_tombstone"
+
+    def __init__(self) -> None:
+        # Lazy-load the collection so the repo can be instantiated without MongoDB,
+        # to simplify testing; note that MongoDB is of course required to use the repo.
+        self.__collection: Collection | None = None
+
+    @staticmethod
+    @cached(cache={}, key=lambda collection_name: hashkey(collection_name))
+    def __build_indexes(collection_name: str) -> None:
+        collection = MongoConnector.get_collection(collection_name=collection_name)
+        collection.create_index(
+            ["organization_id", "workspace_id", "project_id", "dataset_storage_id"],
+            unique=True,
+        )
+        collection.create_index([("lease_expires_at", ASCENDING), ("created_at", ASCENDING)])
+
+    @property
+    def _collection(self) -> Collection:
+        if self.__collection is None:
+            self.__collection = MongoConnector.get_collection(collection_name=self.collection_name)
+            self.__build_indexes(collection_name=self.collection_name)
+        return self.__collection
+
+    @staticmethod
+    def _from_document(document: dict) -> DeletionTombstone:
+        created_at = document["created_at"]
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        dataset_storage_id = document.get("dataset_storage_id")
+        return DeletionTombstone(
+            id_=ID(str(document["_id"])),
+            organization_id=ID(document["organization_id"]),
+            workspace_id=ID(document["workspace_id"]),
+            project_id=ID(document["project_id"]),
+            dataset_storage_id=ID(dataset_storage_id) if dataset_storage_id is not None else None,
+            created_at=created_at,
+            stage=document.get("stage"),
+            deleted_documents=document.get("deleted_documents", 0),
+            deleted_objects=document.get("deleted_objects", 0),
+        )
+
+    def create(
+        self,
+        organization_id: ID,
+        workspace_id: ID,
+        project_id: ID,
+        dataset_storage_id: ID | None = None,
+    ) -> DeletionTombstone:
+        """
+        Creates the tombstone of a project or dataset storage, if it does not exist yet
+
+        :param organization_id: ID of the organization owning the deleted entity
+        :param workspace_id: ID of the workspace owning the deleted entity
+        :param project_id: ID of the deleted project, or of the project containing the deleted dataset storage
+        :param dataset_storage_id: ID of the deleted dataset storage, None to delete the whole project
+        :return: the new or the already existing tombstone
+        """
+        document = self._collection.find_one_and_update(
+            filter={
+                "organization_id": str(organization_id),
+                "workspace_id": str(workspace_id),
+                "project_id": str(project_id),
+                "dataset_storage_id": str(dataset_storage_id) if dataset_storage_id is not None else None,
+            },
+            update={
+                "$setOnInsert": {
+                    "created_at": datetime.now(timezone.utc),
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                }
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._from_document(document)
+
+    def acquire_next(self, owner: str, lease_seconds: int) -> DeletionTombstone | None:
+        """
+        Acquires a lease on the oldest tombstone which is not being processed by another worker
+
+        :param owner: Unique name of the worker acquiring the lease
+        :param lease_seconds: Validity of the lease in seconds
+        :return: the acquired tombstone, None if there is no tombstone to process
+        """
+        now = datetime.now(timezone.utc)
+        document = self._collection.find_one_and_update(
+            filter={"$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lt": now}}]},
+            update={"$set": {"lease_owner": owner, "lease_expires_at": now + timedelta(seconds=lease_seconds)}},
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._from_document(document) if document is not None else None
+
+    def update_progress(
+        self,
+        tombstone_id: ID,
+        owner: str,
+        stage: str,
+        deleted_documents: int,
+        deleted_objects: int,
+        lease_seconds: int,
+    ) -> bool:
+        """
+        Persists the progress of a deletion and renews the lease on its tombstone
+
+        :param tombstone_id: ID of the tombstone
+        :param owner: Name of the worker holding the lease
+        :param stage: Name of the deletion stage in progress
+        :param deleted_documents: Number of documents deleted since the last update
+        :param deleted_objects: Number of binary objects deleted since the last update
+        :param lease_seconds: New validity of the lease in seconds
+        :return: True if the progress has been persisted, False if the lease has been lost
+        """
+        result = self._collection.update_one(
+            filter={"_id": ObjectId(tombstone_id), "lease_owner": owner},
+            update={
+                "$set": {
+                    "stage": stage,
+                    "lease_expires_at": datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+                },
+                "$inc": {"deleted_documents": deleted_documents, "deleted_objects": deleted_objects},
+            },
+        )
+        return result.matched_count > 0
+
+    def release(self, tombstone_id: ID, owner: str) -> None:
+        """
+        Releases the lease on a tombstone, so that the deletion can be resumed by any worker
+
+        :param tombstone_id: ID of the tombstone
+        :param owner: Name of the worker holding the lease
+        """
+        self._collection.update_one(
+            filter={"_id": ObjectId(tombstone_id), "lease_owner": owner},
+            update={"$set": {"lease_owner": None, "lease_expires_at": None}},
+        )
+
+    def delete(self, tombstone_id: ID) -> None:
+        """
+        Deletes a tombstone once the deletion is complete
+
+        :param tombstone_id: ID of the tombstone
+        """
+        self._collection.delete_one({"_id": ObjectId(tombstone_id)})
+
+    def get_by_project(self, organization_id: ID, workspace_id: ID, project_id: ID) -> list[DeletionTombstone]:
+        """
+        Returns the pending deletions of a project and of its dataset storages, to report their progress
+
+        :param organization_id: ID of the organization owning the project
+        :param workspace_id: ID of the workspace owning the project
+        :param project_id: ID of the project
+        :return: list of tombstones
+        """
+        documents = self._collection.find(
+            {
+                "organization_id": str(organization_id),
+                "workspace_id": str(workspace_id),
+                "project_id": str(project_id),
+            }
+        )
+        return [self._from_document(document) for document in documents]
+
+    def count(self) -> int:
+        """
+        Returns the number of pending deletions
+        """
+        return self._collection.count_documents({})
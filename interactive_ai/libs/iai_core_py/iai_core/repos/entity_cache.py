@@ -0,0 +1,178 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the process-wide caches of read-mostly entities (projects and label schemas).
+
+The cached entities are validated by their version stamp, which the versioned repos increment every time an entity
+is saved: a repo reads only the stamp of the document and deserializes the full document only if the stamp differs
+from the cached one. Entries can also be invalidated explicitly, e.g. when the project update events are received.
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from iai_core.utils.feature_flags import FeatureFlagProvider
+
+from geti_types import ID, ProjectIdentifier
+
+if TYPE_CHECKING:
+    from iai_core.entities.label_schema import LabelSchema
+    from iai_core.entities.project import Project
+
+logger = logging.getLogger(__name__)
+
+FEATURE_FLAG_ENTITY_CACHE = "FEATURE_FLAG_ENTITY_CACHE"
+ENTITY_CACHE_MAX_SIZE = int(os.environ.get("ENTITY_CACHE_MAX_SIZE", 1024))
+
+EntityT = TypeVar("EntityT")
+
+
+@dataclass(frozen=True)
+class EntityCacheStats:
+    """
+    Statistics of an entity cache since the process started
+
+    name            name of the cache
+    hits            number of lookups served from the cache
+    misses          number of lookups which required to deserialize the entity
+    invalidations   number of entries removed because their entity was modified or deleted
+    size            number of entries currently in the cache
+    """
+
+    name: str
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+
+class VersionedEntityCache(Generic[EntityT]):
+    """
+    Thread-safe LRU cache of entities, each stored with the version stamp of its document.
+
+    Keys are tuples starting with (organization_id, workspace_id, project_id), so that all the entries of a project
+    can be invalidated at once. The cache holds a private copy of each entity and returns a deep copy of it,
+    so that callers can freely modify the returned entity and lazy-loaded attributes are never shared.
+
+    :param name: Name of the cache, used in logs and metrics
+    :param maxsize: Maximum number of entries; the least recently used ones are evicted first
+    """
+
+    def __init__(self, name: str, maxsize: int = ENTITY_CACHE_MAX_SIZE) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[Hashable, EntityT]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether the entity caches are enabled"""
+        return FeatureFlagProvider.is_enabled(FEATURE_FLAG_ENTITY_CACHE)
+
+    def __contains__(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: tuple, version: Hashable) -> EntityT | None:
+        """
+        Get a copy of the cached entity, if its version matches the given one
+
+        :param key: Key of the entity
+        :param version: Current version stamp of the entity document
+        :return: Copy of the cached entity, or None in case of miss or version mismatch
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # The cached entity is never modified, so it can be copied outside the lock
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: tuple, version: Hashable, entity: EntityT) -> None:
+        """
+        Store a copy of a freshly deserialized entity in the cache
+
+        :param key: Key of the entity
+        :param version: Version stamp of the document the entity was deserialized from
+        :param entity: Entity to cache
+        """
+        entity_copy = copy.deepcopy(entity)
+        with self._lock:
+            self._entries[key] = (version, entity_copy)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: tuple) -> None:
+        """
+        Remove an entity from the cache
+
+        :param key: Key of the entity
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def invalidate_project(self, organization_id: ID, project_identifier: ProjectIdentifier) -> None:
+        """
+        Remove all the entities of a project from the cache
+
+        :param organization_id: ID of the organization owning the project
+        :param project_identifier: Identifier of the project
+        """
+        prefix = (organization_id, project_identifier.workspace_id, project_identifier.project_id)
+        with self._lock:
+            keys = [key for key in self._entries if key[:3] == prefix]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Remove all the entities from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> EntityCacheStats:
+        """Statistics of the cache"""
+        with self._lock:
+            return EntityCacheStats(
+                name=self.name,
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+
+PROJECT_CACHE: "VersionedEntityCache[Project]" = VersionedEntityCache(name="project")
+LABEL_SCHEMA_CACHE: "VersionedEntityCache[LabelSchema]" = VersionedEntityCache(name="label_schema")
+ENTITY_CACHES: tuple[VersionedEntityCache, ...] = (PROJECT_CACHE, LABEL_SCHEMA_CACHE)
+
+
+def invalidate_project_entities(organization_id: ID, project_identifier: ProjectIdentifier) -> None:
+    """
+    Remove a project and its label schemas from the entity caches of this process.
+
+    Every process holding the caches should call this function when a project is updated or deleted by another
+    process, so that the changes to the entities that are not versioned (e.g. labels) are picked up.
+
+    :param organization_id: ID of the organization owning the project
+    :param project_identifier: Identifier of the project
+    """
+    for cache in ENTITY_CACHES:
+        cache.invalidate_project(organization_id=organization_id, project_identifier=project_identifier)
+    logger.debug("Invalidated the cached entities of project `%s`", project_identifier.project_id)
@@ -13,7 +13,7 @@ from pymongo.command_cursor import CommandCursor
 from pymongo.cursor import Cursor
 
 from iai_core.entities.image import Image, NullImage
-from iai_core.entities.media import ImageExtensions
+from iai_core.entities.media import ImageExtensions, thumbnail_filename_prefix
 from iai_core.repos.base.dataset_storage_based_repo import DatasetStorageBasedSessionRepo
 from iai_core.repos.base.session_repo import QueryAccessMode
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
@@ -38,6 +38,7 @@ class ImageRepo(DatasetStorageBasedSessionRepo[Image]):
     """
 
     collection_name = "image"
+    identity_mapped = True
 
     def __init__(
         self,
@@ -92,9 +93,9 @@ class ImageRepo(DatasetStorageBasedSessionRepo[Image]):
         :param image: Image containing the references to the binary data to delete
         """
         if image.data_binary_filename:
-            self.binary_repo.delete_by_filename(image.data_binary_filename)
+            self.binary_repo.delete_by_filename(image.data_binary_filename, size=image.size)
         if image.thumbnail_filename:
-            self.thumbnail_binary_repo.delete_by_filename(image.thumbnail_filename)
+            self.thumbnail_binary_repo.delete_by_prefix(thumbnail_filename_prefix(image.thumbnail_filename))
 
     def get_all_identifiers(self) -> Iterator[ImageIdentifier]:
         """
@@ -116,7 +117,7 @@ class ImageRepo(DatasetStorageBasedSessionRepo[Image]):
         # the ID is invalid, the image was already removed, or the user can't access it
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
         query["_id"] = IDToMongo.forward(id_)
-        image_doc = self._collection.find_one(query, {"extension": 1})
+        image_doc = self._collection.find_one(query, {"extension": 1, "size": 1})
         if not image_doc:
             logger.warning(
                 "Image document with id '%s' not found, possibly it is already deleted",
@@ -129,13 +130,13 @@ class ImageRepo(DatasetStorageBasedSessionRepo[Image]):
         image_deleted: bool = super().delete_by_id(id_)
 
         if image_deleted:
-            # Delete thumbnail
+            # Delete thumbnail and its variants
             thumbnail_filename = Image.thumbnail_filename_by_image_id(str(id_))
-            self.thumbnail_binary_repo.delete_by_filename(thumbnail_filename)
+            self.thumbnail_binary_repo.delete_by_prefix(thumbnail_filename_prefix(thumbnail_filename))
 
             # Delete binary
             image_binary_filename = f"{str(id_)}.{image_doc['extension'].lower()}"
-            self.binary_repo.delete_by_filename(image_binary_filename)
+            self.binary_repo.delete_by_filename(image_binary_filename, size=image_doc.get("size"))
 
         return image_deleted
 
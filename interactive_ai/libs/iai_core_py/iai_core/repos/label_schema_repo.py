@@ -3,7 +3,7 @@
 
 """This module implements the MongoDB repos for labels and label schema entities"""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, cast
 
 from pymongo import DESCENDING, IndexModel
@@ -14,6 +14,10 @@ from pymongo.cursor import Cursor
 from iai_core.entities.label import Label, NullLabel
 from iai_core.entities.label_schema import LabelSchema, LabelSchemaView, NullLabelSchema
 from iai_core.repos.base import ProjectBasedSessionRepo
+from iai_core.repos.base.constants import VERSION_FIELD_NAME
+from iai_core.repos.base.identity_map import CTX_IDENTITY_MAP_VAR
+from iai_core.repos.base.session_repo import QueryAccessMode
+from iai_core.repos.entity_cache import LABEL_SCHEMA_CACHE
 from iai_core.repos.mappers import CursorIterator, IDToMongo, LabelSchemaToMongo, LabelToMongo
 from iai_core.utils.type_helpers import SequenceOrSet
 
@@ -24,13 +28,20 @@ class LabelSchemaRepo(ProjectBasedSessionRepo[LabelSchema]):
     """
     Repository to persist LabelSchema entities in the database.
 
+    Label schema documents are versioned: if the entity cache is enabled, the schemas are served from
+    the process-wide LABEL_SCHEMA_CACHE as long as the version stamp of their document does not change.
+
     :param project_identifier: Identifier of the project
     :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
     """
 
+    collection_name = "label_schema"
+    versioned = True
+    identity_mapped = True
+
     def __init__(self, project_identifier: ProjectIdentifier, session: Session | None = None) -> None:
         super().__init__(
-            collection_name="label_schema",
+            collection_name=LabelSchemaRepo.collection_name,
             project_identifier=project_identifier,
             session=session,
         )
@@ -90,6 +101,64 @@ class LabelSchemaRepo(ProjectBasedSessionRepo[LabelSchema]):
             # Save the schema
             super().save(instance, mongodb_session=mongodb_session)
 
+    def _cache_key(self, label_schema_id: ID) -> tuple:
+        return (
+            self._session.organization_id,
+            self.identifier.workspace_id,
+            self.identifier.project_id,
+            label_schema_id,
+        )
+
+    def _get_one_cached(self, extra_filter: dict, latest: bool = False, check_version: bool = True) -> LabelSchema:
+        """
+        Get one label schema through the entity cache.
+
+        The ID and version stamp of the matching document are read first, and the full document is fetched
+        and deserialized only if the schema is not cached or was modified since it was cached.
+
+        :param extra_filter: Filter to apply in addition to the default one
+        :param latest: If True, return the latest matching schema
+        :param check_version: If False, skip the version read because the schema is known not to be cached
+        :return: Found label schema, or NullLabelSchema in case of no match
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query.update(extra_filter)
+        sort_criteria = [("_id", DESCENDING)] if latest else None
+        if check_version:
+            version_doc = self._collection.find_one(query, projection={VERSION_FIELD_NAME: 1}, sort=sort_criteria)
+            if version_doc is None:
+                return self.null_object
+            cached_schema = LABEL_SCHEMA_CACHE.get(
+                self._cache_key(IDToMongo.backward(version_doc["_id"])),
+                version=version_doc.get(VERSION_FIELD_NAME, 0),
+            )
+            if cached_schema is not None:
+                return cached_schema
+            query["_id"] = version_doc["_id"]
+
+        doc = self._collection.find_one(query, sort=sort_criteria)
+        if doc is None:
+            return self.null_object
+        label_schema = self.backward_map(doc)
+        LABEL_SCHEMA_CACHE.put(
+            self._cache_key(label_schema.id_), version=doc.get(VERSION_FIELD_NAME, 0), entity=label_schema
+        )
+        return label_schema
+
+    def _load_by_id(self, id_: ID) -> LabelSchema:
+        """
+        Load a label schema by ID from the database, or from the entity cache if enabled.
+
+        :param id_: ID of the label schema to fetch
+        :return: Found label schema, or NullLabelSchema in case of no match
+        """
+        if id_ == ID() or not LABEL_SCHEMA_CACHE.is_enabled():
+            return super()._load_by_id(id_)
+        return self._get_one_cached(
+            extra_filter={"_id": IDToMongo.forward(id_)},
+            check_version=self._cache_key(id_) in LABEL_SCHEMA_CACHE,
+        )
+
     def get_latest(self, include_views: bool = False) -> LabelSchema:
         """
         Fetch the most recent LabelSchema for the project.
@@ -100,6 +169,8 @@ class LabelSchemaRepo(ProjectBasedSessionRepo[LabelSchema]):
         extra_filter: dict[str, Any] = {}
         if not include_views:
             extra_filter["label_schema_class"] = "label_schema"
+        if LABEL_SCHEMA_CACHE.is_enabled():
+            return self._get_one_cached(extra_filter=extra_filter, latest=True)
         return self.get_one(extra_filter=extra_filter, latest=True)
 
     def get_deleted_label_ids(self) -> tuple[ID, ...]:
@@ -127,6 +198,8 @@ class LabelSchemaRepo(ProjectBasedSessionRepo[LabelSchema]):
             "task_node_id": IDToMongo.forward(task_node_id),
             "label_schema_class": "label_schema_view",
         }
+        if LABEL_SCHEMA_CACHE.is_enabled():
+            return self._get_one_cached(extra_filter=query, latest=True)  # type: ignore
         return self.get_one(extra_filter=query, latest=True)  # type: ignore
 
 
@@ -138,9 +211,12 @@ class LabelRepo(ProjectBasedSessionRepo[Label]):
     :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
     """
 
+    collection_name = "label"
+    identity_mapped = True
+
     def __init__(self, project_identifier: ProjectIdentifier, session: Session | None = None) -> None:
         super().__init__(
-            collection_name="label",
+            collection_name=LabelRepo.collection_name,
             project_identifier=project_identifier,
             session=session,
         )
@@ -161,6 +237,24 @@ class LabelRepo(ProjectBasedSessionRepo[Label]):
     def cursor_wrapper(self) -> Callable[[Cursor | CommandCursor], CursorIterator]:
         return lambda mongo_cursor: CursorIterator(cursor=mongo_cursor, mapper=LabelToMongo, parameter=None)
 
+    def save(self, instance: Label, mongodb_session: ClientSession | None = None) -> None:
+        super().save(instance=instance, mongodb_session=mongodb_session)
+        self._invalidate_label_schemas()
+
+    def save_many(self, instances: Sequence[Label], mongodb_session: ClientSession | None = None) -> None:
+        super().save_many(instances=instances, mongodb_session=mongodb_session)
+        self._invalidate_label_schemas()
+
+    def _invalidate_label_schemas(self) -> None:
+        """The cached and identity-mapped label schemas embed the labels, so they must be reloaded"""
+        LABEL_SCHEMA_CACHE.invalidate_project(
+            organization_id=self._session.organization_id, project_identifier=self.identifier
+        )
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is not None:
+            # Labels and label schemas are stored with the same project scope
+            identity_map.evict_scope(collection_name=LabelSchemaRepo.collection_name, scope=self._identity_scope())
+
     def get_by_ids(self, label_ids: SequenceOrSet[ID]) -> dict[ID, Label]:
         """
         Fetch multiple labels given their ids.
@@ -168,6 +262,25 @@ class LabelRepo(ProjectBasedSessionRepo[Label]):
         :param label_ids: Sequence of Label IDs to fetch from the database
         :return: Dictionary with label.id_ as key and Label as value
         """
-        label_ids_filter = {"_id": {"$in": [IDToMongo.forward(_id) for _id in label_ids]}}
-        labels = self.get_all(extra_filter=label_ids_filter)
-        return {label.id_: label for label in labels}
+        identity_map = CTX_IDENTITY_MAP_VAR.get()
+        if identity_map is None:
+            label_ids_filter = {"_id": {"$in": [IDToMongo.forward(_id) for _id in label_ids]}}
+            return {label.id_: label for label in self.get_all(extra_filter=label_ids_filter)}
+
+        # Serve the labels already loaded in the current request from the identity map
+        labels_by_id: dict[ID, Label] = {}
+        ids_to_load: list[ID] = []
+        for label_id in label_ids:
+            label = identity_map.get(self._identity_key(label_id))
+            if label is not None:
+                labels_by_id[label_id] = cast("Label", label)
+            else:
+                ids_to_load.append(label_id)
+        if ids_to_load:
+            for label_id in ids_to_load:
+                identity_map.record_read(self._identity_key(label_id))
+            label_ids_filter = {"_id": {"$in": [IDToMongo.forward(_id) for _id in ids_to_load]}}
+            for label in self.get_all(extra_filter=label_ids_filter):
+                identity_map.put(self._identity_key(label.id_), label)
+                labels_by_id[label.id_] = label
+        return labels_by_id
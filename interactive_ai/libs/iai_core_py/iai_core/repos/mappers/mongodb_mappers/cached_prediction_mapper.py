@@ -0,0 +1,109 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module contains the MongoDB mapper for CachedPrediction entities"""
+
+import numpy as np
+
+from iai_core.entities.cached_prediction import CachedPrediction
+from iai_core.entities.metadata import FloatMetadata, FloatType, IMetadata
+from iai_core.entities.tensor import Tensor
+from iai_core.repos.mappers.mongodb_mapper_interface import (
+    IMapperForward,
+    IMapperProjectIdentifierBackward,
+    IMapperSimple,
+    MappingError,
+)
+
+from .annotation_mapper import AnnotationToMongo, AnnotationToMongoForwardParameters
+from .id_mapper import IDToMongo
+from .media_mapper import MediaIdentifierToMongo
+from .metadata_mapper import MetadataDocSchema
+from geti_types import ProjectIdentifier
+
+
+class PredictionMetadataToMongo(IMapperSimple[IMetadata, dict]):
+    """
+    MongoDB mapper for the metadata of cached predictions.
+
+    Unlike the metadata items, the tensors are embedded in the document as raw bytes: the cached metadata
+    (feature vectors, active scores) is small and must be restored without reading the binary storage.
+    """
+
+    @staticmethod
+    def forward(instance: IMetadata) -> dict:
+        if isinstance(instance, FloatMetadata):
+            return {
+                "type": MetadataDocSchema.FLOAT.value,
+                "name": instance.name,
+                "value": float(instance.value),
+                "float_type": str(instance.float_type),
+            }
+        if isinstance(instance, Tensor):
+            data = np.ascontiguousarray(instance.numpy)
+            return {
+                "type": MetadataDocSchema.TENSOR.value,
+                "name": instance.name,
+                "dtype": data.dtype.str,
+                "shape": list(data.shape),
+                "data": data.tobytes(),
+            }
+        raise MappingError(f"Metadata of type {type(instance)} cannot be cached")
+
+    @staticmethod
+    def backward(instance: dict) -> IMetadata:
+        if instance["type"] == MetadataDocSchema.FLOAT.value:
+            return FloatMetadata(
+                name=instance["name"],
+                value=float(instance["value"]),
+                float_type=FloatType[instance["float_type"]],
+            )
+        if instance["type"] == MetadataDocSchema.TENSOR.value:
+            numpy = np.frombuffer(instance["data"], dtype=np.dtype(instance["dtype"])).reshape(instance["shape"])
+            return Tensor(name=instance["name"], numpy=numpy.copy())
+        raise MappingError(f"Cached metadata of type '{instance['type']}' could not be recognized")
+
+
+class CachedPredictionToMongo(
+    IMapperForward[CachedPrediction, dict],
+    IMapperProjectIdentifierBackward[CachedPrediction, dict],
+):
+    """MongoDB mapper for `CachedPrediction` entities"""
+
+    @staticmethod
+    def forward(instance: CachedPrediction) -> dict:
+        annotation_parameters = AnnotationToMongoForwardParameters(
+            media_height=instance.media_height, media_width=instance.media_width
+        )
+        return {
+            "_id": IDToMongo.forward(instance.id_),
+            "model_id": IDToMongo.forward(instance.model_id),
+            "label_schema_id": IDToMongo.forward(instance.label_schema_id),
+            "media_identifier": MediaIdentifierToMongo.forward(instance.media_identifier),
+            "roi_key": instance.roi_key,
+            "media_height": instance.media_height,
+            "media_width": instance.media_width,
+            "annotations": [
+                AnnotationToMongo.forward(annotation, parameters=annotation_parameters)
+                for annotation in instance.annotations
+            ],
+            "metadata": [PredictionMetadataToMongo.forward(data) for data in instance.metadata],
+        }
+
+    @staticmethod
+    def backward(instance: dict, project_identifier: ProjectIdentifier) -> CachedPrediction:
+        return CachedPrediction(
+            id_=IDToMongo.backward(instance["_id"]),
+            model_id=IDToMongo.backward(instance["model_id"]),
+            label_schema_id=IDToMongo.backward(instance["label_schema_id"]),
+            media_identifier=MediaIdentifierToMongo.backward(instance["media_identifier"]),
+            roi_key=instance["roi_key"],
+            media_height=instance["media_height"],
+            media_width=instance["media_width"],
+            annotations=[
+                AnnotationToMongo.backward(annotation, project_identifier=project_identifier)
+                for annotation in instance["annotations"]
+            ],
+            metadata=[PredictionMetadataToMongo.backward(data) for data in instance["metadata"]],
+            ephemeral=False,
+        )
@@ -63,23 +63,40 @@ class TensorToMongo(
 
     @staticmethod
     def forward(instance: Tensor) -> dict:
+        from iai_core.adapters.tensor_adapter import PackedTensorAdapter
+
         if instance.data_binary_filename == "":
             raise ValueError("Cannot map Tensor before its binary data is saved")
-        return {
+        doc = {
             "name": instance.name,
             "binary_filename": instance.data_binary_filename,
             "shape": instance.shape,
         }
+        if isinstance(instance.tensor_adapter, PackedTensorAdapter):
+            # The binary file is a packed tensor container
+            doc["offset"] = instance.tensor_adapter.offset
+            doc["length"] = instance.tensor_adapter.length
+        return doc
 
     @staticmethod
     def backward(instance: dict, parameters: TensorMapperBackwardParameters) -> Tensor:
-        from iai_core.adapters.tensor_adapter import TensorAdapter
-
-        tensor_adapter = TensorAdapter(
-            data_source=parameters.tensor_binary_repo,
-            binary_filename=instance["binary_filename"],
-            shape=tuple(instance["shape"]),
-        )
+        from iai_core.adapters.tensor_adapter import PackedTensorAdapter, TensorAdapter
+
+        tensor_adapter: TensorAdapter
+        if "offset" in instance:
+            tensor_adapter = PackedTensorAdapter(
+                data_source=parameters.tensor_binary_repo,
+                binary_filename=instance["binary_filename"],
+                shape=tuple(instance["shape"]),
+                offset=instance["offset"],
+                length=instance["length"],
+            )
+        else:
+            tensor_adapter = TensorAdapter(
+                data_source=parameters.tensor_binary_repo,
+                binary_filename=instance["binary_filename"],
+                shape=tuple(instance["shape"]),
+            )
 
         return Tensor(
             name=instance["name"],
@@ -26,6 +26,7 @@ from iai_core.repos.mappers.mongodb_mappers.metadata_mapper import (
     MetadataItemMapperBackwardParameters,
 )
 from iai_core.repos.storage.binary_repos import TensorBinaryRepo
+from iai_core.repos.storage.packed_tensors import PackedTensorWriter, get_packed_tensor_writer
 
 from geti_types import ID, DatasetStorageIdentifier, MediaIdentifierEntity, Session
 
@@ -105,6 +106,11 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
             IndexModel([("media_identifier", DESCENDING)]),
             IndexModel([("content.schema", DESCENDING)]),  # TODO CVS-144604 drop unused index
             IndexModel([("content.prediction_id", DESCENDING)]),
+            # Lookup of the documents referencing a packed tensor container, before deleting it
+            IndexModel(
+                [("content.binary_filename", DESCENDING)],
+                partialFilterExpression={"content.offset": {"$exists": True}},
+            ),
         ]
         return super_indexes + new_indexes
 
@@ -115,6 +121,21 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
             self.__tensor_binary_repo = TensorBinaryRepo(self.identifier)
         return self.__tensor_binary_repo
 
+    def _append_tensor_to_container(
+        self, tensor: Tensor, packed_tensor_writer: PackedTensorWriter, on_upload: Callable[[], None]
+    ) -> None:
+        from iai_core.adapters.tensor_adapter import PackedTensorAdapter
+
+        location = packed_tensor_writer.append(tensor.numpy, on_upload=on_upload)
+        tensor.tensor_adapter = PackedTensorAdapter(
+            data_source=self.tensor_binary_repo,
+            binary_filename=location.container_filename,
+            shape=tensor.shape,
+            offset=location.offset,
+            length=location.length,
+        )
+        tensor._numpy = None  # type: ignore
+
     def _offload_tensor_onto_repo(self, tensor: Tensor) -> None:
         from iai_core.adapters.tensor_adapter import TensorAdapter
 
@@ -143,10 +164,13 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
 
         :param metadata_item: Metadata item containing the references to the binary data to delete
         """
+        from iai_core.adapters.tensor_adapter import PackedTensorAdapter
+
         match metadata_item.data:
             case Tensor():
                 tensor = cast("Tensor", metadata_item.data)
-                if tensor.data_binary_filename != "":
+                # Packed tensor containers are shared with other tensors, so they are not deleted here
+                if tensor.data_binary_filename != "" and not isinstance(tensor.tensor_adapter, PackedTensorAdapter):
                     self.tensor_binary_repo.delete_by_filename(filename=tensor.data_binary_filename)
             case _:
                 pass  # no binaries to delete
@@ -162,6 +186,9 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
 
         Metadata item should be treated as immutable entities and never saved twice.
 
+        Within a packed tensor writing context (e.g. batch inference), the tensor is appended to a container and
+        the document is saved only once the container is uploaded, so that it never references a missing container.
+
         :param instance: Metadata item to save
         :param mongodb_session: Optional, ClientSession for MongoDB transactions
         """
@@ -176,6 +203,14 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
                 case Tensor():
                     tensor = cast("Tensor", instance.data)
                     if tensor.tensor_adapter is None:
+                        packed_tensor_writer = get_packed_tensor_writer(self.tensor_binary_repo)
+                        if packed_tensor_writer is not None:
+                            self._append_tensor_to_container(
+                                tensor=tensor,
+                                packed_tensor_writer=packed_tensor_writer,
+                                on_upload=partial(super().save, instance, mongodb_session=mongodb_session),
+                            )
+                            return
                         self._offload_tensor_onto_repo(tensor=tensor)
                 case FloatMetadata():
                     pass  # the float value is directly stored in the MongoDB document
@@ -217,7 +252,9 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
         # removed, or the user can't access it
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
         query["_id"] = IDToMongo.forward(id_)
-        metadata_doc = self._collection.find_one(query, {"content.schema": 1, "content.binary_filename": 1})
+        metadata_doc = self._collection.find_one(
+            query, {"content.schema": 1, "content.binary_filename": 1, "content.offset": 1}
+        )
         if not metadata_doc:
             logger.warning(
                 "Metadata item doc with id '%s' not found, possibly already deleted",
@@ -234,6 +271,8 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
             match metadata_doc["content"]["schema"].upper():
                 case MetadataDocSchema.FLOAT.name:
                     pass
+                case MetadataDocSchema.TENSOR.name if "offset" in metadata_doc["content"]:
+                    self._delete_unreferenced_containers({metadata_doc["content"]["binary_filename"]})
                 case MetadataDocSchema.TENSOR.name:
                     self.tensor_binary_repo.delete_by_filename(metadata_doc["content"]["binary_filename"])
                 case _:
@@ -249,10 +288,16 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
         files_to_delete_by_type: dict[str, list[str]] = {
             tensor_type_str: [],
         }
+        # Packed tensor containers can only be deleted once no document references them anymore
+        containers_to_check: set[str] = set()
         query = extra_filter | self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
-        metadata_docs_to_delete = self._collection.find(query, {"content.schema": 1, "content.binary_filename": 1})
+        metadata_docs_to_delete = self._collection.find(
+            query, {"content.schema": 1, "content.binary_filename": 1, "content.offset": 1}
+        )
         for metadata_doc in metadata_docs_to_delete:
-            if "binary_filename" in metadata_doc["content"]:
+            if "offset" in metadata_doc["content"]:
+                containers_to_check.add(metadata_doc["content"]["binary_filename"])
+            elif "binary_filename" in metadata_doc["content"]:
                 type = metadata_doc["content"]["schema"].lower()
                 binary_filename = metadata_doc["content"]["binary_filename"]
                 files_to_delete_by_type.setdefault(type, []).append(binary_filename)
@@ -263,7 +308,25 @@ class MetadataRepo(DatasetStorageBasedSessionRepo[MetadataItem]):
 
         # Delete the documents last, because if there are problems happening during binaries removal, data will be
         # cleaned from repo and leftover binaries will remain.
-        return super().delete_all(extra_filter=extra_filter)
+        deleted = super().delete_all(extra_filter=extra_filter)
+        self._delete_unreferenced_containers(containers_to_check)
+        return deleted
+
+    def _delete_unreferenced_containers(self, container_filenames: set[str]) -> None:
+        """
+        Delete the packed tensor containers that are not referenced by any metadata document anymore.
+
+        :param container_filenames: Filenames of the containers to check
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        for container_filename in container_filenames:
+            # The condition on the offset matches the partial index on the container filenames
+            container_query = query | {
+                "content.binary_filename": container_filename,
+                "content.offset": {"$exists": True},
+            }
+            if self._collection.find_one(container_query, {"_id": 1}) is None:
+                self.tensor_binary_repo.delete_by_filename(filename=container_filename)
 
     def _delete_all_no_filter(self) -> bool:
         # Delete tensors
@@ -20,13 +20,15 @@ from iai_core.entities.model import Model, ModelFormat, ModelOptimizationType, M
 from iai_core.entities.model_storage import ModelStorageIdentifier
 from iai_core.repos.base.model_storage_based_repo import ModelStorageBasedSessionRepo
 from iai_core.repos.base.session_repo import QueryAccessMode
+from iai_core.repos.dataset_storage_repo import DatasetStorageRepo
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 from iai_core.repos.mappers.mongodb_mappers.model_mapper import ModelPurgeInfoToMongo, ModelToMongo
+from iai_core.repos.prediction_cache_repo import PredictionCacheRepo
 from iai_core.repos.storage.binary_repos import ModelBinaryRepo
 from iai_core.utils.feature_flags import FeatureFlagProvider
 
-from geti_types import ID, Session
+from geti_types import ID, DatasetStorageIdentifier, ProjectIdentifier, Session
 
 logger = logging.getLogger(__name__)
 
@@ -579,6 +581,7 @@ class ModelRepo(ModelStorageBasedSessionRepo[Model]):
             exportable_code_filename = model_doc["exportable_code_path"]
             if exportable_code_filename:
                 self.binary_repo.delete_by_filename(exportable_code_filename)
+            self._delete_cached_predictions(model_ids=[id_])
 
         return model_deleted
 
@@ -598,6 +601,7 @@ class ModelRepo(ModelStorageBasedSessionRepo[Model]):
                 "Filtering is unavailable because it is not currently possible to implement it efficiently"
             )
 
+        model_ids = list(self.get_all_ids())
         # Delete the model documents first, to prevent data corruption in case of error
         # during the binaries deletion stage
         any_item_deleted = super().delete_all()
@@ -605,9 +609,27 @@ class ModelRepo(ModelStorageBasedSessionRepo[Model]):
         if any_item_deleted:
             # Delete binary data (weights and exportable code)
             self.binary_repo.delete_all()
+            self._delete_cached_predictions(model_ids=model_ids)
 
         return any_item_deleted
 
+    def _delete_cached_predictions(self, model_ids: Sequence[ID]) -> None:
+        """
+        Invalidate the predictions of the given models, cached in any dataset storage of the project.
+
+        :param model_ids: IDs of the deleted models
+        """
+        project_identifier = ProjectIdentifier(
+            workspace_id=self.identifier.workspace_id, project_id=self.identifier.project_id
+        )
+        for dataset_storage_id in DatasetStorageRepo(project_identifier).get_all_ids():
+            dataset_storage_identifier = DatasetStorageIdentifier(
+                workspace_id=project_identifier.workspace_id,
+                project_id=project_identifier.project_id,
+                dataset_storage_id=dataset_storage_id,
+            )
+            PredictionCacheRepo(dataset_storage_identifier).delete_all_by_model_ids(model_ids)
+
     def set_purge_info(self, model: Model) -> None:
         """
         Updates only the model purge info in the database.
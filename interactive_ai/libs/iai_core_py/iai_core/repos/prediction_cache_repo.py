@@ -0,0 +1,163 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module implements the repository for CachedPrediction entities
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+
+import pymongo
+from pymongo import IndexModel, UpdateOne
+from pymongo.command_cursor import CommandCursor
+from pymongo.cursor import Cursor
+
+from iai_core.entities.cached_prediction import CachedPrediction, NullCachedPrediction
+from iai_core.repos.base.dataset_storage_based_repo import DatasetStorageBasedSessionRepo
+from iai_core.repos.base.session_repo import QueryAccessMode
+from iai_core.repos.mappers.cursor_iterator import CursorIterator
+from iai_core.repos.mappers.mongodb_mappers.cached_prediction_mapper import CachedPredictionToMongo
+from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
+from iai_core.repos.mappers.mongodb_mappers.media_mapper import MediaIdentifierToMongo
+from iai_core.utils.iteration import MAX_CHUNK_SIZE, grouper
+
+from geti_types import ID, DatasetStorageIdentifier, MediaIdentifierEntity, ProjectIdentifier, Session
+
+logger = logging.getLogger(__name__)
+
+# Fields identifying a cached prediction, unique within the collection
+CACHED_PREDICTION_KEY_FIELDS = ("model_id", "label_schema_id", "media_identifier", "roi_key")
+
+
+class PredictionCacheRepo(DatasetStorageBasedSessionRepo[CachedPrediction]):
+    """
+    Repository to persist the predictions of the models, so that they can be reused when the same model
+    infers again on the same media.
+
+    The predictions are keyed by model ID, label schema ID, media identifier and region of interest, and saved
+    with :meth:`upsert_many` so that there is at most one prediction per key; they must be invalidated with
+    :meth:`delete_all_by_model_ids` when the model is deleted.
+
+    :param dataset_storage_identifier: Identifier of the dataset storage
+    :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
+    """
+
+    collection_name = "prediction_cache"
+
+    def __init__(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        session: Session | None = None,
+    ) -> None:
+        super().__init__(
+            collection_name=PredictionCacheRepo.collection_name,
+            session=session,
+            dataset_storage_identifier=dataset_storage_identifier,
+        )
+        self.project_identifier = ProjectIdentifier(
+            workspace_id=dataset_storage_identifier.workspace_id,
+            project_id=dataset_storage_identifier.project_id,
+        )
+
+    @property
+    def forward_map(self) -> Callable[[CachedPrediction], dict]:
+        return CachedPredictionToMongo.forward
+
+    @property
+    def backward_map(self) -> Callable[[dict], CachedPrediction]:
+        return partial(CachedPredictionToMongo.backward, project_identifier=self.project_identifier)
+
+    @property
+    def null_object(self) -> NullCachedPrediction:
+        return NullCachedPrediction()
+
+    @property
+    def cursor_wrapper(self) -> Callable[[Cursor | CommandCursor], CursorIterator]:
+        return lambda mongo_cursor: CursorIterator(
+            cursor=mongo_cursor,
+            mapper=CachedPredictionToMongo,
+            parameter=self.project_identifier,
+        )
+
+    @property
+    def indexes(self) -> list[IndexModel]:
+        super_indexes = super().indexes
+        new_indexes = [
+            IndexModel([("model_id", pymongo.DESCENDING), ("media_identifier", pymongo.DESCENDING)]),
+            IndexModel([("media_identifier.media_id", pymongo.DESCENDING)]),
+            IndexModel([(field, pymongo.DESCENDING) for field in CACHED_PREDICTION_KEY_FIELDS], unique=True),
+        ]
+        return super_indexes + new_indexes
+
+    def upsert_many(self, instances: Sequence[CachedPrediction]) -> None:
+        """
+        Save cached predictions, replacing the predictions with the same key (model, label schema, media and ROI).
+
+        The documents are matched by key rather than by ID, so that concurrent jobs caching the prediction of the
+        same media do not create duplicates; a replaced document keeps its original ID.
+
+        :param instances: Cached predictions to save
+        """
+        if not instances:
+            return
+        query_filter = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+        update_operations = []
+        for instance in instances:
+            doc = self.forward_map(instance) | query_filter
+            doc_id = doc.pop("_id")
+            key_filter = {field: doc[field] for field in CACHED_PREDICTION_KEY_FIELDS} | query_filter
+            update = self._save_update(doc) | {"$setOnInsert": {"_id": doc_id}}
+            update_operations.append(UpdateOne(key_filter, update, upsert=True))
+        self._collection.bulk_write(update_operations, ordered=False)
+        for instance in instances:
+            instance.mark_as_persisted()
+
+    def get_by_model_and_media_identifiers(
+        self,
+        model_id: ID,
+        label_schema_id: ID,
+        media_identifiers: Iterable[MediaIdentifierEntity],
+        chunk_size: int = MAX_CHUNK_SIZE,
+    ) -> dict[tuple[MediaIdentifierEntity, str], CachedPrediction]:
+        """
+        Get the cached predictions of a model for the given media, with one query per chunk of media.
+
+        :param model_id: ID of the model that generated the predictions
+        :param label_schema_id: ID of the label schema of the model; predictions made with a different
+            label schema are ignored
+        :param media_identifiers: identifiers of the media to look up
+        :param chunk_size: maximum number of media identifiers per query
+        :return: dict mapping the key (media identifier, ROI key) to the cached prediction
+        """
+        cached_predictions: dict[tuple[MediaIdentifierEntity, str], CachedPrediction] = {}
+        for chunk in grouper(media_identifiers, chunk_size=chunk_size):
+            query = {
+                "model_id": IDToMongo.forward(model_id),
+                "label_schema_id": IDToMongo.forward(label_schema_id),
+                "media_identifier": {"$in": [MediaIdentifierToMongo.forward(identifier) for identifier in chunk]},
+            }
+            for cached_prediction in self.get_all(extra_filter=query):
+                cached_predictions[cached_prediction.key] = cached_prediction
+        return cached_predictions
+
+    def delete_all_by_model_ids(self, model_ids: Sequence[ID]) -> None:
+        """
+        Delete the cached predictions of the given models
+
+        :param model_ids: IDs of the models whose predictions should be invalidated
+        """
+        if not model_ids:
+            return
+        query = {"model_id": {"$in": [IDToMongo.forward(model_id) for model_id in model_ids]}}
+        self.delete_all(extra_filter=query)
+
+    def delete_all_by_media_id(self, media_id: ID) -> None:
+        """
+        Delete the cached predictions of a media
+
+        :param media_id: Media id
+        """
+        query = {"media_identifier.media_id": IDToMongo.forward(media_id)}
+        self.delete_all(extra_filter=query)
@@ -22,8 +22,10 @@ from iai_core.entities.dataset_storage import NullDatasetStorage
 from iai_core.entities.project import NullProject, Project
 from iai_core.entities.project_performance import ProjectPerformance
 from iai_core.repos.base import SessionBasedRepo
+from iai_core.repos.base.constants import VERSION_FIELD_NAME
 from iai_core.repos.base.session_repo import QueryAccessMode
 from iai_core.repos.dataset_storage_repo import DatasetStorageRepo
+from iai_core.repos.entity_cache import PROJECT_CACHE
 from iai_core.repos.mappers import DatetimeToMongo, ProjectToMongo
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
@@ -40,10 +42,14 @@ class ProjectRepo(SessionBasedRepo[Project]):
     """
     Repository to persist Project entities in the database.
 
+    Project documents are versioned: if the entity cache is enabled, get_by_id serves the projects from
+    the process-wide PROJECT_CACHE as long as the version stamp of their document does not change.
+
     :param session: Session object; if not provided, it is loaded through get_session()
     """
 
     collection_name = "project"
+    versioned = True
 
     def __init__(self, session: Session | None = None) -> None:
         super().__init__(collection_name=ProjectRepo.collection_name, session=session)
@@ -98,6 +104,38 @@ class ProjectRepo(SessionBasedRepo[Project]):
                 DatasetStorageRepo(instance.identifier).save(dataset_storage)
         super().save(instance=instance, mongodb_session=mongodb_session)
 
+    def _load_by_id(self, id_: ID) -> Project:
+        """
+        Load a project by ID from the database, or from the entity cache if enabled.
+
+        If the entity cache is enabled and the project is cached, only the version stamp of the document is read;
+        the full document is fetched and deserialized only if the project was modified since it was cached.
+
+        :param id_: ID of the project to fetch
+        :return: Found project, or NullProject in case of no match
+        """
+        if id_ == ID() or not PROJECT_CACHE.is_enabled():
+            return super()._load_by_id(id_)
+
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["_id"] = IDToMongo.forward(id_)
+        cache_key = (self._session.organization_id, self._session.workspace_id, id_)
+        if cache_key in PROJECT_CACHE:
+            version_doc = self._collection.find_one(query, projection={VERSION_FIELD_NAME: 1})
+            if version_doc is None:
+                PROJECT_CACHE.invalidate(cache_key)
+                return self.null_object
+            cached_project = PROJECT_CACHE.get(cache_key, version=version_doc.get(VERSION_FIELD_NAME, 0))
+            if cached_project is not None:
+                return cached_project
+
+        doc = self._collection.find_one(query)
+        if doc is None:
+            return self.null_object
+        project = self.backward_map(doc)
+        PROJECT_CACHE.put(cache_key, version=doc.get(VERSION_FIELD_NAME, 0), entity=project)
+        return project
+
     def delete_all(self, extra_filter: dict | None = None) -> bool:
         """
         Delete all projects in the database
@@ -132,6 +170,14 @@ class ProjectRepo(SessionBasedRepo[Project]):
         """
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
         query.update(query_filter)
+        # Bump the version stamp, so that the cached copies of the project are refreshed
+        if isinstance(update, list):
+            update = [
+                *update,
+                {"$set": {VERSION_FIELD_NAME: {"$add": [{"$ifNull": [f"${VERSION_FIELD_NAME}", 0]}, 1]}}},
+            ]
+        else:
+            update = {**update, "$inc": {**update.get("$inc", {}), VERSION_FIELD_NAME: 1}}
         result = self._collection.update_one(
             filter=query,
             update=update,
@@ -12,16 +12,22 @@ import shutil
 from pathlib import Path
 from typing import TypeVar
 
+from pymongo.errors import PyMongoError
+
 from iai_core.adapters.binary_interpreters import IBinaryInterpreter
+from iai_core.utils.feature_flags import FeatureFlagProvider
 from iai_core.utils.type_helpers import str2bool
 
 from .local_storage import LocalStorageClient
 from .object_storage import ObjectStorageClient
 from .storage_client import BinaryObjectType, BinaryRepoOwnerIdentifierT, BytesStream, StorageClient
+from .storage_usage_repo import StorageUsageRepo
 from geti_types import CTX_SESSION_VAR, ID, make_session
 
 logger = logging.getLogger(__name__)
 
+FEATURE_FLAG_STORAGE_USAGE_LEDGER = "FEATURE_FLAG_STORAGE_USAGE_LEDGER"
+
 
 T = TypeVar("T")
 
@@ -37,6 +43,9 @@ class BinaryRepo:
 
     Files inside the repository are identified using their filename
 
+    If the storage usage ledger is enabled, the bytes saved and deleted through the repo are recorded in the
+    StorageUsageRepo, so that the size of a project can be obtained without listing its objects.
+
     :param identifier: Identifier of the object to which the data belongs
     :param organization_id: ID of organization to which above mentioned object belongs
     """
@@ -85,6 +94,17 @@ class BinaryRepo:
         """
         return self.storage_client.get_by_filename(filename=filename, binary_interpreter=binary_interpreter)
 
+    def get_range_by_filename(self, filename: str, offset: int, length: int) -> bytes:
+        """
+        Read a byte range of a binary file from the repository.
+
+        :param filename: File name of the binary file
+        :param offset: Position of the first byte to read
+        :param length: Number of bytes to read
+        :return: The bytes read from the storage
+        """
+        return self.storage_client.get_range_by_filename(filename=filename, offset=offset, length=length)
+
     def save(
         self,
         data_source: str | bytes | BytesStream | None,
@@ -92,6 +112,7 @@ class BinaryRepo:
         remove_source: bool | None = False,
         overwrite: bool | None = True,
         make_unique: bool | None = False,
+        replaces_existing: bool = False,
     ) -> str:
         """
         Save file or bytes data to the binary repo under the given filename
@@ -105,6 +126,9 @@ class BinaryRepo:
         :param overwrite: Optional boolean, if true overwrite the file, if false raise an error if the file is already
             present.
         :param make_unique: Optional boolean, if true generate a unique filename for the file to be saved under
+        :param replaces_existing: Whether the file is expected to replace an existing one. If so, and the storage
+            usage ledger is enabled, the size of the replaced file is requested from the storage and deducted from the
+            recorded usage; otherwise, only the size of the saved data is recorded.
         """
         stream_or_str: str | BytesStream
         if data_source is None:
@@ -120,9 +144,17 @@ class BinaryRepo:
                 raise ValueError("Cannot save an unnamed file without specifying a target filename.")
             dst_file_name = os.path.basename(stream_or_str)
 
+        size_delta = 0
+        if self.is_usage_ledger_enabled():
+            size_delta = os.path.getsize(stream_or_str) if isinstance(stream_or_str, str) else stream_or_str.length()
+            if replaces_existing and overwrite and not make_unique:
+                # The size of the overwritten file is freed; it is 0 if the file does not exist
+                size_delta -= self.storage_client.get_object_size(filename=dst_file_name)
+
         filename = self.storage_client.save(
             dst_file_name=dst_file_name, data_source=stream_or_str, overwrite=overwrite, make_unique=make_unique
         )
+        self._record_usage(size_delta)
 
         if remove_source and isinstance(stream_or_str, str) and os.path.exists(stream_or_str):
             try:
@@ -138,6 +170,14 @@ class BinaryRepo:
         :param source_directory: Source directory for this group of entities
         """
         self.storage_client.save_group(source_directory=source_directory)
+        if self.is_usage_ledger_enabled():
+            self._record_usage(
+                sum(
+                    os.path.getsize(os.path.join(directory, file))
+                    for directory, _, files in os.walk(source_directory)
+                    for file in files
+                )
+            )
 
     def export_group(self, target_directory: str) -> None:
         """
@@ -148,19 +188,43 @@ class BinaryRepo:
         """
         self.storage_client.export_group(target_directory=target_directory)
 
-    def delete_by_filename(self, filename: str) -> None:
+    def delete_by_filename(self, filename: str, size: int | None = None) -> None:
         """
         Delete a binary file with the given name
 
         :param filename: Name of the binary file
+        :param size: Optional size of the file, in bytes, if known by the caller. It is deducted from the storage
+            usage ledger, if enabled; when not provided, the size is requested from the storage before the deletion.
         """
+        if not self.is_usage_ledger_enabled():
+            size = 0
+        elif size is None:
+            size = self.storage_client.get_object_size(filename=filename)
         self.storage_client.delete_by_filename(filename=filename)
+        self._record_usage(-size)
+
+    def delete_by_prefix(self, prefix: str) -> None:
+        """
+        Delete all the binary files whose name starts with the given prefix
+
+        :param prefix: Prefix of the filenames of the binary files to delete
+        """
+        size = self.storage_client.delete_by_prefix(prefix=prefix)
+        if self.is_usage_ledger_enabled():
+            self._record_usage(-size)
 
     def delete_all(self) -> None:
         """
         Delete all objects in this particular binary repo
         """
         self.storage_client.delete_all()
+        if self.is_usage_ledger_enabled():
+            try:
+                StorageUsageRepo().reset(
+                    organization_id=self.organization_id, identifier=self.identifier, object_type=self.object_type
+                )
+            except PyMongoError:
+                logger.warning("Failed to reset the storage usage of %s `%s`.", self.object_type, self.identifier)
 
     def get_object_size(self, filename: str) -> int:
         """
@@ -179,6 +243,34 @@ class BinaryRepo:
         """
         return self.storage_client.get_object_storage_size()
 
+    @staticmethod
+    def is_usage_ledger_enabled() -> bool:
+        """
+        Returns whether the bytes saved and deleted through the binary repos are recorded in the storage usage ledger
+        """
+        return FeatureFlagProvider.is_enabled(FEATURE_FLAG_STORAGE_USAGE_LEDGER)
+
+    def _record_usage(self, size_delta: int) -> None:
+        """
+        Record the number of bytes added to (or freed from, if negative) the repo in the storage usage ledger.
+
+        A failure to update the ledger does not fail the storage operation: the drift is corrected by the next
+        reconciliation of the ledger.
+
+        :param size_delta: Number of bytes added to the repo
+        """
+        if size_delta == 0:
+            return
+        try:
+            StorageUsageRepo().increment(
+                organization_id=self.organization_id,
+                identifier=self.identifier,
+                object_type=self.object_type,
+                size=size_delta,
+            )
+        except PyMongoError:
+            logger.warning("Failed to record the storage usage of %s `%s`.", self.object_type, self.identifier)
+
     def create_path_for_temporary_file(self, filename: str, make_unique: bool) -> str:
         """
         Use the local storage client to create a temporary file location that holds a relation to the file with the
@@ -6,10 +6,14 @@ This module contains the base implementation for the storage clients, which mana
 repo.
 """
 
+import glob
+import itertools
 import logging
+import mmap
 import os
 import shutil
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from shutil import copyfile
 
@@ -91,6 +95,23 @@ class LocalStorageClient(StorageClient):
         with open(path, "rb") as file:
             return binary_interpreter.interpret(data=file, filename=filename)
 
+    def get_range_by_filename(self, filename: str, offset: int, length: int) -> bytes:
+        """
+        Get a byte range of a file. The file is memory-mapped, so only the requested pages are read from the disk.
+
+        :param filename: Name of the file
+        :param offset: Position of the first byte to read
+        :param length: Number of bytes to read
+        :return: The bytes read from the file
+        """
+        path = self.__get_physical_path(filename)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"The given resource does not exist. Expected file at path `{path}`")
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), length=0, access=mmap.ACCESS_READ) as mapped_file:
+            if offset + length > len(mapped_file):
+                raise ValueError(f"Range [{offset}, {offset + length}) is out of the bounds of file `{path}`")
+            return mapped_file[offset : offset + length]
+
     def get_path_or_presigned_url(self, filename: str, preset_headers: dict | None = None) -> Path:  # noqa: ARG002
         """
         Get the local path where this file is stored.
@@ -198,6 +219,22 @@ class LocalStorageClient(StorageClient):
         except AssertionError:
             logger.warning("Failed to delete binary at %s", path_to_file)
 
+    def delete_by_prefix(self, prefix: str) -> int:
+        """
+        Delete all the files whose name starts with the given prefix
+
+        :param prefix: Prefix of the filenames of the files to delete
+        :return: Total size of the deleted files, in bytes
+        """
+        if not prefix:
+            return 0
+        size = 0
+        for file_path in glob.iglob(os.path.join(glob.escape(self.base_path), glob.escape(prefix) + "*")):
+            if os.path.isfile(file_path) and not os.path.islink(file_path):
+                size += os.path.getsize(file_path)
+                os.unlink(file_path)
+        return size
+
     def delete_all(self) -> None:
         """
         Delete all objects in this particular binary repo
@@ -216,6 +253,38 @@ class LocalStorageClient(StorageClient):
         except (FileNotFoundError, OSError):
             pass
 
+    def delete_batch(self, max_objects: int) -> int:
+        """
+        Delete at most 'max_objects' files in this particular binary repo
+
+        :param max_objects: Maximum number of files to delete
+        :return: Number of deleted files; if lower than max_objects, the repo is now empty
+        """
+        if not os.path.exists(self.base_path):
+            return 0
+        file_paths = list(itertools.islice(self.__iter_file_paths(self.base_path), max_objects))
+        for file_path in file_paths:
+            os.unlink(file_path)
+        if len(file_paths) < max_objects:
+            # Only empty folders are left
+            shutil.rmtree(self.base_path, ignore_errors=True)
+        return len(file_paths)
+
+    @staticmethod
+    def __iter_file_paths(folder_path: str) -> Iterator[str]:
+        """
+        Lazily iterate over the paths of the files in a folder and its sub-folders
+
+        :param folder_path: Path of the folder
+        :return: Iterator over the file paths
+        """
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from LocalStorageClient.__iter_file_paths(entry.path)
+                else:
+                    yield entry.path
+
     def get_object_size(self, filename: str) -> int:
         """
         Measure the size of the object with the given filename
@@ -7,6 +7,7 @@ repo.
 """
 
 import io
+import itertools
 import logging
 import os
 import random
@@ -193,6 +194,31 @@ class ObjectStorageClient(StorageClient):
             logger.error(f"The given resource does not exist. Expected file to be present at {object_name}: {e}")
             raise FileNotFoundError(f"The given resource does not exist. Expected file to be present at {object_name}")
 
+    @retry_on_rate_limit()
+    @reinit_client_and_retry_on_timeout
+    def get_range_by_filename(self, filename: str, offset: int, length: int) -> bytes:
+        """
+        Get a byte range of an object with a ranged GET request, without downloading the whole object.
+
+        :param filename: Name of the object
+        :param offset: Position of the first byte to read
+        :param length: Number of bytes to read
+        :return: The bytes read from the object
+        """
+        object_name = os.path.join(self.object_name_base, filename)
+        try:
+            response = self.client.get_object(
+                bucket_name=self.bucket_name, object_name=object_name, offset=offset, length=length
+            )
+        except S3Error as e:
+            logger.error(f"The given resource does not exist. Expected file to be present at {object_name}: {e}")
+            raise FileNotFoundError(f"The given resource does not exist. Expected file to be present at {object_name}")
+        try:
+            return response.data
+        finally:
+            response.close()
+            response.release_conn()
+
     def get_path_or_presigned_url(self, filename: str, preset_headers: dict | None = None) -> str:
         """
         Generate a presigned URL for the object described by the given filename. This presigned URL can be used by
@@ -334,6 +360,29 @@ class ObjectStorageClient(StorageClient):
         object_name = os.path.join(self.object_name_base, filename)
         self.client.remove_object(bucket_name=self.bucket_name, object_name=object_name)
 
+    @retry_on_rate_limit()
+    @reinit_client_and_retry_on_timeout
+    def delete_by_prefix(self, prefix: str) -> int:
+        """
+        Delete all the files whose name starts with the given prefix, with one listing and one batch deletion
+
+        :param prefix: Prefix of the filenames of the files to delete
+        :return: Total size of the deleted files, in bytes
+        """
+        objects = [
+            obj
+            for obj in self.client.list_objects(self.bucket_name, prefix=os.path.join(self.object_name_base, prefix))
+            if not obj.is_dir
+        ]
+        if not objects:
+            return 0
+        errors = self.client.remove_objects(
+            self.bucket_name, delete_object_list=[DeleteObject(obj.object_name) for obj in objects]
+        )
+        for error in errors:
+            logger.error("An error occured when deleting object: %s", error)
+        return sum(obj.size for obj in objects)
+
     # TODO CVS-133311 apply retry on rate limit after refactoring
     @reinit_client_and_retry_on_timeout
     def delete_all(self) -> None:
@@ -348,6 +397,26 @@ class ObjectStorageClient(StorageClient):
         for error in errors:
             logger.error("An error occured when deleting object: %s", error)
 
+    @retry_on_rate_limit()
+    @reinit_client_and_retry_on_timeout
+    def delete_batch(self, max_objects: int) -> int:
+        """
+        Delete at most 'max_objects' objects in this particular binary repo
+
+        Only the first page(s) of the object listing are fetched, so the cost of the call is bounded by max_objects.
+
+        :param max_objects: Maximum number of objects to delete
+        :return: Number of deleted objects; if lower than max_objects, the repo is now empty
+        """
+        objects = self.client.list_objects(self.bucket_name, prefix=self.object_name_base + "/", recursive=True)
+        delete_object_list = [DeleteObject(x.object_name) for x in itertools.islice(objects, max_objects)]
+        if not delete_object_list:
+            return 0
+        errors = self.client.remove_objects(self.bucket_name, delete_object_list=delete_object_list)
+        for error in errors:
+            logger.error("An error occured when deleting object: %s", error)
+        return len(delete_object_list)
+
     @retry_on_rate_limit()
     @reinit_client_and_retry_on_timeout
     def get_object_size(self, filename: str) -> int:
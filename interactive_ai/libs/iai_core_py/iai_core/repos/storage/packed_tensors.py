@@ -0,0 +1,170 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the writer of packed tensor containers.
+
+A packed tensor container is a binary file holding the uncompressed arrays of many tensors back to back, each one
+in '.npy' format; the metadata document of each tensor stores the container filename with the offset and length
+of the tensor data. Packing the tensors written by a batch inference run avoids creating one tiny object per tensor
+and allows reading the tensors back with byte-range requests. The metadata documents are saved only once their
+container is uploaded, so that a document never references a missing container.
+"""
+
+import logging
+import os
+import tempfile
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import BinaryIO
+
+import numpy as np
+
+from iai_core.repos.storage.binary_repos import TensorBinaryRepo
+from iai_core.utils.feature_flags import FeatureFlagProvider
+
+from geti_types import DatasetStorageIdentifier
+
+logger = logging.getLogger(__name__)
+
+FEATURE_FLAG_PACKED_TENSORS = "FEATURE_FLAG_PACKED_TENSORS"
+# Size above which a container is closed and uploaded, and a new one is started
+PACKED_TENSOR_CONTAINER_MAX_SIZE = int(os.environ.get("PACKED_TENSOR_CONTAINER_MAX_SIZE", 256 * 1024 * 1024))
+PACKED_TENSOR_CONTAINER_EXTENSION = ".tensors"
+
+
+@dataclass(frozen=True)
+class PackedTensorLocation:
+    """
+    Location of a tensor within a packed tensor container
+
+    container_filename  filename of the container in the tensor binary repo
+    offset              position of the tensor data within the container, in bytes
+    length              size of the tensor data, in bytes
+    """
+
+    container_filename: str
+    offset: int
+    length: int
+
+
+class PackedTensorWriter:
+    """
+    Writer appending tensors to packed tensor containers of a dataset storage.
+
+    The tensors are appended to a local temporary file, which is uploaded to the tensor binary repo when it exceeds
+    the maximum container size or when the writer is flushed. The location of a tensor is known before its container
+    is uploaded, so anything referencing it (typically the metadata document of the tensor) must be persisted by
+    a callback run after the upload.
+
+    :param tensor_binary_repo: Tensor binary repo of the dataset storage
+    :param max_container_size: Size of the containers, in bytes, above which a new container is started
+    """
+
+    def __init__(
+        self, tensor_binary_repo: TensorBinaryRepo, max_container_size: int = PACKED_TENSOR_CONTAINER_MAX_SIZE
+    ) -> None:
+        self.tensor_binary_repo = tensor_binary_repo
+        self.max_container_size = max_container_size
+        self._container_file: BinaryIO | None = None
+        self._container_filename = ""
+        self._upload_callbacks: list[Callable[[], None]] = []
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether the tensors saved by batch inference are packed into containers"""
+        return FeatureFlagProvider.is_enabled(FEATURE_FLAG_PACKED_TENSORS)
+
+    def append(self, array: np.ndarray, on_upload: Callable[[], None] | None = None) -> PackedTensorLocation:
+        """
+        Append an array to the current container
+
+        The container is uploaded at the latest when the writer is flushed; if it already exceeds the maximum size,
+        it is uploaded before appending the array, so that the callbacks never run before the caller is done with
+        the returned location.
+
+        :param array: Array to append
+        :param on_upload: Optional function to call once the container holding the array is uploaded
+        :return: Location of the array within the container
+        """
+        if self._container_file is not None and self._container_file.tell() >= self.max_container_size:
+            self.flush()
+        if self._container_file is None:
+            self._container_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                prefix="packed_tensors_", suffix=PACKED_TENSOR_CONTAINER_EXTENSION, delete=False
+            )
+            self._container_filename = f"packed_{uuid.uuid4().hex}{PACKED_TENSOR_CONTAINER_EXTENSION}"
+        offset = self._container_file.tell()
+        np.save(self._container_file, np.ascontiguousarray(array), allow_pickle=False)
+        location = PackedTensorLocation(
+            container_filename=self._container_filename,
+            offset=offset,
+            length=self._container_file.tell() - offset,
+        )
+        if on_upload is not None:
+            self._upload_callbacks.append(on_upload)
+        return location
+
+    def flush(self) -> None:
+        """Upload the current container, if any, to the tensor binary repo, then run the callbacks of its tensors"""
+        if self._container_file is None:
+            return
+        container_file, self._container_file = self._container_file, None
+        upload_callbacks, self._upload_callbacks = self._upload_callbacks, []
+        container_file.close()
+        self.tensor_binary_repo.save(
+            data_source=container_file.name,
+            dst_file_name=self._container_filename,
+            remove_source=True,
+            overwrite=False,
+        )
+        logger.debug("Uploaded packed tensor container `%s`", self._container_filename)
+        for callback in upload_callbacks:
+            callback()
+
+
+CTX_PACKED_TENSOR_WRITERS_VAR: ContextVar[dict[DatasetStorageIdentifier, PackedTensorWriter] | None] = ContextVar(
+    "packed_tensor_writers", default=None
+)
+
+
+def get_packed_tensor_writer(tensor_binary_repo: TensorBinaryRepo) -> PackedTensorWriter | None:
+    """
+    Get the packed tensor writer of the dataset storage, if the tensors are being packed in the current context
+
+    :param tensor_binary_repo: Tensor binary repo of the dataset storage
+    :return: The writer, or None if the tensors must be stored individually
+    """
+    writers = CTX_PACKED_TENSOR_WRITERS_VAR.get()
+    if writers is None:
+        return None
+    identifier = tensor_binary_repo.identifier
+    if identifier not in writers:
+        writers[identifier] = PackedTensorWriter(tensor_binary_repo=tensor_binary_repo)
+    return writers[identifier]
+
+
+@contextmanager
+def packed_tensor_writing() -> Iterator[None]:
+    """
+    Context manager within which the tensors saved through the metadata repos are packed into containers.
+
+    The metadata documents of the packed tensors are saved after their container is uploaded, at the latest when
+    the context is exited (even in case of error); until then, the metadata items remain ephemeral. If the process
+    is killed before, the container may be left without any document referencing it, but a document never
+    references a missing container. If the packed tensors are disabled, the context manager has no effect.
+    """
+    if not PackedTensorWriter.is_enabled():
+        yield
+        return
+    writers: dict[DatasetStorageIdentifier, PackedTensorWriter] = {}
+    token = CTX_PACKED_TENSOR_WRITERS_VAR.set(writers)
+    try:
+        yield
+    finally:
+        CTX_PACKED_TENSOR_WRITERS_VAR.reset(token)
+        for writer in writers.values():
+            writer.flush()
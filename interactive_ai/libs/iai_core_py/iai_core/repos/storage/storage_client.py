@@ -108,6 +108,13 @@ class StorageClient(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_range_by_filename(self, filename: str, offset: int, length: int) -> bytes:
+        """
+        Fetch a byte range of a file. Implemented by the child class
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_path_or_presigned_url(self, filename: str, preset_headers: dict | None = None) -> Path | str:
         """
@@ -185,6 +192,16 @@ class StorageClient(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def delete_by_prefix(self, prefix: str) -> int:
+        """
+        Delete all the files whose name starts with the given prefix. Implemented by the child class
+
+        :param prefix: Prefix of the filenames of the files to delete
+        :return: Total size of the deleted files, in bytes
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def delete_all(self) -> None:
         """
@@ -192,6 +209,16 @@ class StorageClient(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def delete_batch(self, max_objects: int) -> int:
+        """
+        Delete at most 'max_objects' objects in this particular binary repo. Implemented by the child class
+
+        :param max_objects: Maximum number of objects to delete
+        :return: Number of deleted objects; if lower than max_objects, the repo is now empty
+        """
+        raise NotImplementedError
+
     @staticmethod
     def __create_unique_filename_for_file(filename: str) -> str:
         """
@@ -0,0 +1,182 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the storage usage ledger repo, which keeps track of the bytes stored by each binary repo
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from cachetools import cached
+from cachetools.keys import hashkey
+from pymongo.collection import Collection
+
+from iai_core.entities.model_storage import ModelStorageIdentifier
+from iai_core.repos.base.mongo_connector import MongoConnector
+
+from .storage_client import BinaryObjectType, BinaryRepoOwnerIdentifierT
+from geti_types import ID, DatasetStorageIdentifier, ProjectIdentifier
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProjectStorageUsage:
+    """
+    Storage usage of a project, as recorded in the ledger
+
+    usage               bytes stored by each binary repo of the project, by object type and by owner ID (dataset
+                        storage, model storage or project)
+    reconciled_at       time of the last reconciliation of the ledger with the storage, None if the ledger has never
+                        been reconciled and may thus miss the objects stored before it was introduced
+    """
+
+    usage: dict[str, dict[str, int]] = field(default_factory=dict)
+    reconciled_at: datetime | None = None
+
+    def get_size(self, object_types: Iterable[BinaryObjectType]) -> int:
+        """
+        Returns the total number of bytes stored for the given object types
+
+        :param object_types: Object types to sum the usage for
+        :return: Size in bytes
+        """
+        return sum(sum(self.usage.get(str(object_type), {}).values()) for object_type in object_types)
+
+
+class StorageUsageRepo:
+    """
+    Ledger of the bytes stored by the binary repos.
+
+    The ledger holds one document per project. The usage of each binary repo is stored under
+    'usage.<object_type>.<owner_id>', where the owner is the dataset storage, the model storage or the project
+    that the binary repo belongs to. Updates are atomic ($inc/$unset), so that concurrent writers do not need
+    to coordinate; the drift caused by failed updates is corrected by reconciling the ledger with the storage.
+    """
+
+    collection_name = "storage_usage"
+
+    def __init__(self) -> None:
+        # Lazy-load the collection so the repo can be instantiated without MongoDB
+        self.__collection: Collection | None = None
+
+    @staticmethod
+    @cached(cache={}, key=lambda collection_name: hashkey(collection_name))
+    def __build_indexes(collection_name: str) -> None:
+        collection = MongoConnector.get_collection(collection_name=collection_name)
+        collection.create_index(["organization_id", "workspace_id", "project_id"], unique=True)
+
+    @property
+    def _collection(self) -> Collection:
+        if self.__collection is None:
+            self.__collection = MongoConnector.get_collection(collection_name=self.collection_name)
+            self.__build_indexes(collection_name=self.collection_name)
+        return self.__collection
+
+    @staticmethod
+    def _project_filter(organization_id: ID, workspace_id: ID, project_id: ID) -> dict:
+        return {
+            "organization_id": str(organization_id),
+            "workspace_id": str(workspace_id),
+            "project_id": str(project_id),
+        }
+
+    @staticmethod
+    def _usage_field(identifier: BinaryRepoOwnerIdentifierT, object_type: BinaryObjectType) -> str:
+        owner_id: ID
+        if isinstance(identifier, DatasetStorageIdentifier):
+            owner_id = identifier.dataset_storage_id
+        elif isinstance(identifier, ModelStorageIdentifier):
+            owner_id = identifier.model_storage_id
+        else:
+            owner_id = identifier.project_id
+        return f"usage.{object_type}.{owner_id}"
+
+    def increment(
+        self,
+        organization_id: ID,
+        identifier: BinaryRepoOwnerIdentifierT,
+        object_type: BinaryObjectType,
+        size: int,
+    ) -> None:
+        """
+        Atomically adds the given number of bytes to the usage of a binary repo
+
+        :param organization_id: ID of the organization owning the binary repo
+        :param identifier: Identifier of the binary repo owner
+        :param object_type: Object type of the binary repo
+        :param size: Number of bytes to add, negative if bytes have been freed
+        """
+        if size == 0:
+            return
+        self._collection.update_one(
+            filter=self._project_filter(organization_id, identifier.workspace_id, identifier.project_id),
+            update={"$inc": {self._usage_field(identifier, object_type): size}},
+            upsert=True,
+        )
+
+    def reset(self, organization_id: ID, identifier: BinaryRepoOwnerIdentifierT, object_type: BinaryObjectType) -> None:
+        """
+        Removes the usage of a binary repo whose objects have all been deleted
+
+        :param organization_id: ID of the organization owning the binary repo
+        :param identifier: Identifier of the binary repo owner
+        :param object_type: Object type of the binary repo
+        """
+        self._collection.update_one(
+            filter=self._project_filter(organization_id, identifier.workspace_id, identifier.project_id),
+            update={"$unset": {self._usage_field(identifier, object_type): ""}},
+        )
+
+    def get_project_usage(self, organization_id: ID, project_identifier: ProjectIdentifier) -> ProjectStorageUsage:
+        """
+        Returns the storage usage of a project
+
+        :param organization_id: ID of the organization owning the project
+        :param project_identifier: Identifier of the project
+        :return: ProjectStorageUsage, empty and not reconciled if nothing was recorded for the project
+        """
+        document = self._collection.find_one(
+            self._project_filter(organization_id, project_identifier.workspace_id, project_identifier.project_id)
+        )
+        if document is None:
+            return ProjectStorageUsage()
+        reconciled_at = document.get("reconciled_at")
+        if reconciled_at is not None and reconciled_at.tzinfo is None:
+            reconciled_at = reconciled_at.replace(tzinfo=timezone.utc)
+        return ProjectStorageUsage(usage=document.get("usage", {}), reconciled_at=reconciled_at)
+
+    def set_project_usage(
+        self,
+        organization_id: ID,
+        project_identifier: ProjectIdentifier,
+        usage: dict[str, dict[str, int]],
+    ) -> None:
+        """
+        Overwrites the storage usage of a project with the one measured from the storage, marking it as reconciled
+
+        :param organization_id: ID of the organization owning the project
+        :param project_identifier: Identifier of the project
+        :param usage: Bytes stored by each binary repo of the project, by object type and by owner ID
+        """
+        self._collection.update_one(
+            filter=self._project_filter(
+                organization_id, project_identifier.workspace_id, project_identifier.project_id
+            ),
+            update={"$set": {"usage": usage, "reconciled_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+
+    def delete_project_usage(self, organization_id: ID, project_identifier: ProjectIdentifier) -> None:
+        """
+        Deletes the storage usage of a project
+
+        :param organization_id: ID of the organization owning the project
+        :param project_identifier: Identifier of the project
+        """
+        self._collection.delete_one(
+            self._project_filter(organization_id, project_identifier.workspace_id, project_identifier.project_id)
+        )
@@ -14,6 +14,7 @@ from weakref import WeakValueDictionary
 from pymongo.command_cursor import CommandCursor
 from pymongo.cursor import Cursor
 
+from iai_core.entities.media import thumbnail_filename_prefix
 from iai_core.entities.video import NullVideo, Video
 from iai_core.repos.base.dataset_storage_based_repo import DatasetStorageBasedSessionRepo
 from iai_core.repos.base.session_repo import QueryAccessMode
@@ -61,6 +62,36 @@ class VideoCache(metaclass=Singleton):
                 self._cache[(dataset_storage_identifier, video_id)] = video
         return video
 
+    def get_or_load_many(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        video_ids: Iterable[ID],
+        load_many_fn: Callable[[list[ID]], dict[ID, Video]],
+    ) -> dict[ID, Video]:
+        """
+        Get many videos from the cache, loading all the missing ones at once through the provided function.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the videos
+        :param video_ids: IDs of the videos
+        :param load_many_fn: Function to load the videos missing from the cache, returning them by ID
+        :return: Dict mapping the ID of each found video to the Video object
+        """
+        videos: dict[ID, Video] = {}
+        with self._cache_lock:
+            missing_video_ids = []
+            for video_id in video_ids:
+                video = self._cache.get((dataset_storage_identifier, video_id), None)
+                if video is None:  # cache miss
+                    missing_video_ids.append(video_id)
+                else:
+                    videos[video_id] = video
+            if missing_video_ids:
+                loaded_videos = load_many_fn(missing_video_ids)
+                for video_id, video in loaded_videos.items():
+                    self._cache[(dataset_storage_identifier, video_id)] = video
+                videos.update(loaded_videos)
+        return videos
+
     def remove(self, dataset_storage_identifier: DatasetStorageIdentifier, video_id: ID) -> None:
         """
         Remove a video from the cache, if present.
@@ -92,6 +123,7 @@ class VideoRepo(DatasetStorageBasedSessionRepo[Video]):
     """
 
     collection_name = "video"
+    identity_mapped = True
 
     def __init__(
         self,
@@ -149,7 +181,7 @@ class VideoRepo(DatasetStorageBasedSessionRepo[Video]):
         query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
         query["_id"] = IDToMongo.forward(id_)
         # Find the video document, retrieve only the extension field
-        video_doc = self._collection.find_one(query, {"extension": 1})
+        video_doc = self._collection.find_one(query, {"extension": 1, "size": 1})
         if not video_doc:
             logger.warning(
                 "Video document with id '%s' not found, possibly it is already deleted",
@@ -163,15 +195,16 @@ class VideoRepo(DatasetStorageBasedSessionRepo[Video]):
         # during the binary deletion stage
         video_deleted: bool = super().delete_by_id(id_)
         if video_deleted:
-            # Delete the thumbnails (both image- and video-like)
+            # Delete the thumbnails (both image- and video-like) and the variants of the frame thumbnail, which
+            # all share the same prefix
             frame_thumbnail_binary_filename = Video.thumbnail_filename_by_video_id(str(id_))
-            video_thumbnail_binary_filename = Video.thumbnail_video_filename_by_video_id(str(id_))
-            self.thumbnail_binary_repo.delete_by_filename(filename=frame_thumbnail_binary_filename)
-            self.thumbnail_binary_repo.delete_by_filename(filename=video_thumbnail_binary_filename)
+            self.thumbnail_binary_repo.delete_by_prefix(
+                prefix=thumbnail_filename_prefix(frame_thumbnail_binary_filename)
+            )
 
             # Delete binary
             video_binary_filename = f"{str(id_)}.{video_doc['extension'].lower()}"
-            self.binary_repo.delete_by_filename(filename=video_binary_filename)
+            self.binary_repo.delete_by_filename(filename=video_binary_filename, size=video_doc.get("size"))
 
         return video_deleted
 
@@ -219,6 +252,17 @@ class VideoRepo(DatasetStorageBasedSessionRepo[Video]):
             dataset_storage_identifier=self.identifier, video_id=id_, load_fn=super().get_by_id
         )
 
+    def get_by_ids(self, ids: Iterable[ID]) -> dict[ID, Video]:
+        """
+        Fetch many videos by ID, with one query for all the videos that are not in the cache.
+
+        :param ids: IDs of the videos
+        :return: Dict mapping the ID of each found video to the Video
+        """
+        return VideoCache().get_or_load_many(
+            dataset_storage_identifier=self.identifier, video_ids=ids, load_many_fn=self.get_video_by_ids
+        )
+
     def get_frame_identifiers(self, *, stride: int | None = None) -> Iterator[VideoFrameIdentifier]:
         """
         Get frame identifiers for all videos in video_repo.
@@ -0,0 +1,413 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the background deletion engine for projects and dataset storages.
+
+Deleting a project or a dataset storage only creates a tombstone; the documents and binaries are then removed by the
+BackgroundDeletionWorker in bounded chunks, with a pause between chunks to limit the load on MongoDB and on the
+object storage. The progress is persisted in the tombstone, so that the deletion resumes after a restart.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from iai_core.repos import BinaryRepo, DatasetStorageRepo, ProjectRepo
+from iai_core.repos.base.constants import (
+    DATASET_STORAGE_ID_FIELD_NAME,
+    ORGANIZATION_ID_FIELD_NAME,
+    PROJECT_ID_FIELD_NAME,
+    WORKSPACE_ID_FIELD_NAME,
+)
+from iai_core.repos.base.mongo_connector import MongoConnector
+from iai_core.repos.deletion_tombstone_repo import DeletionTombstone, DeletionTombstoneRepo
+from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
+from iai_core.repos.storage.binary_repo import StorageClientFactory
+from iai_core.repos.storage.storage_client import BinaryObjectType
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
+
+from geti_types import (
+    CTX_SESSION_VAR,
+    DatasetStorageIdentifier,
+    ProjectIdentifier,
+    Singleton,
+    make_session,
+    session_context,
+)
+
+logger = logging.getLogger(__name__)
+
+DELETION_DOCUMENTS_CHUNK_SIZE = int(os.environ.get("DELETION_DOCUMENTS_CHUNK_SIZE", 1000))
+DELETION_OBJECTS_CHUNK_SIZE = int(os.environ.get("DELETION_OBJECTS_CHUNK_SIZE", 500))
+# Pause between two chunks, to rate-limit the deletion
+DELETION_CHUNK_INTERVAL_SECONDS = float(os.environ.get("DELETION_CHUNK_INTERVAL_SECONDS", 0.2))
+DELETION_POLL_INTERVAL_SECONDS = float(os.environ.get("DELETION_POLL_INTERVAL_SECONDS", 10))
+DELETION_LEASE_SECONDS = int(os.environ.get("DELETION_LEASE_SECONDS", 300))
+
+# Collections whose documents belong to a dataset storage
+DATASET_STORAGE_COLLECTIONS = (
+    "annotation_scene",
+    "annotation_scene_state",
+    "compiled_dataset_shard",
+    "dataset",
+    "dataset_item",
+    "dataset_storage_filter_data",
+    "image",
+    "media_score",
+    "metadata_item",
+    "pipeline_dataset_entity",
+    "prediction_cache",
+    "suspended_annotation_scenes",
+    "training_revision_filter",
+    "video",
+    "video_annotation_range",
+)
+# Collections whose documents belong to a project
+PROJECT_COLLECTIONS = (
+    *DATASET_STORAGE_COLLECTIONS,
+    "active_model_state",
+    "annotation_template",
+    "configurable_parameters",
+    "dataset_storage",
+    "evaluation_result",
+    "label",
+    "label_schema",
+    "model",
+    "model_storage",
+    "task_node",
+)
+DATASET_STORAGE_OBJECT_TYPES = (
+    BinaryObjectType.IMAGES,
+    BinaryObjectType.VIDEOS,
+    BinaryObjectType.THUMBNAILS,
+    BinaryObjectType.TENSORS,
+)
+PROJECT_OBJECT_TYPES = (
+    *DATASET_STORAGE_OBJECT_TYPES,
+    BinaryObjectType.MODELS,
+    BinaryObjectType.CODE_DEPLOYMENTS,
+)
+
+
+@dataclass(frozen=True)
+class DeletionProgress:
+    """
+    Progress of a background deletion, reported after each processed chunk
+
+    tombstone           tombstone of the deletion
+    stage               name of the deletion stage the chunk belongs to
+    deleted_documents   number of documents deleted in the chunk
+    deleted_objects     number of binary objects deleted in the chunk
+    duration            time spent to delete the chunk, in seconds
+    """
+
+    tombstone: DeletionTombstone
+    stage: str
+    deleted_documents: int
+    deleted_objects: int
+    duration: float
+
+
+@dataclass(frozen=True)
+class _DeletionStage:
+    """
+    Step of a deletion, executed in chunks until there is nothing left to delete
+
+    name                unique name of the stage, persisted in the tombstone
+    delete_chunk        callable deleting one chunk and returning the number of deleted items
+    chunk_size          maximum number of items deleted by a chunk; a shorter chunk completes the stage
+    binary              True if the stage deletes binary objects, False if it deletes documents
+    """
+
+    name: str
+    delete_chunk: Callable[[], int]
+    chunk_size: int
+    binary: bool
+
+
+def schedule_project_deletion(project_identifier: ProjectIdentifier) -> DeletionTombstone:
+    """
+    Creates the tombstone of a project, so that its documents and binaries are deleted in the background.
+
+    The project should already be hidden and inaccessible by the time this function is called.
+
+    :param project_identifier: Identifier of the project to delete
+    :return: the tombstone of the project
+    """
+    tombstone = DeletionTombstoneRepo().create(
+        organization_id=CTX_SESSION_VAR.get().organization_id,
+        workspace_id=project_identifier.workspace_id,
+        project_id=project_identifier.project_id,
+    )
+    logger.info("Scheduled background deletion of project `%s`", project_identifier.project_id)
+    return tombstone
+
+
+def schedule_dataset_storage_deletion(dataset_storage_identifier: DatasetStorageIdentifier) -> DeletionTombstone:
+    """
+    Creates the tombstone of a dataset storage, so that its documents and binaries are deleted in the background.
+
+    The dataset storage should already be detached from its project by the time this function is called.
+
+    :param dataset_storage_identifier: Identifier of the dataset storage to delete
+    :return: the tombstone of the dataset storage
+    """
+    tombstone = DeletionTombstoneRepo().create(
+        organization_id=CTX_SESSION_VAR.get().organization_id,
+        workspace_id=dataset_storage_identifier.workspace_id,
+        project_id=dataset_storage_identifier.project_id,
+        dataset_storage_id=dataset_storage_identifier.dataset_storage_id,
+    )
+    logger.info("Scheduled background deletion of dataset storage `%s`", dataset_storage_identifier.dataset_storage_id)
+    return tombstone
+
+
+class BackgroundDeletionWorker(metaclass=Singleton):
+    """
+    Worker processing the deletion tombstones in a background thread.
+
+    Multiple replicas can run the worker: each tombstone is leased to one worker at a time.
+
+    :param progress_callback: Optional callable invoked after each deleted chunk, e.g. to record metrics
+    """
+
+    def __init__(self, progress_callback: Callable[[DeletionProgress], None] | None = None) -> None:
+        self._owner = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self._progress_callback = progress_callback
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start processing the tombstones in a background thread"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="background-deletion", daemon=True)
+        self._thread.start()
+        logger.info("Background deletion worker `%s` started", self._owner)
+
+    def stop(self) -> None:
+        """Stop the background thread; the deletion in progress is resumed later from its last chunk"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=DELETION_LEASE_SECONDS)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed = self.process_next()
+            except Exception:
+                logger.exception("Error occurred in the background deletion worker")
+                processed = False
+            if not processed:
+                self._stop_event.wait(DELETION_POLL_INTERVAL_SECONDS)
+
+    def process_next(self) -> bool:
+        """
+        Acquire the next tombstone and delete its entity, chunk by chunk
+
+        :return: True if a tombstone was processed, False if there was nothing to delete
+        """
+        tombstone_repo = DeletionTombstoneRepo()
+        tombstone = tombstone_repo.acquire_next(owner=self._owner, lease_seconds=DELETION_LEASE_SECONDS)
+        if tombstone is None:
+            return False
+
+        session = make_session(organization_id=tombstone.organization_id, workspace_id=tombstone.workspace_id)
+        with session_context(session=session):
+            completed = self._process(tombstone)
+        if completed:
+            tombstone_repo.delete(tombstone.id_)
+            logger.info(
+                "Background deletion of %s completed: %d documents and %d objects deleted",
+                self._describe(tombstone),
+                tombstone.deleted_documents,
+                tombstone.deleted_objects,
+            )
+        elif self._stop_event.is_set():
+            tombstone_repo.release(tombstone_id=tombstone.id_, owner=self._owner)
+        return True
+
+    def _process(self, tombstone: DeletionTombstone) -> bool:
+        """
+        Execute the stages of a deletion, starting from the stage persisted in the tombstone
+
+        :param tombstone: Tombstone of the deletion
+        :return: True if the deletion is complete, False if it was interrupted
+        """
+        stages = self._get_stages(tombstone)
+        stage_names = [stage.name for stage in stages]
+        first_stage = stage_names.index(tombstone.stage) if tombstone.stage in stage_names else 0
+        tombstone_repo = DeletionTombstoneRepo()
+
+        for stage in stages[first_stage:]:
+            stage_start = time.monotonic()
+            stage_deleted = 0
+            while True:
+                if self._stop_event.is_set():
+                    return False
+                chunk_start = time.monotonic()
+                deleted = stage.delete_chunk()
+                duration = time.monotonic() - chunk_start
+                stage_deleted += deleted
+                deleted_documents = 0 if stage.binary else deleted
+                deleted_objects = deleted if stage.binary else 0
+                if not tombstone_repo.update_progress(
+                    tombstone_id=tombstone.id_,
+                    owner=self._owner,
+                    stage=stage.name,
+                    deleted_documents=deleted_documents,
+                    deleted_objects=deleted_objects,
+                    lease_seconds=DELETION_LEASE_SECONDS,
+                ):
+                    logger.warning("Lost the lease on the deletion of %s", self._describe(tombstone))
+                    return False
+                tombstone = replace(
+                    tombstone,
+                    stage=stage.name,
+                    deleted_documents=tombstone.deleted_documents + deleted_documents,
+                    deleted_objects=tombstone.deleted_objects + deleted_objects,
+                )
+                if self._progress_callback is not None:
+                    self._progress_callback(
+                        DeletionProgress(
+                            tombstone=tombstone,
+                            stage=stage.name,
+                            deleted_documents=deleted_documents,
+                            deleted_objects=deleted_objects,
+                            duration=duration,
+                        )
+                    )
+                if deleted < stage.chunk_size:
+                    break
+                self._stop_event.wait(DELETION_CHUNK_INTERVAL_SECONDS)
+
+            stage_duration = time.monotonic() - stage_start
+            if stage_deleted:
+                logger.info(
+                    "Deletion of %s, stage `%s`: %d items deleted in %.1fs (%.1f items/s)",
+                    self._describe(tombstone),
+                    stage.name,
+                    stage_deleted,
+                    stage_duration,
+                    stage_deleted / max(stage_duration, 1e-3),
+                )
+
+        self._finalize(tombstone)
+        return True
+
+    @staticmethod
+    def _describe(tombstone: DeletionTombstone) -> str:
+        if tombstone.dataset_storage_id is not None:
+            return f"dataset storage `{tombstone.dataset_storage_id}`"
+        return f"project `{tombstone.project_id}`"
+
+    @staticmethod
+    def _get_stages(tombstone: DeletionTombstone) -> list[_DeletionStage]:
+        """
+        Returns the stages of a deletion: the binaries are deleted first, then the documents
+
+        :param tombstone: Tombstone of the deletion
+        :return: list of stages, in execution order
+        """
+        match_filter = {
+            ORGANIZATION_ID_FIELD_NAME: IDToMongo.forward(tombstone.organization_id),
+            WORKSPACE_ID_FIELD_NAME: IDToMongo.forward(tombstone.workspace_id),
+            PROJECT_ID_FIELD_NAME: IDToMongo.forward(tombstone.project_id),
+        }
+        identifier: ProjectIdentifier | DatasetStorageIdentifier
+        if tombstone.dataset_storage_id is not None:
+            match_filter[DATASET_STORAGE_ID_FIELD_NAME] = IDToMongo.forward(tombstone.dataset_storage_id)
+            identifier = DatasetStorageIdentifier(
+                workspace_id=tombstone.workspace_id,
+                project_id=tombstone.project_id,
+                dataset_storage_id=tombstone.dataset_storage_id,
+            )
+            object_types: tuple[BinaryObjectType, ...] = DATASET_STORAGE_OBJECT_TYPES
+            collection_names: tuple[str, ...] = DATASET_STORAGE_COLLECTIONS
+        else:
+            identifier = ProjectIdentifier(workspace_id=tombstone.workspace_id, project_id=tombstone.project_id)
+            object_types = PROJECT_OBJECT_TYPES
+            collection_names = PROJECT_COLLECTIONS
+
+        stages = []
+        for object_type in object_types:
+            # The storage of the project (or dataset storage) contains the one of its dataset and model storages
+            storage_client = StorageClientFactory.acquire_storage_client(
+                identifier=identifier, object_type=object_type, organization_id=tombstone.organization_id
+            )
+            stages.append(
+                _DeletionStage(
+                    name=f"binaries.{object_type}",
+                    delete_chunk=lambda client=storage_client: client.delete_batch(  # type: ignore[misc]
+                        max_objects=DELETION_OBJECTS_CHUNK_SIZE
+                    ),
+                    chunk_size=DELETION_OBJECTS_CHUNK_SIZE,
+                    binary=True,
+                )
+            )
+        for collection_name in collection_names:
+            stages.append(
+                _DeletionStage(
+                    name=f"documents.{collection_name}",
+                    delete_chunk=lambda name=collection_name: _delete_documents_chunk(  # type: ignore[misc]
+                        collection_name=name, match_filter=match_filter, max_documents=DELETION_DOCUMENTS_CHUNK_SIZE
+                    ),
+                    chunk_size=DELETION_DOCUMENTS_CHUNK_SIZE,
+                    binary=False,
+                )
+            )
+        return stages
+
+    @staticmethod
+    def _finalize(tombstone: DeletionTombstone) -> None:
+        """
+        Delete the document of the deleted project or dataset storage, once all its content has been deleted
+
+        :param tombstone: Tombstone of the deletion
+        """
+        project_identifier = ProjectIdentifier(workspace_id=tombstone.workspace_id, project_id=tombstone.project_id)
+        if tombstone.dataset_storage_id is not None:
+            DatasetStorageRepo(project_identifier).delete_by_id(tombstone.dataset_storage_id)
+            if BinaryRepo.is_usage_ledger_enabled():
+                dataset_storage_identifier = DatasetStorageIdentifier(
+                    workspace_id=tombstone.workspace_id,
+                    project_id=tombstone.project_id,
+                    dataset_storage_id=tombstone.dataset_storage_id,
+                )
+                for object_type in DATASET_STORAGE_OBJECT_TYPES:
+                    StorageUsageRepo().reset(
+                        organization_id=tombstone.organization_id,
+                        identifier=dataset_storage_identifier,
+                        object_type=object_type,
+                    )
+        else:
+            ProjectRepo().delete_by_id(tombstone.project_id)
+            if BinaryRepo.is_usage_ledger_enabled():
+                StorageUsageRepo().delete_project_usage(
+                    organization_id=tombstone.organization_id, project_identifier=project_identifier
+                )
+
+
+def _delete_documents_chunk(collection_name: str, match_filter: dict, max_documents: int) -> int:
+    """
+    Delete at most 'max_documents' documents matching the filter in a collection
+
+    :param collection_name: Name of the collection
+    :param match_filter: Filter selecting the documents to delete
+    :param max_documents: Maximum number of documents to delete
+    :return: Number of deleted documents; if lower than max_documents, no matching document is left
+    """
+    collection = MongoConnector.get_collection(collection_name=collection_name)
+    ids = [document["_id"] for document in collection.find(match_filter, projection={"_id": 1}, limit=max_documents)]
+    if not ids:
+        return 0
+    collection.delete_many({"_id": {"$in": ids}})
+    return len(ids)
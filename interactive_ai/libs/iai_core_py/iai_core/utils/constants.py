@@ -8,3 +8,7 @@ This module implements various constants for use in the sdk
 MAX_POLYGON_POINTS = 5000
 DEFAULT_USER_NAME = "sc"
 DEFAULT_THUMBNAIL_SIZE = 256
+# Sizes of the thumbnail variants, from the small thumbnails of the dense media grid to the preview
+SMALL_THUMBNAIL_SIZE = 128
+PREVIEW_THUMBNAIL_SIZE = 512
+THUMBNAIL_VARIANT_SIZES = (SMALL_THUMBNAIL_SIZE, DEFAULT_THUMBNAIL_SIZE, PREVIEW_THUMBNAIL_SIZE)
@@ -59,11 +59,11 @@ class DatasetHelper:
         :return: a dataset created with the media identifiers and empty annotations.
         """
         dataset_items: list[DatasetItem] = []
-        for media_identifier in media_identifiers:
-            media = Media2DFactory().get_media_for_identifier(
-                media_identifier=media_identifier,
-                dataset_storage_identifier=dataset_storage.identifier,
-            )
+        all_media = Media2DFactory().get_media_for_identifiers(
+            media_identifiers=media_identifiers,
+            dataset_storage_identifier=dataset_storage.identifier,
+        )
+        for media_identifier, media in zip(media_identifiers, all_media):
             annotation_scene = AnnotationScene(
                 kind=annotation_scene_kind,
                 media_identifier=media_identifier,
@@ -113,6 +113,7 @@ class DatasetHelper:
         roi: Annotation | None = None,
         set_ignored_label_ids: bool = True,
         annotation_scene_state: AnnotationSceneState | None = None,
+        media: Media2D | None = None,
     ) -> DatasetItem:
         """
         Creates a dataset item from an annotation_scene and adds it to the passed subset
@@ -127,12 +128,16 @@ class DatasetHelper:
         :param annotation_scene_state: If provided and 'set_ignored_label_ids=True', then
             this annotation scene state will be used to compute the ignored labels,
             rather than loading the necessary information from the database.
+        :param media: If provided, the media of the annotation scene, which is then not loaded from the database.
+            Useful when the media of many annotation scenes are loaded at once with
+            Media2DFactory.get_media_for_identifiers.
         :return: DatasetItem
         """
-        media = Media2DFactory().get_media_for_identifier(
-            media_identifier=annotation_scene.media_identifier,
-            dataset_storage_identifier=dataset_storage.identifier,
-        )
+        if media is None:
+            media = Media2DFactory().get_media_for_identifier(
+                media_identifier=annotation_scene.media_identifier,
+                dataset_storage_identifier=dataset_storage.identifier,
+            )
         dataset_item = DatasetItem(
             id_=DatasetRepo.generate_id(), media=media, annotation_scene=annotation_scene, roi=roi, subset=subset
         )
@@ -181,21 +186,23 @@ class DatasetHelper:
             annotation_kind=AnnotationSceneKind.ANNOTATION,
         )
 
+        all_media = Media2DFactory().get_media_for_identifiers(
+            media_identifiers=media_identifiers,
+            dataset_storage_identifier=dataset_storage.identifier,
+        )
+
         # Iterate over these annotations
         dataset_items = [
             DatasetHelper._get_dataset_item_with_filtered_annotations(
                 dataset_storage=dataset_storage,
                 labels=labels,
-                media=Media2DFactory().get_media_for_identifier(
-                    media_identifier=media_identifier,
-                    dataset_storage_identifier=dataset_storage.identifier,
-                ),
+                media=media,
                 roi=roi,
                 task_node=task_node,
                 annotation_scene=user_annotation_scene,
                 annotation_scene_kind=AnnotationSceneKind.TASK_PREDICTION,
             )
-            for media_identifier, user_annotation_scene in zip(media_identifiers, user_annotation_scenes)
+            for media, user_annotation_scene in zip(all_media, user_annotation_scenes)
         ]
         latest_schema = LabelSchemaRepo(project.identifier).get_latest()
         dataset = Dataset(
@@ -475,6 +482,7 @@ class DatasetHelper:
             annotation_scene=filtered_ann_scene,
             roi=filtered_roi,
             dataset_storage=dataset_storage,
+            media=media,
         )
 
     @staticmethod
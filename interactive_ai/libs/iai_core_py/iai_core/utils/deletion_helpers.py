@@ -16,6 +16,7 @@ from iai_core.repos import (
     ActiveModelStateRepo,
     AnnotationSceneRepo,
     AnnotationSceneStateRepo,
+    BinaryRepo,
     CompiledDatasetShardsRepo,
     ConfigurableParametersRepo,
     DatasetRepo,
@@ -29,6 +30,7 @@ from iai_core.repos import (
     ModelRepo,
     ModelStorageRepo,
     ModelTestResultRepo,
+    PredictionCacheRepo,
     ProjectRepo,
     TaskNodeRepo,
     VideoAnnotationRangeRepo,
@@ -36,6 +38,7 @@ from iai_core.repos import (
 )
 from iai_core.repos.dataset_entity_repo import PipelineDatasetRepo
 from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
 from iai_core.repos.training_revision_filter_repo import _TrainingRevisionFilterRepo
 
 from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, MediaIdentifierEntity, ProjectIdentifier
@@ -174,6 +177,17 @@ class DeletionHelpers:
         media_score_repo = MediaScoreRepo(dataset_storage.identifier)
         media_score_repo.delete_all_by_media_id(media_id)
 
+    @staticmethod
+    def delete_cached_predictions_by_media_id(dataset_storage: DatasetStorage, media_id: ID) -> None:
+        """
+        Delete the cached predictions related to the media with given identifier
+
+        :param dataset_storage: DatasetStorage containing the media
+        :param media_id: Media id of media being deleted
+        """
+        logger.debug("Deleting cached predictions of media %s", media_id)
+        PredictionCacheRepo(dataset_storage.identifier).delete_all_by_media_id(media_id)
+
     @staticmethod
     def delete_image_entity(dataset_storage: DatasetStorage, image: Image) -> None:
         """
@@ -194,6 +208,7 @@ class DeletionHelpers:
             media_identifier=image.media_identifier,
         )
         DeletionHelpers.delete_media_score_entities_by_media_id(dataset_storage=dataset_storage, media_id=image.id_)
+        DeletionHelpers.delete_cached_predictions_by_media_id(dataset_storage=dataset_storage, media_id=image.id_)
         DatasetStorageFilterRepo(dataset_storage.identifier).delete_all_by_media_id(media_id=image.id_)
         ImageRepo(dataset_storage.identifier).delete_by_id(image.id_)
 
@@ -218,6 +233,7 @@ class DeletionHelpers:
         )
         VideoAnnotationRangeRepo(dataset_storage.identifier).delete_all_by_video_id(video_id=video.id_)
         DeletionHelpers.delete_media_score_entities_by_media_id(dataset_storage=dataset_storage, media_id=video.id_)
+        DeletionHelpers.delete_cached_predictions_by_media_id(dataset_storage=dataset_storage, media_id=video.id_)
         DatasetStorageFilterRepo(dataset_storage.identifier).delete_all_by_media_id(media_id=video.id_)
         VideoRepo(dataset_storage.identifier).delete_by_id(video.id_)
 
@@ -315,6 +331,17 @@ class DeletionHelpers:
 
         CompiledDatasetShardsRepo(dataset_storage.identifier).delete_all()
 
+    @staticmethod
+    def delete_cached_predictions_by_dataset_storage(dataset_storage: DatasetStorage) -> None:
+        """
+        Delete all cached predictions by dataset storage.
+
+        :param dataset_storage: Dataset storage containing the cached predictions
+        """
+        logger.debug("Deleting all cached predictions of storage `%s`", dataset_storage.id_)
+
+        PredictionCacheRepo(dataset_storage.identifier).delete_all()
+
     @staticmethod
     def delete_all_entities_in_dataset_storage(dataset_storage: DatasetStorage) -> None:
         """
@@ -326,6 +353,7 @@ class DeletionHelpers:
          - Result sets
          - Pipeline
          - Compiled dataset shard
+         - Cached predictions
         and their related entities.
 
         :param dataset_storage: Dataset storage to delete
@@ -335,6 +363,7 @@ class DeletionHelpers:
         DeletionHelpers.delete_media_entities_by_dataset_storage(dataset_storage=dataset_storage)
         DeletionHelpers.delete_pipeline_dataset_entities_by_dataset_storage(dataset_storage=dataset_storage)
         DeletionHelpers.delete_compiled_dataset_shards_by_dataset_storage(dataset_storage=dataset_storage)
+        DeletionHelpers.delete_cached_predictions_by_dataset_storage(dataset_storage=dataset_storage)
         DeletionHelpers.delete_datasets_by_dataset_storage(dataset_storage=dataset_storage)
 
     ##################################
@@ -508,6 +537,10 @@ class DeletionHelpers:
 
         DeletionHelpers.delete_all_entities_in_project(project=project)
         ProjectRepo().delete_by_id(project.id_)
+        if BinaryRepo.is_usage_ledger_enabled():
+            StorageUsageRepo().delete_project_usage(
+                organization_id=CTX_SESSION_VAR.get().organization_id, project_identifier=project.identifier
+            )
 
     @staticmethod
     def delete_dataset_storage_by_id(dataset_storage_identifier: DatasetStorageIdentifier) -> None:
@@ -3,7 +3,11 @@
 
 """Utility functions that deal with file-system"""
 
+import contextvars
+import logging
 import os
+import threading
+from datetime import datetime, timedelta, timezone
 
 from iai_core.entities.model_storage import ModelStorageIdentifier
 from iai_core.entities.project import Project
@@ -16,13 +20,30 @@ from iai_core.repos.storage.binary_repos import (
     ThumbnailBinaryRepo,
     VideoBinaryRepo,
 )
+from iai_core.repos.storage.storage_client import BinaryObjectType
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
 from iai_core.utils.feature_flags import FeatureFlagProvider
 from iai_core.utils.timed_lru_cache import timed_lru_cache
 
-from geti_types import DatasetStorageIdentifier
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier
+
+logger = logging.getLogger(__name__)
 
 FEATURE_FLAG_STORAGE_SIZE_COMPUTATION = "FEATURE_FLAG_STORAGE_SIZE_COMPUTATION"
 
+# Maximum age of the storage usage ledger of a project before it is reconciled again with the storage
+STORAGE_USAGE_RECONCILIATION_INTERVAL_HOURS = int(os.environ.get("STORAGE_USAGE_RECONCILIATION_INTERVAL_HOURS", 24))
+
+# Object types accounted in the size of a project
+PROJECT_SIZE_OBJECT_TYPES = (
+    BinaryObjectType.IMAGES,
+    BinaryObjectType.VIDEOS,
+    BinaryObjectType.THUMBNAILS,
+    BinaryObjectType.TENSORS,
+    BinaryObjectType.MODELS,
+    BinaryObjectType.CODE_DEPLOYMENTS,
+)
+
 # The 10GiB is selected, considering the log is adding 1GiB per day, the user will have
 # 10 days until the system becomes unusable.
 MIN_FREE_SPACE_GIB = int(os.environ.get("MIN_FREE_SPACE_GIB", 5)) + 10
@@ -37,18 +58,18 @@ MSG_ERR_NOT_ENOUGH_SPACE = (
     "should be available."
 )
 
+_reconciliations_lock = threading.Lock()
+_reconciliations_in_progress: set[ID] = set()
 
-@timed_lru_cache(seconds=30)
-def compute_project_size(project: Project) -> float:
+
+def _measure_project_usage(project: Project) -> dict[str, dict[str, int]]:
     """
-    Computes the size of the data in the project. This includes data such as model
-    storages, dataset storages and project storage. Value is only recomputed if it
-    hasn't been computed in the last 5 minutes.
+    Measures the bytes stored by each binary repo of the project by listing its objects in the storage.
 
-    :param project: Project to calculate the size for
-    :return: project size in bytes
+    :param project: Project to measure the usage for
+    :return: Bytes stored by each binary repo, by object type and by owner ID
     """
-    total_size = 0.0
+    usage: dict[str, dict[str, int]] = {str(object_type): {} for object_type in PROJECT_SIZE_OBJECT_TYPES}
 
     # Add the size of all the dataset storage directories
     for dataset_storage_id in project.dataset_storage_ids:
@@ -57,10 +78,9 @@ def compute_project_size(project: Project) -> float:
             project_id=project.id_,
             dataset_storage_id=dataset_storage_id,
         )
-        total_size += ImageBinaryRepo(dataset_storage_identifier).get_object_storage_size()
-        total_size += VideoBinaryRepo(dataset_storage_identifier).get_object_storage_size()
-        total_size += ThumbnailBinaryRepo(dataset_storage_identifier).get_object_storage_size()
-        total_size += TensorBinaryRepo(dataset_storage_identifier).get_object_storage_size()
+        for binary_repo_type in (ImageBinaryRepo, VideoBinaryRepo, ThumbnailBinaryRepo, TensorBinaryRepo):
+            binary_repo = binary_repo_type(dataset_storage_identifier)
+            usage[str(binary_repo.object_type)][str(dataset_storage_id)] = int(binary_repo.get_object_storage_size())
 
     # Add the size of all the model storage directories
     for training_task_node in project.get_trainable_task_nodes():
@@ -69,12 +89,82 @@ def compute_project_size(project: Project) -> float:
             model_storage_identifier = ModelStorageIdentifier(
                 workspace_id=project.workspace_id, project_id=project.id_, model_storage_id=model_storage.id_
             )
-            total_size += ModelBinaryRepo(model_storage_identifier).get_object_storage_size()
+            model_binary_repo = ModelBinaryRepo(model_storage_identifier)
+            usage[str(model_binary_repo.object_type)][str(model_storage.id_)] = int(
+                model_binary_repo.get_object_storage_size()
+            )
 
     # Add the size of extra project files
-    total_size += CodeDeploymentBinaryRepo(project.identifier).get_object_storage_size()
+    code_deployment_binary_repo = CodeDeploymentBinaryRepo(project.identifier)
+    usage[str(code_deployment_binary_repo.object_type)][str(project.id_)] = int(
+        code_deployment_binary_repo.get_object_storage_size()
+    )
+    return usage
+
+
+def reconcile_project_size(project: Project) -> float:
+    """
+    Rebuilds the storage usage ledger of the project from the objects actually present in the storage, correcting
+    the drift caused by failed ledger updates and the objects stored before the ledger was enabled.
+
+    :param project: Project to reconcile the ledger for
+    :return: project size in bytes
+    """
+    usage = _measure_project_usage(project)
+    StorageUsageRepo().set_project_usage(
+        organization_id=CTX_SESSION_VAR.get().organization_id, project_identifier=project.identifier, usage=usage
+    )
+    return float(sum(sum(owner_usage.values()) for owner_usage in usage.values()))
+
+
+def _reconcile_project_size_in_background(project: Project) -> None:
+    with _reconciliations_lock:
+        if project.id_ in _reconciliations_in_progress:
+            return
+        _reconciliations_in_progress.add(project.id_)
+
+    def reconcile() -> None:
+        try:
+            reconcile_project_size(project)
+        except Exception:
+            logger.exception("Failed to reconcile the storage usage of project `%s`.", project.id_)
+        finally:
+            with _reconciliations_lock:
+                _reconciliations_in_progress.discard(project.id_)
+
+    # The session is needed to resolve the organization of the project
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(reconcile,), daemon=True).start()
+
+
+@timed_lru_cache(seconds=30)
+def compute_project_size(project: Project) -> float:
+    """
+    Computes the size of the data in the project. This includes data such as model
+    storages, dataset storages and project storage. Value is only recomputed if it
+    hasn't been computed in the last 30 seconds.
 
-    return total_size
+    If the storage usage ledger is enabled, the size is read from the ledger instead of listing the objects of the
+    project; the ledger is reconciled with the storage the first time it is read, and then in the background once
+    the last reconciliation is older than STORAGE_USAGE_RECONCILIATION_INTERVAL_HOURS.
+
+    :param project: Project to calculate the size for
+    :return: project size in bytes
+    """
+    if not BinaryRepo.is_usage_ledger_enabled():
+        usage = _measure_project_usage(project)
+        return float(sum(sum(owner_usage.values()) for owner_usage in usage.values()))
+
+    project_usage = StorageUsageRepo().get_project_usage(
+        organization_id=CTX_SESSION_VAR.get().organization_id, project_identifier=project.identifier
+    )
+    if project_usage.reconciled_at is None:
+        return reconcile_project_size(project)
+    if datetime.now(timezone.utc) - project_usage.reconciled_at > timedelta(
+        hours=STORAGE_USAGE_RECONCILIATION_INTERVAL_HOURS
+    ):
+        _reconcile_project_size_in_background(project)
+    return float(project_usage.get_size(PROJECT_SIZE_OBJECT_TYPES))
 
 
 def check_free_space_for_upload(
@@ -6,18 +6,30 @@ This module implements a singleton-class that fetches media for a given identifi
 """
 
 import io
+from collections.abc import Sequence
 from typing import BinaryIO
 
 import cv2
 import numpy as np
 
-from iai_core.entities.media import ImageExtensions
+from iai_core.entities.image import Image, NullImage
+from iai_core.entities.media import THUMBNAIL_VARIANT_EXTENSIONS, ImageExtensions, thumbnail_variant_filename
 from iai_core.entities.media_2d import Media2D
-from iai_core.entities.video import VideoFrame
+from iai_core.entities.video import NullVideo, Video, VideoFrame
 from iai_core.repos.storage.binary_repos import ThumbnailBinaryRepo
-from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE
+from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE, THUMBNAIL_VARIANT_SIZES
+from iai_core.utils.iteration import grouper
 
-from geti_types import DatasetStorageIdentifier, ImageIdentifier, MediaIdentifierEntity, Singleton, VideoFrameIdentifier
+from geti_types import (
+    ID,
+    DatasetStorageIdentifier,
+    ImageIdentifier,
+    MediaIdentifierEntity,
+    Singleton,
+    VideoFrameIdentifier,
+)
+
+WEBP_THUMBNAIL_QUALITY = 80
 
 
 class Media2DFactory(metaclass=Singleton):
@@ -53,6 +65,58 @@ class Media2DFactory(metaclass=Singleton):
             f"Could not retrieve 2D-media for `{media_identifier}`, instance of `{repr(media_identifier)}`"
         )
 
+    @staticmethod
+    def get_media_for_identifiers(
+        media_identifiers: Sequence[MediaIdentifierEntity],
+        dataset_storage_identifier: DatasetStorageIdentifier,
+    ) -> list[Media2D]:
+        """
+        Retrieves the media of many identifiers from the database.
+
+        Unlike calling get_media_for_identifier for each identifier, the images and the videos are fetched with one
+        query per chunk of IDs, and each video is fetched only once for all its frames.
+
+        :param media_identifiers: Identifiers of the media to fetch
+        :param dataset_storage_identifier: Identifier of the DS containing the media
+        :return: Media entities, in the same order as the identifiers; NullImage or a frame of NullVideo is returned
+            for the media that are not found
+        """
+        from iai_core.repos import ImageRepo, VideoRepo
+
+        image_ids: set[ID] = set()
+        video_ids: set[ID] = set()
+        for media_identifier in media_identifiers:
+            if isinstance(media_identifier, VideoFrameIdentifier):
+                video_ids.add(media_identifier.media_id)
+            elif isinstance(media_identifier, ImageIdentifier):
+                image_ids.add(media_identifier.media_id)
+            else:
+                raise ValueError(
+                    f"Could not retrieve 2D-media for `{media_identifier}`, instance of `{repr(media_identifier)}`"
+                )
+        image_ids.discard(ID())
+        video_ids.discard(ID())
+
+        images_by_id: dict[ID, Image] = {}
+        if image_ids:
+            image_repo = ImageRepo(dataset_storage_identifier)
+            for image_ids_chunk in grouper(image_ids):
+                images_by_id.update(image_repo.get_image_by_ids(image_ids_chunk))
+        videos_by_id: dict[ID, Video] = {}
+        if video_ids:
+            video_repo = VideoRepo(dataset_storage_identifier)
+            for video_ids_chunk in grouper(video_ids):
+                videos_by_id.update(video_repo.get_by_ids(video_ids_chunk))
+
+        media: list[Media2D] = []
+        for media_identifier in media_identifiers:
+            if isinstance(media_identifier, VideoFrameIdentifier):
+                video = videos_by_id.get(media_identifier.media_id, NullVideo())
+                media.append(VideoFrame(video, media_identifier.frame_index))
+            else:
+                media.append(images_by_id.get(media_identifier.media_id, NullImage()))
+        return media
+
     @staticmethod
     def crop_to_thumbnail(media_numpy: np.ndarray, target_height: int, target_width: int) -> np.ndarray:
         """
@@ -112,3 +176,47 @@ class Media2DFactory(metaclass=Singleton):
             data_source=im_bytes, dst_file_name=thumbnail_binary_filename
         )
         return io.BytesIO(im_bytes)
+
+    @staticmethod
+    def create_and_save_media_thumbnail_variants(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        media_numpy: np.ndarray,
+        thumbnail_binary_filename: str,
+    ) -> BinaryIO:
+        """
+        Creates and saves the thumbnail of the media together with its variants, in all the thumbnail sizes and
+        both in JPEG and WebP format.
+
+        The media is cropped only once, to the largest variant; the smaller variants are downscaled from it.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+        :param media_numpy: Base media to use for thumbnail generation, represented in numpy RGB
+        :param thumbnail_binary_filename: Binary filename of the default thumbnail, the variants are named after it
+        :return: The thumbnail of the default size, in JPEG format
+        """
+        thumbnail_binary_repo = ThumbnailBinaryRepo(dataset_storage_identifier)
+        largest_size = max(THUMBNAIL_VARIANT_SIZES)
+        largest_thumbnail = cv2.cvtColor(
+            Media2DFactory.crop_to_thumbnail(
+                media_numpy=media_numpy, target_height=largest_size, target_width=largest_size
+            ),
+            cv2.COLOR_RGB2BGR,
+        )
+        default_thumbnail_bytes = b""
+        for size in THUMBNAIL_VARIANT_SIZES:
+            im_bgr = (
+                largest_thumbnail
+                if size == largest_size
+                else cv2.resize(largest_thumbnail, (size, size), interpolation=cv2.INTER_AREA)
+            )
+            for extension in THUMBNAIL_VARIANT_EXTENSIONS:
+                params = [cv2.IMWRITE_WEBP_QUALITY, WEBP_THUMBNAIL_QUALITY] if extension == ImageExtensions.WEBP else []
+                _, data = cv2.imencode(extension.value, im_bgr, params)
+                im_bytes = data.tobytes()
+                variant_filename = thumbnail_variant_filename(
+                    thumbnail_filename=thumbnail_binary_filename, size=size, extension=extension
+                )
+                thumbnail_binary_repo.save(data_source=im_bytes, dst_file_name=variant_filename)
+                if variant_filename == thumbnail_binary_filename:
+                    default_thumbnail_bytes = im_bytes
+        return io.BytesIO(default_thumbnail_bytes)
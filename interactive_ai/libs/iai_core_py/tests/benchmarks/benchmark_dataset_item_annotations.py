@@ -0,0 +1,122 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the lookup of the annotations of the dataset items.
+
+The benchmark generates an annotation scene with many small boxes and a set of ROIs on it, like the dataset items
+of the second task of a task chain, then collects the annotations of every ROI comparing:
+  - the linear scan, where the center of every shape of the scene is tested against each ROI and the shapes
+    in the full box are deep-copied
+  - DatasetItem.get_annotations, which queries the spatial index of the annotation scene, built once and shared
+    by all the ROIs, and makes shallow copies of the shapes
+
+Usage:
+    python tests/benchmarks/benchmark_dataset_item_annotations.py --num-boxes 5000 --num-rois 500 --repeat 3
+"""
+
+import argparse
+import copy
+import random
+import time
+
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.dataset_item import DatasetItem
+from iai_core.entities.image import Image
+from iai_core.entities.media import MediaPreprocessing, MediaPreprocessingStatus
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Rectangle
+from iai_core.utils.shape_factory import ShapeFactory
+
+from geti_types import ID
+
+
+def make_annotation_scene(num_boxes: int, num_labels: int) -> AnnotationScene:
+    """Generate an annotation scene with small boxes spread over the whole media"""
+    scored_labels = [ScoredLabel(label_id=ID(f"label_{i}"), is_empty=False) for i in range(num_labels)]
+    annotations = []
+    for _ in range(num_boxes):
+        x1, y1 = random.uniform(0.0, 0.98), random.uniform(0.0, 0.98)
+        shape = Rectangle(x1=x1, y1=y1, x2=x1 + random.uniform(0.001, 0.02), y2=y1 + random.uniform(0.001, 0.02))
+        annotations.append(Annotation(shape=shape, labels=[random.choice(scored_labels)]))
+    return AnnotationScene(kind=AnnotationSceneKind.ANNOTATION, id_=ID("annotation_scene"), annotations=annotations)
+
+
+def make_dataset_items(annotation_scene: AnnotationScene, num_rois: int, roi_size: float) -> list[DatasetItem]:
+    """Generate the dataset items of the scene, one for the full box and one for each ROI"""
+    image = Image(
+        id=ID("image"),
+        name="image",
+        uploader_id="uploader",
+        width=4000,
+        height=3000,
+        size=100,
+        preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.FINISHED),
+    )
+    rois = [Annotation(shape=Rectangle.generate_full_box(), labels=[])]
+    for _ in range(num_rois):
+        x1, y1 = random.uniform(0.0, 1.0 - roi_size), random.uniform(0.0, 1.0 - roi_size)
+        rois.append(Annotation(shape=Rectangle(x1=x1, y1=y1, x2=x1 + roi_size, y2=y1 + roi_size), labels=[]))
+    return [DatasetItem(id_=ID(), media=image, annotation_scene=annotation_scene, roi=roi) for roi in rois]
+
+
+def get_annotations_with_scan(dataset_item: DatasetItem, label_ids: set[ID]) -> list[Annotation]:
+    """Collect the annotations like DatasetItem.get_annotations before the spatial index"""
+    is_full_box = Rectangle.is_full_box(dataset_item.roi.shape)
+    roi_as_box = ShapeFactory.shape_as_rectangle(dataset_item.roi.shape)
+    annotations = []
+    for annotation in dataset_item.annotation_scene.annotations:
+        if not is_full_box and not dataset_item.roi.shape.contains_center(annotation.shape):
+            continue
+        shape_labels = [label for label in annotation.get_labels() if label.id_ in label_ids]
+        if not shape_labels:
+            continue
+        if not is_full_box:
+            shape = annotation.shape.denormalize_wrt_roi_shape(roi_as_box)
+        else:
+            shape = copy.deepcopy(annotation.shape)
+        annotations.append(Annotation(shape=shape, labels=shape_labels, id_=annotation.id_))
+    return annotations
+
+
+def get_annotations_with_index(dataset_item: DatasetItem, label_ids: set[ID]) -> list[Annotation]:
+    return dataset_item.get_annotations(label_ids=label_ids, preserve_id=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-boxes", type=int, default=5000, help="Number of boxes in the annotation scene")
+    parser.add_argument("--num-rois", type=int, default=500, help="Number of ROIs (dataset items) of the scene")
+    parser.add_argument("--roi-size", type=float, default=0.1, help="Side of the ROIs, relative to the media")
+    parser.add_argument("--num-labels", type=int, default=5, help="Number of labels of the boxes")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs timed for each implementation")
+    args = parser.parse_args()
+
+    annotation_scene = make_annotation_scene(num_boxes=args.num_boxes, num_labels=args.num_labels)
+    dataset_items = make_dataset_items(annotation_scene, num_rois=args.num_rois, roi_size=args.roi_size)
+    # Leave out one label, so that the annotations are always filtered and copied
+    label_ids = {ID(f"label_{i}") for i in range(1, args.num_labels)}
+    print(f"Generated a scene with {args.num_boxes} boxes and {len(dataset_items)} dataset items")
+
+    expected_annotations: list[list[Annotation]] = []
+    for name, get_annotations_fn in (
+        ("linear scan", get_annotations_with_scan),
+        ("spatial index", get_annotations_with_index),
+    ):
+        elapsed_times = []
+        for _ in range(args.repeat):
+            # Drop the index built by the previous run, its construction is part of the measurement
+            annotation_scene._shape_center_index = None
+            start_time = time.perf_counter()
+            annotations = [get_annotations_fn(dataset_item, label_ids) for dataset_item in dataset_items]
+            elapsed_times.append(time.perf_counter() - start_time)
+        if not expected_annotations:
+            expected_annotations = annotations
+        elif annotations != expected_annotations:
+            raise RuntimeError(f"The output of '{name}' differs from the linear scan")
+        best_time = min(elapsed_times)
+        num_annotations = sum(len(item_annotations) for item_annotations in annotations)
+        print(f"{name:>16}: {best_time * 1000:9.1f} ms (best of {args.repeat}), {num_annotations} annotations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the label lookups and of the hierarchy relations of a label schema.
+
+The benchmark builds a hierarchical classification schema (one exclusive group per parent label), then processes
+a list of annotations the way the validators and the dataset helpers do: for each label of each annotation, the
+label is looked up by ID and by name and its ancestors and descendants are computed. It compares:
+  - linear scans of the labels of the schema and walks of the label tree, like LabelSchema used to do
+  - LabelSchema and LabelTree as implemented, with the label map by ID and the cached ancestors and descendants
+
+The benchmark does not need any external service.
+
+Usage:
+    python tests/benchmarks/benchmark_label_schema.py --num-labels 1000 --branching 10 --num-annotations 10000
+"""
+
+import argparse
+import random
+import time
+
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.label_schema import LabelGroup, LabelSchema
+
+from geti_types import ID
+
+
+def make_label_schema(num_labels: int, branching: int) -> LabelSchema:
+    """Make a schema of `num_labels` labels, where each label has up to `branching` children in its own group"""
+    label_schema = LabelSchema(id_=ID("label_schema"))
+    labels = [Label(name=f"label {i}", domain=Domain.CLASSIFICATION, id_=ID(f"{i:06d}")) for i in range(num_labels)]
+    label_schema.add_group(LabelGroup(name="root group", labels=labels[:branching]))
+    for parent_index in range(num_labels):
+        first_child_index = (parent_index + 1) * branching
+        children = labels[first_child_index : first_child_index + branching]
+        if not children:
+            break
+        label_schema.add_group(LabelGroup(name=f"children of {parent_index}", labels=children))
+        for child in children:
+            label_schema.add_child(labels[parent_index], child)
+    return label_schema
+
+
+def process_with_linear_scans(label_schema: LabelSchema, label_ids: list[ID]) -> list[tuple[int, int]]:
+    label_tree = label_schema.label_tree
+    result = []
+    for label_id in label_ids:
+        label = next(label for label in label_schema.get_all_labels() if label.id_ == label_id)
+        label = next(other for other in label_schema.get_labels(include_empty=True) if other.name == label.name)
+        ancestors = []
+        parent: Label | None = label
+        while parent is not None:
+            ancestors.append(parent)
+            parent = label_tree.get_parent(parent)
+        descendants = label_tree.descendants(label)
+        result.append((len(ancestors), len(descendants)))
+    return result
+
+
+def process_with_indexes(label_schema: LabelSchema, label_ids: list[ID]) -> list[tuple[int, int]]:
+    result = []
+    for label_id in label_ids:
+        label = label_schema.get_label_by_id(label_id)
+        label = label_schema.get_label_by_name(label.name)  # type: ignore[union-attr]
+        ancestors = label_schema.get_ancestors(label)  # type: ignore[arg-type]
+        descendants = label_schema.get_descendants(label)  # type: ignore[arg-type]
+        result.append((len(ancestors), len(descendants)))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-labels", type=int, default=1000, help="Number of labels in the schema")
+    parser.add_argument("--branching", type=int, default=10, help="Number of children per label")
+    parser.add_argument("--num-annotations", type=int, default=10_000, help="Number of annotation labels to process")
+    args = parser.parse_args()
+
+    label_schema = make_label_schema(num_labels=args.num_labels, branching=args.branching)
+    label_ids = [label.id_ for label in label_schema.get_all_labels()]
+    rng = random.Random(0)
+    annotation_label_ids = [rng.choice(label_ids) for _ in range(args.num_annotations)]
+    print(f"Generated a schema with {len(label_ids)} labels and {len(annotation_label_ids)} annotation labels")
+
+    expected_result: list[tuple[int, int]] = []
+    for name, process_fn in (
+        ("linear scans", process_with_linear_scans),
+        ("indexed", process_with_indexes),
+    ):
+        start_time = time.perf_counter()
+        result = process_fn(label_schema, annotation_label_ids)
+        elapsed = time.perf_counter() - start_time
+        if not expected_result:
+            expected_result = result
+        elif result != expected_result:
+            raise RuntimeError(f"The output of '{name}' differs from the linear scans")
+        print(f"{name:>12}: {elapsed:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
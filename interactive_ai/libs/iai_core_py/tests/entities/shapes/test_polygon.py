@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import copy
 
 import pytest
 
@@ -214,3 +215,19 @@ class TestPolygon:
         area2 = polygon2.get_area()
         assert area == 0.0025000000000000022
         assert area != area2
+
+    def test_polygon_copy(self):
+        """
+        <b>Description:</b>
+        Check Polygon class shallow copy
+
+        <b>Expected results:</b>
+        Test passes if the copy is equal to the polygon and has its own list of points
+        """
+        polygon = self.polygon()
+        polygon_copy = copy.copy(polygon)
+        assert polygon_copy == polygon
+        assert polygon_copy is not polygon
+        assert polygon_copy.points is not polygon.points
+        polygon_copy.points.append(Point(x=0.5, y=0.5))
+        assert len(polygon.points) == len(polygon_copy.points) - 1
@@ -3,8 +3,9 @@
 
 from copy import deepcopy
 
-from iai_core.entities.annotation import AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
 from iai_core.entities.scored_label import LabelSource, ScoredLabel
+from iai_core.entities.shapes import Rectangle
 
 
 class TestAnnotationScene:
@@ -56,3 +57,35 @@ class TestAnnotationScene:
         assert model_ids_no_user_annotations == {model_id_1, model_id_2}
         model_ids_with_user_annotations = annotation_scene.get_model_ids(include_user_annotations=True)
         assert model_ids_with_user_annotations == {model_id_1, model_id_2, model_id_3}
+
+    def test_get_shape_center_index(self, fxt_ote_id) -> None:
+        # Arrange
+        annotations = [
+            Annotation(shape=Rectangle(x1=0.1 * i, y1=0.1 * i, x2=0.1 * i + 0.1, y2=0.1 * i + 0.1), labels=[])
+            for i in range(5)
+        ]
+        annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION,
+            media_identifier=fxt_ote_id(0),
+            id_=fxt_ote_id(1),
+            annotations=annotations,
+        )
+        roi = Rectangle(x1=0.0, y1=0.0, x2=0.3, y2=0.3)
+
+        # Act
+        index = annotation_scene.get_shape_center_index()
+        same_index = annotation_scene.get_shape_center_index()
+        annotation_scene.append_annotation(Annotation(shape=Rectangle(x1=0.0, y1=0.0, x2=0.2, y2=0.2), labels=[]))
+        index_after_append = annotation_scene.get_shape_center_index()
+        annotation_scene.annotations[0].shape = Rectangle(x1=0.8, y1=0.8, x2=0.9, y2=0.9)
+        index_after_shape_update = annotation_scene.get_shape_center_index()
+        copied_annotation_scene = deepcopy(annotation_scene)
+
+        # Assert
+        assert same_index is index
+        assert index.get_indices_of_centers_in(roi) == [0, 1, 2]
+        assert index_after_append is not index
+        assert index_after_append.get_indices_of_centers_in(roi) == [0, 1, 2, 5]
+        assert index_after_shape_update is not index_after_append
+        assert index_after_shape_update.get_indices_of_centers_in(roi) == [1, 2, 5]
+        assert copied_annotation_scene._shape_center_index is None
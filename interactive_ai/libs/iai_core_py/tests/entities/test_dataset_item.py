@@ -468,6 +468,62 @@ class TestDatasetItem:
         )
         assert ignore_labels_dataset_item.get_annotations(include_empty=True) == []
 
+        # Check that the shapes returned for a full box ROI are copies of the original shapes
+        result_annotations = full_box_roi_dataset_item.get_annotations(include_empty=True)
+        for result_annotation, annotation in zip(
+            result_annotations, full_box_roi_dataset_item.annotation_scene.annotations
+        ):
+            assert result_annotation.shape is not annotation.shape
+            assert result_annotation.shape == annotation.shape
+
+    def test_dataset_item_get_annotations_many_rois(self):
+        """
+        <b>Description:</b>
+        Check DatasetItem class "get_annotations" method with many ROIs on the same annotation scene
+
+        <b>Input data:</b>
+        Annotation scene with a grid of rectangles, dataset items for several ROIs of the scene
+
+        <b>Expected results:</b>
+        Test passes if, for each ROI, the returned annotations are the ones whose center is in the ROI, in order
+        """
+        labels = DatasetItemParameters.labels()
+        scored_label = ScoredLabel(label_id=labels[0].id_, is_empty=labels[0].is_empty)
+        annotations = [
+            Annotation(
+                shape=Rectangle(x1=x / 20, y1=y / 20, x2=(x + 1.5) / 20, y2=(y + 1.5) / 20), labels=[scored_label]
+            )
+            for y in range(18)
+            for x in range(18)
+        ]
+        annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION, id_=ID("annotation_scene"), annotations=annotations
+        )
+        image = DatasetItemParameters.generate_random_image()
+        roi_shapes = [Rectangle(x1=c / 10, y1=c / 20, x2=c / 10 + 0.25, y2=c / 20 + 0.5) for c in range(8)]
+        roi_shapes.append(Polygon([Point(0.1, 0.1), Point(0.9, 0.2), Point(0.5, 0.8), Point(0.1, 0.1)]))
+        shape_center_index = annotation_scene.get_shape_center_index()
+
+        for roi_shape in roi_shapes:
+            dataset_item = DatasetItem(
+                id_=ID(),
+                media=image,
+                annotation_scene=annotation_scene,
+                roi=Annotation(shape=roi_shape, labels=[]),
+            )
+            expected_annotations = [
+                annotation for annotation in annotations if roi_shape.contains_center(annotation.shape)
+            ]
+
+            result_annotations = dataset_item.get_annotations(preserve_id=True)
+
+            assert expected_annotations
+            assert [annotation.id_ for annotation in result_annotations] == [
+                annotation.id_ for annotation in expected_annotations
+            ]
+        # The spatial index of the scene is reused for all the ROIs
+        assert annotation_scene._shape_center_index is shape_center_index
+
     def test_dataset_item_append_annotations(self):
         """
         <b>Description:</b>
@@ -3,6 +3,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import copy
 from unittest.mock import patch
 
 import pytest
@@ -832,6 +833,42 @@ class TestLabelTree:
         # Checking __eq__ method for comparing LabelTree object with different type object
         assert not isinstance(label_tree, str)
 
+    def test_label_tree_relations_cache(self):
+        """
+        <b>Description:</b>
+        Check that the cached ancestors and descendants of LabelTree are invalidated when the tree changes
+
+        <b>Input data:</b>
+        LabelTree object with children
+
+        <b>Expected results:</b>
+        Test passes if "get_ancestors" and "get_descendants" return the updated relations after "add_child"
+        and "remove_node", and if the returned lists can be modified without altering the cache
+
+        <b>Steps</b>
+        1. Get the ancestors and descendants to populate the cache, then modify the returned lists
+        2. Add a child and check the updated relations
+        3. Remove a node and check the updated relations
+        """
+        label_tree = self.label_tree()
+        label_tree.get_ancestors(labels.label_0_1_3).clear()
+        label_tree.get_descendants(labels.label_0).clear()
+        self.check_get_ancestors_method(label_tree)
+        self.check_get_descendants_method(label_tree)
+        # Checking relations after "add_child" method
+        label_tree.add_child(labels.label_0_1_3, labels.non_included_label)
+        assert label_tree.get_ancestors(labels.non_included_label) == [
+            labels.non_included_label,
+            labels.label_0_1_3,
+            labels.label_0_1,
+            labels.label_0,
+        ]
+        assert label_tree.get_descendants(labels.label_0_1) == [labels.label_0_1_3, labels.non_included_label]
+        # Checking relations after "remove_node" method
+        label_tree.remove_node(labels.label_0_1_3)
+        assert label_tree.get_ancestors(labels.non_included_label) == [labels.non_included_label]
+        assert label_tree.get_descendants(labels.label_0_1) == []
+
 
 class TestLabelSchemaGroupEntity:
     @staticmethod
@@ -1345,6 +1382,78 @@ class TestLabelSchema:
         assert retrieved_existing_label == label
         assert retrieved_non_existing_label is None
 
+    def test_label_lookups_after_mutation(self, fxt_label_schema_example) -> None:
+        """
+        <b>Description:</b>
+        Check that the label lookups by ID and by name reflect the changes of the schema
+
+        <b>Input data:</b>
+        LabelSchema instance
+
+        <b>Expected results:</b>
+        The lookups find the labels of added groups and the labels added or renamed in place, and not the labels
+        removed from a group; deleted labels are still found by ID but not by name.
+
+        <b>Steps</b>
+        1. Look up a label to build the label map
+        2. Add a group and look up its label
+        3. Rename a label in place and look it up
+        4. Append a label to a group directly and look it up
+        5. Remove a label from its group and look it up
+        6. Delete a label and look it up
+        """
+        label_schema: LabelSchema = fxt_label_schema_example.label_schema
+        flowering: Label = fxt_label_schema_example.flowering
+        new_label = Label(name="new label", domain=Domain.CLASSIFICATION, id_=ID("new_label_id"))
+        assert label_schema.get_label_by_name(label_name=flowering.name) == flowering
+
+        label_schema.add_group(LabelGroup(name="new group", labels=[new_label]))
+        assert label_schema.get_label_by_id(label_id=new_label.id_) == new_label
+        assert label_schema.get_label_by_name(label_name=new_label.name) == new_label
+
+        new_label.name = "renamed label"
+        assert label_schema.get_label_by_name(label_name="new label") is None
+        assert label_schema.get_label_by_name(label_name="renamed label") == new_label
+
+        new_group = next(group for group in label_schema._groups if group.name == "new group")
+        appended_label = Label(name="appended label", domain=Domain.CLASSIFICATION, id_=ID("appended_label_id"))
+        new_group.labels.append(appended_label)
+        assert label_schema.get_label_by_id(label_id=appended_label.id_) == appended_label
+
+        new_group.remove_label(new_label)
+        assert label_schema.get_label_by_id(label_id=new_label.id_) is None
+        assert label_schema.get_label_by_name(label_name=new_label.name) is None
+
+        label_schema.deleted_label_ids = [flowering.id_]
+        assert label_schema.get_label_by_id(label_id=flowering.id_) == flowering
+        assert label_schema.get_label_by_name(label_name=flowering.name) is None
+
+    def test_label_lookups_after_mutation_of_a_copy(self, fxt_label_schema_example) -> None:
+        """
+        <b>Description:</b>
+        Check that the label map of a schema is not affected by the changes of another schema
+
+        <b>Input data:</b>
+        LabelSchema instance and a deep copy of it
+
+        <b>Expected results:</b>
+        A label removed from a group of the copy is not found in the copy, and is still found in the original
+        schema without rebuilding its label map.
+        """
+        label_schema: LabelSchema = fxt_label_schema_example.label_schema
+        flowering: Label = fxt_label_schema_example.flowering
+        assert label_schema.get_label_by_id(label_id=flowering.id_) == flowering
+        label_schema_copy = copy.deepcopy(label_schema)
+        assert label_schema_copy.get_label_by_id(label_id=flowering.id_) == flowering
+
+        group_copy = next(group for group in label_schema_copy._groups if flowering in group.labels)
+        group_copy.remove_label(flowering)
+
+        assert label_schema_copy.get_label_by_id(label_id=flowering.id_) is None
+        with patch.object(label_schema, "get_all_labels") as mock_get_all_labels:
+            assert label_schema.get_label_by_id(label_id=flowering.id_) == flowering
+        mock_get_all_labels.assert_not_called()
+
     def test_add_label_relations_for_task(self, fxt_ote_id) -> None:
         """
         Test 'add_label_relations_for_task' in a complex scenario:
@@ -0,0 +1,42 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import pytest
+
+from iai_core.entities.media import (
+    ImageExtensions,
+    select_thumbnail_variant_size,
+    thumbnail_filename_prefix,
+    thumbnail_variant_filename,
+)
+
+
+class TestThumbnailVariants:
+    def test_thumbnail_variant_filename(self) -> None:
+        assert (
+            thumbnail_variant_filename("image_id_thumbnail.jpg", size=256, extension=ImageExtensions.JPG)
+            == "image_id_thumbnail.jpg"
+        )
+        assert (
+            thumbnail_variant_filename("image_id_thumbnail.jpg", size=256, extension=ImageExtensions.WEBP)
+            == "image_id_thumbnail_256.webp"
+        )
+        assert (
+            thumbnail_variant_filename("image_id_thumbnail.jpg", size=128, extension=ImageExtensions.JPG)
+            == "image_id_thumbnail_128.jpg"
+        )
+        # The thumbnail and all its variants can be deleted by prefix
+        prefix = thumbnail_filename_prefix("image_id_thumbnail.jpg")
+        assert prefix == "image_id_thumbnail"
+        assert all(
+            thumbnail_variant_filename("image_id_thumbnail.jpg", size=size, extension=extension).startswith(prefix)
+            for size in (128, 256, 512)
+            for extension in (ImageExtensions.JPG, ImageExtensions.WEBP)
+        )
+
+    @pytest.mark.parametrize(
+        "requested_size, expected_size",
+        [(1, 128), (128, 128), (129, 256), (256, 256), (300, 512), (2000, 512)],
+    )
+    def test_select_thumbnail_variant_size(self, requested_size, expected_size) -> None:
+        assert select_thumbnail_variant_size(requested_size) == expected_size
@@ -5,8 +5,10 @@ from unittest.mock import patch
 
 import pytest
 from pymongo import UpdateOne
+from pymongo.collection import Collection
 from pymongo.results import DeleteResult
 
+from iai_core.repos.base.identity_map import CTX_IDENTITY_MAP_VAR, identity_map_context
 from iai_core.repos.base.session_repo import QueryAccessMode
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
@@ -185,6 +187,55 @@ class TestSessionBasedRepo:
         mock_find_one.assert_called_once_with({"_id": str(instance.id_)})
         assert found_object == instance
 
+    @pytest.mark.parametrize("identity_mapped", [False, True], ids=["not identity-mapped", "identity-mapped"])
+    def test_get_by_id_with_identity_map(
+        self, fxt_session_repo, fxt_mappable_object, fxt_mapper, identity_mapped
+    ) -> None:
+        session = make_session()
+        repos = [fxt_session_repo(session) for _ in range(4)]
+        instance = fxt_mappable_object(x=3)
+        instance_doc = fxt_mapper.forward(instance)
+
+        with (
+            identity_map_context() as identity_map,
+            patch.object(type(repos[0]), "identity_mapped", identity_mapped),
+            patch.object(Collection, "find_one", return_value=instance_doc) as mock_find_one,
+            patch.object(Collection, "delete_one", return_value=DeleteResult({"n": 1}, True)),
+        ):
+            # Each lookup uses a new repo, as it happens across the code paths of a request
+            found_objects = [repo.get_by_id(instance.id_) for repo in repos[:3]]
+            find_count_before_delete = mock_find_one.call_count
+            repos[3].delete_by_id(instance.id_)
+            repos[3].get_by_id(instance.id_)
+
+        assert all(found_object == instance for found_object in found_objects)
+        if identity_mapped:
+            assert find_count_before_delete == 1
+            assert found_objects[0] is found_objects[1] is found_objects[2]
+            # only the lookup after the deletion fetched the document again
+            assert identity_map.duplicate_reads.total() == 1
+        else:
+            assert find_count_before_delete == 3
+            assert identity_map.duplicate_reads.total() == 3
+        assert CTX_IDENTITY_MAP_VAR.get() is None
+
+    def test_save_with_identity_map(self, fxt_session_repo, fxt_mappable_object) -> None:
+        session = make_session()
+        repo = fxt_session_repo(session)
+        instance = fxt_mappable_object(x=3)
+
+        with (
+            identity_map_context(),
+            patch.object(type(repo), "identity_mapped", True),
+            patch.object(repo._collection, "update_one"),
+            patch.object(repo._collection, "find_one") as mock_find_one,
+        ):
+            repo.save(instance)
+            found_object = repo.get_by_id(instance.id_)
+
+        mock_find_one.assert_not_called()
+        assert found_object is instance
+
     @pytest.mark.parametrize("latest", [False, True], ids=["sort by latest", "no sort"])
     def test_get_one(self, fxt_session_repo, fxt_mappable_object, fxt_mapper, latest) -> None:
         session = make_session()
@@ -14,7 +14,7 @@ from urllib3.exceptions import ReadTimeoutError
 
 from iai_core.adapters.binary_interpreters import RAWBinaryInterpreter
 from iai_core.entities.model_storage import ModelStorageIdentifier
-from iai_core.repos.storage.binary_repo import BinaryRepo
+from iai_core.repos.storage.binary_repo import FEATURE_FLAG_STORAGE_USAGE_LEDGER, BinaryRepo
 from iai_core.repos.storage.binary_repos import (
     CodeDeploymentBinaryRepo,
     ImageBinaryRepo,
@@ -30,8 +30,9 @@ from iai_core.repos.storage.object_storage import (
 )
 from iai_core.repos.storage.s3_connector import S3Connector
 from iai_core.repos.storage.storage_client import BinaryObjectType
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
 
-from geti_types import DatasetStorageIdentifier
+from geti_types import DatasetStorageIdentifier, ProjectIdentifier
 from geti_types.session import DEFAULT_ORGANIZATION_ID
 
 
@@ -395,6 +396,35 @@ class TestBinaryRepoS3Storage:
                 bucket_name=fxt_binary_object_type.bucket_name(),
             )
 
+    def test_delete_by_prefix_s3(self, request, fxt_binary_repo) -> None:
+        # Enable feature flag
+        set_object_storage_env_variables(s3_credentials_provider="local")
+        request.addfinalizer(unset_object_storage_env_variables)
+        listed_objects = [
+            Mock(object_name="base/dummy_thumbnail.jpg", size=10, is_dir=False),
+            Mock(object_name="base/dummy_thumbnail_128.webp", size=5, is_dir=False),
+        ]
+
+        # Patch minio related methods
+        with (
+            patch.object(Minio, "list_objects", return_value=listed_objects) as mock_list_objects,
+            patch.object(Minio, "remove_objects", return_value=[]) as mock_remove_objects,
+            patch.object(BinaryRepo, "_record_usage") as mock_record_usage,
+            patch.dict(os.environ, {FEATURE_FLAG_STORAGE_USAGE_LEDGER: "true"}),
+        ):
+            # Call the tested method
+            binary_repo = fxt_binary_repo()
+            binary_repo.delete_by_prefix(prefix="dummy_thumbnail")
+
+            # Assert that the objects are listed and deleted at once, and that their size is freed
+            mock_list_objects.assert_called_once_with(
+                binary_repo.storage_client.bucket_name,
+                prefix=os.path.join(binary_repo.storage_client.object_name_base, "dummy_thumbnail"),
+            )
+            deleted_objects = mock_remove_objects.call_args.kwargs["delete_object_list"]
+            assert [obj._name for obj in deleted_objects] == [obj.object_name for obj in listed_objects]
+            mock_record_usage.assert_called_once_with(-15)
+
     def test_delete_all_s3(
         self,
         request,
@@ -679,6 +709,21 @@ class TestBinaryRepoLocalStorage:
         with pytest.raises(FileNotFoundError):
             binary_repo.get_by_filename(filename=filename, binary_interpreter=RAWBinaryInterpreter())
 
+    def test_delete_by_prefix_local(self, request, fxt_dataset_storage_identifier, fxt_dataset_storage) -> None:
+        binary_repo = ThumbnailBinaryRepo(fxt_dataset_storage_identifier)
+        request.addfinalizer(binary_repo.delete_all)
+        for filename in ("media_1_thumbnail.jpg", "media_1_thumbnail_128.webp", "media_2_thumbnail.jpg"):
+            binary_repo.save(dst_file_name=filename, data_source=b"dummy_content")
+
+        with patch("iai_core.repos.storage.binary_repo.StorageUsageRepo") as mock_storage_usage_repo:
+            binary_repo.delete_by_prefix(prefix="media_1_thumbnail")
+
+        # The storage usage ledger is disabled
+        mock_storage_usage_repo.assert_not_called()
+        assert not binary_repo.exists(filename="media_1_thumbnail.jpg")
+        assert not binary_repo.exists(filename="media_1_thumbnail_128.webp")
+        assert binary_repo.exists(filename="media_2_thumbnail.jpg")
+
     def test_delete_all_local(self, request, fxt_ote_id) -> None:
         # Create two different workspaces and dataset storages, and two different binary repos
         ws_1_id, ws_2_id = fxt_ote_id(1), fxt_ote_id(2)
@@ -736,3 +781,47 @@ class TestBinaryRepoLocalStorage:
         # Remove the data at the URL and assert "exists" is now false
         binary_repo.delete_by_filename(filename)
         assert not binary_repo.exists(filename=filename)
+
+    def test_storage_usage_ledger_local(self, request, tmp_path, fxt_dataset_storage_identifier) -> None:
+        project_identifier = ProjectIdentifier(
+            workspace_id=fxt_dataset_storage_identifier.workspace_id,
+            project_id=fxt_dataset_storage_identifier.project_id,
+        )
+        storage_usage_repo = StorageUsageRepo()
+        request.addfinalizer(
+            lambda: storage_usage_repo.delete_project_usage(
+                organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier
+            )
+        )
+        src_file_path = tmp_path / "myfile.jpg"
+        src_file_path.write_bytes(b"dummy_file_content")
+
+        def get_recorded_size() -> int:
+            return storage_usage_repo.get_project_usage(
+                organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier
+            ).get_size([BinaryObjectType.IMAGES])
+
+        with patch.dict(os.environ, {FEATURE_FLAG_STORAGE_USAGE_LEDGER: "true"}):
+            binary_repo = ImageBinaryRepo(fxt_dataset_storage_identifier)
+            request.addfinalizer(binary_repo.delete_all)
+
+            filename = binary_repo.save(dst_file_name="dummy.file", data_source=b"dummy_content")
+            binary_repo.save(data_source=str(src_file_path))
+            assert get_recorded_size() == len(b"dummy_content") + len(b"dummy_file_content")
+
+            # Replacing a file only records the size difference
+            binary_repo.save(dst_file_name=filename, data_source=b"dummy", overwrite=True, replaces_existing=True)
+            assert get_recorded_size() == len(b"dummy") + len(b"dummy_file_content")
+
+            # The size known by the caller is recorded without requesting it from the storage
+            with patch.object(binary_repo.storage_client, "get_object_size") as mock_get_object_size:
+                binary_repo.save(dst_file_name="other.file", data_source=b"other")
+                binary_repo.delete_by_filename(filename="other.file", size=len(b"other"))
+            mock_get_object_size.assert_not_called()
+            assert get_recorded_size() == len(b"dummy") + len(b"dummy_file_content")
+
+            binary_repo.delete_by_filename(filename=filename)
+            assert get_recorded_size() == len(b"dummy_file_content")
+
+            binary_repo.delete_all()
+            assert get_recorded_size() == 0
@@ -0,0 +1,34 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import os
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from iai_core.repos.storage.packed_tensors import PackedTensorWriter
+
+
+class TestPackedTensorWriter:
+    def test_callbacks_run_after_upload(self) -> None:
+        events: list[str] = []
+        tensor_binary_repo = MagicMock()
+        tensor_binary_repo.save.side_effect = lambda data_source, dst_file_name, **kwargs: events.append(
+            f"upload {dst_file_name} ({os.path.getsize(data_source)} bytes)"
+        )
+        array = np.zeros((4, 4), dtype=np.float32)
+        writer = PackedTensorWriter(tensor_binary_repo=tensor_binary_repo, max_container_size=100)
+
+        first_location = writer.append(array, on_upload=lambda: events.append("save 0"))
+        # The first container exceeds the maximum size, but it is uploaded only when the next tensor is appended
+        assert events == []
+        second_location = writer.append(array, on_upload=lambda: events.append("save 1"))
+        writer.flush()
+
+        assert first_location.container_filename != second_location.container_filename
+        assert events == [
+            f"upload {first_location.container_filename} ({first_location.length} bytes)",
+            "save 0",
+            f"upload {second_location.container_filename} ({second_location.length} bytes)",
+            "save 1",
+        ]
@@ -0,0 +1,69 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from iai_core.entities.model_storage import ModelStorageIdentifier
+from iai_core.repos.storage.storage_client import BinaryObjectType
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
+
+from geti_types import DatasetStorageIdentifier, ProjectIdentifier
+from geti_types.session import DEFAULT_ORGANIZATION_ID
+
+
+class TestStorageUsageRepo:
+    def test_increment_and_reset(self, request, fxt_ote_id) -> None:
+        project_identifier = ProjectIdentifier(workspace_id=fxt_ote_id(1), project_id=fxt_ote_id(2))
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=project_identifier.workspace_id,
+            project_id=project_identifier.project_id,
+            dataset_storage_id=fxt_ote_id(3),
+        )
+        model_storage_identifier = ModelStorageIdentifier(
+            workspace_id=project_identifier.workspace_id,
+            project_id=project_identifier.project_id,
+            model_storage_id=fxt_ote_id(4),
+        )
+        repo = StorageUsageRepo()
+        request.addfinalizer(
+            lambda: repo.delete_project_usage(
+                organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier
+            )
+        )
+
+        repo.increment(DEFAULT_ORGANIZATION_ID, dataset_storage_identifier, BinaryObjectType.IMAGES, 100)
+        repo.increment(DEFAULT_ORGANIZATION_ID, dataset_storage_identifier, BinaryObjectType.IMAGES, -30)
+        repo.increment(DEFAULT_ORGANIZATION_ID, dataset_storage_identifier, BinaryObjectType.THUMBNAILS, 10)
+        repo.increment(DEFAULT_ORGANIZATION_ID, model_storage_identifier, BinaryObjectType.MODELS, 1000)
+        repo.increment(DEFAULT_ORGANIZATION_ID, project_identifier, BinaryObjectType.CODE_DEPLOYMENTS, 5)
+        usage = repo.get_project_usage(organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier)
+
+        assert usage.reconciled_at is None
+        assert usage.get_size([BinaryObjectType.IMAGES]) == 70
+        assert usage.get_size([BinaryObjectType.IMAGES, BinaryObjectType.MODELS]) == 1070
+        assert usage.get_size([BinaryObjectType.VIDEOS]) == 0
+
+        repo.reset(DEFAULT_ORGANIZATION_ID, dataset_storage_identifier, BinaryObjectType.IMAGES)
+        usage = repo.get_project_usage(organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier)
+
+        assert usage.get_size([BinaryObjectType.IMAGES]) == 0
+        assert usage.get_size(BinaryObjectType) == 1015
+
+    def test_set_and_delete_project_usage(self, fxt_ote_id) -> None:
+        project_identifier = ProjectIdentifier(workspace_id=fxt_ote_id(1), project_id=fxt_ote_id(2))
+        repo = StorageUsageRepo()
+        repo.increment(DEFAULT_ORGANIZATION_ID, project_identifier, BinaryObjectType.CODE_DEPLOYMENTS, 5)
+
+        repo.set_project_usage(
+            organization_id=DEFAULT_ORGANIZATION_ID,
+            project_identifier=project_identifier,
+            usage={str(BinaryObjectType.IMAGES): {str(fxt_ote_id(3)): 42}},
+        )
+        usage = repo.get_project_usage(organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier)
+
+        assert usage.reconciled_at is not None
+        assert usage.get_size(BinaryObjectType) == 42
+
+        repo.delete_project_usage(organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier)
+        usage = repo.get_project_usage(organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=project_identifier)
+
+        assert usage.reconciled_at is None
+        assert usage.usage == {}
@@ -748,3 +748,52 @@ class TestAnnotationSceneRepo:
         assert user_annotation_scenes == 1
         assert pred_annotation_scenes == 2
         assert len(all_annotation_scenes) == user_annotation_scenes + pred_annotation_scenes
+
+    def test_get_all_non_empty_by_kind(self, request) -> None:
+        """
+        <b>Description:</b>
+        Check that the latest non-empty annotation scenes can be retrieved in chunks
+
+        <b>Input data:</b>
+        Project with 4 annotated images
+
+        <b>Expected results:</b>
+        Test passes if only the latest annotation scenes with annotations are returned,
+        in chunks of at most the requested size
+
+        <b>Steps</b>
+        1. Create Project and save a newer, empty annotation scene for one of the images
+        2. Retrieve the non-empty annotation scenes in chunks of 2
+        3. Check the chunks and the retrieved scenes
+        """
+        register_model_template(request, type(None), "classification", "CLASSIFICATION", trainable=True)
+        project = generate_random_annotated_project(
+            test_case=request,
+            name="__Test annotation repo",
+            description="TestRepos()",
+            model_template_id="classification",
+            number_of_images=4,
+            number_of_videos=0,
+        )[0]
+        dataset_storage = project.get_training_dataset_storage()
+        ann_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+        request.addfinalizer(lambda: ann_scene_repo.delete_all())
+        annotation_scenes = list(ann_scene_repo.get_all_by_kind(kind=AnnotationSceneKind.ANNOTATION))
+        assert len(annotation_scenes) == 4
+        emptied_scene = annotation_scenes[0]
+        ann_scene_repo.save(
+            AnnotationScene(
+                kind=AnnotationSceneKind.ANNOTATION,
+                media_identifier=emptied_scene.media_identifier,
+                media_height=emptied_scene.media_height,
+                media_width=emptied_scene.media_width,
+                id_=AnnotationSceneRepo.generate_id(),
+                annotations=[],
+            )
+        )
+
+        chunks = list(ann_scene_repo.get_all_non_empty_by_kind(kind=AnnotationSceneKind.ANNOTATION, chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert {scene.id_ for chunk in chunks for scene in chunk} == {scene.id_ for scene in annotation_scenes[1:]}
+        assert all(scene.annotations for chunk in chunks for scene in chunk)
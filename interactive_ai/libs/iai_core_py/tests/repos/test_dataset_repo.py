@@ -153,6 +153,37 @@ class TestDatasetItemRepo:
         mock_ann_scene_save.assert_called_once_with(dataset_item.annotation_scene, mongodb_session=None)
         mock_save_many.assert_called_once_with([dataset_item], mongodb_session=None)
 
+    def test_save_many_copy_on_write(
+        self,
+        request,
+        fxt_dataset_storage_persisted,
+        fxt_dataset_identifier,
+        fxt_dataset_item,
+    ) -> None:
+        dataset_item_repo = _DatasetItemRepo(fxt_dataset_identifier)
+        persisted_scene_item: DatasetItem = fxt_dataset_item(1)
+        persisted_scene_item.annotation_scene.mark_as_persisted()
+        new_scene = AnnotationScene(
+            kind=AnnotationSceneKind.INTERMEDIATE,
+            media_identifier=persisted_scene_item.media_identifier,
+            media_height=persisted_scene_item.media.height,
+            media_width=persisted_scene_item.media.width,
+            id_=AnnotationSceneRepo.generate_id(),
+        )
+        new_scene_item = DatasetItem(
+            id_=DatasetRepo.generate_id(), media=persisted_scene_item.media, annotation_scene=new_scene
+        )
+        dataset_items = [persisted_scene_item, new_scene_item]
+
+        with (
+            patch.object(SessionBasedRepo, "save_many") as mock_save_many,
+            patch.object(AnnotationSceneRepo, "save") as mock_ann_scene_save,
+        ):
+            dataset_item_repo.save_many_copy_on_write(dataset_items)
+
+        mock_ann_scene_save.assert_called_once_with(new_scene, mongodb_session=None)
+        mock_save_many.assert_called_once_with(dataset_items, mongodb_session=None)
+
     def test_get_all_docs(
         self,
         request,
@@ -549,6 +580,27 @@ class TestDatasetRepo:
             )
             mock_save.assert_called_once_with(fxt_dataset, mongodb_session=None)
 
+    def test_save_snapshot(self, fxt_dataset_storage_identifier, fxt_dataset) -> None:
+        # Arrange
+        dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
+        assert len(fxt_dataset) == 3
+
+        with (
+            patch.object(_DatasetItemRepo, "save_many_copy_on_write") as mock_save_many_items,
+            patch.object(_DatasetItemRepo, "save_many_deep") as mock_save_many_deep,
+            patch.object(SessionBasedRepo, "save") as mock_save,
+        ):
+            # Act
+            dataset_repo.save_snapshot(fxt_dataset)
+
+            # Assert
+            mock_save_many_items.assert_called_once_with(
+                instances=tuple(fxt_dataset),
+                mongodb_session=None,
+            )
+            mock_save_many_deep.assert_not_called()
+            mock_save.assert_called_once_with(fxt_dataset, mongodb_session=None)
+
     def test_save_immutable(self, fxt_dataset_storage_identifier) -> None:
         """Test that immutable datasets cannot be saved twice"""
         dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
@@ -578,6 +630,40 @@ class TestDatasetRepo:
         # Assert
         assert len(dataset_repo.get_by_id(dataset.id_)) == 4
 
+    def test_add_items_to_dataset_deep(self, fxt_dataset_storage_identifier, fxt_dataset_item, fxt_ote_id) -> None:
+        # Arrange
+        dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
+        dataset_items = [fxt_dataset_item(i) for i in range(2)]
+
+        with (
+            patch.object(_DatasetItemRepo, "save_many_deep") as mock_save_many_deep,
+            patch.object(_DatasetItemRepo, "save_many_shallow") as mock_save_many_shallow,
+        ):
+            # Act
+            dataset_repo.add_items_to_dataset(dataset_id=fxt_ote_id(1), dataset_items=dataset_items, deep=True)
+
+            # Assert
+            mock_save_many_deep.assert_called_once_with(instances=dataset_items)
+            mock_save_many_shallow.assert_not_called()
+
+    def test_save_without_items(self, request, fxt_dataset_storage_identifier, fxt_dataset_item) -> None:
+        # Arrange
+        dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
+        request.addfinalizer(lambda: dataset_repo.delete_all())
+        dataset_items = [fxt_dataset_item(i) for i in range(4)]
+        dataset = Dataset(id=dataset_repo.generate_id(), items=dataset_items)
+        dataset_repo.add_items_to_dataset(dataset_id=dataset.id_, dataset_items=dataset_items[:2])
+        dataset_repo.add_items_to_dataset(dataset_id=dataset.id_, dataset_items=dataset_items[2:])
+
+        with patch.object(_DatasetItemRepo, "save_many_shallow") as mock_save_many_items:
+            # Act
+            dataset_repo.save_without_items(dataset)
+
+        # Assert
+        mock_save_many_items.assert_not_called()
+        assert not dataset.ephemeral
+        assert len(dataset_repo.get_by_id(dataset.id_)) == 4
+
     def test_get_items_from_dataset(self, request, fxt_dataset_storage_identifier, fxt_dataset_item) -> None:
         # Arrange
         dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
@@ -505,6 +505,52 @@ class TestDatasetStorageFilterRepo:
         assert len(retrieved_annotated_media_identifiers) == 2
         assert set(retrieved_annotated_media_identifiers).issubset(set(annotated_media_identifiers))
 
+    def test_get_annotated_media_identifiers_and_states(
+        self,
+        request,
+        fxt_dataset_storage_persisted,
+        fxt_dataset_storage_filter_data_video,
+        fxt_mongo_id,
+    ) -> None:
+        """
+        <b>Description:</b>
+        Check that the annotated images and video frames are obtained with their media annotation state.
+
+        <b>Input data:</b>
+        One annotated image, one partially annotated video frame and one unannotated image
+
+        <b>Expected results:</b>
+        Test passes if only the annotated image and the partially annotated frame are returned, with their states
+
+        <b>Steps</b>
+        1. Create test data
+        2. Save test data to the repo
+        3. Get the annotated media identifiers and states
+        4. Check that the unannotated image is excluded and that the states are correct
+        """
+        repo = DatasetStorageFilterRepo(fxt_dataset_storage_persisted.identifier)
+        repo.delete_all()
+        request.addfinalizer(lambda: repo.delete_all())
+        annotated_image = ImageIdentifier(image_id=ID(fxt_mongo_id(1)))
+        partially_annotated_frame = VideoFrameIdentifier(video_id=ID(fxt_mongo_id(2)), frame_index=6)
+        unannotated_image = ImageIdentifier(image_id=ID(fxt_mongo_id(3)))
+        media_states = (
+            (annotated_image, AnnotationState.ANNOTATED),
+            (partially_annotated_frame, AnnotationState.PARTIALLY_ANNOTATED),
+            (unannotated_image, AnnotationState.NONE),
+        )
+        for media_identifier, annotation_state in media_states:
+            fxt_dataset_storage_filter_data_video.media_identifier = media_identifier
+            fxt_dataset_storage_filter_data_video.media_annotation_state = annotation_state
+            repo.upsert_dataset_storage_filter_data(fxt_dataset_storage_filter_data_video)
+
+        annotated_media_states = set(repo.get_annotated_media_identifiers_and_states())
+
+        assert annotated_media_states == {
+            (annotated_image, AnnotationState.ANNOTATED),
+            (partially_annotated_frame, AnnotationState.PARTIALLY_ANNOTATED),
+        }
+
     def test_get_video_annotation_statistics(
         self,
         request,
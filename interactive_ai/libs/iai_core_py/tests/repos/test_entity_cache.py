@@ -0,0 +1,56 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from iai_core.repos.entity_cache import VersionedEntityCache
+
+from geti_types import ID, ProjectIdentifier
+
+ORGANIZATION_ID = ID("organization_id")
+PROJECT_IDENTIFIER = ProjectIdentifier(workspace_id=ID("workspace_id"), project_id=ID("project_id"))
+
+
+class TestVersionedEntityCache:
+    def test_get_put(self) -> None:
+        cache: VersionedEntityCache[dict] = VersionedEntityCache(name="test")
+        key = (ORGANIZATION_ID, PROJECT_IDENTIFIER.workspace_id, PROJECT_IDENTIFIER.project_id)
+        entity = {"name": "project"}
+
+        assert cache.get(key, version=1) is None
+        cache.put(key, version=1, entity=entity)
+        entity["name"] = "modified after caching"
+        cached_entity = cache.get(key, version=1)
+        outdated_entity = cache.get(key, version=2)
+
+        assert cached_entity == {"name": "project"}
+        assert outdated_entity is None
+        # The caller can modify the returned copy without altering the cache
+        cached_entity["name"] = "modified copy"
+        assert cache.get(key, version=1) == {"name": "project"}
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (2, 2, 1)
+
+    def test_eviction(self) -> None:
+        cache: VersionedEntityCache[str] = VersionedEntityCache(name="test", maxsize=2)
+        keys = [(ORGANIZATION_ID, PROJECT_IDENTIFIER.workspace_id, ID(f"project_{i}")) for i in range(3)]
+
+        cache.put(keys[0], version=0, entity="project_0")
+        cache.put(keys[1], version=0, entity="project_1")
+        cache.get(keys[0], version=0)  # project_1 becomes the least recently used
+        cache.put(keys[2], version=0, entity="project_2")
+
+        assert keys[0] in cache
+        assert keys[1] not in cache
+        assert keys[2] in cache
+
+    def test_invalidate_project(self) -> None:
+        cache: VersionedEntityCache[str] = VersionedEntityCache(name="test")
+        project_prefix = (ORGANIZATION_ID, PROJECT_IDENTIFIER.workspace_id, PROJECT_IDENTIFIER.project_id)
+        other_key = (ORGANIZATION_ID, PROJECT_IDENTIFIER.workspace_id, ID("other_project"), ID("schema"))
+        cache.put((*project_prefix, ID("schema_1")), version=0, entity="schema_1")
+        cache.put((*project_prefix, ID("schema_2")), version=0, entity="schema_2")
+        cache.put(other_key, version=0, entity="other_schema")
+
+        cache.invalidate_project(organization_id=ORGANIZATION_ID, project_identifier=PROJECT_IDENTIFIER)
+
+        assert cache.stats.size == 1
+        assert cache.stats.invalidations == 2
+        assert other_key in cache
@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import os
 from collections.abc import Sequence
 from unittest.mock import ANY, call, patch
 
@@ -10,6 +11,7 @@ from iai_core.entities.label import Domain, Label
 from iai_core.entities.label_schema import LabelGroup, LabelSchema, LabelSchemaView, LabelTree
 from iai_core.repos import LabelRepo, LabelSchemaRepo
 from iai_core.repos.base import SessionBasedRepo
+from iai_core.repos.entity_cache import LABEL_SCHEMA_CACHE
 
 
 def make_tree_from_labels(labels: Sequence[Label]) -> LabelTree:
@@ -149,6 +151,36 @@ class TestLabelSchemaRepo:
         # Assert
         assert_schemas_have_same_id_and_labels(schema_view_reloaded, fxt_label_schema_view_persisted)
 
+    def test_get_latest_cached(
+        self,
+        request,
+        fxt_label_schema_repo,
+        fxt_labels,
+        fxt_label_schema_1_persisted,
+        fxt_label_schema_2_persisted,
+    ) -> None:
+        # Arrange
+        request.addfinalizer(LABEL_SCHEMA_CACHE.clear)
+        label_schema_repo: LabelSchemaRepo = fxt_label_schema_repo
+        edited_label = fxt_labels[2]
+
+        # Act
+        with patch.dict(os.environ, {"FEATURE_FLAG_ENTITY_CACHE": "true"}):
+            stats_before = LABEL_SCHEMA_CACHE.stats
+            label_schema_repo.get_latest()
+            schema_cached = label_schema_repo.get_latest()
+            schema_by_id_cached = label_schema_repo.get_by_id(fxt_label_schema_2_persisted.id_)
+            stats_after_reads = LABEL_SCHEMA_CACHE.stats
+            edited_label.name = "edited_label"
+            LabelRepo(label_schema_repo.identifier).save(edited_label)  # invalidates the cached schemas
+            schema_after_edit = label_schema_repo.get_latest()
+
+        # Assert
+        assert_schemas_have_same_id_and_labels(schema_cached, fxt_label_schema_2_persisted)
+        assert_schemas_have_same_id_and_labels(schema_by_id_cached, fxt_label_schema_2_persisted)
+        assert stats_after_reads.hits == stats_before.hits + 2
+        assert schema_after_edit.get_label_by_id(edited_label.id_).name == "edited_label"
+
     @pytest.fixture
     def fxt_labels(self, request, fxt_empty_project_persisted):
         label_repo = LabelRepo(fxt_empty_project_persisted.identifier)
@@ -1,14 +1,18 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import os
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from pymongo.results import DeleteResult
 
+from iai_core.adapters.tensor_adapter import PackedTensorAdapter
 from iai_core.entities.metadata import FloatMetadata, NullMetadataItem
 from iai_core.entities.tensor import Tensor
 from iai_core.repos import MetadataRepo
 from iai_core.repos.storage.binary_repos import TensorBinaryRepo
+from iai_core.repos.storage.packed_tensors import FEATURE_FLAG_PACKED_TENSORS, packed_tensor_writing
 
 from geti_types import ImageIdentifier
 
@@ -26,6 +30,7 @@ class TestMetadataRepo:
             "media_identifier_-1",
             "content.schema_-1",
             "content.prediction_id_-1",
+            "content.binary_filename_-1",
         }
 
     def test_tensor_binary_repo(self, fxt_dataset_storage) -> None:
@@ -73,6 +78,46 @@ class TestMetadataRepo:
         with pytest.raises(RuntimeError):
             metadata_repo.save(metadata_item)
 
+    def test_save_packed_tensors(
+        self,
+        fxt_dataset_storage,
+        fxt_metadata_item_factory,
+        fxt_image_identifier,
+    ) -> None:
+        metadata_repo = MetadataRepo(fxt_dataset_storage.identifier)
+        metadata_items = [
+            fxt_metadata_item_factory(
+                metadata_type="tensor",
+                media_identifier=fxt_image_identifier,
+                dataset_storage=fxt_dataset_storage,
+                save=False,
+            )
+            for _ in range(3)
+        ]
+        for i, metadata_item in enumerate(metadata_items):
+            metadata_item.data.numpy = np.full((2, 3), fill_value=i, dtype=np.float32)
+
+        with patch.dict(os.environ, {FEATURE_FLAG_PACKED_TENSORS: "true"}), packed_tensor_writing():
+            for metadata_item in metadata_items:
+                metadata_repo.save(metadata_item)
+            # The documents are saved only once their container is uploaded
+            container_filename = metadata_items[0].data.tensor_adapter.binary_filename
+            assert not metadata_repo.tensor_binary_repo.exists(container_filename)
+            assert all(isinstance(metadata_repo.get_by_id(item.id_), NullMetadataItem) for item in metadata_items)
+
+        # All the tensors are stored in the same container, and each one is read back from its own byte range
+        tensor_adapters = [metadata_repo.get_by_id(item.id_).data.tensor_adapter for item in metadata_items]
+        assert all(isinstance(adapter, PackedTensorAdapter) for adapter in tensor_adapters)
+        assert len({adapter.binary_filename for adapter in tensor_adapters}) == 1
+        for i, adapter in enumerate(tensor_adapters):
+            np.testing.assert_array_equal(adapter.numpy, np.full((2, 3), fill_value=i, dtype=np.float32))
+
+        # The container is deleted only with the last tensor referencing it
+        metadata_repo.delete_by_id(metadata_items[0].id_)
+        assert metadata_repo.tensor_binary_repo.exists(container_filename)
+        metadata_repo.delete_all_by_media_identifier(fxt_image_identifier)
+        assert not metadata_repo.tensor_binary_repo.exists(container_filename)
+
     def test_delete_by_id(
         self,
         fxt_dataset_storage,
@@ -186,37 +231,55 @@ class TestMetadataRepo:
             metadata_repo.delete_all(extra_filter=extra_filter)
 
         # Assert
-        mock_find.assert_called_once_with(extra_filter, {"content.schema": 1, "content.binary_filename": 1})
+        mock_find.assert_called_once_with(
+            extra_filter, {"content.schema": 1, "content.binary_filename": 1, "content.offset": 1}
+        )
         mock_tensor_delete_by_filename.assert_not_called()
         mock_delete_many.assert_called_once_with(extra_filter)
 
+    @pytest.mark.parametrize("container_still_referenced", [False, True])
     def test_delete_all_with_filter(
         self,
         fxt_dataset_storage,
         fxt_metadata_item_factory,
         fxt_ote_id,
+        container_still_referenced,
     ) -> None:
         # Arrange
         extra_filter = {"foo": "bar"}
         metadata_repo = MetadataRepo(fxt_dataset_storage.identifier)
 
         # Act
+        # The preliminary filter is a new dict at each call, as the repo extends it in place
         with (
             patch.object(metadata_repo._collection, "delete_many") as mock_delete_many,
             patch.object(metadata_repo._collection, "find") as mock_find,
-            patch.object(metadata_repo, "preliminary_query_match_filter", return_value={}),
+            patch.object(metadata_repo._collection, "find_one") as mock_find_one,
+            patch.object(metadata_repo, "preliminary_query_match_filter", side_effect=lambda **kwargs: {}),
             patch.object(metadata_repo.tensor_binary_repo, "delete_by_filename") as mock_tensor_delete_by_filename,
         ):
             mock_find.return_value = [
                 {"content": {"schema": "tensor", "binary_filename": "tensor_file"}},
+                {"content": {"schema": "tensor", "binary_filename": "container_file", "offset": 0}},
+                {"content": {"schema": "tensor", "binary_filename": "container_file", "offset": 128}},
             ]
-            mock_delete_many.return_value = DeleteResult({"n": 1}, True)
+            mock_find_one.return_value = {"_id": fxt_ote_id()} if container_still_referenced else None
+            mock_delete_many.return_value = DeleteResult({"n": 3}, True)
             metadata_repo.delete_all(extra_filter=extra_filter)
 
         # Assert
-        mock_find.assert_called_once_with(extra_filter, {"content.schema": 1, "content.binary_filename": 1})
-        mock_tensor_delete_by_filename.assert_called_once_with(filename="tensor_file")
+        mock_find.assert_called_once_with(
+            extra_filter, {"content.schema": 1, "content.binary_filename": 1, "content.offset": 1}
+        )
         mock_delete_many.assert_called_once_with(extra_filter)
+        # The packed container is deleted only if no remaining document references it
+        mock_find_one.assert_called_once_with(
+            {"content.binary_filename": "container_file", "content.offset": {"$exists": True}}, {"_id": 1}
+        )
+        expected_deleted_files = ["tensor_file"] if container_still_referenced else ["tensor_file", "container_file"]
+        assert [
+            call.kwargs["filename"] for call in mock_tensor_delete_by_filename.call_args_list
+        ] == expected_deleted_files
 
     def test_delete_all_no_filter(
         self,
@@ -0,0 +1,139 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import numpy as np
+
+from iai_core.entities.annotation import Annotation
+from iai_core.entities.cached_prediction import FULL_BOX_ROI_KEY, CachedPrediction, NullCachedPrediction
+from iai_core.entities.metadata import FloatMetadata, FloatType
+from iai_core.entities.shapes import Rectangle
+from iai_core.entities.tensor import Tensor
+from iai_core.repos import PredictionCacheRepo
+
+from geti_types import ID, ImageIdentifier
+
+LABEL_SCHEMA_ID = ID("66a1b2c3d4e5f60718293a4b")
+OTHER_LABEL_SCHEMA_ID = ID("66a1b2c3d4e5f60718293a4c")
+
+
+def make_cached_prediction(model_id: ID, media_identifier: ImageIdentifier, roi_key: str) -> CachedPrediction:
+    return CachedPrediction(
+        id_=PredictionCacheRepo.generate_id(),
+        model_id=model_id,
+        label_schema_id=LABEL_SCHEMA_ID,
+        media_identifier=media_identifier,
+        roi_key=roi_key,
+        media_height=480,
+        media_width=640,
+        annotations=[Annotation(shape=Rectangle(x1=0.1, y1=0.2, x2=0.3, y2=0.4), labels=[])],
+        metadata=[
+            FloatMetadata(name="active_score", value=0.25, float_type=FloatType.ACTIVE_SCORE),
+            Tensor(name="representation_vector", numpy=np.arange(8, dtype=np.float32)),
+        ],
+    )
+
+
+class TestPredictionCacheRepo:
+    def test_get_by_model_and_media_identifiers(self, request, fxt_dataset_storage, fxt_ote_id) -> None:
+        """
+        <b>Description:</b>
+        Check that the cached predictions are looked up by model, label schema, media and ROI
+
+        <b>Input data:</b>
+        Cached predictions of two models for two media and two ROIs
+
+        <b>Expected results:</b>
+        Test succeeds if only the predictions of the requested model and label schema are returned, keyed by
+        media identifier and ROI key, and with the same annotations and metadata.
+
+        <b>Steps</b>
+        1. Save the cached predictions
+        2. Look them up for the first model, in chunks of one media
+        3. Look them up with another label schema
+        """
+        repo = PredictionCacheRepo(fxt_dataset_storage.identifier)
+        request.addfinalizer(lambda: repo.delete_all())
+        model_id, other_model_id = fxt_ote_id(1), fxt_ote_id(2)
+        image_1, image_2 = ImageIdentifier(image_id=fxt_ote_id(3)), ImageIdentifier(image_id=fxt_ote_id(4))
+        roi_key = CachedPrediction.roi_key_for(Annotation(shape=Rectangle(x1=0.5, y1=0.5, x2=1.0, y2=1.0), labels=[]))
+        predictions = [
+            make_cached_prediction(model_id=model_id, media_identifier=image_1, roi_key=FULL_BOX_ROI_KEY),
+            make_cached_prediction(model_id=model_id, media_identifier=image_1, roi_key=roi_key),
+            make_cached_prediction(model_id=model_id, media_identifier=image_2, roi_key=FULL_BOX_ROI_KEY),
+            make_cached_prediction(model_id=other_model_id, media_identifier=image_2, roi_key=roi_key),
+        ]
+        repo.upsert_many(predictions)
+
+        cached_predictions = repo.get_by_model_and_media_identifiers(
+            model_id=model_id,
+            label_schema_id=LABEL_SCHEMA_ID,
+            media_identifiers=[image_1, image_2],
+            chunk_size=1,
+        )
+        no_predictions = repo.get_by_model_and_media_identifiers(
+            model_id=model_id, label_schema_id=OTHER_LABEL_SCHEMA_ID, media_identifiers=[image_1, image_2]
+        )
+
+        assert set(cached_predictions) == {(image_1, FULL_BOX_ROI_KEY), (image_1, roi_key), (image_2, FULL_BOX_ROI_KEY)}
+        cached_prediction = cached_predictions[(image_1, roi_key)]
+        assert cached_prediction.id_ == predictions[1].id_
+        shape = cached_prediction.annotations[0].shape
+        assert (shape.x1, shape.y1, shape.x2, shape.y2) == (0.1, 0.2, 0.3, 0.4)
+        assert cached_prediction.metadata == predictions[1].metadata
+        assert not no_predictions
+
+    def test_upsert_many(self, request, fxt_dataset_storage, fxt_ote_id, fxt_image_identifier) -> None:
+        """
+        <b>Description:</b>
+        Check that saving a prediction with the same key as a cached one replaces it
+
+        <b>Input data:</b>
+        Two cached predictions with the same key and different IDs
+
+        <b>Expected results:</b>
+        Test succeeds if there is only one document for the key, with the ID of the first prediction and the
+        content of the second one
+        """
+        repo = PredictionCacheRepo(fxt_dataset_storage.identifier)
+        request.addfinalizer(lambda: repo.delete_all())
+        first_prediction = make_cached_prediction(
+            model_id=fxt_ote_id(1), media_identifier=fxt_image_identifier, roi_key=FULL_BOX_ROI_KEY
+        )
+        second_prediction = make_cached_prediction(
+            model_id=fxt_ote_id(1), media_identifier=fxt_image_identifier, roi_key=FULL_BOX_ROI_KEY
+        )
+        second_prediction.media_height = 720
+
+        repo.upsert_many([first_prediction])
+        repo.upsert_many([second_prediction])
+
+        cached_predictions = list(repo.get_all())
+        assert len(cached_predictions) == 1
+        assert cached_predictions[0].id_ == first_prediction.id_
+        assert cached_predictions[0].media_height == 720
+
+    def test_delete_all_by_model_ids(self, request, fxt_dataset_storage, fxt_ote_id, fxt_image_identifier) -> None:
+        """
+        <b>Description:</b>
+        Check that the cached predictions of the given models are deleted
+
+        <b>Input data:</b>
+        Cached predictions of two models
+
+        <b>Expected results:</b>
+        Test succeeds if only the predictions of the deleted model are removed
+        """
+        repo = PredictionCacheRepo(fxt_dataset_storage.identifier)
+        request.addfinalizer(lambda: repo.delete_all())
+        deleted_prediction = make_cached_prediction(
+            model_id=fxt_ote_id(1), media_identifier=fxt_image_identifier, roi_key=FULL_BOX_ROI_KEY
+        )
+        kept_prediction = make_cached_prediction(
+            model_id=fxt_ote_id(2), media_identifier=fxt_image_identifier, roi_key=FULL_BOX_ROI_KEY
+        )
+        repo.upsert_many([deleted_prediction, kept_prediction])
+
+        repo.delete_all_by_model_ids([fxt_ote_id(1)])
+
+        assert repo.get_by_id(deleted_prediction.id_) == NullCachedPrediction()
+        assert repo.get_by_id(kept_prediction.id_).id_ == kept_prediction.id_
@@ -2,7 +2,9 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 #
+import os
 import time
+from unittest.mock import patch
 
 import pytest
 from testfixtures import compare
@@ -11,6 +13,7 @@ from iai_core.adapters.adapter import ReferenceAdapter
 from iai_core.entities.dataset_storage import DatasetStorage
 from iai_core.entities.project import Project
 from iai_core.repos import DatasetStorageRepo, ProjectRepo
+from iai_core.repos.entity_cache import PROJECT_CACHE
 from iai_core.repos.project_repo_helpers import ProjectQueryData, ProjectSortBy, ProjectSortDirection
 from iai_core.utils.deletion_helpers import DeletionHelpers
 from iai_core.utils.project_factory import ProjectFactory
@@ -559,3 +562,23 @@ class TestProjectRepo:
             repo.count_all(include_hidden=False, permitted_projects=tuple(project_ids[1::]))  # type: ignore
             == num_projects - 1
         )
+
+    def test_get_by_id_cached(self, request, fxt_empty_project_persisted) -> None:
+        request.addfinalizer(PROJECT_CACHE.clear)
+        repo = ProjectRepo()
+        project_id = fxt_empty_project_persisted.id_
+
+        with patch.dict(os.environ, {"FEATURE_FLAG_ENTITY_CACHE": "true"}):
+            stats_before = PROJECT_CACHE.stats
+            project = repo.get_by_id(project_id)
+            cached_project = repo.get_by_id(project_id)
+            stats_after_reads = PROJECT_CACHE.stats
+            repo.hide(project)  # bumps the version of the project document
+            hidden_project = repo.get_by_id(project_id)
+            stats_after_update = PROJECT_CACHE.stats
+
+        assert cached_project == project
+        assert cached_project is not project
+        assert stats_after_reads.hits == stats_before.hits + 1
+        assert hidden_project.hidden
+        assert stats_after_update.misses == stats_after_reads.misses + 1
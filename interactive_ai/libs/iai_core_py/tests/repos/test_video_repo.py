@@ -283,3 +283,34 @@ class TestVideoRepo:
 
         assert len(video_by_id.keys()) == 3
         assert list(video_by_id.keys()) == video_ids[0:5:2]
+
+    def test_get_by_ids(self, request, fxt_dataset_storage_identifier) -> None:
+        video_repo = VideoRepo(fxt_dataset_storage_identifier)
+        videos = [
+            Video(
+                name=f"Video #{i}",
+                id=VideoRepo.generate_id(),
+                uploader_id="Author",
+                fps=5.0,
+                width=100,
+                height=50,
+                total_frames=10,
+                size=1000,
+                preprocessing=MediaPreprocessing(status=MediaPreprocessingStatus.FINISHED),
+            )
+            for i in range(5)
+        ]
+        video_ids = [video.id_ for video in videos]
+        request.addfinalizer(lambda: video_repo.delete_all())
+        video_repo.save_many(videos)
+        cached_video = video_repo.get_by_id(video_ids[0])
+        missing_video_id = VideoRepo.generate_id()
+
+        with patch.object(VideoRepo, "get_video_by_ids", wraps=video_repo.get_video_by_ids) as mock_get_videos:
+            video_by_id = video_repo.get_by_ids([*video_ids[0:5:2], missing_video_id])
+
+        # The cached video is not fetched again, the other ones are fetched with one query
+        mock_get_videos.assert_called_once_with([video_ids[2], video_ids[4], missing_video_id])
+        assert set(video_by_id) == set(video_ids[0:5:2])
+        assert video_by_id[video_ids[0]] is cached_video
+        assert video_repo.get_by_id(video_ids[2]) is video_by_id[video_ids[2]]
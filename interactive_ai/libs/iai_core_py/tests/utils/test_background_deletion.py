@@ -0,0 +1,116 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+
+from iai_core.entities.dataset_storage import NullDatasetStorage
+from iai_core.entities.image import Image
+from iai_core.entities.project import NullProject
+from iai_core.repos import DatasetRepo, DatasetStorageRepo, ImageRepo, LabelSchemaRepo, ProjectRepo, TaskNodeRepo
+from iai_core.repos.deletion_tombstone_repo import DeletionTombstoneRepo
+from iai_core.repos.storage.binary_repos import ImageBinaryRepo
+from iai_core.utils.background_deletion import (
+    BackgroundDeletionWorker,
+    DeletionProgress,
+    schedule_dataset_storage_deletion,
+    schedule_project_deletion,
+)
+from tests.test_helpers import TestProject
+
+from geti_types import DatasetStorageIdentifier
+
+
+def reset_singletons() -> None:
+    BackgroundDeletionWorker._instance = None
+
+
+@pytest.fixture
+def fxt_deletion_worker(request):
+    request.addfinalizer(reset_singletons)
+    with (
+        patch("iai_core.utils.background_deletion.DELETION_DOCUMENTS_CHUNK_SIZE", 2),
+        patch("iai_core.utils.background_deletion.DELETION_OBJECTS_CHUNK_SIZE", 2),
+        patch("iai_core.utils.background_deletion.DELETION_CHUNK_INTERVAL_SECONDS", 0),
+    ):
+        yield BackgroundDeletionWorker()
+
+
+class TestBackgroundDeletion:
+    def test_delete_project(self, fxt_deletion_worker, project_with_data: TestProject) -> None:
+        project = project_with_data.project
+        dataset_storage = project.get_training_dataset_storage()
+        DatasetRepo(dataset_storage.identifier).save_deep(project_with_data.circle_dataset)
+        image_repo = ImageRepo(dataset_storage.identifier)
+        image_repo.save(cast(Image, project_with_data.circle_dataset[0].media))
+        image_binary_repo = ImageBinaryRepo(dataset_storage.identifier)
+        filenames = [image_binary_repo.save(dst_file_name=f"image_{i}.jpg", data_source=b"image") for i in range(3)]
+        assert list(DatasetRepo(dataset_storage.identifier).get_all())
+
+        tombstone = schedule_project_deletion(project_identifier=project.identifier)
+
+        # Nothing is deleted until the worker processes the tombstone
+        assert list(image_repo.get_all())
+        assert fxt_deletion_worker.process_next()
+        assert not fxt_deletion_worker.process_next()
+        assert isinstance(ProjectRepo().get_by_id(project.id_), NullProject)
+        assert isinstance(DatasetStorageRepo(project.identifier).get_by_id(dataset_storage.id_), NullDatasetStorage)
+        assert not list(image_repo.get_all())
+        assert not list(DatasetRepo(dataset_storage.identifier).get_all())
+        assert not list(LabelSchemaRepo(project.identifier).get_all())
+        assert not list(TaskNodeRepo(project.identifier).get_all())
+        assert not any(image_binary_repo.exists(filename) for filename in filenames)
+        assert not DeletionTombstoneRepo().get_by_project(
+            organization_id=tombstone.organization_id,
+            workspace_id=tombstone.workspace_id,
+            project_id=tombstone.project_id,
+        )
+
+    def test_resume_deletion(self, fxt_deletion_worker, project_with_data: TestProject) -> None:
+        project = project_with_data.project
+        dataset_storage = project.get_training_dataset_storage()
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=project.workspace_id, project_id=project.id_, dataset_storage_id=dataset_storage.id_
+        )
+        dataset_repo = DatasetRepo(dataset_storage_identifier)
+        dataset_repo.save_deep(project_with_data.circle_dataset)
+        image_binary_repo = ImageBinaryRepo(dataset_storage_identifier)
+        filenames = [image_binary_repo.save(dst_file_name=f"image_{i}.jpg", data_source=b"image") for i in range(5)]
+        progresses: list[DeletionProgress] = []
+
+        def stop_after_first_chunk(progress: DeletionProgress) -> None:
+            progresses.append(progress)
+            fxt_deletion_worker._stop_event.set()
+
+        fxt_deletion_worker._progress_callback = stop_after_first_chunk
+        tombstone = schedule_dataset_storage_deletion(dataset_storage_identifier)
+
+        # Interrupt the deletion after the first chunk: the lease is released and the progress is persisted
+        assert fxt_deletion_worker.process_next()
+        (interrupted_tombstone,) = DeletionTombstoneRepo().get_by_project(
+            organization_id=tombstone.organization_id,
+            workspace_id=tombstone.workspace_id,
+            project_id=tombstone.project_id,
+        )
+        assert interrupted_tombstone.stage == "binaries.images"
+        assert interrupted_tombstone.deleted_objects == 2
+        assert any(image_binary_repo.exists(filename) for filename in filenames)
+
+        # Resume the deletion
+        fxt_deletion_worker._stop_event.clear()
+        fxt_deletion_worker._progress_callback = progresses.append
+        assert fxt_deletion_worker.process_next()
+
+        assert progresses[1].stage == "binaries.images"
+        assert progresses[1].tombstone.deleted_objects == 4
+        assert sum(progress.deleted_objects for progress in progresses) >= len(filenames)
+        assert not any(image_binary_repo.exists(filename) for filename in filenames)
+        assert not list(dataset_repo.get_all())
+        assert isinstance(DatasetStorageRepo(project.identifier).get_by_id(dataset_storage.id_), NullDatasetStorage)
+        assert not isinstance(ProjectRepo().get_by_id(project.id_), NullProject)
+        assert not DeletionTombstoneRepo().get_by_project(
+            organization_id=tombstone.organization_id,
+            workspace_id=tombstone.workspace_id,
+            project_id=tombstone.project_id,
+        )
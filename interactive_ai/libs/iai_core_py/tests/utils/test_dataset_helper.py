@@ -43,7 +43,9 @@ class TestDatasetHelper:
             id=fxt_mongo_id(1),
         )
         with (
-            patch.object(Media2DFactory, "get_media_for_identifier", return_value=fxt_image_entity) as mock_get_media,
+            patch.object(
+                Media2DFactory, "get_media_for_identifiers", return_value=[fxt_image_entity]
+            ) as mock_get_media,
             patch.object(
                 AnnotationSceneRepo, "generate_id", return_value=fxt_mongo_id(0)
             ) as mock_generate_annotation_id,
@@ -58,7 +60,7 @@ class TestDatasetHelper:
 
             assert result == expected_dataset
             mock_get_media.assert_called_once_with(
-                media_identifier=fxt_image_identifier,
+                media_identifiers=[fxt_image_identifier],
                 dataset_storage_identifier=fxt_dataset_storage.identifier,
             )
             mock_generate_annotation_id.assert_called_once_with()
@@ -96,7 +98,9 @@ class TestDatasetHelper:
                 "get_latest_annotations_by_kind_and_identifiers",
                 return_value=[fxt_annotation_scene],
             ) as mock_get_annotations,
-            patch.object(Media2DFactory, "get_media_for_identifier", return_value=fxt_image_entity) as mock_get_media,
+            patch.object(
+                Media2DFactory, "get_media_for_identifiers", return_value=[fxt_image_entity]
+            ) as mock_get_media,
             patch.object(
                 LabelSchemaRepo,
                 "get_latest_view_by_task",
@@ -132,13 +136,14 @@ class TestDatasetHelper:
                 annotation_kind=AnnotationSceneKind.ANNOTATION,
             )
             mock_get_media.assert_called_once_with(
-                media_identifier=fxt_image_identifier,
+                media_identifiers=[fxt_image_identifier],
                 dataset_storage_identifier=fxt_dataset_storage.identifier,
             )
             mock_scene_to_item.assert_called_once_with(
                 annotation_scene=ANY,
                 roi=None,
                 dataset_storage=fxt_dataset_storage,
+                media=fxt_image_entity,
             )
             mock_save_dataset.assert_called_once_with(expected_dataset)
             task_node_iter = fxt_detection_segmentation_chain_project.get_trainable_task_nodes()[0]
@@ -6,8 +6,13 @@ from unittest.mock import patch
 import pytest
 
 from iai_core.repos import BinaryRepo
+from iai_core.repos.storage.binary_repo import FEATURE_FLAG_STORAGE_USAGE_LEDGER
+from iai_core.repos.storage.storage_client import BinaryObjectType
+from iai_core.repos.storage.storage_usage_repo import StorageUsageRepo
 from iai_core.utils.filesystem import check_free_space_for_operation, check_free_space_for_upload, compute_project_size
 
+from geti_types.session import DEFAULT_ORGANIZATION_ID
+
 FEATURE_FLAG_STORAGE_SIZE_COMPUTATION = "FEATURE_FLAG_STORAGE_SIZE_COMPUTATION"
 
 
@@ -110,3 +115,30 @@ def test_compute_project_size(fxt_detection_project) -> None:
 
     # Project contains 5 binary repo's for which size should be computed for, each being 100 bytes.
     assert project_size == 500.0
+
+
+def test_compute_project_size_from_ledger(request, fxt_detection_project) -> None:
+    request.addfinalizer(
+        lambda: StorageUsageRepo().delete_project_usage(
+            organization_id=DEFAULT_ORGANIZATION_ID, project_identifier=fxt_detection_project.identifier
+        )
+    )
+    with (
+        patch.dict(os.environ, {FEATURE_FLAG_STORAGE_USAGE_LEDGER: "true"}),
+        patch.object(BinaryRepo, "get_object_storage_size", return_value=100) as mock_get_object_storage_size,
+    ):
+        # The ledger is reconciled with the storage the first time it is read
+        project_size = compute_project_size(fxt_detection_project)
+        mock_get_object_storage_size.reset_mock()
+
+        StorageUsageRepo().increment(
+            organization_id=DEFAULT_ORGANIZATION_ID,
+            identifier=fxt_detection_project.identifier,
+            object_type=BinaryObjectType.CODE_DEPLOYMENTS,
+            size=50,
+        )
+        project_size_from_ledger = compute_project_size(fxt_detection_project)
+
+    assert project_size == 500.0
+    assert project_size_from_ledger == 550.0
+    mock_get_object_storage_size.assert_not_called()
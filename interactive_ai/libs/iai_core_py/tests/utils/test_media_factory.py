@@ -0,0 +1,143 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from functools import partial
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from iai_core.entities.image import NullImage
+from iai_core.entities.video import NullVideo, VideoFrame
+from iai_core.repos import ImageRepo, VideoRepo
+from iai_core.repos.storage.binary_repos import ThumbnailBinaryRepo
+from iai_core.utils.iteration import grouper
+from iai_core.utils.media_factory import Media2DFactory
+
+from geti_types import ID, ImageIdentifier, VideoFrameIdentifier
+
+
+class TestMedia2DFactory:
+    def test_create_and_save_media_thumbnail_variants(self, fxt_dataset_storage_identifier) -> None:
+        # Arrange
+        media_numpy = np.random.randint(low=0, high=255, size=(600, 1000, 3), dtype=np.uint8)
+        saved: dict[str, bytes] = {}
+
+        def save(data_source: bytes, dst_file_name: str) -> str:
+            saved[dst_file_name] = data_source
+            return dst_file_name
+
+        # Act
+        with (
+            patch.object(ThumbnailBinaryRepo, "__init__", return_value=None),
+            patch.object(ThumbnailBinaryRepo, "save", side_effect=save),
+        ):
+            thumbnail = Media2DFactory.create_and_save_media_thumbnail_variants(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                media_numpy=media_numpy,
+                thumbnail_binary_filename="image_id_thumbnail.jpg",
+            )
+
+        # Assert
+        assert set(saved) == {
+            "image_id_thumbnail_128.jpg",
+            "image_id_thumbnail_128.webp",
+            "image_id_thumbnail.jpg",
+            "image_id_thumbnail_256.webp",
+            "image_id_thumbnail_512.jpg",
+            "image_id_thumbnail_512.webp",
+        }
+        assert thumbnail.read() == saved["image_id_thumbnail.jpg"]
+        for filename, size in (
+            ("image_id_thumbnail_128.webp", 128),
+            ("image_id_thumbnail.jpg", 256),
+            ("image_id_thumbnail_512.jpg", 512),
+        ):
+            decoded = cv2.imdecode(np.frombuffer(saved[filename], np.uint8), cv2.IMREAD_COLOR)
+            assert decoded.shape == (size, size, 3)
+
+    def test_get_media_for_identifiers(
+        self, fxt_dataset_storage_identifier, fxt_image_entity_factory, fxt_video_entity
+    ) -> None:
+        # Arrange
+        image_1 = fxt_image_entity_factory(index=1)
+        image_2 = fxt_image_entity_factory(index=2)
+        missing_image_identifier = ImageIdentifier(image_id=ID("missing_image"))
+        missing_frame_identifier = VideoFrameIdentifier(video_id=ID("missing_video"), frame_index=0)
+        media_identifiers = [
+            image_1.media_identifier,
+            VideoFrameIdentifier(video_id=fxt_video_entity.id_, frame_index=0),
+            image_2.media_identifier,
+            VideoFrameIdentifier(video_id=fxt_video_entity.id_, frame_index=5),
+            missing_image_identifier,
+            missing_frame_identifier,
+            image_1.media_identifier,
+        ]
+
+        # Act
+        with (
+            patch.object(
+                ImageRepo, "get_image_by_ids", return_value={image_1.id_: image_1, image_2.id_: image_2}
+            ) as mock_get_images,
+            patch.object(
+                VideoRepo, "get_by_ids", return_value={fxt_video_entity.id_: fxt_video_entity}
+            ) as mock_get_videos,
+        ):
+            media = Media2DFactory.get_media_for_identifiers(
+                media_identifiers=media_identifiers,
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+            )
+
+        # Assert
+        mock_get_images.assert_called_once()
+        assert set(mock_get_images.call_args.args[0]) == {image_1.id_, image_2.id_, missing_image_identifier.media_id}
+        mock_get_videos.assert_called_once()
+        assert set(mock_get_videos.call_args.args[0]) == {fxt_video_entity.id_, missing_frame_identifier.media_id}
+        assert media[0] == image_1
+        assert media[2] == image_2
+        assert media[6] == image_1
+        assert isinstance(media[4], NullImage)
+        for index, frame_index in ((1, 0), (3, 5)):
+            assert isinstance(media[index], VideoFrame)
+            assert media[index].video is fxt_video_entity
+            assert media[index].frame_index == frame_index
+        assert isinstance(media[5], VideoFrame)
+        assert isinstance(media[5].video, NullVideo)
+
+    def test_get_media_for_identifiers_queries_per_chunk(
+        self, fxt_dataset_storage_identifier, fxt_image_entity_factory, fxt_video_entity
+    ) -> None:
+        # Arrange: 5 images and 10 frames of each of 3 videos, resolved in chunks of 2 IDs
+        images = {image.id_: image for image in (fxt_image_entity_factory(index=i) for i in range(5))}
+        video_ids = [ID(f"video_{i}") for i in range(3)]
+        media_identifiers = [image.media_identifier for image in images.values()]
+        media_identifiers += [
+            VideoFrameIdentifier(video_id=video_id, frame_index=frame_index)
+            for frame_index in range(10)
+            for video_id in video_ids
+        ]
+
+        # Act
+        with (
+            patch("iai_core.utils.media_factory.grouper", new=partial(grouper, chunk_size=2)),
+            patch.object(
+                ImageRepo, "get_image_by_ids", side_effect=lambda ids: {id_: images[id_] for id_ in ids}
+            ) as mock_get_images,
+            patch.object(
+                VideoRepo, "get_by_ids", side_effect=lambda ids: dict.fromkeys(ids, fxt_video_entity)
+            ) as mock_get_videos,
+        ):
+            media = Media2DFactory.get_media_for_identifiers(
+                media_identifiers=media_identifiers,
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+            )
+
+        # Assert: one query per chunk of IDs, and each video is fetched once for all its frames
+        assert mock_get_images.call_count == 3
+        assert mock_get_videos.call_count == 2
+        fetched_image_ids = [id_ for call in mock_get_images.call_args_list for id_ in call.args[0]]
+        fetched_video_ids = [id_ for call in mock_get_videos.call_args_list for id_ in call.args[0]]
+        assert sorted(fetched_image_ids) == sorted(images)
+        assert sorted(fetched_video_ids) == sorted(video_ids)
+        assert [item.media_identifier for item in media[:5]] == media_identifiers[:5]
+        assert all(item.video is fxt_video_entity for item in media[5:])
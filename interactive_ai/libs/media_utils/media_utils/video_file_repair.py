@@ -106,6 +106,7 @@ class VideoFileRepair:
                 dst_file_name=filename,
                 remove_source=True,
                 overwrite=True,
+                replaces_existing=True,
             )
             VideoDecoder.reset_reader(file_location=str(file_location))
 
@@ -22,6 +22,7 @@ class ActiveLearningKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
         return [
             TopicSubscription(topic="media_deletions", callback=self.on_media_deleted),
             TopicSubscription(topic="media_uploads", callback=self.on_media_uploaded),
+            TopicSubscription(topic="new_annotation_scene", callback=self.on_new_annotation_scene),
             TopicSubscription(
                 topic="predictions_and_metadata_created",
                 callback=self.on_new_predictions_and_metadata,
@@ -75,6 +76,23 @@ class ActiveLearningKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
             asynchronous=True,
         )
 
+    @staticmethod
+    @setup_session_kafka
+    @unified_tracing
+    def on_new_annotation_scene(raw_message: KafkaRawMessage) -> None:
+        value: dict = raw_message.value
+        workspace_id = ID(value["workspace_id"])
+        project_id = ID(value["project_id"])
+        dataset_storage_id = ID(value["dataset_storage_id"])
+        annotation_scene_id = ID(value["annotation_scene_id"])
+
+        ActiveScoresUpdateUseCase.on_annotation_scene_saved(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            dataset_storage_id=dataset_storage_id,
+            annotation_scene_id=annotation_scene_id,
+        )
+
     @staticmethod
     @setup_session_kafka
     @unified_tracing
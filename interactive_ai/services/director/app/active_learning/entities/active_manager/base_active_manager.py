@@ -5,16 +5,19 @@
 
 import abc
 import logging
+from collections import defaultdict
 from collections.abc import Callable, Iterator, Sequence
 from functools import partial
 from queue import PriorityQueue
 from typing import Generic
 
 import numpy as np
+from geti_feature_tools import FeatureFlagProvider
 
 from active_learning.entities import ActiveScore, ActiveScoreSuggestionInfo, ActiveSuggestion
 from active_learning.entities.active_learning_config import ActiveScoreReductionFunction, TActiveLearningConfig
 from active_learning.storage.repos import ActiveScoreRepo, ActiveSuggestionRepo
+from features.feature_flag import FeatureFlag
 
 from geti_fastapi_tools.exceptions import DatasetStorageNotFoundException, ProjectNotFoundException
 from geti_telemetry_tools import unified_tracing
@@ -27,10 +30,12 @@ from geti_types import (
     VideoFrameIdentifier,
     VideoIdentifier,
 )
+from iai_core.entities.annotation_scene_state import AnnotationState, NullAnnotationSceneState
 from iai_core.entities.dataset_storage import DatasetStorage, NullDatasetStorage
 from iai_core.entities.project import NullProject, Project
 from iai_core.entities.task_node import TaskNode
-from iai_core.repos import DatasetStorageRepo, ProjectRepo, VideoRepo
+from iai_core.repos import AnnotationSceneStateRepo, DatasetStorageRepo, ProjectRepo, VideoRepo
+from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
 from iai_core.services import ModelService
 from iai_core.utils.iteration import grouper
 from iai_core.utils.type_helpers import SequenceOrSet
@@ -247,6 +252,108 @@ class BaseActiveManager(Generic[TActiveLearningConfig], metaclass=abc.ABCMeta):
             The list is sorted by score (better/lower score first).
         """
 
+    @unified_tracing
+    def _get_best_unannotated_candidates_impl(
+        self,
+        size: int,
+        annotation_state: AnnotationState,
+        task_node_id: ID | None = None,
+        models_ids: Sequence[ID] | None = None,
+    ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+        """
+        Implementation of _get_best_unannotated_candidates, shared between the active managers.
+        The 'task_node_id' parameter differentiates between per-project and per-task AL.
+
+        The flags of the active scores are reconciled first if some of them are missing.
+
+        :param size: Maximum size of the output candidates pool
+        :param annotation_state: Media-level annotation state of the candidates
+        :param task_node_id: Optional, task node whose active scores should be used
+        :param models_ids: Optional, if specified prioritize the media inferred by
+            one of the models in the list.
+        :return: Tuple of at most 'size' elements, where each element is an
+            ActiveScoreSuggestionInfo corresponding to the selected media.
+        """
+        active_score_repo = ActiveScoreRepo(self.dataset_storage_identifier)
+        if active_score_repo.has_unreconciled_flags():
+            self.reconcile_score_flags()
+        return active_score_repo.find_best_unannotated_candidates(
+            size=size,
+            annotation_state=annotation_state,
+            task_node_id=task_node_id,
+            models_ids=models_ids,
+        )
+
+    @abc.abstractmethod
+    def _get_best_unannotated_candidates(
+        self,
+        size: int,
+        models_ids: Sequence[ID] | None = None,
+    ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+        """
+        Get a pool of media that are the best candidates to be suggested, selecting
+        them with the annotation state and suggestion flags of the active scores.
+
+        :param size: Maximum size of the output candidates pool
+        :param models_ids: Optional, if specified prioritize the media inferred by
+            one of the models in the list.
+        :return: Tuple of at most 'size' elements, where each element is an
+            ActiveScoreSuggestionInfo corresponding to the selected media.
+        """
+
+    @unified_tracing
+    def reconcile_score_flags(self) -> None:
+        """
+        Realign the annotation state and suggestion flags of the active scores with the
+        media annotation states of the dataset storage and with the active suggestions.
+
+        The flags are normally kept up to date by the annotation and suggestion events;
+        this method fixes the active scores created before the flags were introduced and
+        any drift caused by lost or reordered events.
+        """
+        logger.info(
+            "Reconciling the active score flags of dataset storage `%s` of project `%s` in workspace `%s`",
+            self.dataset_storage_id,
+            self.project_id,
+            self.workspace_id,
+        )
+        active_score_repo = ActiveScoreRepo(self.dataset_storage_identifier)
+        active_score_repo.reset_flags()
+
+        dataset_storage_filter_repo = DatasetStorageFilterRepo(self.dataset_storage_identifier)
+        for media_states_chunk in grouper(dataset_storage_filter_repo.get_annotated_media_identifiers_and_states()):
+            media_identifiers_by_state: dict[AnnotationState, list[MediaIdentifierEntity]] = defaultdict(list)
+            for media_identifier, annotation_state in media_states_chunk:
+                media_identifiers_by_state[annotation_state].append(media_identifier)
+            for annotation_state, media_identifiers in media_identifiers_by_state.items():
+                active_score_repo.set_annotation_state(
+                    media_identifiers=media_identifiers, annotation_state=annotation_state
+                )
+
+        suggested_media = self._get_previously_suggested_media()
+        active_score_repo.set_suggested(suggested=True, media_identifiers=suggested_media)
+
+    @unified_tracing
+    def update_annotation_state(self, annotation_scene_id: ID) -> None:
+        """
+        Update the annotation state flag of the active score of the media of an annotation scene.
+
+        :param annotation_scene_id: ID of the new or modified annotation scene
+        """
+        annotation_scene_state = AnnotationSceneStateRepo(
+            self.dataset_storage_identifier
+        ).get_latest_for_annotation_scene(annotation_scene_id)
+        if isinstance(annotation_scene_state, NullAnnotationSceneState):
+            logger.warning(
+                "Cannot update the active score flags: no state found for annotation scene `%s`",
+                annotation_scene_id,
+            )
+            return
+        ActiveScoreRepo(self.dataset_storage_identifier).set_annotation_state(
+            media_identifiers=(annotation_scene_state.media_identifier,),
+            annotation_state=annotation_scene_state.get_state_media_level(),
+        )
+
     @unified_tracing
     def reset_suggestions(self) -> None:
         """
@@ -258,6 +365,7 @@ class BaseActiveManager(Generic[TActiveLearningConfig], metaclass=abc.ABCMeta):
             self.workspace_id,
         )
         ActiveSuggestionRepo(self.dataset_storage_identifier).delete_all()
+        ActiveScoreRepo(self.dataset_storage_identifier).set_suggested(suggested=False)
 
     @unified_tracing
     def get_suggestions(self, size: int) -> tuple[ActiveScoreSuggestionInfo, ...]:
@@ -282,25 +390,30 @@ class BaseActiveManager(Generic[TActiveLearningConfig], metaclass=abc.ABCMeta):
         }
         active_models_ids = [model_id for model_id in active_model_id_per_task.values() if model_id != ID()]
 
-        # Pick the best non-suggested media
-        candidates_iter = self._get_unannotated_non_suggested_media_identifiers()
-        candidates_chunks = grouper(candidates_iter)
-        # store top k candidates with a priority queue
-        pq: PriorityQueue = PriorityQueue()
-        for candidates_chunk in candidates_chunks:
-            best_from_list = self._get_best_candidates(
-                candidates=candidates_chunk,
-                size=size,
-                models_ids=active_models_ids,
-            )
-            for candidate_info in best_from_list:
-                if pq.qsize() >= size:
-                    _, worst_candidate = pq.get()
-                    candidate_info = min([worst_candidate, candidate_info], key=lambda x: x.score)  # noqa: PLW2901
-                # score negated because we want to keep the best candidates (lowest score)
-                pq.put((-candidate_info.score, candidate_info))
-
-        candidates_info = [info for _, info in pq.queue]
+        candidates_info: list[ActiveScoreSuggestionInfo]
+        if FeatureFlagProvider.is_enabled(FeatureFlag.FEATURE_FLAG_INDEXED_ACTIVE_SUGGESTIONS):
+            # Pick the best non-suggested media with a single indexed query
+            candidates_info = list(self._get_best_unannotated_candidates(size=size, models_ids=active_models_ids))
+        else:
+            # Pick the best non-suggested media
+            candidates_iter = self._get_unannotated_non_suggested_media_identifiers()
+            candidates_chunks = grouper(candidates_iter)
+            # store top k candidates with a priority queue
+            pq: PriorityQueue = PriorityQueue()
+            for candidates_chunk in candidates_chunks:
+                best_from_list = self._get_best_candidates(
+                    candidates=candidates_chunk,
+                    size=size,
+                    models_ids=active_models_ids,
+                )
+                for candidate_info in best_from_list:
+                    if pq.qsize() >= size:
+                        _, worst_candidate = pq.get()
+                        candidate_info = min([worst_candidate, candidate_info], key=lambda x: x.score)  # noqa: PLW2901
+                    # score negated because we want to keep the best candidates (lowest score)
+                    pq.put((-candidate_info.score, candidate_info))
+
+            candidates_info = [info for _, info in pq.queue]
 
         num_non_inferred_candidates = sum(c.score == 1.0 for c in candidates_info)
         num_inferred_candidates = len(candidates_info) - num_non_inferred_candidates
@@ -394,6 +507,9 @@ class BaseActiveManager(Generic[TActiveLearningConfig], metaclass=abc.ABCMeta):
             for media_info in suggested_media_info
         ]
         repo.save_many(suggestions)
+        ActiveScoreRepo(self.dataset_storage_identifier).set_suggested(
+            suggested=True, media_identifiers=[media_info.media_identifier for media_info in suggested_media_info]
+        )
 
     @unified_tracing
     def remove_media(self, media_identifiers: Sequence[MediaIdentifierEntity] | None = None) -> None:
@@ -132,6 +132,17 @@ class PipelineActiveManager(BaseActiveManager[ActiveLearningProjectConfig]):  #
             inferred_only=inferred_only,
         )
 
+    def _get_best_unannotated_candidates(
+        self,
+        size: int,
+        models_ids: Sequence[ID] | None = None,
+    ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+        return self._get_best_unannotated_candidates_impl(
+            size=size,
+            annotation_state=AnnotationState.NONE,
+            models_ids=models_ids,
+        )
+
     def _update_reduced_scores(self, scores: Sequence[ActiveScore]) -> None:
         """
         Iterate over a sequence of ActiveScore entities and overwrite (in-place)
@@ -205,30 +205,32 @@ class TaskActiveManager(BaseActiveManager[ActiveLearningTaskConfig]):
 
         :return: Tuple containing the identifiers of the unannotated media.
         """
+        dataset_storage_filter_repo = DatasetStorageFilterRepo(
+            dataset_storage_identifier=self.dataset_storage_identifier
+        )
+        return dataset_storage_filter_repo.get_media_identifiers_by_annotation_state(
+            annotation_state=self._get_unannotated_media_state(),
+            sample_size=MAX_UNANNOTATED_DATASET_SIZE,
+        )
+
+    def _get_unannotated_media_state(self) -> AnnotationState:
+        """
+        Get the media-level annotation state of the media that are unannotated for the current task node.
+
+        :return: AnnotationState of the candidate media
+        """
         prev_trainable_tasks_ids: list[ID] = []
         for prev_task in self.get_trainable_task_nodes():
             if prev_task.id_ == self.task_node_id:
                 break
             prev_trainable_tasks_ids.append(prev_task.id_)
 
-        dataset_storage_filter_repo = DatasetStorageFilterRepo(
-            dataset_storage_identifier=self.dataset_storage_identifier
-        )
         if prev_trainable_tasks_ids:
             # PARTIALLY_ANNOTATED is equipollent to NONE for active learning purposes.
             # For instance, in the second task of det->cls chain, we are interested also in
             # media where some boxes do not have cls label while other ones do.
-            media_identifiers = dataset_storage_filter_repo.get_media_identifiers_by_annotation_state(
-                annotation_state=AnnotationState.PARTIALLY_ANNOTATED,
-                sample_size=MAX_UNANNOTATED_DATASET_SIZE,
-            )
-        else:
-            media_identifiers = dataset_storage_filter_repo.get_media_identifiers_by_annotation_state(
-                annotation_state=AnnotationState.NONE,
-                sample_size=MAX_UNANNOTATED_DATASET_SIZE,
-            )
-
-        return media_identifiers
+            return AnnotationState.PARTIALLY_ANNOTATED
+        return AnnotationState.NONE
 
     def _get_best_candidates(
         self,
@@ -245,6 +247,18 @@ class TaskActiveManager(BaseActiveManager[ActiveLearningTaskConfig]):
             inferred_only=inferred_only,
         )
 
+    def _get_best_unannotated_candidates(
+        self,
+        size: int,
+        models_ids: Sequence[ID] | None = None,
+    ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+        return super()._get_best_unannotated_candidates_impl(
+            size=size,
+            annotation_state=self._get_unannotated_media_state(),
+            task_node_id=self.task_node_id,
+            models_ids=models_ids,
+        )
+
     def _update_reduced_scores(self, scores: Sequence[ActiveScore]) -> None:
         """
         Iterate over a sequence of ActiveScore entities and overwrite (in-place)
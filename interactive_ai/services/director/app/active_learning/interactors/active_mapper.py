@@ -323,6 +323,30 @@ class ActiveMapper(metaclass=Singleton):
             media_identifiers=media_identifiers,  # type: ignore
         )
 
+    @staticmethod
+    @unified_tracing
+    def update_annotation_state(
+        workspace_id: ID,
+        project_id: ID,
+        dataset_storage_id: ID,
+        annotation_scene_id: ID,
+    ) -> None:
+        """
+        Update the annotation state flag of the active score of the media annotated
+        by the given annotation scene.
+
+        :param workspace_id: ID of the workspace containing the project
+        :param project_id: ID of the project containing the media
+        :param dataset_storage_id: ID of the dataset storage containing the media
+        :param annotation_scene_id: ID of the new or modified annotation scene
+        """
+        active_manager = ActiveMapper._get_active_manager(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            dataset_storage_id=dataset_storage_id,
+        )
+        active_manager.update_annotation_state(annotation_scene_id=annotation_scene_id)
+
     @staticmethod
     def __update_active_scores(  # noqa: PLR0913
         workspace_id: ID,
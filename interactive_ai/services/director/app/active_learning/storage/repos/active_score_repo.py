@@ -23,17 +23,30 @@ from geti_types import (
     VideoFrameIdentifier,
     VideoIdentifier,
 )
+from iai_core.entities.annotation_scene_state import AnnotationState
+from iai_core.repos.base.constants import DATASET_STORAGE_ID_FIELD_NAME
 from iai_core.repos.base.dataset_storage_based_repo import DatasetStorageBasedSessionRepo
+from iai_core.repos.base.session_repo import QueryAccessMode
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 from iai_core.repos.mappers.mongodb_mappers.media_mapper import MediaIdentifierToMongo
+from iai_core.utils.iteration import grouper
 from iai_core.utils.type_helpers import SequenceOrSet
 
+# Fields of the active score documents that are maintained from the annotation and suggestion events, not mapped
+# to the ActiveScore entity: media-level annotation state (AnnotationState name) and whether the media was suggested
+ANNOTATION_STATE_FIELD_NAME = "annotation_state"
+SUGGESTED_FIELD_NAME = "suggested"
+
 
 class ActiveScoreRepo(DatasetStorageBasedSessionRepo[ActiveScore]):
     """
     Repository to persist ActiveScore entities in the database.
 
+    Besides the mapped entity, each document holds the media-level annotation state and the suggestion flag of its
+    media, so that the best candidates to suggest can be found with an indexed sorted query. The flags are only
+    initialized when the document is created, and then maintained through the dedicated methods.
+
     :param dataset_storage_identifier: Identifier of the dataset_storage
     :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
     """
@@ -72,9 +85,89 @@ class ActiveScoreRepo(DatasetStorageBasedSessionRepo[ActiveScore]):
             IndexModel([("media_identifier", pymongo.DESCENDING)]),
             IndexModel([("media_identifier.media_id", pymongo.DESCENDING)]),
             IndexModel([("score", pymongo.ASCENDING)]),
+            IndexModel(
+                [
+                    (DATASET_STORAGE_ID_FIELD_NAME, pymongo.DESCENDING),
+                    (SUGGESTED_FIELD_NAME, pymongo.ASCENDING),
+                    (ANNOTATION_STATE_FIELD_NAME, pymongo.ASCENDING),
+                    ("score", pymongo.ASCENDING),
+                ]
+            ),  # Indexed to find the best unannotated non-suggested candidates without scanning the dataset
         ]
         return super_indexes + new_indexes
 
+    def _save_update(self, doc: dict) -> dict:
+        update = super()._save_update(doc)
+        # The flags are not part of the entity, so saving a score must not overwrite them
+        update["$setOnInsert"] = {
+            ANNOTATION_STATE_FIELD_NAME: AnnotationState.NONE.name,
+            SUGGESTED_FIELD_NAME: False,
+        }
+        return update
+
+    def _update_flags(self, update: dict, media_identifiers: SequenceOrSet[MediaIdentifierEntity] | None) -> None:
+        """
+        Update the flags of the active scores of the given media (all media if None)
+
+        :param update: Value of the '$set' operator
+        :param media_identifiers: Media identifiers of the scores to update, or None to update all the scores
+        """
+        if media_identifiers is None:
+            data_filter: dict[str, Any] = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+            self._collection.update_many(filter=data_filter, update={"$set": update})
+            return
+        for media_identifiers_chunk in grouper(set(media_identifiers)):
+            data_filter = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+            data_filter["media_identifier"] = {
+                "$in": [MediaIdentifierToMongo.forward(identifier) for identifier in media_identifiers_chunk]
+            }
+            self._collection.update_many(filter=data_filter, update={"$set": update})
+
+    def set_annotation_state(
+        self, media_identifiers: SequenceOrSet[MediaIdentifierEntity], annotation_state: AnnotationState
+    ) -> None:
+        """
+        Set the media-level annotation state of the active scores of the given media.
+
+        :param media_identifiers: Identifiers of the images and video frames whose state changed
+        :param annotation_state: New media-level annotation state
+        """
+        self._update_flags({ANNOTATION_STATE_FIELD_NAME: annotation_state.name}, media_identifiers=media_identifiers)
+
+    def set_suggested(
+        self, suggested: bool, media_identifiers: SequenceOrSet[MediaIdentifierEntity] | None = None
+    ) -> None:
+        """
+        Set the suggestion flag of the active scores.
+
+        :param suggested: Whether the media have been suggested
+        :param media_identifiers: Identifiers of the images and video frames to update; if None, all the scores
+            in the dataset storage are updated
+        """
+        self._update_flags({SUGGESTED_FIELD_NAME: suggested}, media_identifiers=media_identifiers)
+
+    def reset_flags(self) -> None:
+        """Mark all the active scores in the dataset storage as unannotated and not suggested"""
+        self._update_flags(
+            {ANNOTATION_STATE_FIELD_NAME: AnnotationState.NONE.name, SUGGESTED_FIELD_NAME: False},
+            media_identifiers=None,
+        )
+
+    def has_unreconciled_flags(self) -> bool:
+        """
+        Check whether any active score lacks the flags, e.g. because it was created before they were introduced.
+
+        :return: True if the flags of the dataset storage must be reconciled
+        """
+        # Missing fields are indexed as null, so this query is covered by the compound index
+        query = {SUGGESTED_FIELD_NAME: None}
+        return (
+            self._collection.find_one(
+                {**self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ), **query}, projection=["_id"]
+            )
+            is not None
+        )
+
     def get_by_media_identifier(self, media_identifier: MediaIdentifierEntity) -> ActiveScore:
         """
         Get an ActiveScore instance given its media identifier.
@@ -147,7 +240,6 @@ class ActiveScoreRepo(DatasetStorageBasedSessionRepo[ActiveScore]):
             ActiveScoreSuggestionInfo corresponding to the selected media.
             The list is sorted by score (better/lower score first).
         """
-        media_identifier_mapper = MediaIdentifierToMongo
         if models_ids is None:
             models_ids = []
 
@@ -263,9 +355,95 @@ class ActiveScoreRepo(DatasetStorageBasedSessionRepo[ActiveScore]):
         # Note: the concatenation order matters because we pick the first-'size' items
         selectable_docs = inferred_docs + inferred_old_docs + non_inferred_docs
         selected_docs = selectable_docs[:size]
+        return self._docs_to_suggestions_info(selected_docs)
+
+    def find_best_unannotated_candidates(
+        self,
+        size: int,
+        annotation_state: AnnotationState,
+        task_node_id: ID | None = None,
+        models_ids: Sequence[ID] | None = None,
+        inferred_only: bool = False,
+    ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+        """
+        Find the 'best' set (i.e. lowest active score) of 'size' elements among the media
+        with the given annotation state that have not been suggested yet.
+
+        Unlike :meth:`find_best_candidates`, the candidates are selected through the
+        flags stored in the active score documents, so the query is served by the
+        compound index on (flags, score) and does not need the list of candidate media.
+        The priority is the same: first the media inferred by one of the given models,
+        then the media inferred by other models, and finally a random sample of the
+        media with a default score.
+
+        :param size: Max number of elements to return
+        :param annotation_state: Media-level annotation state of the candidates
+        :param task_node_id: Optional, task node whose active scores should be used
+        :param models_ids: Optional, if specified the query will prioritize the active
+            scores generated with one of the models in the list
+        :param inferred_only: If True, exclude the media with a default active score
+            (i.e. not updated based on the results of an inference).
+        :return: Tuple of at most 'size' elements, where each element is an
+            ActiveScoreSuggestionInfo corresponding to the selected media.
+            The inferred media are sorted by score (better/lower score first).
+        """
+        flags_filter = {SUGGESTED_FIELD_NAME: False, ANNOTATION_STATE_FIELD_NAME: annotation_state.name}
+        inferred_filters: list[dict[str, Any]]
+        if models_ids:
+            models_ids_mongo = [IDToMongo.forward(model_id) for model_id in models_ids]
+            inferred_filters = [
+                {**flags_filter, "score": {"$lt": 1.0}, "tasks.model_id": {"$in": models_ids_mongo}},
+                {**flags_filter, "score": {"$lt": 1.0}, "tasks.model_id": {"$nin": models_ids_mongo}},
+            ]
+        else:
+            inferred_filters = [{**flags_filter, "score": {"$lt": 1.0}}]
+
+        selected_docs: list[dict] = []
+        for inferred_filter in inferred_filters:
+            remaining_size = size - len(selected_docs)
+            if remaining_size <= 0:
+                break
+            if task_node_id is None:  # per-project active learning
+                pipeline: list[dict] = [
+                    {"$match": inferred_filter},
+                    {"$sort": {"score": 1}},
+                    {"$limit": remaining_size},
+                    {"$project": {"_id": 0, "media_identifier": 1, "score": 1, "models": "$tasks.model_id"}},
+                ]
+            else:  # per-task active learning
+                pipeline = [
+                    {"$match": inferred_filter},
+                    {"$unwind": "$tasks"},
+                    {"$match": {"tasks.task_node_id": IDToMongo.forward(task_node_id)}},
+                    {"$sort": {"tasks.score": 1}},
+                    {"$limit": remaining_size},
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "media_identifier": 1,
+                            "score": "$tasks.score",
+                            "models": "$tasks.model_id",
+                        }
+                    },
+                ]
+            selected_docs.extend(self.aggregate_read(pipeline))
+
+        remaining_size = size - len(selected_docs)
+        if not inferred_only and remaining_size > 0:
+            # Shuffle the media with a default score, for the same reason explained in find_best_candidates
+            pipeline = [
+                {"$match": {**flags_filter, "score": {"$eq": 1.0}}},
+                {"$sample": {"size": remaining_size}},
+                {"$project": {"_id": 0, "media_identifier": 1, "score": 1, "models": "$tasks.model_id"}},
+            ]
+            selected_docs.extend(self.aggregate_read(pipeline))
+        return self._docs_to_suggestions_info(selected_docs)
+
+    @staticmethod
+    def _docs_to_suggestions_info(score_docs: Sequence[dict]) -> tuple[ActiveScoreSuggestionInfo, ...]:
         return tuple(
             ActiveScoreSuggestionInfo(
-                media_identifier=media_identifier_mapper.backward(score_doc["media_identifier"]),
+                media_identifier=MediaIdentifierToMongo.backward(score_doc["media_identifier"]),
                 score=score_doc["score"],
                 # support both ids and arrays of ids
                 models_ids=(
@@ -274,7 +452,7 @@ class ActiveScoreRepo(DatasetStorageBasedSessionRepo[ActiveScore]):
                     else (IDToMongo.backward(score_doc["models"]),)
                 ),
             )
-            for score_doc in selected_docs
+            for score_doc in score_docs
         )
 
     def find_unmapped_candidates(
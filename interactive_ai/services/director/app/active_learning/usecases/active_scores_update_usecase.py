@@ -148,6 +148,40 @@ class ActiveScoresUpdateUseCase:
                 media_identifiers=media_identifiers,
             )
 
+    @staticmethod
+    def on_annotation_scene_saved(
+        workspace_id: ID,
+        project_id: ID,
+        dataset_storage_id: ID,
+        annotation_scene_id: ID,
+    ) -> None:
+        """
+        Handler to be called when an annotation scene is created or modified.
+
+        It updates the annotation state flag of the active score of the annotated media.
+
+        :param workspace_id: ID of the workspace containing the project
+        :param project_id: ID of the project containing the media
+        :param dataset_storage_id: ID of the dataset storage containing the media
+        :param annotation_scene_id: ID of the new or modified annotation scene
+        """
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            dataset_storage_id=dataset_storage_id,
+        )
+        if not ActiveScoresUpdateUseCase._is_training_dataset_storage(
+            dataset_storage_identifier=dataset_storage_identifier
+        ):
+            return  # no active learning on secondary dataset storages
+
+        ActiveMapper.update_annotation_state(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            dataset_storage_id=dataset_storage_id,
+            annotation_scene_id=annotation_scene_id,
+        )
+
     @staticmethod
     def on_media_deleted(
         workspace_id: ID,
@@ -14,3 +14,4 @@ class FeatureFlag(Enum):
     FEATURE_FLAG_STORAGE_SIZE_COMPUTATION = auto()
     FEATURE_FLAG_CREDIT_SYSTEM = auto()
     FEATURE_FLAG_NEW_CONFIGURABLE_PARAMETERS = auto()
+    FEATURE_FLAG_INDEXED_ACTIVE_SUGGESTIONS = auto()
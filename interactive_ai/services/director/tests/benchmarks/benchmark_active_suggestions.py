@@ -0,0 +1,165 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the selection of the active learning suggestions.
+
+The benchmark fills the active score collection of a synthetic dataset storage, where part of the media are
+annotated or already suggested and part of the scores are still the default ones, then compares:
+  - the chunked selection, where the unannotated non-suggested media are sent to one aggregation per chunk of
+    candidates and the results are merged with a priority queue (BaseActiveManager without the feature flag)
+  - the indexed selection (ActiveScoreRepo.find_best_unannotated_candidates), served by the compound index
+    on the annotation state and suggestion flags and on the score
+
+The list of unannotated media is given to the chunked selection for free, so its timing does not include the
+dataset storage filter query that precedes it in the active manager.
+
+The benchmark needs a MongoDB instance, configured through the same environment variables as the director.
+
+Usage:
+    python tests/benchmarks/benchmark_active_suggestions.py --num-items 500000 --size 50 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from queue import PriorityQueue
+
+from bson import ObjectId
+
+from active_learning.entities import ActiveScore, ActiveScoreSuggestionInfo, TaskActiveScore
+from active_learning.storage.repos import ActiveScoreRepo
+
+from geti_types import (
+    ID,
+    DatasetStorageIdentifier,
+    ImageIdentifier,
+    MediaIdentifierEntity,
+    make_session,
+    session_context,
+)
+from iai_core.entities.annotation_scene_state import AnnotationState
+from iai_core.utils.iteration import grouper
+
+
+def make_scores(
+    active_score_repo: ActiveScoreRepo,
+    num_items: int,
+    annotated_ratio: float,
+    suggested_ratio: float,
+    inferred_ratio: float,
+) -> tuple[list[MediaIdentifierEntity], set[MediaIdentifierEntity]]:
+    """
+    Save the synthetic active scores and set their flags
+
+    :return: Identifiers of the unannotated media and identifiers of the suggested media
+    """
+    task_node_id = ID(ObjectId())
+    model_id = ID(ObjectId())
+    unannotated_media: list[MediaIdentifierEntity] = []
+    annotated_media: list[MediaIdentifierEntity] = []
+    suggested_media: set[MediaIdentifierEntity] = set()
+    for chunk_indices in grouper(range(num_items), chunk_size=10_000):
+        scores = []
+        for _ in chunk_indices:
+            media_identifier = ImageIdentifier(image_id=ID(ObjectId()))
+            if random.random() < inferred_ratio:
+                score = random.random() * 0.99
+                tasks_scores = {task_node_id: TaskActiveScore(score=score, model_id=model_id)}
+            else:
+                score = 1.0
+                tasks_scores = {task_node_id: TaskActiveScore()}
+            scores.append(
+                ActiveScore(media_identifier=media_identifier, pipeline_score=score, tasks_scores=tasks_scores)
+            )
+            if random.random() < annotated_ratio:
+                annotated_media.append(media_identifier)
+            else:
+                unannotated_media.append(media_identifier)
+                if random.random() < suggested_ratio:
+                    suggested_media.add(media_identifier)
+        active_score_repo.save_many(scores)
+    active_score_repo.set_annotation_state(
+        media_identifiers=annotated_media, annotation_state=AnnotationState.ANNOTATED
+    )
+    active_score_repo.set_suggested(suggested=True, media_identifiers=suggested_media)
+    return unannotated_media, suggested_media
+
+
+def select_chunked(
+    active_score_repo: ActiveScoreRepo,
+    unannotated_media: list[MediaIdentifierEntity],
+    suggested_media: set[MediaIdentifierEntity],
+    size: int,
+) -> list[ActiveScoreSuggestionInfo]:
+    """Select the suggestions like BaseActiveManager.get_suggestions without the indexed flags"""
+    candidates = (media for media in unannotated_media if media not in suggested_media)
+    pq: PriorityQueue = PriorityQueue()
+    for candidates_chunk in grouper(candidates):
+        for candidate_info in active_score_repo.find_best_candidates(candidate_media=candidates_chunk, size=size):
+            if pq.qsize() >= size:
+                _, worst_candidate = pq.get()
+                candidate_info = min([worst_candidate, candidate_info], key=lambda x: x.score)  # noqa: PLW2901
+            pq.put((-candidate_info.score, candidate_info))
+    return [info for _, info in pq.queue]
+
+
+def select_indexed(active_score_repo: ActiveScoreRepo, size: int) -> list[ActiveScoreSuggestionInfo]:
+    return list(active_score_repo.find_best_unannotated_candidates(size=size, annotation_state=AnnotationState.NONE))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-items", type=int, default=500_000, help="Number of media in the dataset storage")
+    parser.add_argument("--size", type=int, default=50, help="Number of suggestions to select")
+    parser.add_argument("--annotated-ratio", type=float, default=0.2, help="Fraction of annotated media")
+    parser.add_argument("--suggested-ratio", type=float, default=0.1, help="Fraction of suggested unannotated media")
+    parser.add_argument("--inferred-ratio", type=float, default=0.7, help="Fraction of media with a computed score")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of selections timed for each implementation")
+    args = parser.parse_args()
+
+    with session_context(make_session()):
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=ID(ObjectId()), project_id=ID(ObjectId()), dataset_storage_id=ID(ObjectId())
+        )
+        active_score_repo = ActiveScoreRepo(dataset_storage_identifier)
+        try:
+            start_time = time.perf_counter()
+            unannotated_media, suggested_media = make_scores(
+                active_score_repo=active_score_repo,
+                num_items=args.num_items,
+                annotated_ratio=args.annotated_ratio,
+                suggested_ratio=args.suggested_ratio,
+                inferred_ratio=args.inferred_ratio,
+            )
+            print(
+                f"Generated {args.num_items} active scores in {time.perf_counter() - start_time:.1f} s: "
+                f"{len(unannotated_media)} unannotated, {len(suggested_media)} suggested"
+            )
+
+            expected_scores: list[float] = []
+            for name, select_fn in (
+                (
+                    "chunked selection",
+                    lambda: select_chunked(active_score_repo, unannotated_media, suggested_media, args.size),
+                ),
+                ("indexed selection", lambda: select_indexed(active_score_repo, args.size)),
+            ):
+                elapsed_times = []
+                for _ in range(args.repeat):
+                    start_time = time.perf_counter()
+                    suggestions = select_fn()
+                    elapsed_times.append(time.perf_counter() - start_time)
+                # The media with a default score are sampled randomly, so only the scores are compared
+                scores = sorted(suggestion.score for suggestion in suggestions)
+                if not expected_scores:
+                    expected_scores = scores
+                elif scores != expected_scores:
+                    raise RuntimeError(f"The output of '{name}' differs from the chunked selection")
+                best_time = min(elapsed_times)
+                print(f"{name:>20}: {best_time * 1000:9.1f} ms (best of {args.repeat})")
+        finally:
+            active_score_repo.delete_all()
+
+
+if __name__ == "__main__":
+    main()
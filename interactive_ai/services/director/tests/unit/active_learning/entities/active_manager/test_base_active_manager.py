@@ -1,17 +1,20 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 from collections.abc import Sequence
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
+from geti_feature_tools import FeatureFlagProvider
 
 from active_learning.entities import ActiveLearningProjectConfig, ActiveScoreSuggestionInfo
 from active_learning.entities.active_manager.base_active_manager import BaseActiveManager
 from active_learning.storage.repos import ActiveScoreRepo, ActiveSuggestionRepo
 
 from geti_types import ID, MediaIdentifierEntity, VideoIdentifier
+from iai_core.entities.annotation_scene_state import AnnotationSceneState, AnnotationState
 from iai_core.entities.video import Video
-from iai_core.repos import DatasetStorageRepo, ProjectRepo, VideoRepo
+from iai_core.repos import AnnotationSceneStateRepo, DatasetStorageRepo, ProjectRepo, VideoRepo
+from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
 from iai_core.services import ModelService
 
 
@@ -43,6 +46,13 @@ def fxt_base_active_manager_testable(mock_project_repo, mock_dataset_storage_rep
         ) -> tuple[ActiveScoreSuggestionInfo, ...]:
             raise NotImplementedError
 
+        def _get_best_unannotated_candidates(
+            self,
+            size: int,
+            models_ids: Sequence[ID] | None = None,
+        ) -> tuple[ActiveScoreSuggestionInfo, ...]:
+            raise NotImplementedError
+
     def _build_manager(workspace_id: ID, project_id: ID, dataset_storage_id: ID):
         with (
             patch.object(ProjectRepo, "get_by_id", return_value=fxt_project),
@@ -122,6 +132,154 @@ class TestBaseActiveManager:
         assert fxt_media_identifier_factory(0) in suggested_media
         assert fxt_media_identifier_factory(3) not in suggested_media
 
+    def test_get_suggestions_indexed(
+        self,
+        fxt_ote_id,
+        fxt_base_active_manager_testable,
+        fxt_project,
+        fxt_media_identifier_factory,
+    ) -> None:
+        model_id = fxt_ote_id(100)
+        active_manager = fxt_base_active_manager_testable(
+            workspace_id=fxt_project.workspace_id,
+            project_id=fxt_project.id_,
+            dataset_storage_id=fxt_project.get_training_dataset_storage().id_,
+        )
+        best_candidates = (
+            ActiveScoreSuggestionInfo(
+                media_identifier=fxt_media_identifier_factory(0), score=0.3, models_ids=(model_id,)
+            ),
+            ActiveScoreSuggestionInfo(
+                media_identifier=fxt_media_identifier_factory(1), score=1.0, models_ids=(model_id,)
+            ),
+        )
+
+        with (
+            patch.object(FeatureFlagProvider, "is_enabled", return_value=True),
+            patch.object(ModelService, "get_inference_active_model_id", return_value=model_id),
+            patch.object(active_manager, "_get_unannotated_non_suggested_media_identifiers") as mock_get_unannotated,
+            patch.object(
+                active_manager, "_get_best_unannotated_candidates", return_value=best_candidates
+            ) as mock_get_best_unannotated_candidates,
+        ):
+            suggestions = active_manager.get_suggestions(size=2)
+
+        mock_get_unannotated.assert_not_called()
+        mock_get_best_unannotated_candidates.assert_called_once_with(size=2, models_ids=[model_id])
+        assert suggestions == best_candidates
+
+    @pytest.mark.parametrize("unreconciled", [False, True], ids=["reconciled", "unreconciled"])
+    def test_get_best_unannotated_candidates_impl(
+        self, unreconciled, fxt_base_active_manager_testable, fxt_project, fxt_ote_id
+    ) -> None:
+        active_manager = fxt_base_active_manager_testable(
+            workspace_id=fxt_project.workspace_id,
+            project_id=fxt_project.id_,
+            dataset_storage_id=fxt_project.get_training_dataset_storage().id_,
+        )
+        task_node_id = fxt_ote_id(1)
+        models_ids = [fxt_ote_id(100)]
+
+        with (
+            patch.object(ActiveScoreRepo, "__init__", new=do_nothing),
+            patch.object(ActiveScoreRepo, "has_unreconciled_flags", return_value=unreconciled),
+            patch.object(active_manager, "reconcile_score_flags") as mock_reconcile,
+            patch.object(ActiveScoreRepo, "find_best_unannotated_candidates", return_value=()) as mock_find,
+        ):
+            active_manager._get_best_unannotated_candidates_impl(
+                size=3,
+                annotation_state=AnnotationState.PARTIALLY_ANNOTATED,
+                task_node_id=task_node_id,
+                models_ids=models_ids,
+            )
+
+        if unreconciled:
+            mock_reconcile.assert_called_once_with()
+        else:
+            mock_reconcile.assert_not_called()
+        mock_find.assert_called_once_with(
+            size=3,
+            annotation_state=AnnotationState.PARTIALLY_ANNOTATED,
+            task_node_id=task_node_id,
+            models_ids=models_ids,
+        )
+
+    def test_reconcile_score_flags(
+        self, fxt_base_active_manager_testable, fxt_project, fxt_media_identifier_factory
+    ) -> None:
+        active_manager = fxt_base_active_manager_testable(
+            workspace_id=fxt_project.workspace_id,
+            project_id=fxt_project.id_,
+            dataset_storage_id=fxt_project.get_training_dataset_storage().id_,
+        )
+        media_identifiers = [fxt_media_identifier_factory(i) for i in range(4)]
+        annotated_media = (
+            (media_identifiers[0], AnnotationState.ANNOTATED),
+            (media_identifiers[1], AnnotationState.PARTIALLY_ANNOTATED),
+            (media_identifiers[2], AnnotationState.ANNOTATED),
+        )
+
+        with (
+            patch.object(ActiveScoreRepo, "__init__", new=do_nothing),
+            patch.object(DatasetStorageFilterRepo, "__init__", new=do_nothing),
+            patch.object(ActiveScoreRepo, "reset_flags") as mock_reset_flags,
+            patch.object(
+                DatasetStorageFilterRepo,
+                "get_annotated_media_identifiers_and_states",
+                return_value=iter(annotated_media),
+            ),
+            patch.object(ActiveScoreRepo, "set_annotation_state") as mock_set_annotation_state,
+            patch.object(active_manager, "_get_previously_suggested_media", return_value=(media_identifiers[3],)),
+            patch.object(ActiveScoreRepo, "set_suggested") as mock_set_suggested,
+        ):
+            active_manager.reconcile_score_flags()
+
+        mock_reset_flags.assert_called_once_with()
+        mock_set_annotation_state.assert_has_calls(
+            [
+                call(
+                    media_identifiers=[media_identifiers[0], media_identifiers[2]],
+                    annotation_state=AnnotationState.ANNOTATED,
+                ),
+                call(
+                    media_identifiers=[media_identifiers[1]],
+                    annotation_state=AnnotationState.PARTIALLY_ANNOTATED,
+                ),
+            ]
+        )
+        mock_set_suggested.assert_called_once_with(suggested=True, media_identifiers=(media_identifiers[3],))
+
+    def test_update_annotation_state(
+        self, fxt_base_active_manager_testable, fxt_project, fxt_media_identifier, fxt_ote_id
+    ) -> None:
+        active_manager = fxt_base_active_manager_testable(
+            workspace_id=fxt_project.workspace_id,
+            project_id=fxt_project.id_,
+            dataset_storage_id=fxt_project.get_training_dataset_storage().id_,
+        )
+        annotation_scene_state = AnnotationSceneState(
+            media_identifier=fxt_media_identifier,
+            annotation_scene_id=fxt_ote_id(2),
+            annotation_state_per_task={fxt_ote_id(3): AnnotationState.ANNOTATED},
+            unannotated_rois={},
+            id_=fxt_ote_id(4),
+        )
+
+        with (
+            patch.object(AnnotationSceneStateRepo, "__init__", new=do_nothing),
+            patch.object(ActiveScoreRepo, "__init__", new=do_nothing),
+            patch.object(
+                AnnotationSceneStateRepo, "get_latest_for_annotation_scene", return_value=annotation_scene_state
+            ) as mock_get_state,
+            patch.object(ActiveScoreRepo, "set_annotation_state") as mock_set_annotation_state,
+        ):
+            active_manager.update_annotation_state(annotation_scene_id=fxt_ote_id(2))
+
+        mock_get_state.assert_called_once_with(fxt_ote_id(2))
+        mock_set_annotation_state.assert_called_once_with(
+            media_identifiers=(fxt_media_identifier,), annotation_state=AnnotationState.ANNOTATED
+        )
+
     def test_init_scores(
         self,
         fxt_base_active_manager_testable,
@@ -174,7 +332,11 @@ class TestBaseActiveManager:
             score=0.4,
             models_ids=(fxt_ote_id(1), fxt_ote_id(2)),
         )
-        with patch.object(ActiveSuggestionRepo, "save_many", return_value=None) as mock_save_many:
+        with (
+            patch.object(ActiveSuggestionRepo, "save_many", return_value=None) as mock_save_many,
+            patch.object(ActiveScoreRepo, "__init__", new=do_nothing),
+            patch.object(ActiveScoreRepo, "set_suggested", return_value=None) as mock_set_suggested,
+        ):
             active_manager.mark_as_suggested(
                 suggested_media_info=[suggested_item],
                 user_id="dummy_user",
@@ -182,6 +344,7 @@ class TestBaseActiveManager:
             )
 
         mock_save_many.assert_called_once()
+        mock_set_suggested.assert_called_once_with(suggested=True, media_identifiers=[fxt_media_identifier])
 
     def test_reset_suggestions(self, fxt_base_active_manager_testable, fxt_project) -> None:
         active_manager = fxt_base_active_manager_testable(
@@ -189,10 +352,15 @@ class TestBaseActiveManager:
             project_id=fxt_project.id_,
             dataset_storage_id=fxt_project.get_training_dataset_storage().id_,
         )
-        with patch.object(ActiveSuggestionRepo, "delete_all") as mock_delete:
+        with (
+            patch.object(ActiveSuggestionRepo, "delete_all") as mock_delete,
+            patch.object(ActiveScoreRepo, "__init__", new=do_nothing),
+            patch.object(ActiveScoreRepo, "set_suggested") as mock_set_suggested,
+        ):
             active_manager.reset_suggestions()
 
         mock_delete.assert_called_once()
+        mock_set_suggested.assert_called_once_with(suggested=False)
 
     @pytest.mark.parametrize("all_media", [True, False], ids=["all media", "some media"])
     def test_remove_media(
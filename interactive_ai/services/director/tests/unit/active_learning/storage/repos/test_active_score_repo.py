@@ -9,6 +9,7 @@ from active_learning.entities import ActiveScore, ActiveScoreSuggestionInfo, Nul
 from active_learning.storage.repos.active_score_repo import ActiveScoreRepo
 
 from geti_types import ID, DatasetStorageIdentifier, VideoFrameIdentifier, VideoIdentifier
+from iai_core.entities.annotation_scene_state import AnnotationState
 
 
 class TestActiveScoreRepo:
@@ -479,6 +480,110 @@ class TestActiveScoreRepo:
             assert len(best_media_ids) == 5
             assert set(identifiers[:4]).issubset(best_media_ids)
 
+    @pytest.mark.parametrize("consider_model", [False, True], ids=["ignore model", "consider model"])
+    def test_find_best_unannotated_candidates(
+        self,
+        request,
+        consider_model,
+        fxt_ote_id,
+        fxt_project,
+        fxt_dataset_storage,
+        fxt_active_score_factory,
+        fxt_media_identifier_factory,
+    ) -> None:
+        """
+        <b>Description:</b>
+        Test the method ActiveScoreRepo.find_best_unannotated_candidates.
+
+        <b>Input data:</b>
+        Dataset storage
+
+        <b>Expected results:</b>
+        ActiveScoreRepo.find_best_unannotated_candidates returns the best scores among
+        the media flagged as unannotated and not suggested, and saving the scores again
+        does not overwrite the flags.
+
+        <b>Steps</b>
+        1. Create and save four active scores with custom project-level score values
+           and other two scores with default values.
+        2. Flag the best score as suggested and the second best as annotated, then save
+           all the scores again.
+        3. Call 'find_best_unannotated_candidates' to get the best set of 2 items.
+        4. Verify that the output is well sorted and it excludes the flagged items
+        5. Call 'find_best_unannotated_candidates' to get the best set of 5 items.
+        6. Verify that the output contains the 3 remaining inferred items and 2 items
+           with a default score.
+        """
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_project.workspace_id,
+            project_id=fxt_project.id_,
+            dataset_storage_id=fxt_dataset_storage.id_,
+        )
+        repo = ActiveScoreRepo(dataset_storage_identifier)
+        request.addfinalizer(lambda: repo.delete_all())
+        # fmt: off
+        model_1_id, model_2_id, model_3_id = fxt_ote_id(101), fxt_ote_id(102), fxt_ote_id(103)
+        score_0: ActiveScore = fxt_active_score_factory(index=0, score=0.7, model_ids=[model_1_id, model_2_id])
+        score_1: ActiveScore = fxt_active_score_factory(index=1, score=0.3, model_ids=[model_1_id, model_2_id])
+        score_2: ActiveScore = fxt_active_score_factory(index=2, score=0.1, model_ids=[model_1_id, model_2_id])
+        score_3: ActiveScore = fxt_active_score_factory(index=3, score=0.5, model_ids=[model_2_id, model_3_id])
+        score_4: ActiveScore = fxt_active_score_factory(index=4, score=0.2, model_ids=[model_1_id, model_2_id])
+        # fmt: on
+        score_5, score_6 = tuple(
+            ActiveScore.make_default(
+                id_=ActiveScoreRepo.generate_id(),
+                media_identifier=fxt_media_identifier_factory(i),
+                task_nodes_ids=[],
+            )
+            for i in (5, 6)
+        )
+        scores = [score_0, score_1, score_2, score_3, score_4, score_5, score_6]
+        identifiers = [score.media_identifier for score in scores]
+        repo.save_many(scores)
+        repo.set_suggested(suggested=True, media_identifiers=[identifiers[2]])
+        repo.set_annotation_state(media_identifiers=[identifiers[4]], annotation_state=AnnotationState.ANNOTATED)
+        repo.save_many(scores)
+
+        best_items = repo.find_best_unannotated_candidates(
+            size=2,
+            annotation_state=AnnotationState.NONE,
+            models_ids=([model_1_id]) if consider_model else None,
+        )
+
+        if consider_model:
+            # score_3 is last because it refers to another model
+            assert best_items == (
+                ActiveScoreSuggestionInfo(
+                    media_identifier=identifiers[1], score=0.3, models_ids=(model_1_id, model_2_id)
+                ),
+                ActiveScoreSuggestionInfo(
+                    media_identifier=identifiers[0], score=0.7, models_ids=(model_1_id, model_2_id)
+                ),
+            )
+        else:
+            assert best_items == (
+                ActiveScoreSuggestionInfo(
+                    media_identifier=identifiers[1], score=0.3, models_ids=(model_1_id, model_2_id)
+                ),
+                ActiveScoreSuggestionInfo(
+                    media_identifier=identifiers[3], score=0.5, models_ids=(model_2_id, model_3_id)
+                ),
+            )
+
+        best_items = repo.find_best_unannotated_candidates(
+            size=5,
+            annotation_state=AnnotationState.NONE,
+            models_ids=([model_1_id]) if consider_model else None,
+        )
+        assert {item.media_identifier for item in best_items} == {
+            identifiers[0],
+            identifiers[1],
+            identifiers[3],
+            identifiers[5],
+            identifiers[6],
+        }
+        assert not repo.has_unreconciled_flags()
+
     @pytest.mark.parametrize("mapped_only", [False, True], ids=["include unmapped", "exclude unmapped"])
     @pytest.mark.parametrize("consider_model", [False, True], ids=["ignore model", "consider model"])
     def test_find_best_candidates_task_level(
@@ -79,6 +79,32 @@ class TestActiveScoresUpdateUseCase:
             media_identifiers=new_media,
         )
 
+    def test_on_annotation_scene_saved(self, fxt_ote_id) -> None:
+        workspace_id = fxt_ote_id(1)
+        project_id = fxt_ote_id(2)
+        dataset_storage_id = fxt_ote_id(3)
+        annotation_scene_id = fxt_ote_id(4)
+        with (
+            patch.object(
+                ActiveScoresUpdateUseCase, "_is_training_dataset_storage", return_value=True
+            ) as mock_is_main_storage,
+            patch.object(ActiveMapper, "update_annotation_state", return_value=None) as mock_update_annotation_state,
+        ):
+            ActiveScoresUpdateUseCase.on_annotation_scene_saved(
+                workspace_id=workspace_id,
+                project_id=project_id,
+                dataset_storage_id=dataset_storage_id,
+                annotation_scene_id=annotation_scene_id,
+            )
+
+        mock_is_main_storage.assert_called_once()
+        mock_update_annotation_state.assert_called_once_with(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            dataset_storage_id=dataset_storage_id,
+            annotation_scene_id=annotation_scene_id,
+        )
+
     @pytest.mark.parametrize("asynchronous", (False, True))
     def test_on_media_deleted(self, asynchronous, fxt_media_identifier_factory, fxt_ote_id) -> None:
         workspace_id = fxt_ote_id(1)
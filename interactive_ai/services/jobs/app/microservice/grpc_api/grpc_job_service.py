@@ -16,7 +16,16 @@ import grpc
 
 from microservice.exceptions import DuplicateJobFoundException
 from microservice.grpc_api.mappers.proto_mapper import JobToProto
-from microservice.job_manager import JobManager, JobsAcl, JobSortingField, Pagination, SortDirection, TimestampFilter
+from microservice.job_manager import (
+    JobManager,
+    JobsAcl,
+    JobSortingField,
+    JobSubmission,
+    JobSubmissionStatus,
+    Pagination,
+    SortDirection,
+    TimestampFilter,
+)
 from model.duplicate_policy import DuplicatePolicy
 from model.job_state import JobStateGroup
 from model.telemetry import Telemetry
@@ -36,6 +45,8 @@ from grpc_interfaces.job_submission.pb.job_service_pb2 import (
     JobResponse,
     ListJobsResponse,
     SubmitJobRequest,
+    SubmitJobsBulkRequest,
+    SubmitJobsBulkResponse,
 )
 from grpc_interfaces.job_submission.pb.job_service_pb2_grpc import JobServiceServicer, add_JobServiceServicer_to_server
 from iai_core.session.session_propagation import setup_session_grpc
@@ -49,6 +60,7 @@ MAX_N_JOBS_RETURNED = 50
 
 MSG_ERR_DESERIALIZE_JOB_PAYLOAD = "Failed to deserialize the job payload. Please check the payload and try again."
 MSG_ERR_DESERIALIZE_JOB_METADATA = "Failed to deserialize the job metadata. Please check the metadata and try again."
+MSG_ERR_DESERIALIZE_JOB_KEY = "Failed to deserialize the job key. Please provide a JSON object as key and try again."
 MSG_ERR_SERIALIZE_JOB_PAYLOAD = "Failed to serialize the job payload. Please check the payload and try again."
 MSG_ERR_INSUFFICIENT_CREDITS = "Insufficient balance for job submission"
 MSG_ERR_DUPLICATE_JOB = (
@@ -59,6 +71,11 @@ MSG_ERR_NOT_FOUND_JOB = "The requested job was not found. Please check the job I
 MSG_ERR_DUPLICATE_POLICY = "The supplied duplicate policy is invalid. Please provide a valid policy and try again."
 MSG_ERR_TEMPLATE = "Request failed due to the following error: `{}`. Please try again later."
 
+SUBMISSION_STATUS_DETAILS = {
+    JobSubmissionStatus.DUPLICATE: MSG_ERR_DUPLICATE_JOB,
+    JobSubmissionStatus.INSUFFICIENT_CREDITS: MSG_ERR_INSUFFICIENT_CREDITS,
+}
+
 
 class GRPCJobService(JobServiceServicer):
     """
@@ -81,50 +98,27 @@ class GRPCJobService(JobServiceServicer):
         :raises: JobPayloadNotDeserializableException if the payload is not deserializable
         """
         try:
-            payload_dict = json.loads(request.payload)
-        except JSONDecodeError:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(MSG_ERR_DESERIALIZE_JOB_PAYLOAD)
-            return JobIdResponse()
-        try:
-            metadata_dict = json.loads(request.metadata)
-        except JSONDecodeError:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(MSG_ERR_DESERIALIZE_JOB_METADATA)
-            return JobIdResponse()
-
-        try:
-            duplicate_policy = DuplicatePolicy[request.duplicate_policy.upper()]
-        except KeyError:
+            submission = self._to_job_submission(request)
+        except ValueError as err:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details(MSG_ERR_DUPLICATE_POLICY)
+            context.set_details(str(err))
             return JobIdResponse()
 
-        project_id = ID(request.project_id) if request.project_id else None
-        author = ID(request.author)
-        telemetry = Telemetry(context=request.telemetry.context)
-
-        cost_requests = (
-            {resource.unit: resource.amount for resource in request.cost}
-            if request.cost is not None and len(request.cost) > 0
-            else None
-        )
-
         try:
             job_id = self.job_manager.submit(
-                job_type=request.type,
-                priority=request.priority,
-                job_name=request.job_name,
-                key=request.key,
-                payload=payload_dict,
-                metadata=metadata_dict,
-                author=author,
-                duplicate_policy=duplicate_policy,
-                telemetry=telemetry,
-                project_id=project_id,
-                gpu_num_required=request.gpu_num_required,
-                cost_requests=cost_requests,
-                cancellable=request.cancellable,
+                job_type=submission.job_type,
+                priority=submission.priority,
+                job_name=submission.job_name,
+                key=submission.key,
+                payload=submission.payload,
+                metadata=submission.metadata,
+                author=submission.author,
+                duplicate_policy=submission.duplicate_policy,
+                telemetry=submission.telemetry,
+                project_id=submission.project_id,
+                gpu_num_required=submission.gpu_num_required,
+                cost_requests=submission.cost_requests,
+                cancellable=submission.cancellable,
             )
         except InsufficientCreditsException:
             context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
@@ -134,9 +128,45 @@ class GRPCJobService(JobServiceServicer):
             context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
             context.set_details(MSG_ERR_DUPLICATE_JOB)
             return JobIdResponse()
-        logger.info("Job with ID '%s' submitted by user_id: '%s'.", job_id, author)
+        logger.info("Job with ID '%s' submitted by user_id: '%s'.", job_id, submission.author)
         return JobIdResponse(id=job_id)
 
+    @setup_session_grpc
+    @unified_tracing
+    def submit_bulk(self, request: SubmitJobsBulkRequest, context) -> SubmitJobsBulkResponse:  # noqa: ANN001, ARG002
+        """
+        Submit a batch of jobs to the job service.
+
+        Unlike submit, the failure of a job does not fail the request: the outcome of each job is returned instead.
+
+        :param request: the SubmitJobsBulkRequest containing the information of the new jobs
+        :param context: the gRPC context for the request
+        :return: a SubmitJobsBulkResponse containing the outcome of each job, in the same order as the request
+        """
+        outcomes: list[SubmitJobsBulkResponse.Outcome | None] = [None] * len(request.jobs)
+        submissions: dict[int, JobSubmission] = {}
+        for index, job_request in enumerate(request.jobs):
+            try:
+                submissions[index] = self._to_job_submission(job_request)
+            except ValueError as err:
+                outcomes[index] = SubmitJobsBulkResponse.Outcome(
+                    status=JobSubmissionStatus.INVALID.name, details=str(err)
+                )
+
+        submission_outcomes = self.job_manager.submit_bulk(submissions=list(submissions.values()))
+        for index, outcome in zip(submissions, submission_outcomes):
+            outcomes[index] = SubmitJobsBulkResponse.Outcome(
+                status=outcome.status.name,
+                id=outcome.job_id if outcome.job_id is not None else "",
+                details=SUBMISSION_STATUS_DETAILS.get(outcome.status, ""),
+            )
+        logger.info(
+            "%d/%d jobs submitted by bulk submission.",
+            sum(outcome.status == JobSubmissionStatus.SUBMITTED for outcome in submission_outcomes),
+            len(request.jobs),
+        )
+        return SubmitJobsBulkResponse(outcomes=outcomes)
+
     @setup_session_grpc
     @unified_tracing
     def get_by_id(self, request: GetJobByIdRequest, context) -> JobResponse:  # noqa: ANN001
@@ -399,3 +429,52 @@ class GRPCJobService(JobServiceServicer):
         except KeyError as err:
             raise ValueError(f"Invalid sort_direction '{sort_direction}'.") from err
         return _sort_by, _sort_direction
+
+    @staticmethod
+    def _to_job_submission(request: SubmitJobRequest) -> JobSubmission:
+        """
+        Validates a job submission request and converts it to a JobSubmission.
+
+        :param request: the SubmitJobRequest to convert
+        :return: the JobSubmission
+        :raises ValueError: if the key, the payload, the metadata or the duplicate policy is invalid
+        """
+        try:
+            key_dict = json.loads(request.key)
+        except JSONDecodeError as err:
+            raise ValueError(MSG_ERR_DESERIALIZE_JOB_KEY) from err
+        if not isinstance(key_dict, dict):
+            raise ValueError(MSG_ERR_DESERIALIZE_JOB_KEY)
+        try:
+            payload_dict = json.loads(request.payload)
+        except JSONDecodeError as err:
+            raise ValueError(MSG_ERR_DESERIALIZE_JOB_PAYLOAD) from err
+        try:
+            metadata_dict = json.loads(request.metadata)
+        except JSONDecodeError as err:
+            raise ValueError(MSG_ERR_DESERIALIZE_JOB_METADATA) from err
+        try:
+            duplicate_policy = DuplicatePolicy[request.duplicate_policy.upper()]
+        except KeyError as err:
+            raise ValueError(MSG_ERR_DUPLICATE_POLICY) from err
+
+        cost_requests = (
+            {resource.unit: resource.amount for resource in request.cost}
+            if request.cost is not None and len(request.cost) > 0
+            else None
+        )
+        return JobSubmission(
+            job_type=request.type,
+            priority=request.priority,
+            job_name=request.job_name,
+            key=request.key,
+            payload=payload_dict,
+            metadata=metadata_dict,
+            author=ID(request.author),
+            duplicate_policy=duplicate_policy,
+            cancellable=request.cancellable,
+            telemetry=Telemetry(context=request.telemetry.context),
+            project_id=ID(request.project_id) if request.project_id else None,
+            gpu_num_required=request.gpu_num_required,
+            cost_requests=cost_requests,
+        )
@@ -7,11 +7,11 @@ Job manager module
 
 import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from pymongo.client_session import ClientSession
 
@@ -19,6 +19,7 @@ from microservice.exceptions import DuplicateJobFoundException, JobNotCancellabl
 from microservice.job_repo import SessionBasedMicroserviceJobRepo, WorkspaceBasedMicroserviceJobRepo
 from model.duplicate_policy import DuplicatePolicy
 from model.job import Job
+from model.job_change import publish_job_changed
 from model.job_state import JobGpuRequestState, JobState, JobStateGroup
 from model.mapper.job_mapper import JobMapper
 from model.telemetry import Telemetry
@@ -26,7 +27,7 @@ from model.telemetry import Telemetry
 from geti_spicedb_tools import SpiceDB, SpiceDBResourceTypes
 from geti_telemetry_tools import unified_tracing
 from geti_types import CTX_SESSION_VAR, ID, Singleton
-from grpc_interfaces.credit_system.client import CreditSystemClient, ResourceRequest
+from grpc_interfaces.credit_system.client import CreditSystemClient, InsufficientCreditsException, ResourceRequest
 from iai_core.utils.time_utils import now
 
 if TYPE_CHECKING:
@@ -102,6 +103,73 @@ class JobsAcl:
     permitted_projects: Sequence[ID] | None = None
     workspace_jobs_author: str | None = None
 
+    def permits(self, job: Job) -> bool:
+        """
+        Checks if the job is accessible according to the ACL, matching the MongoDB ACL filtering query
+
+        :param job: job to check
+        :return: True if the job can be accessed, False otherwise
+        """
+        if job.project_id is not None:
+            return self.permitted_projects is None or job.project_id in self.permitted_projects
+        return self.workspace_jobs_author is None or job.author == self.workspace_jobs_author
+
+
+@dataclass()
+class JobSubmission:
+    """
+    Job submission, one of the jobs of a bulk submission
+
+    Fields match the parameters of :meth:`JobManager.submit`.
+    """
+
+    job_type: str
+    priority: int
+    job_name: str
+    key: str
+    payload: dict
+    metadata: dict
+    author: ID
+    duplicate_policy: DuplicatePolicy
+    cancellable: bool
+    telemetry: Telemetry | None = None
+    project_id: ID | None = None
+    gpu_num_required: int | None = None
+    cost_requests: dict[str, int] | None = None
+
+
+class JobSubmissionStatus(Enum):
+    """
+    Enum representing the possible outcomes of a job submission within a bulk submission
+
+    SUBMITTED               the job has been submitted
+    OMITTED                 a duplicate job was found and the policy is OMIT, the duplicate's ID is returned
+    REPLACED                the job has been replaced by a later job of the same batch having the same key
+    DUPLICATE               a duplicate job was found and the policy is REJECT
+    INSUFFICIENT_CREDITS    the organization doesn't have enough credits for the job
+    INVALID                 the job submission is malformed (i.e. payload cannot be deserialized)
+    """
+
+    SUBMITTED = auto()
+    OMITTED = auto()
+    REPLACED = auto()
+    DUPLICATE = auto()
+    INSUFFICIENT_CREDITS = auto()
+    INVALID = auto()
+
+
+@dataclass(frozen=True)
+class JobSubmissionOutcome:
+    """
+    Outcome of a job submission within a bulk submission
+
+    status          submission status
+    job_id          ID of the submitted job, or of its duplicate if the job has been omitted
+    """
+
+    status: JobSubmissionStatus
+    job_id: ID | None = None
+
 
 class JobManager(metaclass=Singleton):
     """
@@ -110,6 +178,7 @@ class JobManager(metaclass=Singleton):
     Main entry point for jobs management related operations available in Jobs microservice.
     Operations provided by this module are available to clients through REST or gRPC API and are:
         * submit a job
+        * submit a batch of jobs
         * get job by ID
         * mark job cancelled (with or without deletion flag)
         * get jobs count
@@ -182,49 +251,25 @@ class JobManager(metaclass=Singleton):
         :return submitted job ID
         """
         normalized_key = self._normalize_key(key)
-        _telemetry = telemetry if telemetry is not None else Telemetry()
-        session = CTX_SESSION_VAR.get()
-        document = {
-            "workspace_id": session.workspace_id,
-            "type": job_type,
-            "priority": priority,
-            "job_name": job_name,
-            "state": JobState.SUBMITTED.value,
-            "state_group": JobStateGroup.SCHEDULED.value,
-            "cancellation_info": {"is_cancelled": False, "cancellable": cancellable},
-            "step_details": [],
-            "key": normalized_key,
-            "payload": payload,
-            "metadata": metadata,
-            "creation_time": now(),
-            "author": author,
-            "executions": {"main": {}},
-            "session": session.as_json(),
-            "telemetry": {"context": _telemetry.context},
-        }
-        if project_id is not None:
-            document["project_id"] = str(project_id)
-        if gpu_num_required is not None:
-            document["gpu"] = {
-                "num_required": gpu_num_required,
-                "state": JobGpuRequestState.WAITING.value,
-            }
-
+        submission = JobSubmission(
+            job_type=job_type,
+            priority=priority,
+            job_name=job_name,
+            key=key,
+            payload=payload,
+            metadata=metadata,
+            author=author,
+            duplicate_policy=duplicate_policy,
+            cancellable=cancellable,
+            telemetry=telemetry,
+            project_id=project_id,
+            gpu_num_required=gpu_num_required,
+            cost_requests=cost_requests,
+        )
+        document = self._build_job_document(submission=submission, normalized_key=normalized_key)
         if cost_requests is not None:
             with CreditSystemClient(metadata_getter=lambda: ()) as client:
-                lease_id = client.acquire_lease(
-                    organization_id=str(session.organization_id),
-                    workspace_id=str(session.workspace_id),
-                    project_id=str(project_id) if project_id is not None else None,
-                    service_name=job_type,
-                    requests=[ResourceRequest(amount=cost_requests[unit], unit=unit) for unit in cost_requests],
-                )
-                document["cost"] = {
-                    "requests": [{"amount": cost_requests[unit], "unit": unit} for unit in cost_requests],
-                    "lease_id": lease_id,
-                    "consumed": [],
-                    "reported": False,
-                }
+                document["cost"] = self._acquire_cost_lease(client=client, submission=submission)
 
         job_repo = WorkspaceBasedMicroserviceJobRepo()
         with job_repo._mongo_client.start_session() as mongodb_session:
@@ -280,6 +325,241 @@ class JobManager(metaclass=Singleton):
                 logger.info(f"Duplicate job with ID {duplicate.get('_id')} has been found, rejecting submitted job")
                 raise DuplicateJobFoundException
         job_id = job_repo.insert_document(document, mongodb_session=mongodb_session)
+        JobManager._create_job_relation(job_id=job_id, project_id=project_id)
+        publish_job_changed(job_id=ID(job_id))
+        return ID(job_id)
+
+    def submit_bulk(self, submissions: Sequence[JobSubmission]) -> list[JobSubmissionOutcome]:
+        """
+        Submits a batch of jobs to storage.
+
+        The batch is processed as if the jobs were submitted one by one in the given order, but the duplicates are
+        looked up with a single query and the jobs are inserted with a single bulk write, so that hundreds of jobs
+        can be submitted in one request. Duplicates are also checked among the jobs of the batch:
+            - 'REPLACE': a previous job of the batch with the same key is not submitted (REPLACED outcome)
+            - 'OMIT': the ID of the previous job of the batch with the same key is returned (OMITTED outcome)
+            - 'REJECT': the job is not submitted (DUPLICATE outcome)
+
+        A failure of a job (i.e. insufficient credits) does not prevent the other jobs of the batch to be submitted.
+
+        :param submissions: jobs to submit
+        :return: outcome of the submission of each job, in the same order as the submissions
+        """
+        keys = [self._normalize_key(submission.key) for submission in submissions]
+        outcomes: list[JobSubmissionOutcome | None] = [None] * len(submissions)
+        documents: dict[int, dict] = {}  # index of the submission -> document to insert
+        pending_keys: dict[str, int] = {}  # job key -> index of the submission of the batch holding it
+        omitted_for: dict[int, int] = {}  # index of the omitted submission -> index of the duplicate submission
+        replaced_keys: set[str] = set()
+
+        job_repo = WorkspaceBasedMicroserviceJobRepo()
+        with job_repo._mongo_client.start_session() as mongodb_session:
+            duplicate_ids = self._find_duplicate_ids(
+                keys=[
+                    key
+                    for key, submission in zip(keys, submissions)
+                    if submission.duplicate_policy in (DuplicatePolicy.OMIT, DuplicatePolicy.REJECT)
+                ],
+                job_repo=job_repo,
+            )
+            for index, (key, submission) in enumerate(zip(keys, submissions)):
+                # Duplicates are only looked up for OMIT and REJECT policies
+                if submission.duplicate_policy == DuplicatePolicy.REPLACE:
+                    replaced_index = pending_keys.pop(key, None)
+                    if replaced_index is not None:
+                        del documents[replaced_index]
+                        outcomes[replaced_index] = JobSubmissionOutcome(status=JobSubmissionStatus.REPLACED)
+                    replaced_keys.add(key)
+                elif key in pending_keys or key in duplicate_ids:
+                    if submission.duplicate_policy == DuplicatePolicy.REJECT:
+                        outcomes[index] = JobSubmissionOutcome(status=JobSubmissionStatus.DUPLICATE)
+                    elif key in pending_keys:
+                        omitted_for[index] = pending_keys[key]
+                    else:
+                        outcomes[index] = JobSubmissionOutcome(
+                            status=JobSubmissionStatus.OMITTED, job_id=duplicate_ids[key]
+                        )
+                    continue
+                documents[index] = self._build_job_document(submission=submission, normalized_key=key)
+                pending_keys[key] = index
+
+            # Credits are only leased for the jobs that are actually going to be inserted
+            self._acquire_cost_leases(submissions=submissions, documents=documents, outcomes=outcomes)
+
+            self._cancel_submitted_duplicates(keys=replaced_keys, job_repo=job_repo, mongodb_session=mongodb_session)
+            inserted_ids = job_repo.insert_documents(list(documents.values()), mongodb_session=mongodb_session)
+
+        for index, job_id in zip(documents, inserted_ids):
+            if job_id is None:
+                logger.info("Duplicate job has been inserted concurrently, rejecting submitted job")
+                outcomes[index] = JobSubmissionOutcome(status=JobSubmissionStatus.DUPLICATE)
+                continue
+            self._create_job_relation(job_id=job_id, project_id=submissions[index].project_id)
+            publish_job_changed(job_id=job_id)
+            outcomes[index] = JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=job_id)
+
+        # Jobs omitted in favour of a job of the batch share its outcome
+        for index, duplicate_index in omitted_for.items():
+            outcomes[index] = self._get_omitted_outcome(cast("JobSubmissionOutcome", outcomes[duplicate_index]))
+        return cast("list[JobSubmissionOutcome]", outcomes)
+
+    @staticmethod
+    def _cancel_submitted_duplicates(
+        keys: Collection[str],
+        job_repo: WorkspaceBasedMicroserviceJobRepo,
+        mongodb_session: ClientSession,
+    ) -> None:
+        """
+        Marks the SUBMITTED jobs with the given keys as cancelled and to be deleted.
+
+        :param keys: normalized keys of the jobs to replace
+        :param job_repo: job repo
+        :param mongodb_session: ClientSession for MongoDB transactions
+        """
+        if not keys:
+            return
+        job_repo.update_many(
+            job_filter={"key": {"$in": sorted(keys)}, "state": JobState.SUBMITTED.value},
+            update={
+                "$set": {
+                    "cancellation_info.is_cancelled": True,
+                    "cancellation_info.delete_job": True,
+                }
+            },
+            mongodb_session=mongodb_session,
+        )
+
+    @staticmethod
+    def _get_omitted_outcome(duplicate_outcome: JobSubmissionOutcome) -> JobSubmissionOutcome:
+        """
+        Returns the outcome of a job omitted in favour of a duplicate job of the same batch.
+
+        :param duplicate_outcome: outcome of the duplicate job
+        :return: OMITTED outcome with the ID of the duplicate job if it has been submitted, its outcome otherwise
+        """
+        if duplicate_outcome.status == JobSubmissionStatus.SUBMITTED:
+            return JobSubmissionOutcome(status=JobSubmissionStatus.OMITTED, job_id=duplicate_outcome.job_id)
+        return duplicate_outcome
+
+    def _acquire_cost_leases(
+        self,
+        submissions: Sequence[JobSubmission],
+        documents: dict[int, dict],
+        outcomes: list[JobSubmissionOutcome | None],
+    ) -> None:
+        """
+        Acquires the credits leases of the jobs to insert having cost requests. The jobs whose lease cannot be
+        acquired are removed from the documents to insert.
+
+        :param submissions: job submissions of the batch
+        :param documents: documents to insert by index of the submission, updated in place
+        :param outcomes: outcomes by index of the submission, updated in place
+        """
+        indexes = [index for index in documents if submissions[index].cost_requests is not None]
+        if not indexes:
+            return
+        with CreditSystemClient(metadata_getter=lambda: ()) as client:
+            for index in indexes:
+                try:
+                    documents[index]["cost"] = self._acquire_cost_lease(client=client, submission=submissions[index])
+                except InsufficientCreditsException:
+                    del documents[index]
+                    outcomes[index] = JobSubmissionOutcome(status=JobSubmissionStatus.INSUFFICIENT_CREDITS)
+
+    @staticmethod
+    def _find_duplicate_ids(keys: Sequence[str], job_repo: WorkspaceBasedMicroserviceJobRepo) -> dict[str, ID]:
+        """
+        Looks up the jobs that are not running yet with the given keys.
+
+        :param keys: normalized job keys
+        :param job_repo: job repo
+        :return: dict mapping each key having a duplicate to the ID of the duplicate job
+        """
+        if not keys:
+            return {}
+        documents = job_repo.aggregate_read(
+            [
+                {"$match": {"key": {"$in": sorted(set(keys))}, "state": {"$lt": JobState.RUNNING.value}}},
+                {"$project": {"key": 1}},
+            ]
+        )
+        duplicate_ids: dict[str, ID] = {}
+        for document in documents:
+            duplicate_ids.setdefault(document["key"], ID(document["_id"]))
+        return duplicate_ids
+
+    @staticmethod
+    def _build_job_document(submission: JobSubmission, normalized_key: str) -> dict:
+        """
+        Builds the document of a new job, without its cost lease.
+
+        :param submission: job submission
+        :param normalized_key: normalized job key
+        :return: job document
+        """
+        telemetry = submission.telemetry if submission.telemetry is not None else Telemetry()
+        session = CTX_SESSION_VAR.get()
+        document = {
+            "workspace_id": session.workspace_id,
+            "type": submission.job_type,
+            "priority": submission.priority,
+            "job_name": submission.job_name,
+            "state": JobState.SUBMITTED.value,
+            "state_group": JobStateGroup.SCHEDULED.value,
+            "cancellation_info": {"is_cancelled": False, "cancellable": submission.cancellable},
+            "step_details": [],
+            "key": normalized_key,
+            "payload": submission.payload,
+            "metadata": submission.metadata,
+            "creation_time": now(),
+            "author": submission.author,
+            "executions": {"main": {}},
+            "session": session.as_json(),
+            "telemetry": {"context": telemetry.context},
+        }
+        if submission.project_id is not None:
+            document["project_id"] = str(submission.project_id)
+        if submission.gpu_num_required is not None:
+            document["gpu"] = {
+                "num_required": submission.gpu_num_required,
+                "state": JobGpuRequestState.WAITING.value,
+            }
+        return document
+
+    @staticmethod
+    def _acquire_cost_lease(client: CreditSystemClient, submission: JobSubmission) -> dict:
+        """
+        Acquires a credits lease for the job cost requests.
+
+        :param client: credit system client
+        :param submission: job submission having cost requests
+        :return: cost document of the job
+        :raises InsufficientCreditsException: if the organization doesn't have enough credits
+        """
+        session = CTX_SESSION_VAR.get()
+        cost_requests = submission.cost_requests or {}
+        lease_id = client.acquire_lease(
+            organization_id=str(session.organization_id),
+            workspace_id=str(session.workspace_id),
+            project_id=str(submission.project_id) if submission.project_id is not None else None,
+            service_name=submission.job_type,
+            requests=[ResourceRequest(amount=cost_requests[unit], unit=unit) for unit in cost_requests],
+        )
+        return {
+            "requests": [{"amount": cost_requests[unit], "unit": unit} for unit in cost_requests],
+            "lease_id": lease_id,
+            "consumed": [],
+            "reported": False,
+        }
+
+    @staticmethod
+    def _create_job_relation(job_id: ID, project_id: ID | None) -> None:
+        """
+        Creates the SpiceDB relation between a new job and its project, or its workspace if it has no project.
+
+        :param job_id: ID of the new job
+        :param project_id: ID of the project of the job, if any
+        """
         if project_id is not None:
             SpiceDB().create_job(
                 job_id=str(job_id),
@@ -293,7 +573,6 @@ class JobManager(metaclass=Singleton):
                 parent_entity_type=SpiceDBResourceTypes.WORKSPACE.value,
                 job_id=str(job_id),
             )
-        return ID(job_id)
 
     def get_by_id(self, job_id: ID) -> Job | None:
         """
@@ -328,7 +607,7 @@ class JobManager(metaclass=Singleton):
                 and JobState.READY_FOR_SCHEDULING.value < job.state.value < JobState.FINISHED.value
             ):
                 raise JobNotCancellableException(job_id)
-            return job_repo.update(
+            updated = job_repo.update(
                 job_id=job_id,
                 update={
                     "$set": {
@@ -339,6 +618,9 @@ class JobManager(metaclass=Singleton):
                     }
                 },
             )
+            if updated:
+                publish_job_changed(job_id=job_id)
+            return updated
 
     #################################################################################
     # Count & search                                                                #
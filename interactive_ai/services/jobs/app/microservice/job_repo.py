@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from pymongo import DESCENDING, IndexModel
+from pymongo import DESCENDING, IndexModel, UpdateOne
 from pymongo.errors import DuplicateKeyError
 
 from model.job import Job, NullJob
@@ -190,6 +190,41 @@ class WorkspaceBasedMicroserviceJobRepo(SessionBasedRepo[Job]):
             raise DuplicateKeyError("Duplicate detected, cannot insert the document.")
         return IDToMongo.backward(result.upserted_id)
 
+    def insert_documents(
+        self, documents: Sequence[dict], mongodb_session: ClientSession | None = None
+    ) -> list[ID | None]:
+        """
+        Inserts the input documents in the database with a single bulk write.
+        Each document is checked for duplicates as in
+        :class:`~microservice.job_repo.WorkspaceBasedMicroserviceJobRepo.insert_document`, but a duplicate only
+        prevents the insertion of the document it conflicts with.
+
+        :param documents: Documents to insert
+        :param mongodb_session: Optional, ClientSession for MongoDB transactions
+        :return: ID of each inserted document, None for the documents not inserted because of a duplicate
+        """
+        if not documents:
+            return []
+        preliminary_query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+        operations = []
+        for document in documents:
+            if "_id" not in document:
+                document["_id"] = self.generate_id()
+            document["_id"] = IDToMongo.forward(document["_id"])
+            document.update(preliminary_query)
+
+            query = self._get_document_duplicate_filter(document)
+            query.update(preliminary_query)
+            # Using "$setOnInsert" will not update existing documents
+            operations.append(UpdateOne(filter=query, update={"$setOnInsert": document}, upsert=True))
+
+        result = self._collection.bulk_write(operations, ordered=False, session=mongodb_session)
+        upserted_ids = result.upserted_ids
+        return [
+            IDToMongo.backward(upserted_ids[index]) if index in upserted_ids else None
+            for index in range(len(documents))
+        ]
+
     def _get_document_duplicate_filter(self, document: dict) -> dict:
         """
         Returns a dict query for filtering duplicate jobs.
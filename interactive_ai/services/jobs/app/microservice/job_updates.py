@@ -0,0 +1,177 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Job updates module
+
+Keeps, for each workspace, the recent history of job changes notified via Kafka, so that clients can long-poll
+for job deltas instead of repeatedly listing and counting the jobs.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+from model.job import Job
+
+from geti_types import ID, Singleton
+
+logger = logging.getLogger(__name__)
+
+JOB_UPDATES_HISTORY_SIZE = int(os.environ.get("JOB_UPDATES_HISTORY_SIZE", 1000))
+
+
+@dataclass(frozen=True)
+class JobUpdate:
+    """
+    Change of a job
+
+    version             sequence number of the change within the workspace
+    job_id              ID of the changed job
+    job                 job after the change, None if the job has been deleted
+    """
+
+    version: int
+    job_id: ID
+    job: Job | None
+
+
+@dataclass(frozen=True)
+class JobUpdates:
+    """
+    Job changes that happened after a given cursor
+
+    cursor              cursor pointing to the latest change, to be used in the next lookup
+    updates             latest change of each changed job, oldest first
+    resync              True if the changes after the given cursor are not available anymore (unknown or expired
+                        cursor): the client has to reload the jobs list and continue from the returned cursor
+    """
+
+    cursor: str
+    updates: tuple[JobUpdate, ...]
+    resync: bool = False
+
+
+class _WorkspaceJobUpdates:
+    """Job changes history of a single workspace"""
+
+    def __init__(self, history_size: int) -> None:
+        self.version = 0
+        self.history: deque[JobUpdate] = deque(maxlen=history_size)
+        self.waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
+class JobUpdatesBroadcaster(metaclass=Singleton):
+    """
+    Job updates broadcaster
+
+    Receives the job changes from the Kafka consumer thread and wakes up the requests waiting for changes in the
+    same workspace. Cursors are only valid for the process which issued them: a cursor issued before a restart
+    results in a resync.
+
+    :param history_size: maximum number of changes kept in memory for each workspace
+    """
+
+    def __init__(self, history_size: int = JOB_UPDATES_HISTORY_SIZE) -> None:
+        self._instance_id = uuid.uuid4().hex
+        self._history_size = history_size
+        self._lock = threading.Lock()
+        self._workspaces: dict[ID, _WorkspaceJobUpdates] = {}
+
+    def publish(self, workspace_id: ID, job_id: ID, job: Job | None) -> None:
+        """
+        Records a job change and notifies the requests waiting for changes in the workspace
+
+        :param workspace_id: ID of the workspace the job belongs to
+        :param job_id: ID of the changed job
+        :param job: job after the change, None if the job has been deleted
+        """
+        with self._lock:
+            workspace_updates = self._get_workspace_updates(workspace_id)
+            workspace_updates.version += 1
+            workspace_updates.history.append(JobUpdate(version=workspace_updates.version, job_id=job_id, job=job))
+            waiters = list(workspace_updates.waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The event loop of the waiting request has been closed in the meantime
+                logger.debug("Unable to notify a job updates waiter, event loop is closed")
+
+    def get_updates(self, workspace_id: ID, cursor: str | None) -> JobUpdates:
+        """
+        Returns the job changes that happened after the given cursor
+
+        :param workspace_id: ID of the workspace
+        :param cursor: cursor returned by a previous lookup, None to get the current cursor only
+        :return: JobUpdates
+        """
+        with self._lock:
+            return self._get_updates(workspace_id=workspace_id, cursor=cursor)
+
+    async def wait_for_updates(self, workspace_id: ID, cursor: str | None, timeout: float) -> JobUpdates:
+        """
+        Returns the job changes that happened after the given cursor, waiting for the first change if there are none.
+        Returns immediately if the cursor is None or needs a resync.
+
+        :param workspace_id: ID of the workspace
+        :param cursor: cursor returned by a previous lookup, None to get the current cursor only
+        :param timeout: maximum waiting time in seconds
+        :return: JobUpdates, without updates if no change happened before the timeout
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            job_updates = self._get_updates(workspace_id=workspace_id, cursor=cursor)
+            if cursor is None or job_updates.updates or job_updates.resync or timeout <= 0:
+                return job_updates
+            # Registering the waiter under the lock guarantees that no change is missed
+            workspace_updates = self._get_workspace_updates(workspace_id)
+            workspace_updates.waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                workspace_updates.waiters.discard(waiter)
+        return self.get_updates(workspace_id=workspace_id, cursor=cursor)
+
+    def _get_workspace_updates(self, workspace_id: ID) -> _WorkspaceJobUpdates:
+        workspace_updates = self._workspaces.get(workspace_id)
+        if workspace_updates is None:
+            workspace_updates = _WorkspaceJobUpdates(history_size=self._history_size)
+            self._workspaces[workspace_id] = workspace_updates
+        return workspace_updates
+
+    def _get_updates(self, workspace_id: ID, cursor: str | None) -> JobUpdates:
+        workspace_updates = self._workspaces.get(workspace_id)
+        version = workspace_updates.version if workspace_updates is not None else 0
+        current_cursor = f"{self._instance_id}.{version}"
+        if cursor is None:
+            return JobUpdates(cursor=current_cursor, updates=())
+
+        since_version = self._parse_cursor(cursor)
+        if since_version is None or since_version > version:
+            return JobUpdates(cursor=current_cursor, updates=(), resync=True)
+        if workspace_updates is None or since_version == version:
+            return JobUpdates(cursor=current_cursor, updates=())
+        if since_version < workspace_updates.history[0].version - 1:
+            # Some of the changes after the cursor have already been evicted from the history
+            return JobUpdates(cursor=current_cursor, updates=(), resync=True)
+
+        latest_updates: dict[ID, JobUpdate] = {}
+        for update in workspace_updates.history:
+            if update.version > since_version:
+                latest_updates.pop(update.job_id, None)
+                latest_updates[update.job_id] = update
+        return JobUpdates(cursor=current_cursor, updates=tuple(latest_updates.values()))
+
+    def _parse_cursor(self, cursor: str) -> int | None:
+        instance_id, _, version = cursor.partition(".")
+        if instance_id != self._instance_id or not version.isdigit():
+            return None
+        return int(version)
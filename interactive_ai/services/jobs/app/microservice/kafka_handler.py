@@ -0,0 +1,43 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Module for jobs microservice Kafka handler
+"""
+
+import logging
+import socket
+
+from microservice.job_manager import JobManager
+from microservice.job_updates import JobUpdatesBroadcaster
+from model.job_change import JOB_CHANGED_TOPIC
+
+from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
+from geti_telemetry_tools import unified_tracing
+from geti_types import ID, Singleton
+from iai_core.session.session_propagation import setup_session_kafka
+
+logger = logging.getLogger(__name__)
+
+
+class JobUpdatesHandler(BaseKafkaHandler, metaclass=Singleton):
+    """KafkaHandler feeding the job changes to the job updates broadcaster"""
+
+    def __init__(self) -> None:
+        # Each replica keeps its own job updates history, so it needs its own consumer group to receive all the changes
+        super().__init__(group_id=f"jobs_microservice_{socket.gethostname()}")
+
+    @property
+    def topics_subscriptions(self) -> list[TopicSubscription]:
+        return [
+            TopicSubscription(topic=JOB_CHANGED_TOPIC, callback=self.on_job_changed),
+        ]
+
+    @staticmethod
+    @setup_session_kafka
+    @unified_tracing
+    def on_job_changed(raw_message: KafkaRawMessage) -> None:
+        value: dict = raw_message.value
+        job_id = ID(value["job_id"])
+        job = JobManager().get_by_id(job_id=job_id)
+        JobUpdatesBroadcaster().publish(workspace_id=ID(value["workspace_id"]), job_id=job_id, job=job)
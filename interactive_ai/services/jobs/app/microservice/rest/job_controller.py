@@ -4,8 +4,11 @@ import logging
 from collections.abc import Sequence
 from datetime import datetime
 
+from starlette.concurrency import run_in_threadpool
+
 from microservice.exceptions import JobNotCancellableException
 from microservice.job_manager import JobManager, JobsAcl, JobSortingField, Pagination, SortDirection, TimestampFilter
+from microservice.job_updates import JobUpdatesBroadcaster
 from microservice.rest.http_exceptions import (
     BadRequestHTTPException,
     JobNotCancellableHTTPException,
@@ -24,6 +27,7 @@ IO_CONTROLLER = logging.DEBUG
 
 DEFAULT_N_JOBS_RETURNED = 10
 MAX_N_JOBS_RETURNED = 50
+MAX_JOB_UPDATES_WAIT_SECONDS = 30
 
 logger = logging.getLogger(__name__)
 
@@ -106,20 +110,7 @@ class JobController(metaclass=Singleton):
             _sort_direction = None
 
         session = CTX_SESSION_VAR.get()
-        view_all_workspace_jobs = SpiceDB().check_permission(
-            subject_type=SpiceDBResourceTypes.USER.value,
-            subject_id=user_id,
-            resource_type=SpiceDBResourceTypes.WORKSPACE.value,
-            resource_id=session.workspace_id,
-            permission=Permissions.VIEW_ALL_WORKSPACE_JOBS.value,
-        )
-        permitted_projects = [
-            ID(project_id)
-            for project_id in SpiceDB().get_user_projects(user_id=user_id, permission=Permissions.VIEW_PROJECT)
-        ]
-        acl = JobsAcl(
-            permitted_projects=permitted_projects, workspace_jobs_author=None if view_all_workspace_jobs else user_id
-        )
+        acl = self._get_jobs_acl(user_id=user_id)
 
         count = self.job_manager.get_jobs_count(
             job_types=job_types,
@@ -171,6 +162,33 @@ class JobController(metaclass=Singleton):
         )
         return JobRestViews.jobs_to_rest(jobs=jobs, total_count=count, find_query=find_query, jobs_count=jobs_count)
 
+    async def get_job_updates(self, user_id: str, cursor: str | None = None, timeout: int | None = None) -> dict:
+        """
+        Get a REST view of the jobs changed in the workspace after the given cursor, waiting for a change if none
+        happened yet (long polling).
+
+        Clients are expected to get an initial cursor (no cursor parameter), then to load the jobs list, and then
+        to poll for updates passing the cursor returned by the previous call.
+
+        :param user_id: the user requesting the job updates
+        :param cursor: cursor returned by the previous call, None to get the current cursor
+        :param timeout: maximum waiting time in seconds
+        :return: REST representation of the job updates
+        """
+        timeout_ = (
+            min(max(timeout, 0), MAX_JOB_UPDATES_WAIT_SECONDS) if timeout is not None else MAX_JOB_UPDATES_WAIT_SECONDS
+        )
+        job_updates = await JobUpdatesBroadcaster().wait_for_updates(
+            workspace_id=CTX_SESSION_VAR.get().workspace_id, cursor=cursor, timeout=timeout_
+        )
+        updates = job_updates.updates
+        if any(update.job is not None for update in updates):
+            acl = await run_in_threadpool(self._get_jobs_acl, user_id=user_id)
+            updates = tuple(update for update in updates if update.job is None or acl.permits(update.job))
+        return JobRestViews.job_updates_to_rest(
+            job_updates=updates, cursor=job_updates.cursor, resync=job_updates.resync
+        )
+
     @unified_tracing
     def get_job(self, user_uid: str, job_id: ID) -> dict:
         """
@@ -222,3 +240,26 @@ class JobController(metaclass=Singleton):
             f"by user_id: '{user_uid}'."
         )
         return f"Job with ID '{job_id}' marked as cancelled{' with deletion flag' if delete_job else ''}."
+
+    @staticmethod
+    def _get_jobs_acl(user_id: str) -> JobsAcl:
+        """
+        Get the ACL restricting the jobs visible to the user in the current workspace.
+
+        :param user_id: the user requesting the jobs
+        :return: JobsAcl
+        """
+        view_all_workspace_jobs = SpiceDB().check_permission(
+            subject_type=SpiceDBResourceTypes.USER.value,
+            subject_id=user_id,
+            resource_type=SpiceDBResourceTypes.WORKSPACE.value,
+            resource_id=CTX_SESSION_VAR.get().workspace_id,
+            permission=Permissions.VIEW_ALL_WORKSPACE_JOBS.value,
+        )
+        permitted_projects = [
+            ID(project_id)
+            for project_id in SpiceDB().get_user_projects(user_id=user_id, permission=Permissions.VIEW_PROJECT)
+        ]
+        return JobsAcl(
+            permitted_projects=permitted_projects, workspace_jobs_author=None if view_all_workspace_jobs else user_id
+        )
@@ -78,6 +78,28 @@ def get_jobs_endpoint(  # noqa: PLR0913
     )
 
 
+@router.get("/organizations/{organization_id}/workspaces/{workspace_id}/jobs/updates")
+async def get_job_updates_endpoint(
+    user_id: Annotated[ID, Depends(get_user_id_fastapi)],
+    organization_id: str,  # noqa: ARG001
+    workspace_id: str,  # noqa: ARG001
+    cursor: str | None = None,
+    timeout: int | None = None,
+) -> dict:
+    """
+    Long polling endpoint for getting the jobs changed in the workspace after the given cursor.
+    If no job changed yet, the request waits until a change happens or the timeout expires.
+
+    :param user_id: ID of user making a request
+    :param organization_id: The id of the organization
+    :param workspace_id: The id of the workspace to watch jobs in
+    :param cursor: The cursor returned by the previous call; if not specified, the current cursor is returned
+    :param timeout: The maximum waiting time in seconds
+    :return: The changed jobs and the cursor for the next call
+    """
+    return await JobController().get_job_updates(user_id=user_id, cursor=cursor, timeout=timeout)
+
+
 @router.get("/organizations/{organization_id}/workspaces/{workspace_id}/jobs/{job_id}")
 def get_job_endpoint(
     user_id: Annotated[ID, Depends(get_user_id_fastapi)],
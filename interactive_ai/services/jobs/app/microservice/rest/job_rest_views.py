@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from microservice.job_manager import JobsCount, JobSortingField, Pagination, SortDirection
+from microservice.job_updates import JobUpdate
 from model.job import Job, JobStepDetails
 from model.job_state import JobStateGroup
 
@@ -103,6 +104,27 @@ class JobRestViews:
             rest_views["next_page"] = JobRestViews._get_next_page_url(offset=offset, find_query=find_query)
         return rest_views
 
+    @staticmethod
+    def job_updates_to_rest(job_updates: Sequence[JobUpdate], cursor: str, resync: bool) -> dict:
+        """
+        Get the REST view of the job updates.
+
+        :param job_updates: Sequence of job updates to convert to REST
+        :param cursor: cursor to use for getting the following updates
+        :param resync: whether the client has to reload the jobs list
+        :return: REST view of the job updates; deleted jobs are represented by their ID and a 'deleted' flag
+        """
+        return {
+            "cursor": cursor,
+            "resync": resync,
+            "jobs": [
+                JobRestViews.job_to_rest(update.job)
+                if update.job is not None
+                else {"id": str(update.job_id), "deleted": True}
+                for update in job_updates
+            ],
+        }
+
     @staticmethod
     def job_progress_to_rest(job_step_progress: tuple[JobStepDetails, ...]) -> list[dict]:
         """
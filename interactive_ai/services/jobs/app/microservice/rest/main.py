@@ -14,9 +14,10 @@ from starlette.exceptions import HTTPException
 from starlette.responses import JSONResponse
 
 from microservice.grpc_api.grpc_job_service import GRPCJobService
+from microservice.kafka_handler import JobUpdatesHandler
 from microservice.rest.job_endpoints import router as jobs_router
 
-from geti_telemetry_tools import ENABLE_TRACING, FastAPITelemetry, GrpcServerTelemetry
+from geti_telemetry_tools import ENABLE_TRACING, FastAPITelemetry, GrpcServerTelemetry, KafkaTelemetry
 
 
 @asynccontextmanager
@@ -27,16 +28,21 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     # Startup
     if ENABLE_TRACING:
         GrpcServerTelemetry.instrument()
+        KafkaTelemetry.instrument()
     grpc_api_server_process = Process(target=GRPCJobService.serve)
     grpc_api_server_process.start()
+    # The Kafka consumer thread is started after forking the gRPC server process, so that it's not inherited
+    JobUpdatesHandler()
     yield
     # Shutdown
+    JobUpdatesHandler().stop()
     grpc_api_server_process.kill()
     grpc_api_server_process.join()
     grpc_api_server_process.close()
     if ENABLE_TRACING:
         FastAPITelemetry.uninstrument(app)
         GrpcServerTelemetry.uninstrument()
+        KafkaTelemetry.uninstrument()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -0,0 +1,29 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Job change notifications module
+"""
+
+from geti_kafka_tools import publish_event
+from geti_types import CTX_SESSION_VAR, ID
+
+JOB_CHANGED_TOPIC = "on_job_changed"
+
+
+def publish_job_changed(job_id: ID) -> None:
+    """
+    Publishes an on_job_changed Kafka event, notifying that a user visible field of the job
+    (state, progress, cancellation info, ...) has changed or that the job has been deleted.
+
+    The event only carries the job identifiers: consumers are expected to read the current job document.
+
+    :param job_id: identifier of the changed job
+    """
+    session = CTX_SESSION_VAR.get()
+    publish_event(
+        topic=JOB_CHANGED_TOPIC,
+        body={"workspace_id": str(session.workspace_id), "job_id": str(job_id)},
+        key=str(job_id).encode(),
+        headers_getter=lambda: CTX_SESSION_VAR.get().as_list_bytes(),
+    )
@@ -13,6 +13,7 @@ from typing import Any
 from pymongo import ReturnDocument
 
 from model.job import Job, JobConsumedResource, JobStepDetails
+from model.job_change import publish_job_changed
 from model.job_state import JobGpuRequestState, JobState, JobStateGroup, JobTaskState
 from model.mapper.job_mapper import JobConsumedResourceMapper, JobMapper, JobStepDetailsMapper
 from scheduler.job_repo import SessionBasedSchedulerJobRepo
@@ -120,7 +121,9 @@ class StateMachine(metaclass=Singleton):
                 logger.info(f"Job {job_id} successfully deleted")
             else:
                 logger.info(f"Job {job_id} seems already to be deleted")
-            return deleted
+        if deleted:
+            publish_job_changed(job_id=job_id)
+        return deleted
 
     #################################################################################
     # Cancellation                                                                  #
@@ -134,7 +137,7 @@ class StateMachine(metaclass=Singleton):
         """
         job_repo = SessionBasedSchedulerJobRepo()
         with job_repo._mongo_client.start_session():
-            return job_repo.update(
+            updated = job_repo.update(
                 job_id=job_id,
                 update={
                     "$set": {
@@ -144,6 +147,9 @@ class StateMachine(metaclass=Singleton):
                     }
                 },
             )
+            if updated:
+                publish_job_changed(job_id=job_id)
+            return updated
 
     #################################################################################
     # Scheduling / Running                                                          #
@@ -276,6 +282,7 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"Job {job_id} has been set to scheduled state")
+                publish_job_changed(job_id=job_id)
             return updated
 
     def set_running_state(self, job_id: ID) -> bool:
@@ -299,6 +306,7 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"Job {job_id} has been set to running state")
+                publish_job_changed(job_id=job_id)
             return updated
 
     #################################################################################
@@ -357,6 +365,7 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"Job's {job_id} step {task_id} has been updated")
+                publish_job_changed(job_id=job_id)
             return updated
 
     def update_metadata(self, job_id: ID, metadata: dict) -> bool:
@@ -376,6 +385,7 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"Job's {job_id} metadata has been updated")
+                publish_job_changed(job_id=job_id)
             return updated
 
     def update_cost_consumed(self, job_id: ID, consumed_resources: list[JobConsumedResource]) -> bool:
@@ -471,6 +481,7 @@ class StateMachine(metaclass=Singleton):
             updated = job_repo.update(job_id=job_id, update={"$set": update_set})
         if updated:
             logger.info(f"Job {job_id} has been set to finished state")
+            publish_job_changed(job_id=job_id)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
@@ -692,6 +703,7 @@ class StateMachine(metaclass=Singleton):
             )
         if updated:
             logger.info(f"Job {job_id} has been set to failed state")
+            publish_job_changed(job_id=job_id)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
@@ -905,6 +917,7 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"A cancelled flag has been dropped for job {job_id}")
+                publish_job_changed(job_id=job_id)
             return updated
 
     def set_and_publish_cancelled_state(self, job_id: ID) -> bool:
@@ -947,6 +960,7 @@ class StateMachine(metaclass=Singleton):
             )
         if updated:
             logger.info(f"Job {job_id} has been set to cancelled state")
+            publish_job_changed(job_id=job_id)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
@@ -1012,4 +1026,5 @@ class StateMachine(metaclass=Singleton):
             )
             if updated:
                 logger.info(f"Job {job_id} has been reset to submitted state")
+                publish_job_changed(job_id=job_id)
             return updated
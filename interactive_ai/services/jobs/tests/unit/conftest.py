@@ -3,6 +3,7 @@
 
 import json
 import logging
+from unittest.mock import patch
 
 import pytest
 from bson import ObjectId
@@ -55,6 +56,12 @@ def fxt_session_ctx():
         yield session
 
 
+@pytest.fixture(autouse=True)
+def fxt_mock_publish_job_changed():
+    with patch("model.job_change.publish_event") as mock_publish_event:
+        yield mock_publish_event
+
+
 @pytest.fixture
 def fxt_step_details():
     yield JobStepDetails(
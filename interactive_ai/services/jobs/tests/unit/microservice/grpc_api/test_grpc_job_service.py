@@ -8,7 +8,16 @@ import grpc
 import pytest
 
 from microservice.grpc_api.grpc_job_service import DEFAULT_N_JOBS_RETURNED, GRPCJobService
-from microservice.job_manager import JobManager, JobsAcl, JobSortingField, Pagination, SortDirection, TimestampFilter
+from microservice.job_manager import (
+    JobManager,
+    JobsAcl,
+    JobSortingField,
+    JobSubmissionOutcome,
+    JobSubmissionStatus,
+    Pagination,
+    SortDirection,
+    TimestampFilter,
+)
 from model.duplicate_policy import DuplicatePolicy
 from model.job import Job, JobCancellationInfo, JobFlyteExecutions, JobMainFlyteExecution
 from model.job_state import JobState, JobStateGroup
@@ -28,6 +37,8 @@ from grpc_interfaces.job_submission.pb.job_service_pb2 import (
     JobResponse,
     ListJobsResponse,
     SubmitJobRequest,
+    SubmitJobsBulkRequest,
+    SubmitJobsBulkResponse,
 )
 from iai_core.utils.constants import DEFAULT_USER_NAME
 
@@ -209,6 +220,84 @@ class TestGRPCJobService:
         fxt_grpc_context.set_code.assert_called_once_with(grpc.StatusCode.FAILED_PRECONDITION)
         fxt_grpc_context.set_details.assert_called_once_with(expected_error_message)
 
+    def test_submit_bulk(self, fxt_grpc_job_service, fxt_grpc_context) -> None:
+        telemetry = Telemetry(context="fake_context")
+        requests = [
+            SubmitJobRequest(
+                priority=1,
+                workspace_id="workspace_id",
+                job_name="job_name",
+                type="test",
+                key=DUMMY_KEY,
+                payload=payload,
+                metadata=json.dumps(DUMMY_METADATA),
+                duplicate_policy="OMIT",
+                author=DUMMY_USER,
+                telemetry=SubmitJobRequest.Telemetry(context=telemetry.context),
+            )
+            for payload in (json.dumps(DUMMY_PAYLOAD), "{'key': object}", json.dumps(DUMMY_PAYLOAD))
+        ]
+        submission_outcomes = [
+            JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID("dummy_job_id")),
+            JobSubmissionOutcome(status=JobSubmissionStatus.INSUFFICIENT_CREDITS),
+        ]
+
+        with patch.object(JobManager, "submit_bulk", return_value=submission_outcomes) as mock_submit_bulk:
+            result = fxt_grpc_job_service.submit_bulk(SubmitJobsBulkRequest(jobs=requests), fxt_grpc_context)
+
+        submissions = mock_submit_bulk.call_args.kwargs["submissions"]
+        assert len(submissions) == 2
+        assert submissions[0].payload == DUMMY_PAYLOAD
+        assert submissions[0].duplicate_policy == DuplicatePolicy.OMIT
+        assert submissions[0].telemetry == telemetry
+        assert result == SubmitJobsBulkResponse(
+            outcomes=[
+                SubmitJobsBulkResponse.Outcome(status="SUBMITTED", id="dummy_job_id"),
+                SubmitJobsBulkResponse.Outcome(
+                    status="INVALID",
+                    details="Failed to deserialize the job payload. Please check the payload and try again.",
+                ),
+                SubmitJobsBulkResponse.Outcome(
+                    status="INSUFFICIENT_CREDITS", details="Insufficient balance for job submission"
+                ),
+            ]
+        )
+        fxt_grpc_context.set_code.assert_not_called()
+
+    @pytest.mark.parametrize("invalid_key", ["not a json", '["not", "an", "object"]'])
+    def test_submit_bulk_invalid_key(self, invalid_key, fxt_grpc_job_service, fxt_grpc_context) -> None:
+        requests = [
+            SubmitJobRequest(
+                priority=1,
+                workspace_id="workspace_id",
+                job_name="job_name",
+                type="test",
+                key=key,
+                payload=json.dumps(DUMMY_PAYLOAD),
+                metadata=json.dumps(DUMMY_METADATA),
+                duplicate_policy="OMIT",
+                author=DUMMY_USER,
+                telemetry=SubmitJobRequest.Telemetry(context="fake_context"),
+            )
+            for key in (invalid_key, DUMMY_KEY)
+        ]
+        submission_outcomes = [JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID("dummy_job_id"))]
+
+        with patch.object(JobManager, "submit_bulk", return_value=submission_outcomes) as mock_submit_bulk:
+            result = fxt_grpc_job_service.submit_bulk(SubmitJobsBulkRequest(jobs=requests), fxt_grpc_context)
+
+        submissions = mock_submit_bulk.call_args.kwargs["submissions"]
+        assert [submission.key for submission in submissions] == [DUMMY_KEY]
+        assert result == SubmitJobsBulkResponse(
+            outcomes=[
+                SubmitJobsBulkResponse.Outcome(
+                    status="INVALID",
+                    details="Failed to deserialize the job key. Please provide a JSON object as key and try again.",
+                ),
+                SubmitJobsBulkResponse.Outcome(status="SUBMITTED", id="dummy_job_id"),
+            ]
+        )
+
     def test_get_by_id(self, fxt_grpc_job_service, fxt_grpc_context) -> None:
         dummy_workspace_id = ID("dummy_workspace_id")
         dummy_job_id = ID("dummy_job_id")
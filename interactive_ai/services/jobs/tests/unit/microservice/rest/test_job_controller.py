@@ -1,7 +1,8 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import asyncio
 import json
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from starlette import status
@@ -17,13 +18,19 @@ from microservice.job_manager import (
     SortDirection,
     TimestampFilter,
 )
+from microservice.job_updates import JobUpdate, JobUpdates, JobUpdatesBroadcaster
 from microservice.rest.http_exceptions import (
     BadRequestHTTPException,
     JobNotCancellableHTTPException,
     JobNotFoundHTTPException,
     JobNotPermittedHTTPException,
 )
-from microservice.rest.job_controller import DEFAULT_N_JOBS_RETURNED, MAX_N_JOBS_RETURNED, JobController
+from microservice.rest.job_controller import (
+    DEFAULT_N_JOBS_RETURNED,
+    MAX_JOB_UPDATES_WAIT_SECONDS,
+    MAX_N_JOBS_RETURNED,
+    JobController,
+)
 from microservice.rest.job_rest_views import FindJobsQuery, JobRestViews
 from model.job_state import JobStateGroup
 
@@ -320,6 +327,38 @@ class TestJobController:
         assert error.value.detail == expected_error_message
         assert error.value.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_get_job_updates(self, fxt_job, fxt_workspace_job) -> None:
+        # Arrange
+        fxt_workspace_job.id = ID("workspace_job_id")
+        job_updates = JobUpdates(
+            cursor="instance.3",
+            updates=(
+                JobUpdate(version=1, job_id=fxt_job.id, job=fxt_job),
+                JobUpdate(version=2, job_id=fxt_workspace_job.id, job=fxt_workspace_job),
+                JobUpdate(version=3, job_id=ID("deleted_job_id"), job=None),
+            ),
+        )
+
+        # Act
+        with (
+            patch.object(JobUpdatesBroadcaster, "wait_for_updates", return_value=job_updates) as mock_wait_for_updates,
+            patch.object(SpiceDB, "get_user_projects", return_value=[fxt_job.project_id]),
+            patch.object(SpiceDB, "check_permission", return_value=False),
+        ):
+            result = asyncio.run(JobController().get_job_updates(user_id="user", cursor="instance.0", timeout=3600))
+
+        # Assert
+        mock_wait_for_updates.assert_awaited_once_with(
+            workspace_id=ANY, cursor="instance.0", timeout=MAX_JOB_UPDATES_WAIT_SECONDS
+        )
+        # The workspace job is filtered out, since the user is neither its author nor allowed to view all jobs
+        assert result["cursor"] == "instance.3"
+        assert not result["resync"]
+        assert result["jobs"] == [
+            JobRestViews.job_to_rest(job=fxt_job),
+            {"id": "deleted_job_id", "deleted": True},
+        ]
+
     def test_cancel_job(self, fxt_job) -> None:
         # Arrange
         job_id = fxt_job.id
@@ -55,6 +55,18 @@ class TestJobRESTEndpoint:
         )
         compare(json.loads(result.content), DUMMY_DATA, ignore_eq=True)
 
+    def test_job_updates_endpoint(self, fxt_client) -> None:
+        # Arrange
+        endpoint = f"{API_JOBS_PATTERN}/updates?{urlencode({'cursor': 'instance.1', 'timeout': 10})}"
+
+        # Act
+        with patch.object(JobController, "get_job_updates", return_value=DUMMY_DATA) as mock_get_job_updates:
+            result = fxt_client.get(endpoint)
+
+        # Assert
+        mock_get_job_updates.assert_awaited_once_with(user_id=DUMMY_USER, cursor="instance.1", timeout=10)
+        compare(json.loads(result.content), DUMMY_DATA, ignore_eq=True)
+
     def test_job_endpoint_cancel(self, fxt_client) -> None:
         # Arrange
         endpoint = f"{API_JOBS_PATTERN}/{DUMMY_JOB_ID}:cancel"
@@ -8,7 +8,17 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 
 from microservice.exceptions import DuplicateJobFoundException, JobNotCancellableException
-from microservice.job_manager import JobManager, JobsAcl, JobSortingField, Pagination, SortDirection, TimestampFilter
+from microservice.job_manager import (
+    JobManager,
+    JobsAcl,
+    JobSortingField,
+    JobSubmission,
+    JobSubmissionOutcome,
+    JobSubmissionStatus,
+    Pagination,
+    SortDirection,
+    TimestampFilter,
+)
 from microservice.job_repo import SessionBasedMicroserviceJobRepo, WorkspaceBasedMicroserviceJobRepo
 from model.duplicate_policy import DuplicatePolicy
 from model.job import JobCancellationInfo
@@ -17,6 +27,7 @@ from model.telemetry import Telemetry
 
 from geti_spicedb_tools import SpiceDB, SpiceDBResourceTypes
 from geti_types import ID
+from grpc_interfaces.credit_system.client import InsufficientCreditsException
 from iai_core.utils.constants import DEFAULT_USER_NAME
 from iai_core.utils.time_utils import now
 
@@ -275,6 +286,130 @@ def test_submit_reject(
     mock_create_project_job.assert_not_called()
 
 
+def make_job_submission(
+    key: str, duplicate_policy: DuplicatePolicy, cost_requests: dict[str, int] | None = None
+) -> JobSubmission:
+    return JobSubmission(
+        job_type="test",
+        priority=1,
+        job_name="Test job",
+        key=key,
+        payload={},
+        metadata={},
+        author=author,
+        duplicate_policy=duplicate_policy,
+        cancellable=True,
+        project_id=project_id,
+        cost_requests=cost_requests,
+    )
+
+
+@patch.object(SpiceDB, "create_job")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "insert_documents")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "update_many")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "aggregate_read")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "__init__", new=mock_job_repo)
+@patch.object(JobManager, "__init__", new=mock_job_manager)
+def test_submit_bulk(
+    mock_aggregate_read,
+    mock_update_many,
+    mock_insert_documents,
+    mock_create_job,
+    request,
+    fxt_session_ctx,
+) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    key_a, key_b, key_c, key_d = (json.dumps({"job_key": value}) for value in "abcd")
+    mock_aggregate_read.return_value = iter([{"_id": "existing_job_c", "key": key_c}])
+    mock_insert_documents.side_effect = lambda documents, mongodb_session: [
+        ID(f"job_{document['key']}") for document in documents
+    ]
+    submissions = [
+        make_job_submission(key=key_a, duplicate_policy=DuplicatePolicy.REPLACE),
+        make_job_submission(key=key_a, duplicate_policy=DuplicatePolicy.OMIT),
+        make_job_submission(key=key_b, duplicate_policy=DuplicatePolicy.REPLACE),
+        make_job_submission(key=key_b, duplicate_policy=DuplicatePolicy.REPLACE),
+        make_job_submission(key=key_c, duplicate_policy=DuplicatePolicy.OMIT),
+        make_job_submission(key=key_c, duplicate_policy=DuplicatePolicy.REJECT),
+        make_job_submission(key=key_d, duplicate_policy=DuplicatePolicy.REJECT),
+    ]
+
+    # Act
+    outcomes = JobManager().submit_bulk(submissions=submissions)
+
+    # Assert
+    assert outcomes == [
+        JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID(f"job_{key_a}")),
+        JobSubmissionOutcome(status=JobSubmissionStatus.OMITTED, job_id=ID(f"job_{key_a}")),
+        JobSubmissionOutcome(status=JobSubmissionStatus.REPLACED),
+        JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID(f"job_{key_b}")),
+        JobSubmissionOutcome(status=JobSubmissionStatus.OMITTED, job_id=ID("existing_job_c")),
+        JobSubmissionOutcome(status=JobSubmissionStatus.DUPLICATE),
+        JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID(f"job_{key_d}")),
+    ]
+    mock_aggregate_read.assert_called_once_with(
+        [
+            {"$match": {"key": {"$in": sorted([key_a, key_c, key_d])}, "state": {"$lt": JobState.RUNNING.value}}},
+            {"$project": {"key": 1}},
+        ]
+    )
+    mock_update_many.assert_called_once_with(
+        job_filter={"key": {"$in": sorted([key_a, key_b])}, "state": JobState.SUBMITTED.value},
+        update={
+            "$set": {
+                "cancellation_info.is_cancelled": True,
+                "cancellation_info.delete_job": True,
+            }
+        },
+        mongodb_session=ANY,
+    )
+    mock_insert_documents.assert_called_once()
+    assert [document["key"] for document in mock_insert_documents.call_args.args[0]] == [key_a, key_b, key_d]
+    assert mock_create_job.call_count == 3
+
+
+@patch.object(SpiceDB, "create_job")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "insert_documents")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "update_many")
+@patch.object(WorkspaceBasedMicroserviceJobRepo, "__init__", new=mock_job_repo)
+@patch.object(JobManager, "__init__", new=mock_job_manager)
+@patch("microservice.job_manager.CreditSystemClient", autospec=True)
+def test_submit_bulk_insufficient_credits(
+    mock_credits_service_client,
+    mock_update_many,
+    mock_insert_documents,
+    mock_create_job,
+    request,
+    fxt_session_ctx,
+) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    key_a, key_b = (json.dumps({"job_key": value}) for value in "ab")
+    client = mock_credits_service_client.return_value.__enter__.return_value
+    client.acquire_lease.side_effect = [InsufficientCreditsException(), "lease_id"]
+    mock_insert_documents.return_value = [ID("job_b")]
+    submissions = [
+        make_job_submission(key=key_a, duplicate_policy=DuplicatePolicy.REPLACE, cost_requests={"images": 100}),
+        make_job_submission(key=key_b, duplicate_policy=DuplicatePolicy.REPLACE, cost_requests={"images": 10}),
+    ]
+
+    # Act
+    outcomes = JobManager().submit_bulk(submissions=submissions)
+
+    # Assert
+    assert outcomes == [
+        JobSubmissionOutcome(status=JobSubmissionStatus.INSUFFICIENT_CREDITS),
+        JobSubmissionOutcome(status=JobSubmissionStatus.SUBMITTED, job_id=ID("job_b")),
+    ]
+    inserted_documents = mock_insert_documents.call_args.args[0]
+    assert [document["key"] for document in inserted_documents] == [key_b]
+    assert inserted_documents[0]["cost"]["lease_id"] == "lease_id"
+    mock_create_job.assert_called_once()
+
+
 @patch.object(SpiceDB, "create_job")
 @patch.object(WorkspaceBasedMicroserviceJobRepo, "insert_document", return_value="job_id")
 @patch.object(WorkspaceBasedMicroserviceJobRepo, "update_many")
@@ -65,3 +65,31 @@ def test_update_many(request) -> None:
 
     # Assert
     collection.update_many.assert_called_once_with(filter=query_filter, update=update, upsert=False, session=None)
+
+
+def test_insert_documents(request) -> None:
+    # Arrange
+    bulk_collection = MagicMock()
+    bulk_collection.bulk_write.return_value.upserted_ids = {0: "000000000000000000000001"}
+    documents = [
+        {"key": "key_1", "state": 0, "cancellation_info": {"is_cancelled": False}},
+        {"key": "key_2", "state": 0, "cancellation_info": {"is_cancelled": False}},
+    ]
+    job_repo = WorkspaceBasedMicroserviceJobRepo()
+
+    # Act
+    with patch.object(
+        WorkspaceBasedMicroserviceJobRepo,
+        "_collection",
+        new_callable=PropertyMock,
+        return_value=bulk_collection,
+    ):
+        inserted_ids = job_repo.insert_documents(documents)
+
+    # Assert
+    bulk_collection.bulk_write.assert_called_once()
+    operations = bulk_collection.bulk_write.call_args.args[0]
+    assert len(operations) == 2
+    assert bulk_collection.bulk_write.call_args.kwargs == {"ordered": False, "session": None}
+    # The second document is not inserted because a duplicate exists
+    assert inserted_ids == [ID("000000000000000000000001"), None]
@@ -0,0 +1,92 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import asyncio
+import threading
+
+import pytest
+
+from microservice.job_updates import JobUpdatesBroadcaster
+
+from geti_types import ID
+
+WORKSPACE_ID = ID("workspace_id")
+OTHER_WORKSPACE_ID = ID("other_workspace_id")
+
+
+def reset_singletons() -> None:
+    JobUpdatesBroadcaster._instance = None
+
+
+@pytest.fixture
+def fxt_broadcaster(request):
+    broadcaster = JobUpdatesBroadcaster(history_size=3)
+    request.addfinalizer(reset_singletons)
+    return broadcaster
+
+
+class TestJobUpdatesBroadcaster:
+    def test_get_updates(self, fxt_broadcaster, fxt_job) -> None:
+        cursor = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=None).cursor
+
+        fxt_broadcaster.publish(workspace_id=WORKSPACE_ID, job_id=fxt_job.id, job=fxt_job)
+        fxt_broadcaster.publish(workspace_id=OTHER_WORKSPACE_ID, job_id=ID("other_job"), job=None)
+        fxt_broadcaster.publish(workspace_id=WORKSPACE_ID, job_id=ID("deleted_job"), job=None)
+        fxt_broadcaster.publish(workspace_id=WORKSPACE_ID, job_id=fxt_job.id, job=fxt_job)
+        job_updates = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=cursor)
+
+        # Only the latest change of each job of the workspace is returned
+        assert not job_updates.resync
+        assert [update.job_id for update in job_updates.updates] == [ID("deleted_job"), fxt_job.id]
+        assert [update.version for update in job_updates.updates] == [2, 3]
+        assert job_updates.cursor != cursor
+        assert fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=job_updates.cursor).updates == ()
+
+    @pytest.mark.parametrize("cursor", ["unknown_instance.0", "malformed"])
+    def test_get_updates_unknown_cursor(self, fxt_broadcaster, cursor) -> None:
+        job_updates = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=cursor)
+
+        assert job_updates.resync
+        assert job_updates.updates == ()
+
+    def test_get_updates_expired_cursor(self, fxt_broadcaster) -> None:
+        cursor = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=None).cursor
+        for i in range(4):
+            fxt_broadcaster.publish(workspace_id=WORKSPACE_ID, job_id=ID(f"job_{i}"), job=None)
+
+        job_updates = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=cursor)
+
+        # The first change has been evicted from the history
+        assert job_updates.resync
+        assert job_updates.updates == ()
+
+    def test_wait_for_updates(self, fxt_broadcaster) -> None:
+        cursor = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=None).cursor
+
+        async def wait_and_publish():
+            waiting = asyncio.create_task(
+                fxt_broadcaster.wait_for_updates(workspace_id=WORKSPACE_ID, cursor=cursor, timeout=10)
+            )
+            await asyncio.sleep(0.1)
+            # Changes are published by the Kafka consumer thread
+            publisher = threading.Thread(
+                target=fxt_broadcaster.publish,
+                kwargs={"workspace_id": WORKSPACE_ID, "job_id": ID("job"), "job": None},
+            )
+            publisher.start()
+            publisher.join()
+            return await asyncio.wait_for(waiting, timeout=5)
+
+        job_updates = asyncio.run(wait_and_publish())
+
+        assert [update.job_id for update in job_updates.updates] == [ID("job")]
+
+    def test_wait_for_updates_timeout(self, fxt_broadcaster) -> None:
+        cursor = fxt_broadcaster.get_updates(workspace_id=WORKSPACE_ID, cursor=None).cursor
+        fxt_broadcaster.publish(workspace_id=OTHER_WORKSPACE_ID, job_id=ID("other_job"), job=None)
+
+        job_updates = asyncio.run(
+            fxt_broadcaster.wait_for_updates(workspace_id=WORKSPACE_ID, cursor=cursor, timeout=0.1)
+        )
+
+        assert job_updates.updates == ()
+        assert job_updates.cursor == cursor
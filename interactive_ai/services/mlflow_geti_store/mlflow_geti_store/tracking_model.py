@@ -20,6 +20,9 @@ from mlflow_geti_store.utils import ARTIFACT_ROOT_URI_PREFIX, PYARROW_SCHEMA, Ti
 
 logger = logging.getLogger("mlflow")
 
+# SHA-256 checksums of the shard files in the inputs directory, by filename
+SHARD_CHECKSUMS_FILENAME = "shard_checksums.json"
+
 
 class BaseModel(_BaseModel):
     class Config:
@@ -315,6 +318,7 @@ class RunDataModel(BaseModel):
 class RunInputsModel(BaseModel):
     filenames: list[str]
     presigned_urls: list[str]
+    checksums: list[str]
 
     @classmethod
     def from_object_storage(cls, client: S3ObjectStorageClient) -> RunInputsModel:
@@ -322,14 +326,36 @@ class RunInputsModel(BaseModel):
 
         filenames = []
         presigned_urls = []
+        shard_checksums: dict[str, str] = {}
 
         for obj in client.list_files(relative_path=Path("inputs"), recursive=True):
-            if not obj.is_dir and pattern.findall(obj.object_name):
-                filename = os.path.basename(obj.object_name)
+            if obj.is_dir:
+                continue
+            filename = os.path.basename(obj.object_name)
+            if pattern.findall(obj.object_name):
                 filenames += [filename]
                 presigned_urls += [client.get_presigned_url(relative_path=Path("inputs") / filename)]
+            elif filename == SHARD_CHECKSUMS_FILENAME:
+                shard_checksums = cls._read_shard_checksums(client)
+
+        return RunInputsModel(
+            filenames=filenames,
+            presigned_urls=presigned_urls,
+            checksums=[shard_checksums.get(filename, "") for filename in filenames],
+        )
+
+    @staticmethod
+    def _read_shard_checksums(client: S3ObjectStorageClient) -> dict[str, str]:
+        """Read the SHA-256 checksums of the shard files, pushed with the shard files by the dataset sharding task"""
+        response = None
 
-        return RunInputsModel(filenames=filenames, presigned_urls=presigned_urls)
+        try:
+            response = client.get_by_filename(Path("inputs") / SHARD_CHECKSUMS_FILENAME)
+            return json.loads(response.data)
+        finally:
+            if response:
+                response.close()
+                response.release_conn()
 
     def to_mlflow(self) -> RunInputs:
         return RunInputs(
@@ -337,12 +363,12 @@ class RunInputsModel(BaseModel):
                 DatasetInput(
                     dataset=Dataset(
                         name=filename,
-                        digest="",  # TODO(vinnamki): Receive checksum shard.checksum,
+                        digest=checksum,
                         source_type="http",
                         source=presigned_url,
                     ),
                     # mlflow=2.8.0 has error if tags field is not empty
                 )
-                for filename, presigned_url in zip(self.filenames, self.presigned_urls)
+                for filename, presigned_url, checksum in zip(self.filenames, self.presigned_urls, self.checksums)
             ]
         )
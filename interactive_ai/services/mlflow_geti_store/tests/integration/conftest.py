@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -94,6 +95,11 @@ def fxt_inputs_dir(fxt_bucket):
             relative_path=Path("inputs") / f"datum-{idx}-of-10.arrow",
             input_bytes=b"data",
         )
+    checksums = {f"datum-{idx}-of-10.arrow": hashlib.sha256(b"data").hexdigest() for idx in range(10)}
+    client.save_file_from_bytes(
+        relative_path=Path("inputs") / "shard_checksums.json",
+        input_bytes=json.dumps(checksums).encode(),
+    )
 
     yield
     client.delete_files(relative_path=Path("inputs"), recursive=True)
@@ -1,6 +1,8 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import hashlib
+
 import pytest
 import requests
 from mlflow.entities import Metric, RunStatus, ViewType
@@ -41,6 +43,8 @@ class TestTrackingStore:
             assert inp.dataset.source_type == "http"
             response = requests.get(url=inp.dataset.source)
             assert response.content == b"data"
+            # The trainer verifies the downloaded shard files against the digests
+            assert inp.dataset.digest == hashlib.sha256(response.content).hexdigest()
 
     def test_update_run_info(self, fxt_tracking_store: GetiTrackingStore, fxt_job_id):
         updated = fxt_tracking_store.update_run_info(
@@ -3,6 +3,7 @@
 
 import json
 from datetime import timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pyarrow as pa
@@ -237,3 +238,31 @@ class TestTrackingModel:
 
         assert len(run_inputs.dataset_inputs) == 10
         assert all(input.dataset.source == "http://dummy_url" for input in run_inputs.dataset_inputs)
+        assert all(input.dataset.digest == "" for input in run_inputs.dataset_inputs)
+
+    @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
+    def test_run_inputs_model_checksums(self, mock_client):
+        def _create_mock(object_name):
+            mock = MagicMock(spec=Object)
+            mock.object_name = object_name
+            mock.is_dir = False
+            return mock
+
+        filenames = [f"datum-{idx}-of-3.arrow" for idx in range(3)]
+        checksums = {filename: f"checksum_{filename}" for filename in filenames[:2]}
+        mock_client.list_files.return_value = [_create_mock(f"inputs/{filename}") for filename in filenames] + [
+            _create_mock("inputs/shard_checksums.json")
+        ]
+        mock_client.get_presigned_url.return_value = "http://dummy_url"
+        mock_client.get_by_filename.return_value.data = json.dumps(checksums).encode()
+
+        model = RunInputsModel.from_object_storage(client=mock_client)
+
+        run_inputs = model.to_mlflow()
+
+        mock_client.get_by_filename.assert_called_once_with(Path("inputs") / "shard_checksums.json")
+        assert {input.dataset.name: input.dataset.digest for input in run_inputs.dataset_inputs} == {
+            filenames[0]: checksums[filenames[0]],
+            filenames[1]: checksums[filenames[1]],
+            filenames[2]: "",
+        }
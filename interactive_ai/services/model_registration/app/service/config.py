@@ -13,3 +13,6 @@ S3_BUCKETNAME = os.getenv("BUCKET_NAME_MODELMESH", "modelmesh")
 S3_STORAGE = os.getenv("S3_STORAGE", "modelmesh")  # points to a name of ConfigMap with S3 storage config
 RESOURCE_MS_SERVICE = os.getenv("RESOURCE_MS_SERVICE", "impt-resource")
 RESOURCE_MS_PORT = os.getenv("RESOURCE_MS_PORT", "5000")
+MODEL_CONVERSION_WORKERS = int(os.getenv("MODEL_CONVERSION_WORKERS", "2"))
+# Maximum number of converted graphs cached on S3 per project; the least recently used ones are evicted
+MODEL_GRAPH_CACHE_SIZE_PER_PROJECT = int(os.getenv("MODEL_GRAPH_CACHE_SIZE_PER_PROJECT", "5"))
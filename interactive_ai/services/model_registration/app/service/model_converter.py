@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import ctypes
+import hashlib
 import json
 import logging
 import os
@@ -25,7 +26,7 @@ from model_api.models import (
     SegmentationModel,
 )
 
-from service.config import RESOURCE_MS_PORT, RESOURCE_MS_SERVICE, S3_BUCKETNAME
+from service.config import MODEL_GRAPH_CACHE_SIZE_PER_PROJECT, RESOURCE_MS_PORT, RESOURCE_MS_SERVICE, S3_BUCKETNAME
 from service.s3client import S3Client
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -33,6 +34,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_ORGANIZATION_ID = "000000000000000000000001"
 LARGE_MODEL_THRESHOLD_BYTES = 50 * 1024 * 1024
+GRAPH_CACHE_INFIX = "-graph-cache-"
+# Object written last in a graph cache folder: a folder without it is incomplete and never reused
+GRAPH_CACHE_COMPLETION_MARKER = ".complete"
 
 
 class GraphVariant(Enum):
@@ -406,10 +410,43 @@ class ModelConverter:
 
         return export_dir
 
+    @staticmethod
+    def get_graph_cache_key(project: Project, models: list[Model]) -> str:
+        """
+        Returns the name of the S3 folder caching the graph converted from the given models.
+
+        The name is content-addressed: it is derived from the IDs of the optimized models and from the project
+        pipeline (tasks and labels), which are the only inputs of the conversion. It starts with the project ID,
+        so that the cached graphs are purged together with the other artifacts of the project.
+        """
+        digest = hashlib.sha256(project.pipeline.SerializeToString(deterministic=True))
+        for model in models:
+            digest.update(f"{model.task_id}/{model.model_id}/{model.optimized_model_id}/{model.use_ellipse};".encode())
+        return f"{project.id}{GRAPH_CACHE_INFIX}{digest.hexdigest()[:32]}"
+
     def process_model(self, name: str, project: Project, models: list[Model]):  # noqa: ANN201
         """
-        This function calls prepare_graph method to create Mediapipe Graphs, and then uploads .
+        This function calls prepare_graph method to create Mediapipe Graphs, and then uploads them to S3.
+
+        Converted graphs are cached on S3, so if the same models are registered again (e.g. when the active model
+        pipeline is re-registered) the graph is only copied server-side to the pipeline folder. A cache entry is
+        reused only if its completion marker exists, and at most MODEL_GRAPH_CACHE_SIZE_PER_PROJECT entries are
+        kept per project.
         """
+        cache_key = self.get_graph_cache_key(project=project, models=models)
+        marker_key = os.path.join(cache_key, GRAPH_CACHE_COMPLETION_MARKER)
+        if self.s3.check_object_exists(bucket_name=S3_BUCKETNAME, object_key=marker_key):
+            self.s3.copy_folder(
+                bucket_name=S3_BUCKETNAME,
+                source_key=cache_key,
+                target_key=name,
+                exclude=[GRAPH_CACHE_COMPLETION_MARKER],
+            )
+            # Rewrite the marker to mark the entry as recently used
+            self.s3.put_object(bucket_name=S3_BUCKETNAME, object_key=marker_key)
+            logger.info(f"Reused converted graph `{cache_key}` for pipeline `{name}`")
+            return
+
         export_dir = self.prepare_graph(project=project, models=models)
         self.s3.upload_folder(
             bucket_name=S3_BUCKETNAME,
@@ -417,4 +454,25 @@ class ModelConverter:
             local_folder_path=export_dir,
         )
         self._delete_dir(dir_path=export_dir)
+        self.s3.copy_folder(bucket_name=S3_BUCKETNAME, source_key=name, target_key=cache_key)
+        self.s3.put_object(bucket_name=S3_BUCKETNAME, object_key=marker_key)
+        self._evict_graph_cache(project_id=project.id)
         logger.info(f"Model converted successfully {export_dir}")
+
+    def _evict_graph_cache(self, project_id: str) -> None:
+        """
+        Delete the least recently used graph cache entries of the project, beyond MODEL_GRAPH_CACHE_SIZE_PER_PROJECT.
+
+        Only the complete entries are evicted, since the incomplete ones may still be written by another conversion;
+        those left over by an interrupted conversion are purged together with the project.
+        """
+        markers = [
+            obj
+            for obj in self.s3.list_objects(bucket_name=S3_BUCKETNAME, prefix=f"{project_id}{GRAPH_CACHE_INFIX}")
+            if obj["Key"].endswith(f"/{GRAPH_CACHE_COMPLETION_MARKER}")
+        ]
+        markers.sort(key=lambda obj: obj["LastModified"], reverse=True)
+        for marker in markers[MODEL_GRAPH_CACHE_SIZE_PER_PROJECT:]:
+            cache_key = marker["Key"].split("/")[0]
+            self.s3.delete_folder(bucket_name=S3_BUCKETNAME, object_key=cache_key)
+            logger.info(f"Evicted converted graph `{cache_key}` from the cache")
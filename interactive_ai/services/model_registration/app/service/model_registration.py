@@ -2,12 +2,16 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import asyncio
+import functools
 import logging
 import os
 import pathlib
 import shutil
 import sys
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 from zipfile import BadZipFile
 
 import aiofiles
@@ -32,7 +36,7 @@ from grpc_interfaces.model_registration.pb.service_pb2 import (
 from grpc_interfaces.model_registration.pb.service_pb2_grpc import ModelRegistrationServicer
 from kubernetes_asyncio.client.rest import ApiException
 
-from service.config import MODELMESH_NAMESPACE, S3_BUCKETNAME, S3_STORAGE
+from service.config import MODEL_CONVERSION_WORKERS, MODELMESH_NAMESPACE, S3_BUCKETNAME, S3_STORAGE
 from service.inference_manager import InferenceManager
 from service.model_converter import GraphVariant, ModelConverter, UnsupportedModelType
 from service.responses import Responses
@@ -41,6 +45,8 @@ from service.s3client import S3Client
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ReturnT = TypeVar("ReturnT")
+
 
 class ModelRegistration(ModelRegistrationServicer):
     """
@@ -50,8 +56,37 @@ class ModelRegistration(ModelRegistrationServicer):
     def __init__(self) -> None:
         self.s3 = S3Client()
         self.converter = ModelConverter(self.s3)
+        # Model conversion downloads, converts and uploads models: it runs in a bounded pool of worker threads
+        # so that it does not block the event loop serving the other requests
+        self.conversion_executor = ThreadPoolExecutor(
+            max_workers=MODEL_CONVERSION_WORKERS, thread_name_prefix="model_conversion"
+        )
+        self.conversion_queue_depth = 0
         super().__init__()
 
+    async def run_conversion(self, description: str, func: Callable[..., ReturnT], **kwargs) -> ReturnT:
+        """
+        Run a model conversion function in the conversion pool, logging the queue depth and the conversion latency.
+
+        :param description: Description of the conversion, used in the logs
+        :param func: Conversion function to run
+        :param kwargs: Keyword arguments of the function
+        :return: Result of the function
+        """
+        self.conversion_queue_depth += 1
+        logger.info(f"Queued conversion of {description} (conversion queue depth: {self.conversion_queue_depth})")
+        start_time = time.monotonic()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.conversion_executor, functools.partial(func, **kwargs)
+            )
+        finally:
+            self.conversion_queue_depth -= 1
+            logger.info(
+                f"Conversion of {description} completed in {time.monotonic() - start_time:.2f}s "
+                f"(conversion queue depth: {self.conversion_queue_depth})"
+            )
+
     def make_error(self, code: ErrorCode.ValueType) -> Error:
         messages = {
             ErrorCode.MODEL_ALREADY_REGISTERED: "Model is already registered.",
@@ -99,7 +134,13 @@ class ModelRegistration(ModelRegistrationServicer):
                         error=self.make_error(code=ErrorCode.MODEL_ALREADY_REGISTERED),
                     )
 
-            self.converter.process_model(name=pipeline_name, models=req.model, project=req.project)
+            await self.run_conversion(
+                f"pipeline {pipeline_name}",
+                self.converter.process_model,
+                name=pipeline_name,
+                models=req.model,
+                project=req.project,
+            )
             await inference.create_inference(
                 name=pipeline_name,
                 namespace=MODELMESH_NAMESPACE,
@@ -156,8 +197,12 @@ class ModelRegistration(ModelRegistrationServicer):
         graph_archive_path = None
         try:
             graph_directory = pathlib.Path(
-                self.converter.prepare_graph(
-                    models=req.models, project=req.project, graph_variant=GraphVariant.OVMS_DEPLOYMENT
+                await self.run_conversion(
+                    f"deployment graph of project {req.project.id}",
+                    self.converter.prepare_graph,
+                    models=req.models,
+                    project=req.project,
+                    graph_variant=GraphVariant.OVMS_DEPLOYMENT,
                 )
             )
             graph_archive_path = graph_directory.parent.joinpath(f"{req.project.id}.zip")
@@ -4,6 +4,7 @@
 import logging
 import os
 import sys
+from collections.abc import Collection
 
 import boto3
 from botocore.exceptions import ClientError
@@ -95,6 +96,83 @@ class S3Client:
             logger.error(err)
             raise err
 
+    def put_object(self, bucket_name: str, object_key: str, body: bytes = b"") -> None:
+        """
+        Write an object, replacing any existing object with the same key
+
+        :param bucket_name: Name of the bucket
+        :param object_key: Key of the object
+        :param body: Content of the object
+        """
+        try:
+            self.client.put_object(Bucket=bucket_name, Key=object_key, Body=body)
+        except ClientError as err:
+            logger.error(err)
+            raise err
+
+    def check_object_exists(self, bucket_name: str, object_key: str) -> bool:
+        """
+        Check if an object with key `object_key` exists on S3
+
+        :param bucket_name: Name of the bucket to search in
+        :param object_key: Key of the object to check for
+        :return: True if the object exists, False otherwise
+        """
+        try:
+            self.client.head_object(Bucket=bucket_name, Key=object_key)
+        except ClientError as err:
+            if err.response["Error"]["Code"] == "404":
+                return False
+            logger.error(err)
+            raise err
+        return True
+
+    def list_objects(self, bucket_name: str, prefix: str) -> list[dict]:
+        """
+        Return all the objects whose key starts with the given prefix
+
+        :param bucket_name: Name of the bucket to search in
+        :param prefix: Prefix of the object keys
+        :return: List of the objects, as returned by S3 (with 'Key', 'LastModified', 'Size', ...)
+        """
+        objects: list[dict] = []
+        try:
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                objects.extend(page.get("Contents", []))
+        except ClientError as err:
+            logger.error(err)
+            raise err
+        return objects
+
+    def copy_folder(self, bucket_name: str, source_key: str, target_key: str, exclude: Collection[str] = ()) -> None:
+        """
+        Copy all the objects of a folder to another folder of the same bucket.
+
+        The objects are copied server-side, so no data is transferred through the client.
+
+        :param bucket_name: Name of the bucket
+        :param source_key: Name of the folder to copy
+        :param target_key: Name of the destination folder
+        :param exclude: Keys of the objects not to copy, relative to the folder
+        """
+        source_prefix = source_key.rstrip("/") + "/"
+        try:
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=source_prefix):
+                for obj in page.get("Contents", []):
+                    relative_key = obj["Key"][len(source_prefix) :]
+                    if relative_key in exclude:
+                        continue
+                    s3_path = os.path.join(target_key, relative_key)
+                    self.client.copy_object(
+                        Bucket=bucket_name, Key=s3_path, CopySource={"Bucket": bucket_name, "Key": obj["Key"]}
+                    )
+        except ClientError as err:
+            logger.error(err)
+            raise err
+        logger.info(f"Copied folder `s3://{bucket_name}/{source_key}` to `s3://{bucket_name}/{target_key}`")
+
     def delete_folder(self, bucket_name: str, object_key: str):  # noqa: ANN201
         """Deletes folder on s3"""
         try:
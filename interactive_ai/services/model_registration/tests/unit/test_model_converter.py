@@ -3,9 +3,11 @@
 import json
 import os
 import tempfile
-from unittest.mock import ANY, MagicMock, patch
+from datetime import datetime
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
+from grpc_interfaces.model_registration.pb.service_pb2 import Label, Model, Pipeline, Project, Task
 
 from service.model_converter import LARGE_MODEL_THRESHOLD_BYTES, GraphVariant, ModelConverter
 
@@ -225,6 +227,77 @@ def test_prepare_graph(sample_project, sample_models, graph_variant, model_size,
     assert create_graph_mock.call_count == 1
 
 
+def test_get_graph_cache_key():
+    project = Project(
+        id="project",
+        pipeline=Pipeline(tasks=[Task(id="task", task_type="detection", labels=[Label(id="label", name="car")])]),
+    )
+    model = Model(model_id="model", optimized_model_id="optimized_model", task_id="task")
+    other_model = Model(model_id="model", optimized_model_id="other_optimized_model", task_id="task")
+    same_model = Model()
+    same_model.CopyFrom(model)
+    renamed_label_project = Project()
+    renamed_label_project.CopyFrom(project)
+    renamed_label_project.pipeline.tasks[0].labels[0].name = "truck"
+
+    key = ModelConverter.get_graph_cache_key(project=project, models=[model])
+
+    assert key.startswith("project-")
+    assert key == ModelConverter.get_graph_cache_key(project=project, models=[same_model])
+    assert key != ModelConverter.get_graph_cache_key(project=project, models=[other_model])
+    assert key != ModelConverter.get_graph_cache_key(project=renamed_label_project, models=[model])
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_process_model(cached, mock_s3client, model_converter: ModelConverter):
+    mock_s3client.check_object_exists.return_value = cached
+    mock_s3client.list_objects.return_value = []
+    model_converter.prepare_graph = MagicMock(return_value="export_dir")  # type: ignore[method-assign]
+    model_converter._delete_dir = MagicMock()  # type: ignore[method-assign]
+
+    with patch.object(ModelConverter, "get_graph_cache_key", return_value="project-graph-cache-key"):
+        model_converter.process_model(name="pipeline", project=MagicMock(), models=[MagicMock()])
+
+    # The cache entry is reused only if its completion marker exists, and the marker is written last
+    mock_s3client.check_object_exists.assert_called_once_with(
+        bucket_name=ANY, object_key="project-graph-cache-key/.complete"
+    )
+    mock_s3client.put_object.assert_called_once_with(bucket_name=ANY, object_key="project-graph-cache-key/.complete")
+    if cached:
+        model_converter.prepare_graph.assert_not_called()
+        mock_s3client.upload_folder.assert_not_called()
+        mock_s3client.copy_folder.assert_called_once_with(
+            bucket_name=ANY, source_key="project-graph-cache-key", target_key="pipeline", exclude=[".complete"]
+        )
+    else:
+        model_converter.prepare_graph.assert_called_once()
+        mock_s3client.upload_folder.assert_called_once_with(
+            bucket_name=ANY, object_key="pipeline", local_folder_path="export_dir"
+        )
+        mock_s3client.copy_folder.assert_called_once_with(
+            bucket_name=ANY, source_key="pipeline", target_key="project-graph-cache-key"
+        )
+        assert mock_s3client.method_calls[-2] == call.put_object(
+            bucket_name=ANY, object_key="project-graph-cache-key/.complete"
+        )
+
+
+def test_evict_graph_cache(mock_s3client, model_converter: ModelConverter):
+    # Complete entries, from the least to the most recently used, and an incomplete entry
+    mock_s3client.list_objects.return_value = [
+        {"Key": f"project-graph-cache-{i}/.complete", "LastModified": datetime(2025, 1, 1 + i)} for i in range(7)
+    ] + [{"Key": "project-graph-cache-incomplete/graph.pbtxt", "LastModified": datetime(2025, 1, 1)}]
+
+    with patch("service.model_converter.MODEL_GRAPH_CACHE_SIZE_PER_PROJECT", 5):
+        model_converter._evict_graph_cache(project_id="project")
+
+    mock_s3client.list_objects.assert_called_once_with(bucket_name=ANY, prefix="project-graph-cache-")
+    assert mock_s3client.delete_folder.call_args_list == [
+        call(bucket_name=ANY, object_key="project-graph-cache-1"),
+        call(bucket_name=ANY, object_key="project-graph-cache-0"),
+    ]
+
+
 def test_create_ovms_graph_files(
     model_converter: ModelConverter, sample_project, tmp_path, monkeypatch: pytest.MonkeyPatch
 ):
@@ -1,6 +1,8 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -76,12 +78,30 @@ async def test_register_new_pipelines(
     if override:
         remove_inference.assert_awaited_once()
     if expected_response == Responses.Created:
-        converter.assert_called_once()
+        converter.return_value.process_model.assert_called_once_with(name=name, models=ANY, project=ANY)
         create_inference.assert_awaited_once_with(
             name=name, namespace=MODELMESH_NAMESPACE, storage_name=S3_STORAGE, path=name
         )
 
 
+@pytest.mark.asyncio
+async def test_run_conversion(model_registration):
+    thread_names = []
+
+    def convert(name: str) -> str:
+        assert model_registration.conversion_queue_depth >= 1
+        thread_names.append(threading.current_thread().name)
+        return f"converted {name}"
+
+    results = await asyncio.gather(
+        *(model_registration.run_conversion(f"model {i}", convert, name=f"model_{i}") for i in range(3))
+    )
+
+    assert results == ["converted model_0", "converted model_1", "converted model_2"]
+    assert all(thread_name.startswith("model_conversion") for thread_name in thread_names)
+    assert model_registration.conversion_queue_depth == 0
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "reason, expected_response",
@@ -75,6 +75,31 @@ def test_upload_folder(s3_client):
     os.rmdir("test_folder")
 
 
+def test_copy_folder(s3_client):
+    s3_client.client.create_bucket(Bucket="copy-bucket")
+    s3_client.client.put_object(Bucket="copy-bucket", Key="source/config.json", Body="config")
+    s3_client.client.put_object(Bucket="copy-bucket", Key="source/model/1/model.xml", Body="model")
+
+    s3_client.put_object("copy-bucket", "source/.complete")
+
+    s3_client.copy_folder("copy-bucket", "source", "target", exclude=[".complete"])
+
+    keys = [obj["Key"] for obj in s3_client.client.list_objects_v2(Bucket="copy-bucket", Prefix="target/")["Contents"]]
+    assert sorted(keys) == ["target/config.json", "target/model/1/model.xml"]
+    body = s3_client.client.get_object(Bucket="copy-bucket", Key="target/model/1/model.xml")["Body"].read()
+    assert body == b"model"
+
+
+def test_put_object_and_check_object_exists(s3_client):
+    s3_client.client.create_bucket(Bucket="test-bucket")
+    assert s3_client.check_object_exists("test-bucket", "folder/.complete") is False
+
+    s3_client.put_object("test-bucket", "folder/.complete")
+
+    assert s3_client.check_object_exists("test-bucket", "folder/.complete") is True
+    assert [obj["Key"] for obj in s3_client.list_objects("test-bucket", prefix="folder")] == ["folder/.complete"]
+
+
 def test_delete_folder(s3_client):
     s3_client.client.create_bucket(Bucket="delete-bucket")
     s3_client.client.put_object(Bucket="delete-bucket", Key="folder_to_delete/file.txt", Body="data")
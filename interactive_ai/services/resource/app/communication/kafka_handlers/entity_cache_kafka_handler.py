@@ -0,0 +1,46 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import logging
+import socket
+
+from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
+from geti_types import CTX_SESSION_VAR, ID, ProjectIdentifier, Singleton
+from iai_core.repos.entity_cache import invalidate_project_entities
+from iai_core.session.session_propagation import setup_session_kafka
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCacheKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
+    """
+    This class invalidates the entity caches of the resource MS when a project is updated or deleted.
+
+    Unlike the other handlers, every replica must receive all the events to invalidate its own cache,
+    so the consumer group is unique per replica.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(group_id=f"entity_cache_consumer_{socket.gethostname()}")
+
+    @property
+    def topics_subscriptions(self) -> list[TopicSubscription]:
+        return [
+            TopicSubscription(topic="project_updates", callback=self.on_project_changed),
+            TopicSubscription(topic="project_deletions", callback=self.on_project_changed),
+        ]
+
+    @staticmethod
+    @setup_session_kafka
+    def on_project_changed(raw_message: KafkaRawMessage) -> None:
+        """
+        Remove the project and its label schemas from the entity caches
+        """
+        value: dict = raw_message.value
+        project_identifier = ProjectIdentifier(
+            workspace_id=ID(value["workspace_id"]),
+            project_id=ID(value["project_id"]),
+        )
+        invalidate_project_entities(
+            organization_id=CTX_SESSION_VAR.get().organization_id,
+            project_identifier=project_identifier,
+        )
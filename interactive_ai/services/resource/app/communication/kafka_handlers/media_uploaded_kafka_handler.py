@@ -1,6 +1,8 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from usecases.media_uploaded_usecase import MediaUploadedUseCase
 
@@ -11,20 +13,32 @@ from iai_core.session.session_propagation import setup_session_kafka
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of uploaded media preprocessed together; 1 preprocesses the media one by one
+MEDIA_PREPROCESSING_BATCH_SIZE = int(os.environ.get("MEDIA_PREPROCESSING_BATCH_SIZE", "1"))
+# Number of media of a batch preprocessed in parallel
+MEDIA_PREPROCESSING_WORKERS = int(os.environ.get("MEDIA_PREPROCESSING_WORKERS", str(os.cpu_count() or 1)))
+
 
 class MediaUploadedKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
     """
     This class handles MEDIA_UPLOADED preprocessing Kafka events.
+
+    If MEDIA_PREPROCESSING_BATCH_SIZE is greater than 1, the events are consumed in batches and the media of a batch
+    are preprocessed in parallel by a pool of MEDIA_PREPROCESSING_WORKERS threads.
     TODO: ITEP-32599 extract to new microservice
     """
 
     def __init__(self) -> None:
-        super().__init__(group_id="media_uploaded_consumer")
+        super().__init__(group_id="media_uploaded_consumer", batch_size=MEDIA_PREPROCESSING_BATCH_SIZE)
 
     @property
     def topics_subscriptions(self) -> list[TopicSubscription]:
         return [
-            TopicSubscription(topic="media_preprocessing", callback=self.on_media_preprocessing),
+            TopicSubscription(
+                topic="media_preprocessing",
+                callback=self.on_media_preprocessing,
+                batch_callback=self.on_media_preprocessing_batch,
+            ),
         ]
 
     @staticmethod
@@ -46,3 +60,31 @@ class MediaUploadedKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
             media_id=ID(value["media_id"]),
             data_binary_filename=value["data_binary_filename"],
         )
+
+    @staticmethod
+    def on_media_preprocessing_batch(raw_messages: list[KafkaRawMessage]) -> None:
+        """
+        Preprocess the media of a batch of MEDIA_UPLOADED events in parallel.
+
+        The media are decoded, resized and encoded by OpenCV and ffmpeg, which do not hold the GIL,
+        so a pool of threads is enough to use all the cores.
+
+        :param raw_messages: Batch of media_preprocessing events; only the MEDIA_UPLOADED ones are processed
+        """
+        uploaded_messages = [message for message in raw_messages if message.value["event"] == "MEDIA_UPLOADED"]
+        if not uploaded_messages:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(MEDIA_PREPROCESSING_WORKERS, len(uploaded_messages)),
+            thread_name_prefix="media_preprocessing",
+        ) as executor:
+            futures = [
+                executor.submit(MediaUploadedKafkaHandler.on_media_preprocessing, message)
+                for message in uploaded_messages
+            ]
+            for message, future in zip(uploaded_messages, futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("Failed to preprocess media `%s`", message.value.get("media_id"))
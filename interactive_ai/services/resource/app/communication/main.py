@@ -8,12 +8,13 @@ from contextlib import asynccontextmanager
 
 import jsonschema
 import uvicorn
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import JSONResponse, Response
 
 from communication.kafka_handlers.annotation_kafka_handler import AnnotationKafkaHandler
+from communication.kafka_handlers.entity_cache_kafka_handler import EntityCacheKafkaHandler
 from communication.kafka_handlers.media_uploaded_kafka_handler import MediaUploadedKafkaHandler
 from communication.kafka_handlers.miscellaneous_kafka_handler import MiscellaneousKafkaHandler
 from communication.kafka_handlers.preprocessing_kafka_handler import PreprocessingKafkaHandler
@@ -32,13 +33,15 @@ from communication.rest_endpoints import (
     status_router,
     workspace_router,
 )
-from metrics.instruments import initialize_metrics
+from communication.rest_utils import setup_identity_map_fastapi
+from metrics.instruments import initialize_metrics, record_deletion_progress
 
 from geti_fastapi_tools.exceptions import GetiBaseException
 from geti_fastapi_tools.responses import error_response_rest
 from geti_fastapi_tools.validation import RestApiValidator
 from geti_telemetry_tools import ENABLE_TRACING, FastAPITelemetry, KafkaTelemetry
 from iai_core.algorithms import ModelTemplateList
+from iai_core.utils.background_deletion import BackgroundDeletionWorker
 from iai_core.utils.exceptions import InvalidProjectDataException
 
 
@@ -59,6 +62,8 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     ThumbVideoKafkaHandler()
     MediaUploadedKafkaHandler()
     PreprocessingKafkaHandler()
+    EntityCacheKafkaHandler()
+    BackgroundDeletionWorker(progress_callback=record_deletion_progress).start()
     yield
     # Shutdown
     AnnotationKafkaHandler().stop()
@@ -66,12 +71,14 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     ThumbVideoKafkaHandler().stop()
     MediaUploadedKafkaHandler().stop()
     PreprocessingKafkaHandler().stop()
+    EntityCacheKafkaHandler().stop()
+    BackgroundDeletionWorker().stop()
     if ENABLE_TRACING:
         FastAPITelemetry.uninstrument(app)
         KafkaTelemetry.uninstrument()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, dependencies=[Depends(setup_identity_map_fastapi)])
 
 if ENABLE_TRACING:
     FastAPITelemetry.instrument(app)
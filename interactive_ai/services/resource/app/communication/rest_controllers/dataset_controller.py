@@ -11,16 +11,19 @@ from communication.exceptions import (
 )
 from communication.rest_data_validator import DatasetRestValidator
 from communication.rest_views.dataset_storage_rest_views import NAME, DatasetStorageRESTViews
+from features.feature_flags import FeatureFlag
 from managers.project_manager import ProjectManager
 from usecases.statistics import StatisticsUseCase
 
 from geti_fastapi_tools.exceptions import BadRequestException, DatasetStorageNotFoundException
 from geti_fastapi_tools.responses import success_response_rest
+from geti_feature_tools import FeatureFlagProvider
 from geti_telemetry_tools import unified_tracing
 from geti_types import ID, DatasetStorageIdentifier, Singleton
 from iai_core.entities.dataset_storage import DatasetStorage, NullDatasetStorage
 from iai_core.entities.datasets import NullDataset
 from iai_core.repos import DatasetRepo, DatasetStorageRepo, ProjectRepo
+from iai_core.utils.background_deletion import schedule_dataset_storage_deletion
 from iai_core.utils.deletion_helpers import DeletionHelpers
 
 
@@ -110,7 +113,11 @@ class DatasetRESTController(metaclass=Singleton):
         project.dataset_storage_adapters.remove(adapter_to_delete)
         ProjectRepo().save(project)
 
-        DeletionHelpers.delete_dataset_storage_by_id(dataset_storage_identifier)
+        if FeatureFlagProvider.is_enabled(FeatureFlag.FEATURE_FLAG_BACKGROUND_DELETION):
+            # The dataset storage is detached from the project, so its content can be deleted in the background
+            schedule_dataset_storage_deletion(dataset_storage_identifier)
+        else:
+            DeletionHelpers.delete_dataset_storage_by_id(dataset_storage_identifier)
         return success_response_rest()
 
     @staticmethod
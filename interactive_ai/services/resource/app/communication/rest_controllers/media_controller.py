@@ -174,6 +174,30 @@ class MediaRESTController(metaclass=Singleton):
             video_id=video_id,
         )
 
+    @staticmethod
+    @unified_tracing
+    def get_video_thumbnail_variant(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        video_id: ID,
+        size: int,
+        extension: ImageExtensions,
+    ) -> BinaryIO | None:
+        """
+        Get the smallest variant of the video thumbnail that is adequate to display it at the requested size.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the video
+        :param video_id: ID of the video
+        :param size: Size at which the thumbnail is displayed, in pixels
+        :param extension: Image format of the variant, either JPG or WEBP
+        :return: Thumbnail variant in BinaryIO format, or None if the video has no thumbnail variants
+        """
+        return MediaManager.get_thumbnail_variant(
+            dataset_storage_identifier=dataset_storage_identifier,
+            thumbnail_filename=Video.thumbnail_filename_by_video_id(str(video_id)),
+            size=size,
+            extension=extension,
+        )
+
     @staticmethod
     @unified_tracing
     def get_video_thumbnail_stream_location(
@@ -15,7 +15,14 @@ from communication.constants import MAX_N_MEDIA_RETURNED
 from communication.exceptions import NotEnoughSpaceException
 from communication.rest_controllers.media_controller import MediaRESTController
 from communication.rest_data_validator import MediaRestValidator
-from communication.rest_utils import convert_numpy_to_jpeg_response, send_file_from_path_or_url, stream_to_jpeg_response
+from communication.rest_utils import (
+    JPEG_MIME_TYPE,
+    WEBP_MIME_TYPE,
+    convert_numpy_to_jpeg_response,
+    send_file_from_path_or_url,
+    stream_to_image_response,
+    stream_to_jpeg_response,
+)
 from features.feature_flags import FeatureFlag
 from usecases.dataset_filter import DatasetFilter, DatasetFilterField, DatasetFilterSortDirection
 
@@ -33,6 +40,8 @@ from geti_fastapi_tools.dependencies import (
 )
 from geti_feature_tools import FeatureFlagProvider
 from geti_types import ID, DatasetStorageIdentifier, MediaType
+from iai_core.entities.media import ImageExtensions
+from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE
 from iai_core.utils.filesystem import check_free_space_for_upload
 
 GENERIC_DS_RULE = {
@@ -224,8 +233,12 @@ def get_video_display(  # noqa: ANN201
     dataset_id: Annotated[ID, Depends(get_dataset_id)],
     video_id: Annotated[ID, Depends(get_video_id)],
     display_type: VideoDisplayType,
+    size: Annotated[int | None, Query(ge=1)] = None,
 ):
-    """Display a video"""
+    """
+    Display a video. For the thumbnail, 'size' is the size in pixels at which it is displayed, so that the
+    smallest adequate thumbnail is served; WebP is served to the clients that accept it.
+    """
     dataset_storage_identifier = DatasetStorageIdentifier(
         workspace_id=workspace_id,
         project_id=project_id,
@@ -255,6 +268,20 @@ def get_video_display(  # noqa: ANN201
         )
 
     if display_type == VideoDisplayType.thumb:
+        accepts_webp = WEBP_MIME_TYPE in request.headers.get("accept", "")
+        if size is not None or accepts_webp:
+            thumbnail_variant = MediaRESTController.get_video_thumbnail_variant(
+                dataset_storage_identifier=dataset_storage_identifier,
+                video_id=video_id,
+                size=size or DEFAULT_THUMBNAIL_SIZE,
+                extension=ImageExtensions.WEBP if accepts_webp else ImageExtensions.JPG,
+            )
+            if thumbnail_variant is not None:
+                return stream_to_image_response(
+                    stream=thumbnail_variant,
+                    mime_type=WEBP_MIME_TYPE if accepts_webp else JPEG_MIME_TYPE,
+                    cache=True,
+                )
         thumbnail = MediaRESTController.get_video_thumbnail(
             dataset_storage_identifier=dataset_storage_identifier,
             video_id=video_id,
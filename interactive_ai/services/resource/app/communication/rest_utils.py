@@ -4,23 +4,26 @@
 import io
 import logging
 import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Annotated, BinaryIO, TypeVar
 
 import cv2
 import numpy as np
-from fastapi import Query
+from fastapi import Query, Request
 from starlette.responses import FileResponse, RedirectResponse, Response, StreamingResponse
 
 from communication.constants import DEFAULT_N_PROJECTS_RETURNED, MAX_N_PROJECTS_RETURNED
 
 from geti_telemetry_tools import unified_tracing
+from iai_core.repos.base.identity_map import IdentityMap, identity_map_context
 from iai_core.repos.project_repo_helpers import ProjectQueryData, ProjectSortBy, ProjectSortDirection, SortDirection
 
 API_GATEWAY_VERSION = 10
 CACHE_CONTROL_HEADER = {"Cache-Control": "private, max-age=3600"}
 JPEG_EXTENSION = ".jpg"
 JPEG_MIME_TYPE = "image/jpeg"
+WEBP_MIME_TYPE = "image/webp"
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
@@ -48,6 +51,18 @@ def project_query_data(
     )
 
 
+async def setup_identity_map_fastapi(request: Request) -> AsyncIterator[None]:
+    """
+    Bind a request-scoped identity map to the repos, if enabled through FEATURE_FLAG_REQUEST_IDENTITY_MAP.
+    The duplicate reads of the request are logged at debug level when the request completes.
+    """
+    if not IdentityMap.is_enabled():
+        yield
+        return
+    with identity_map_context(name=f"{request.method} {request.url.path}"):
+        yield
+
+
 @unified_tracing
 def send_file_from_path_or_url(
     request_host: str,
@@ -125,6 +140,22 @@ def stream_to_jpeg_response(stream: BinaryIO, cache: bool = False) -> StreamingR
     :return: StreamingResponse
         A StreamingResponse containing the bytes stream with the appropriate media type and cache headers.
     """
+    return stream_to_image_response(stream=stream, mime_type=JPEG_MIME_TYPE, cache=cache)
+
+
+def stream_to_image_response(stream: BinaryIO, mime_type: str, cache: bool = False) -> StreamingResponse:
+    """
+    Transfers a bytes stream of an encoded image to an HTTP response.
+
+    :param stream: BinaryIO
+        The input bytes stream.
+    :param mime_type: str
+        The MIME type of the image, e.g. 'image/jpeg' or 'image/webp'.
+    :param cache: bool, optional
+        Whether the client can cache the media response or not (default is False).
+    :return: StreamingResponse
+        A StreamingResponse containing the bytes stream with the given media type and cache headers.
+    """
     headers = CACHE_CONTROL_HEADER if cache else None
     stream.seek(0)
-    return StreamingResponse(content=stream, media_type=JPEG_MIME_TYPE, headers=headers)
+    return StreamingResponse(content=stream, media_type=mime_type, headers=headers)
@@ -11,3 +11,4 @@ class FeatureFlag(Enum):
     FEATURE_FLAG_ANOMALY_REDUCTION = auto()
     FEATURE_FLAG_KEYPOINT_DETECTION = auto()
     FEATURE_FLAG_ASYNCHRONOUS_MEDIA_PREPROCESSING = auto()
+    FEATURE_FLAG_BACKGROUND_DELETION = auto()
@@ -8,9 +8,11 @@ from typing import cast
 from geti_spicedb_tools import Permissions, SpiceDB
 
 from communication.exceptions import DatasetStorageNotInProjectException, LabelNotFoundException, ProjectLockedException
+from features.feature_flags import FeatureFlag
 from managers.annotation_manager import AnnotationManager
 
 from geti_fastapi_tools.exceptions import BadRequestException, ProjectNotFoundException
+from geti_feature_tools import FeatureFlagProvider
 from geti_kafka_tools import publish_event
 from geti_telemetry_tools import unified_tracing
 from geti_types import CTX_SESSION_VAR, ID
@@ -24,6 +26,7 @@ from iai_core.entities.task_graph import TaskGraph
 from iai_core.factories import ProjectParser, ProjectUpdateParser
 from iai_core.repos import ProjectRepo
 from iai_core.repos.project_repo_helpers import ProjectQueryData
+from iai_core.utils.background_deletion import schedule_project_deletion
 from iai_core.utils.deletion_helpers import DeletionHelpers
 from iai_core.utils.project_builder import PersistedProjectBuilder, ProjectUpdateError
 
@@ -326,7 +329,11 @@ class ProjectManager:
         project_repo = ProjectRepo()
         project_repo.hide(project)
 
-        DeletionHelpers.delete_project_by_id(project_id=project_id)
+        if FeatureFlagProvider.is_enabled(FeatureFlag.FEATURE_FLAG_BACKGROUND_DELETION):
+            # The project is hidden, so its content can be deleted later by the background deletion worker
+            schedule_project_deletion(project_identifier=project.identifier)
+        else:
+            DeletionHelpers.delete_project_by_id(project_id=project_id)
         SpiceDB().delete_project(project_id)
 
         publish_event(
@@ -20,9 +20,12 @@ from geti_telemetry_tools import DEBUG_METRICS, OTLP_METRICS_RECEIVER, TEST_METR
 from geti_telemetry_tools.metrics.instruments import BaseInstrumentAttributes
 from geti_telemetry_tools.metrics.instruments import MetricName as MetricNameBase
 from geti_telemetry_tools.metrics.utils import if_elected_publisher_for_metric
+from iai_core.repos.deletion_tombstone_repo import DeletionTombstoneRepo
+from iai_core.repos.entity_cache import ENTITY_CACHES
 from iai_core.repos.leader_election_repo import LeaderElectionRepo
 from iai_core.repos.metrics_reporting_model_storage_repo import MetricsReportingModelStorageRepo
 from iai_core.repos.metrics_reporting_project_repo import MetricsReportingProjectRepo
+from iai_core.utils.background_deletion import DeletionProgress
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,15 @@ class MetricName:
     MODELS_PER_TASK_TYPE = f"{MODEL_TOTAL_GAUGE}.task_type"
     MODELS_PER_ARCH = f"{MODEL_TOTAL_GAUGE}.architecture"
 
+    DELETIONS_BASENAME = f"{MetricNameBase.APPLICATION_BASENAME}.deletions"
+    DELETIONS_PENDING_GAUGE = f"{DELETIONS_BASENAME}.pending_gauge"
+    DELETED_DOCUMENTS_COUNTER = f"{DELETIONS_BASENAME}.documents"
+    DELETED_OBJECTS_COUNTER = f"{DELETIONS_BASENAME}.objects"
+
+    ENTITY_CACHE_BASENAME = f"{MetricNameBase.APPLICATION_BASENAME}.entity_cache"
+    ENTITY_CACHE_HITS_COUNTER = f"{ENTITY_CACHE_BASENAME}.hits"
+    ENTITY_CACHE_MISSES_COUNTER = f"{ENTITY_CACHE_BASENAME}.misses"
+
 
 metric_readers: list[MetricReader] = []
 in_memory_metric_reader: InMemoryMetricReader | None = None
@@ -173,6 +185,88 @@ models_total_per_task_type_gauge = meter.create_observable_gauge(
 )
 
 
+@if_elected_publisher_for_metric(
+    metric_name=MetricName.DELETIONS_PENDING_GAUGE,
+    validity_in_seconds=3540,
+    election_manager_cls=LeaderElectionRepo,
+)
+def pending_deletions_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the number of projects and dataset storages waiting to be deleted in the background
+    """
+    pending_deletions = DeletionTombstoneRepo().count()
+    logger.info("Reporting pending deletions metrics now: %s", pending_deletions)
+    return [Observation(value=pending_deletions)]
+
+
+pending_deletions_gauge = meter.create_observable_gauge(
+    name=MetricName.DELETIONS_PENDING_GAUGE,
+    description="Number of projects and dataset storages waiting to be deleted",
+    unit="deletions",
+    callbacks=[pending_deletions_callback],
+)
+
+deleted_documents_counter = meter.create_counter(
+    name=MetricName.DELETED_DOCUMENTS_COUNTER,
+    description="Number of documents deleted by the background deletion worker",
+    unit="documents",
+)
+
+deleted_objects_counter = meter.create_counter(
+    name=MetricName.DELETED_OBJECTS_COUNTER,
+    description="Number of binary objects deleted by the background deletion worker",
+    unit="objects",
+)
+
+
+def record_deletion_progress(progress: DeletionProgress) -> None:
+    """
+    Record the documents and objects deleted by a chunk of a background deletion
+
+    :param progress: Progress reported by the background deletion worker
+    """
+    attributes = DeletionAttributes(stage=progress.stage).to_dict()
+    if progress.deleted_documents:
+        deleted_documents_counter.add(progress.deleted_documents, attributes=attributes)
+    if progress.deleted_objects:
+        deleted_objects_counter.add(progress.deleted_objects, attributes=attributes)
+
+
+def entity_cache_hits_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the number of entity lookups served from the cache of this process, per cached entity type
+    """
+    return [
+        Observation(value=cache.stats.hits, attributes=EntityCacheAttributes(cache=cache.name).to_dict())
+        for cache in ENTITY_CACHES
+    ]
+
+
+def entity_cache_misses_callback(options: CallbackOptions) -> list[Observation]:  # noqa: ARG001
+    """
+    Report the number of entity lookups which required to deserialize the entity, per cached entity type
+    """
+    return [
+        Observation(value=cache.stats.misses, attributes=EntityCacheAttributes(cache=cache.name).to_dict())
+        for cache in ENTITY_CACHES
+    ]
+
+
+entity_cache_hits_counter = meter.create_observable_counter(
+    name=MetricName.ENTITY_CACHE_HITS_COUNTER,
+    description="Number of project and label schema lookups served from the entity cache",
+    unit="lookups",
+    callbacks=[entity_cache_hits_callback],
+)
+
+entity_cache_misses_counter = meter.create_observable_counter(
+    name=MetricName.ENTITY_CACHE_MISSES_COUNTER,
+    description="Number of project and label schema lookups that missed the entity cache",
+    unit="lookups",
+    callbacks=[entity_cache_misses_callback],
+)
+
+
 @dataclass
 class ProjectsTotalGaugeAttributes(BaseInstrumentAttributes):
     """
@@ -206,6 +300,28 @@ class ModelPerTypeTotalGaugeAttributes(BaseInstrumentAttributes):
     task_type: str
 
 
+@dataclass
+class DeletionAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the background deletion counters
+
+      - stage: deletion stage, identifying the deleted collection or binary object type
+    """
+
+    stage: str
+
+
+@dataclass
+class EntityCacheAttributes(BaseInstrumentAttributes):
+    """
+    Attributes for the entity cache counters
+
+      - cache: name of the cache, identifying the type of the cached entities
+    """
+
+    cache: str
+
+
 def initialize_metrics() -> None:
     """
     Ensure the metrics module is loaded and async gauges are initialized.
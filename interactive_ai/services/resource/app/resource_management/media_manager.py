@@ -51,7 +51,14 @@ from iai_core.adapters.binary_interpreters import NumpyBinaryInterpreter, Stream
 from iai_core.entities.annotation import Annotation
 from iai_core.entities.dataset_storage import DatasetStorage
 from iai_core.entities.image import Image, NullImage
-from iai_core.entities.media import ImageExtensions, MediaPreprocessing, MediaPreprocessingStatus, VideoExtensions
+from iai_core.entities.media import (
+    ImageExtensions,
+    MediaPreprocessing,
+    MediaPreprocessingStatus,
+    VideoExtensions,
+    select_thumbnail_variant_size,
+    thumbnail_variant_filename,
+)
 from iai_core.entities.project import Project
 from iai_core.entities.video import NullVideo, Video, VideoFrame
 from iai_core.repos import ImageRepo, ProjectRepo, VideoRepo
@@ -149,6 +156,38 @@ class MediaManager:
                     f"Video ID: `{video_id}`."
                 )
 
+    @staticmethod
+    def get_thumbnail_variant(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        thumbnail_filename: str,
+        size: int,
+        extension: ImageExtensions,
+    ) -> BinaryIO | None:
+        """
+        Return the smallest thumbnail variant that is adequate to display the thumbnail at the requested size.
+
+        The variants are only generated by the asynchronous media preprocessing, so None is returned if the variant
+        does not exist; in that case, the default thumbnail should be served instead.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+        :param thumbnail_filename: Filename of the default thumbnail of the media
+        :param size: Size at which the thumbnail is displayed, in pixels
+        :param extension: Image format of the variant, either JPG or WEBP
+        :return: Thumbnail variant in BinaryIO format, or None if it does not exist
+        """
+        variant_filename = thumbnail_variant_filename(
+            thumbnail_filename=thumbnail_filename,
+            size=select_thumbnail_variant_size(size),
+            extension=extension,
+        )
+        try:
+            return ThumbnailBinaryRepo(dataset_storage_identifier).get_by_filename(
+                filename=variant_filename,
+                binary_interpreter=StreamBinaryInterpreter(),
+            )
+        except FileNotFoundError:
+            return None
+
     @staticmethod
     def get_image_thumbnail(
         dataset_storage_identifier: DatasetStorageIdentifier,
@@ -59,7 +59,7 @@ class MediaUploadedUseCase:
         dataset_storage_identifier: DatasetStorageIdentifier, image_id: ID, data_binary_filename: str
     ) -> None:
         """
-        Handles image being uploaded. Creates and store image thumbnail
+        Handles image being uploaded. Creates and stores the image thumbnail and its variants
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the dataset
         :param image_id: image ID
@@ -69,8 +69,8 @@ class MediaUploadedUseCase:
             filename=data_binary_filename, binary_interpreter=NumpyBinaryInterpreter()
         )
         try:
-            # Create a thumbnail for the image
-            Media2DFactory.create_and_save_media_thumbnail(
+            # Create the thumbnails for the image, decoded only once for all the sizes and formats
+            Media2DFactory.create_and_save_media_thumbnail_variants(
                 dataset_storage_identifier=dataset_storage_identifier,
                 media_numpy=image_numpy,
                 thumbnail_binary_filename=Image.thumbnail_filename_by_image_id(image_id),
@@ -87,7 +87,8 @@ class MediaUploadedUseCase:
         data_binary_filename: str,
     ) -> None:
         """
-        Handles video being uploaded. Creates and store video thumbnail, generates thumbnail video
+        Handles video being uploaded. Creates and stores the video thumbnail and its variants,
+        generates thumbnail video
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the dataset
         :param video_id: video ID
@@ -103,14 +104,9 @@ class MediaUploadedUseCase:
                 file_location_getter=lambda: url,
                 frame_index=frame_index,
             )
-            cropped_numpy = Media2DFactory.crop_to_thumbnail(
-                media_numpy=frame_numpy,
-                target_height=DEFAULT_THUMBNAIL_SIZE,
-                target_width=DEFAULT_THUMBNAIL_SIZE,
-            )
-            Media2DFactory.create_and_save_media_thumbnail(
+            Media2DFactory.create_and_save_media_thumbnail_variants(
                 dataset_storage_identifier=dataset_storage_identifier,
-                media_numpy=cropped_numpy,
+                media_numpy=frame_numpy,
                 thumbnail_binary_filename=Video.thumbnail_filename_by_video_id(video_id),
             )
 
@@ -0,0 +1,59 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from communication.kafka_handlers.entity_cache_kafka_handler import EntityCacheKafkaHandler
+
+from geti_kafka_tools import KafkaRawMessage
+from geti_types import ID, ProjectIdentifier
+
+PROJECT_IDENTIFIER = ProjectIdentifier(workspace_id=ID("63b183d00000000000000001"), project_id=ID("project_id"))
+
+
+def mock_init(self, *args, **kwargs) -> None:
+    return None
+
+
+def kafka_message(topic: str) -> KafkaRawMessage:
+    return KafkaRawMessage(
+        topic,
+        0,
+        0,
+        int(datetime.now().timestamp()),
+        0,
+        b"project_id",
+        {
+            "project_id": str(PROJECT_IDENTIFIER.project_id),
+            "workspace_id": str(PROJECT_IDENTIFIER.workspace_id),
+        },
+        [
+            ("organization_id", b"000000000000000000000001"),
+            ("workspace_id", b"63b183d00000000000000001"),
+            ("mongodb_sharding_profile", b"NOT_SHARDED"),
+            ("organization_location", b"IT-TR"),
+            ("connected_instance_location", b"NL-GR"),
+        ],
+    )
+
+
+class TestEntityCacheKafkaHandler:
+    @pytest.mark.parametrize("topic", ["project_updates", "project_deletions"])
+    @patch.object(EntityCacheKafkaHandler, "__init__", new=mock_init)
+    def test_on_project_changed(self, topic) -> None:
+        # Arrange
+        message: KafkaRawMessage = kafka_message(topic=topic)
+
+        # Act
+        with patch(
+            "communication.kafka_handlers.entity_cache_kafka_handler.invalidate_project_entities"
+        ) as mock_invalidate:
+            EntityCacheKafkaHandler().on_project_changed(message)
+
+        # Assert
+        mock_invalidate.assert_called_once_with(
+            organization_id=ID("000000000000000000000001"),
+            project_identifier=PROJECT_IDENTIFIER,
+        )
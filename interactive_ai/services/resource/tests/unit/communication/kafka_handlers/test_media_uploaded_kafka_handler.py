@@ -1,7 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 
@@ -80,3 +80,33 @@ class TestMediaUploadedKafkaHandler:
             media_id=ID("media_id"),
             data_binary_filename="data_binary_filename",
         )
+
+    @patch.object(MediaUploadedKafkaHandler, "__init__", new=mock_init)
+    def test_on_media_preprocessing_batch(self) -> None:
+        # Arrange
+        messages = [
+            kafka_message(event="MEDIA_UPLOADED", media_type="IMAGE"),
+            kafka_message(event="MEDIA_PREPROCESSING_STARTED", media_type="IMAGE"),
+            kafka_message(event="MEDIA_UPLOADED", media_type="VIDEO"),
+        ]
+
+        # Act
+        with patch.object(
+            MediaUploadedUseCase, "on_media_uploaded", side_effect=[RuntimeError, None]
+        ) as mock_on_media_uploaded:
+            MediaUploadedKafkaHandler().on_media_preprocessing_batch(messages)
+
+        # Assert
+        assert mock_on_media_uploaded.call_count == 2
+        mock_on_media_uploaded.assert_has_calls(
+            [
+                call(
+                    dataset_storage_identifier=DATASET_STORAGE_ID,
+                    media_type=media_type,
+                    media_id=ID("media_id"),
+                    data_binary_filename="data_binary_filename",
+                )
+                for media_type in ("IMAGE", "VIDEO")
+            ],
+            any_order=True,
+        )
@@ -900,6 +900,45 @@ class TestMediaManager:
         # Assert
         mock_get_by_id.assert_called_once_with(image_id)
 
+    @pytest.mark.parametrize(
+        "size, extension, expected_filename",
+        [
+            (100, ImageExtensions.JPG, "media_id_thumbnail_128.jpg"),
+            (200, ImageExtensions.JPG, "media_id_thumbnail.jpg"),
+            (200, ImageExtensions.WEBP, "media_id_thumbnail_256.webp"),
+            (1000, ImageExtensions.WEBP, "media_id_thumbnail_512.webp"),
+        ],
+    )
+    def test_get_thumbnail_variant(self, fxt_dataset_storage, size, extension, expected_filename) -> None:
+        # Arrange
+        thumbnail = MagicMock()
+
+        # Act
+        with patch.object(ThumbnailBinaryRepo, "get_by_filename", return_value=thumbnail) as mock_get_by_filename:
+            result = MediaManager.get_thumbnail_variant(
+                dataset_storage_identifier=fxt_dataset_storage.identifier,
+                thumbnail_filename="media_id_thumbnail.jpg",
+                size=size,
+                extension=extension,
+            )
+
+        # Assert
+        mock_get_by_filename.assert_called_once_with(filename=expected_filename, binary_interpreter=ANY)
+        assert result == thumbnail
+
+    def test_get_thumbnail_variant_missing(self, fxt_dataset_storage) -> None:
+        # Act
+        with patch.object(ThumbnailBinaryRepo, "get_by_filename", side_effect=FileNotFoundError):
+            result = MediaManager.get_thumbnail_variant(
+                dataset_storage_identifier=fxt_dataset_storage.identifier,
+                thumbnail_filename="media_id_thumbnail.jpg",
+                size=128,
+                extension=ImageExtensions.WEBP,
+            )
+
+        # Assert
+        assert result is None
+
     @patch.dict(os.environ, {"FEATURE_FLAG_ASYNCHRONOUS_MEDIA_PREPROCESSING": "true"})
     def test_get_image_thumbnail_async_preprocessing(self, fxt_dataset_storage, fxt_mongo_id) -> None:
         # Arrange
@@ -142,7 +142,9 @@ class TestMediaUploadedUseCase:
         # Act
         with (
             patch.object(ImageBinaryRepo, "get_by_filename", return_value=image_numpy) as mock_get_by_filename,
-            patch.object(Media2DFactory, "create_and_save_media_thumbnail") as mock_create_and_save_media_thumbnail,
+            patch.object(
+                Media2DFactory, "create_and_save_media_thumbnail_variants"
+            ) as mock_create_and_save_media_thumbnail_variants,
         ):
             MediaUploadedUseCase.on_image_uploaded(
                 dataset_storage_identifier=DATASET_STORAGE_ID,
@@ -152,7 +154,7 @@ class TestMediaUploadedUseCase:
 
         # Assert
         mock_get_by_filename.assert_called_once_with(filename="data_binary_filename", binary_interpreter=ANY)
-        mock_create_and_save_media_thumbnail.assert_called_once_with(
+        mock_create_and_save_media_thumbnail_variants.assert_called_once_with(
             dataset_storage_identifier=DATASET_STORAGE_ID,
             media_numpy=image_numpy,
             thumbnail_binary_filename="image_id_thumbnail.jpg",
@@ -163,7 +165,6 @@ class TestMediaUploadedUseCase:
     def test_on_video_uploaded(self) -> None:
         # Arrange
         frame_numpy = MagicMock()
-        cropped_numpy = MagicMock()
         video_information = VideoInformation(fps=30, width=200, height=100, total_frames=100)
 
         # Act
@@ -175,8 +176,9 @@ class TestMediaUploadedUseCase:
                 VideoDecoder, "get_video_information", return_value=video_information
             ) as mock_get_video_information,
             patch.object(VideoFrameReader, "get_frame_numpy", return_value=frame_numpy) as mock_get_frame_numpy,
-            patch.object(Media2DFactory, "crop_to_thumbnail", return_value=cropped_numpy) as mock_crop_to_thumbnail,
-            patch.object(Media2DFactory, "create_and_save_media_thumbnail") as mock_create_and_save_media_thumbnail,
+            patch.object(
+                Media2DFactory, "create_and_save_media_thumbnail_variants"
+            ) as mock_create_and_save_media_thumbnail_variants,
             patch.object(
                 ThumbnailBinaryRepo, "create_path_for_temporary_file", return_value="temporary_path"
             ) as mock_create_path_for_temporary_file,
@@ -196,10 +198,9 @@ class TestMediaUploadedUseCase:
         mock_get_path_or_presigned_url.assert_called_once_with(filename="data_binary_filename")
         mock_get_video_information.assert_called_once_with("presigned_url")
         mock_get_frame_numpy.assert_called_once_with(file_location_getter=ANY, frame_index=50)
-        mock_crop_to_thumbnail.assert_called_once_with(media_numpy=frame_numpy, target_height=256, target_width=256)
-        mock_create_and_save_media_thumbnail.assert_called_once_with(
+        mock_create_and_save_media_thumbnail_variants.assert_called_once_with(
             dataset_storage_identifier=DATASET_STORAGE_ID,
-            media_numpy=cropped_numpy,
+            media_numpy=frame_numpy,
             thumbnail_binary_filename="video_id_thumbnail.jpg",
         )
         mock_create_path_for_temporary_file.assert_called_once_with(filename="data_binary_filename", make_unique=False)
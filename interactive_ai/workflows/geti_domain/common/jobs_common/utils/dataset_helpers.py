@@ -4,6 +4,7 @@
 
 import copy
 import os
+from collections.abc import Iterator
 
 from geti_kafka_tools import publish_event
 from geti_telemetry_tools import unified_tracing
@@ -41,6 +42,9 @@ MAX_TRAINING_DATASET_SIZE_WARNING = (
     f"The free trial is limited to training with the first {MAX_TRAINING_DATASET_SIZE} annotated data."
 )
 
+# Number of annotation scenes processed at a time when constructing the testing dataset
+TESTING_DATASET_CHUNK_SIZE = int(os.environ.get("TESTING_DATASET_CHUNK_SIZE", "1000"))
+
 
 class DatasetHelpers:
     """
@@ -78,10 +82,10 @@ class DatasetHelpers:
         )
 
         dataset = Dataset(id=DatasetRepo.generate_id())
-        for identifier in unannotated_identifiers:
-            media = Media2DFactory.get_media_for_identifier(
-                identifier, dataset_storage_identifier=dataset_storage.identifier
-            )
+        all_media = Media2DFactory.get_media_for_identifiers(
+            media_identifiers=unannotated_identifiers, dataset_storage_identifier=dataset_storage.identifier
+        )
+        for identifier, media in zip(unannotated_identifiers, all_media):
             annotation_scene = AnnotationScene(
                 kind=AnnotationSceneKind.INTERMEDIATE,
                 media_identifier=identifier,
@@ -218,8 +222,8 @@ class DatasetHelpers:
         This method does the following:
         1. Fetches the current dataset from the task dataset entity
         2. Calls the subset manager to set the unassigned subsets in the dataset
-        3. Save the new subsets to the repo by calling update_subsets and publish that the subsets were updated
-        4. Makes a copy of the dataset and passes it to the training operator
+        3. Save the changed subsets to the repo by calling save_subsets and publish that the subsets were updated
+        4. Saves a snapshot of the dataset, sharing the annotations with the task dataset, for the training operator
 
         :param task_dataset_entity: TaskDataset that holds the current dataset for the task
         :param project_id: ID of the project
@@ -250,12 +254,23 @@ class DatasetHelpers:
         else:
             subsets_to_reset = None
 
+        subsets_before_split = [item.subset for item in training_dataset_items]
         TaskSubsetManager.split(
             dataset_items=iter(training_dataset_items),
             task_node=task_node,
             subsets_to_reset=subsets_to_reset,
         )
-        task_dataset_entity.save_subsets(dataset=dataset, dataset_storage_identifier=dataset_storage.identifier)
+        # Only the items assigned to a new subset need to be updated in the task dataset
+        reassigned_items = [
+            item
+            for item, subset_before_split in zip(training_dataset_items, subsets_before_split)
+            if item.subset != subset_before_split
+        ]
+        if reassigned_items:
+            task_dataset_entity.save_subsets(
+                dataset=Dataset(id=dataset.id_, items=reassigned_items),
+                dataset_storage_identifier=dataset_storage.identifier,
+            )
 
         assigned_items_list_string = [str(assigned_item.id_) for assigned_item in training_dataset_items]
         # Publish dataset update events in chunks of max 20 items, to avoid hitting the Kafka message size limit and
@@ -284,10 +299,59 @@ class DatasetHelpers:
             label_schema_id=task_label_schema.id_,
             id=DatasetRepo.generate_id(),
         )
+        # The training dataset is a snapshot of the task dataset: the annotations are shared, not copied
         dataset_repo = DatasetRepo(dataset_storage.identifier)
-        dataset_repo.save_deep(new_training_dataset)
+        dataset_repo.save_snapshot(new_training_dataset)
         return new_training_dataset
 
+    @staticmethod
+    def construct_testing_dataset_chunks(
+        project: Project,
+        dataset_storage: DatasetStorage,
+        task_node_id: ID,
+        create_new_annotations: bool = False,
+        chunk_size: int = TESTING_DATASET_CHUNK_SIZE,
+    ) -> Iterator[Dataset]:
+        """
+        Construct the testing dataset from all annotated data in dataset storage, one chunk at a time.
+
+        The empty annotation scenes are filtered out by the database query, and the annotation scenes,
+        media and dataset items are created for at most 'chunk_size' annotation scenes at a time, so
+        that each chunk can be processed and saved before the next one is loaded.
+
+        :param project: project containing dataset storage
+        :param dataset_storage: dataset storage containing data
+        :param task_node_id: task node id
+        :param create_new_annotations: If true, create a new ID for the annotation and set kind to intermediate
+        :param chunk_size: maximum number of annotation scenes to process in each chunk
+        :return: iterator over the datasets containing the items of each chunk
+        """
+        ann_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
+        task_nodes = project.tasks
+        # TODO: CVS-88185 Remove assumption about length of task chain
+        crop_for_second_task = task_node_id != task_nodes[1].id_ and len(task_nodes) == 4
+        for annotation_scenes in ann_scene_repo.get_all_non_empty_by_kind(
+            kind=AnnotationSceneKind.ANNOTATION, chunk_size=chunk_size
+        ):
+            if create_new_annotations:
+                for annotation_scene in annotation_scenes:
+                    annotation_scene.id_ = AnnotationSceneRepo.generate_id()
+                    annotation_scene.kind = AnnotationSceneKind.INTERMEDIATE
+
+            dataset = DatasetHelpers.construct_dataset_from_annotation_scenes(
+                annotation_scenes=annotation_scenes,
+                dataset_storage=dataset_storage,
+                subset=Subset.TESTING,
+            )
+            if crop_for_second_task:
+                dataset = FlowControl.flow_control(
+                    project=project,
+                    task_node=task_nodes[2],
+                    dataset=dataset,
+                    prev_task_node=task_nodes[1],
+                )
+            yield dataset
+
     @staticmethod
     @unified_tracing
     def construct_testing_dataset(
@@ -305,31 +369,14 @@ class DatasetHelpers:
         :param create_new_annotations: If true, create a new ID for the annotation and set kind to intermediate
         :return: evaluation dataset from all annotated media in dataset storage
         """
-        ann_scene_repo = AnnotationSceneRepo(dataset_storage.identifier)
-        all_annotation_scenes = ann_scene_repo.get_all_by_kind(kind=AnnotationSceneKind.ANNOTATION)
-        annotation_scenes = [
-            annotation_scene for annotation_scene in all_annotation_scenes if len(annotation_scene.annotations) > 0
-        ]
-        if create_new_annotations:
-            for annotation_scene in annotation_scenes:
-                annotation_scene.id_ = AnnotationSceneRepo.generate_id()
-                annotation_scene.kind = AnnotationSceneKind.INTERMEDIATE
-
-        dataset = DatasetHelpers.construct_dataset_from_annotation_scenes(
-            annotation_scenes=annotation_scenes,
+        dataset = Dataset(id=DatasetRepo.generate_id())
+        for dataset_chunk in DatasetHelpers.construct_testing_dataset_chunks(
+            project=project,
             dataset_storage=dataset_storage,
-            subset=Subset.TESTING,
-        )
-        task_nodes = project.tasks
-        if (
-            task_node_id != task_nodes[1].id_ and len(task_nodes) == 4
-        ):  # TODO: CVS-88185 Remove assumption about length of task chain
-            dataset = FlowControl.flow_control(
-                project=project,
-                task_node=task_nodes[2],
-                dataset=dataset,
-                prev_task_node=task_nodes[1],
-            )
+            task_node_id=task_node_id,
+            create_new_annotations=create_new_annotations,
+        ):
+            dataset.append_many(list(dataset_chunk))
         return dataset
 
     @staticmethod
@@ -347,12 +394,17 @@ class DatasetHelpers:
         :param subset: subset to set items in the dataset to
         :return: dataset
         """
+        all_media = Media2DFactory.get_media_for_identifiers(
+            media_identifiers=[annotation_scene.media_identifier for annotation_scene in annotation_scenes],
+            dataset_storage_identifier=dataset_storage.identifier,
+        )
         items = []
-        for annotation_scene in annotation_scenes:
+        for annotation_scene, media in zip(annotation_scenes, all_media):
             item = DatasetHelper.annotation_scene_to_dataset_item(
                 annotation_scene=annotation_scene,
                 dataset_storage=dataset_storage,
                 subset=subset,
+                media=media,
             )
             items.append(item)
         return Dataset(id=DatasetRepo.generate_id(), items=items)
@@ -0,0 +1,101 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""This module implements a cache for the converted items, shared across the iterations over an extractor."""
+
+import logging
+import os
+import pickle
+import tempfile
+from typing import IO, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ConvertedItemCache(Generic[T]):
+    """
+    Key-value cache for items that are expensive to convert and are needed several times.
+
+    The first `max_items_in_memory` items are kept in memory; the following ones are pickled and appended
+    to a temporary file on disk, which is read back with a single seek per lookup.
+    The temporary file is removed by `close()`, which is also called when the cache is used as a context manager.
+
+    :param max_items_in_memory: maximum number of items to keep in memory before spilling to disk
+    :param spill_dir: directory for the temporary file; if None, the system default temporary directory is used
+    """
+
+    def __init__(self, max_items_in_memory: int, spill_dir: str | None = None) -> None:
+        self._max_items_in_memory = max_items_in_memory
+        self._spill_dir = spill_dir
+        self._memory: dict[int, T] = {}
+        self._disk_offsets: dict[int, tuple[int, int]] = {}
+        self._spill_file: IO[bytes] | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._memory or key in self._disk_offsets
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk_offsets)
+
+    @property
+    def num_items_on_disk(self) -> int:
+        return len(self._disk_offsets)
+
+    def put(self, key: int, item: T) -> None:
+        """
+        Store an item in the cache. Items cannot be overwritten once stored.
+
+        :param key: key of the item
+        :param item: item to store; it must be picklable if the cache may spill to disk
+        """
+        if key in self:
+            raise KeyError(f"Item with key {key} is already cached")
+        if len(self._memory) < self._max_items_in_memory:
+            self._memory[key] = item
+            return
+        if self._spill_file is None:
+            self._spill_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                prefix="converted_items_", suffix=".pkl", dir=self._spill_dir
+            )
+            logger.info(
+                "More than %d converted items, spilling the cache to disk at '%s'",
+                self._max_items_in_memory,
+                self._spill_file.name,
+            )
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_file.seek(0, os.SEEK_END)
+        offset = self._spill_file.tell()
+        self._spill_file.write(data)
+        self._disk_offsets[key] = (offset, len(data))
+
+    def get(self, key: int) -> T:
+        """
+        Get an item from the cache.
+
+        :param key: key of the item
+        :return: the cached item
+        :raises KeyError: if no item is cached with the given key
+        :raises RuntimeError: if the item was spilled to disk but the temporary file is not open
+        """
+        if key in self._memory:
+            return self._memory[key]
+        offset, size = self._disk_offsets[key]
+        if self._spill_file is None:
+            raise RuntimeError(f"Item with key {key} was spilled to disk, but the temporary file is not open")
+        self._spill_file.seek(offset)
+        return pickle.loads(self._spill_file.read(size))  # noqa: S301
+
+    def close(self) -> None:
+        """Clear the cache and delete the temporary file, if any."""
+        self._memory.clear()
+        self._disk_offsets.clear()
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
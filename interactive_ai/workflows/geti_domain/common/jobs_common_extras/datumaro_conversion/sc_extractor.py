@@ -5,7 +5,9 @@
 import logging
 import os
 import shutil
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from itertools import chain
@@ -39,7 +41,7 @@ from geti_types import (
     VideoFrameIdentifier,
     VideoIdentifier,
 )
-from iai_core.entities.annotation import Annotation, AnnotationSceneKind
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind, NullAnnotationScene
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.dataset_storage import DatasetStorage
 from iai_core.entities.datasets import Dataset, NullDataset
@@ -60,12 +62,13 @@ from iai_core.repos import (
     VideoRepo,
 )
 
+from jobs_common_extras.datumaro_conversion.converted_item_cache import ConvertedItemCache
 from jobs_common_extras.datumaro_conversion.mappers.annotation_scene_mapper import AnnotationSceneMapper, LabelMap
 from jobs_common_extras.datumaro_conversion.mappers.dataset_item_mapper import DatasetItemMapper
 from jobs_common_extras.datumaro_conversion.mappers.id_mapper import IDMapper, MediaNameIDMapper, VideoNameIDMapper
 from jobs_common_extras.datumaro_conversion.mappers.label_mapper import LabelSchemaMapper
 
-__all__ = ["ScExtractor", "ScExtractorForFlyteJob", "ScExtractorFromDatasetStorage"]
+__all__ = ["ImageFetchStats", "ScExtractor", "ScExtractorForFlyteJob", "ScExtractorFromDatasetStorage"]
 
 from geti_types import CTX_SESSION_VAR, Session, session_context
 from iai_core.repos.storage.binary_repos import VideoBinaryRepo
@@ -356,8 +359,22 @@ class ScExtractor(dm_DatasetBase):
                            Otherwise, save the video in its original format.
         :return: Datumaro dataset item
         """
-        height = sc_item.height
-        width = sc_item.width
+        dm_anns, has_empty_label = self._convert_item_annotations(sc_item=sc_item)
+        return dm_DatasetItem(
+            id=self._name_mapper.forward(sc_item),
+            subset=sc_item.subset.name if self._use_subset else DEFAULT_SUBSET_NAME,
+            media=self._convert_media(sc_item=sc_item, video_root=video_root),
+            annotations=dm_anns,
+            attributes={"has_empty_label": has_empty_label},
+        )
+
+    def _convert_item_annotations(self, sc_item: DatasetItem) -> tuple[list[dm_Annotation], bool]:
+        """
+        Convert the annotations of a Geti dataset item to DM annotations.
+
+        :param sc_item: Geti dataset item
+        :return: tuple containing the DM annotations and whether the item has an empty label
+        """
         sc_annotations = sc_item.get_annotations(include_empty=True)
 
         # check if sc_item has empty label
@@ -368,8 +385,20 @@ class ScExtractor(dm_DatasetBase):
                 has_empty_label = True
                 break
 
-        dm_anns = self._convert_annotations(annotations=sc_annotations, width=width, height=height)
+        dm_anns = self._convert_annotations(annotations=sc_annotations, width=sc_item.width, height=sc_item.height)
+        return dm_anns, has_empty_label
+
+    def _convert_media(self, sc_item: DatasetItem, video_root: str | None = None) -> dm_Image | dm_VideoFrame:
+        """
+        Convert the media of a Geti dataset item to DM media.
 
+        :param sc_item: Geti dataset item
+        :param video_root: If this value is None, save the video as individual frame images.
+                           Otherwise, save the video in its original format.
+        :return: Datumaro media
+        """
+        height = sc_item.height
+        width = sc_item.width
         if video_root is None or not isinstance(sc_item.media, VideoFrame):
             numpy_data = get_media_numpy(
                 dataset_storage_identifier=self._dataset_storage_identifier,
@@ -384,14 +413,7 @@ class ScExtractor(dm_DatasetBase):
             video_frame = cast("VideoFrame", sc_item.media)
             video_path = self._save_video(video=video_frame.video, video_root=video_root)
             dm_media = dm_VideoFrame(video=dm_Video(path=video_path), index=video_frame.frame_index)
-
-        return dm_DatasetItem(
-            id=self._name_mapper.forward(sc_item),
-            subset=sc_item.subset.name if self._use_subset else DEFAULT_SUBSET_NAME,
-            media=dm_media,
-            annotations=dm_anns,
-            attributes={"has_empty_label": has_empty_label},
-        )
+        return dm_media
 
     def _save_video(self, video: Video, video_root: str) -> str:
         video_name = self._video_mapper.forward(video)
@@ -425,10 +447,46 @@ class DatasetItemWithFuture:
     img_extension: str | None = None
 
 
+@dataclass
+class ImageFetchStats:
+    """
+    Statistics about the images pulled by ScExtractorForFlyteJob.
+
+    :param num_items: number of dataset items yielded by the extractor
+    :param num_bytes: total size of the fetched image binaries
+    :param elapsed_seconds: wall-clock time spent iterating over the extractor
+    :param max_in_flight: highest number of items whose image was being fetched or waiting to be yielded
+    """
+
+    num_items: int = 0
+    num_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    max_in_flight: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.num_items / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.num_bytes / 2**20 / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
 class ScExtractorForFlyteJob(ScExtractor):
     """
     Represents the Geti dataset as a lazy dataset for Datumaro.
     It is used for Flyte job.
+
+    The image binaries are pulled in a thread pool while iterating, with at most `prefetch_window_size` items
+    in flight at any time. The extractor does not keep any reference to the items once they are yielded,
+    so the memory used for the image bytes does not depend on the number of items.
+
+    :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+    :param sc_dataset_or_list_of_sc_items: Dataset items to convert
+    :param label_schema: Label schema of the dataset
+    :param num_thread_pools: Number of threads used to pull the image bytes
+    :param prefetch_window_size: Maximum number of items whose image is fetched ahead of the consumer.
+        Defaults to twice the number of threads.
     """
 
     def __init__(
@@ -437,6 +495,7 @@ class ScExtractorForFlyteJob(ScExtractor):
         sc_dataset_or_list_of_sc_items: list[DatasetItem],
         label_schema: LabelSchema,
         num_thread_pools: int = 10,
+        prefetch_window_size: int | None = None,
     ) -> None:
         super().__init__(
             dataset_storage_identifier,
@@ -445,6 +504,28 @@ class ScExtractorForFlyteJob(ScExtractor):
             use_subset=True,
         )
         self._thread_pool = ThreadPool(processes=num_thread_pools)
+        self._prefetch_window_size = prefetch_window_size if prefetch_window_size else 2 * num_thread_pools
+        if self._prefetch_window_size < 1:
+            raise ValueError(f"The prefetch window size must be positive, got {self._prefetch_window_size}")
+        self._stats_lock = threading.Lock()
+        self._fetch_stats = ImageFetchStats()
+
+    @property
+    def prefetch_window_size(self) -> int:
+        """Maximum number of items whose image is fetched ahead of the consumer"""
+        return self._prefetch_window_size
+
+    @property
+    def fetch_stats(self) -> ImageFetchStats:
+        """Statistics of the image fetching, cumulative over all the iterations"""
+        return self._fetch_stats
+
+    def _init_cache(self):
+        # This is to avoid an iteration (and thus fetching all the images) when creating StreamDataset(...)
+        if self._length is None:
+            self._length = len(self._dataset)
+        if self._subsets is None:
+            self._subsets = {item.subset.name for item in self._dataset}
 
     def _set_name_mapper(self):
         self._name_mapper = IDMapper
@@ -477,47 +558,72 @@ class ScExtractorForFlyteJob(ScExtractor):
             label_id_to_label=self._label_id_to_label,
         )
 
-    @staticmethod
     def _get_image_bytes(
+        self,
         session: Session,
         dataset_storage_identifier: DatasetStorageIdentifier,
         image: Image,
     ) -> bytes:
         with session_context(session=session):
-            return get_image_bytes(dataset_storage_identifier=dataset_storage_identifier, image=image)
+            image_bytes = get_image_bytes(dataset_storage_identifier=dataset_storage_identifier, image=image)
+        with self._stats_lock:
+            self._fetch_stats.num_bytes += len(image_bytes)
+        return image_bytes
+
+    def _submit_item(self, sc_item: DatasetItem, session: Session) -> DatasetItemWithFuture:
+        if isinstance(sc_item.media, Image):
+            future = self._thread_pool.apply_async(
+                self._get_image_bytes,
+                args=(
+                    session,
+                    self._dataset_storage_identifier,
+                    sc_item.media,
+                ),
+            )
+            return DatasetItemWithFuture(
+                item=sc_item,
+                img_bytes_future=future,
+                img_extension=cast("Image", sc_item.media).extension.value,
+            )
+        if isinstance(sc_item.media, VideoFrame):
+            return DatasetItemWithFuture(item=sc_item)
+        raise TypeError(type(sc_item.media))
 
     def __iter__(self) -> Iterator[dm_DatasetItem]:
-        items: list[DatasetItemWithFuture] = []
-
-        for sc_item in self._dataset:
-            if isinstance(sc_item.media, Image):
-                future = self._thread_pool.apply_async(
-                    self._get_image_bytes,
-                    args=(
-                        CTX_SESSION_VAR.get(),
-                        self._dataset_storage_identifier,
-                        sc_item.media,
-                    ),
-                )
-                items.append(
-                    DatasetItemWithFuture(
-                        item=sc_item,
-                        img_bytes_future=future,
-                        img_extension=cast("Image", sc_item.media).extension.value,
-                    )
+        session = CTX_SESSION_VAR.get()
+        sc_items = iter(self._dataset)
+        window: deque[DatasetItemWithFuture] = deque()
+        start_time = time.perf_counter()
+        num_items = 0
+
+        def fill_window() -> None:
+            while len(window) < self._prefetch_window_size:
+                sc_item = next(sc_items, None)
+                if sc_item is None:
+                    return
+                window.append(self._submit_item(sc_item=sc_item, session=session))
+            self._fetch_stats.max_in_flight = max(self._fetch_stats.max_in_flight, len(window))
+
+        try:
+            fill_window()
+            while window:
+                # Drop the item from the window before yielding, so that its bytes are only referenced
+                # by the Datumaro item and can be released as soon as the consumer is done with it
+                item = window.popleft()
+                fill_window()
+                dm_item = self.dataset_item_mapper.forward(
+                    dataset_storage_identifier=self._dataset_storage_identifier,
+                    instance=item.item,
+                    image_bytes_future=item.img_bytes_future,
+                    extension=item.img_extension,
                 )
-            elif isinstance(sc_item.media, VideoFrame):
-                items.append(DatasetItemWithFuture(item=sc_item))
-            else:
-                raise TypeError(type(sc_item.media))
-
-        for item in items:
-            yield self.dataset_item_mapper.forward(
-                dataset_storage_identifier=self._dataset_storage_identifier,
-                instance=item.item,
-                image_bytes_future=item.img_bytes_future,
-                extension=item.img_extension,
-            )
+                del item
+                num_items += 1
+                yield dm_item
+        finally:
+            with self._stats_lock:
+                self._fetch_stats.num_items += num_items
+                self._fetch_stats.elapsed_seconds += time.perf_counter() - start_time
 
 
 @dataclass
@@ -554,12 +660,29 @@ class ProgressConfig(NamedTuple):
     total_iter_count: int
 
 
+class ConvertedAnnotations(NamedTuple):
+    """
+    Media-independent part of a converted Datumaro item, cached across the iterations over the extractor.
+
+    :param dm_id: ID of the Datumaro item
+    :param annotations: Datumaro annotations of the item
+    :param has_empty_label: Whether the item has an empty label
+    """
+
+    dm_id: str
+    annotations: list[dm_Annotation]
+    has_empty_label: bool
+
+
 class ScExtractorFromDatasetStorage(ScExtractor):
     """
     Represents the Geti dataset storage as a lazy dataset for Datumaro.
+
+    The converted items are cached across the iterations, possibly on disk: close the extractor, or use it as a
+    context manager, once the dataset is exported to release the cache.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         dataset_storage: DatasetStorage,
         label_schema: LabelSchema,
@@ -567,16 +690,25 @@ class ScExtractorFromDatasetStorage(ScExtractor):
         include_unannotated: bool = True,
         video_export_config: VideoExportConfig | None = None,
         progress_config: ProgressConfig | None = None,
+        annotation_batch_size: int = 1000,
+        max_cached_items_in_memory: int = 20000,
     ) -> None:
         """
         Represents the Geti dataset storage as a lazy dataset for Datumaro.
 
+        Datumaro's export iterates the dataset several times: the annotation scenes are loaded in batches
+        during the first iteration and their conversion is cached (spilling to disk when large), so that
+        the following iterations do not access the database again.
+
         :param dataset_storage: Geti dataset storage
         :param label_schema: Geti label schema
         :param use_subset: Whether to set subset name from sc item or not
         :param include_unannotated: Whether to include unannotated media or not
         :param video_export_config: If this is given, save video as its original format.
         :param progress_config: If this is given, iteration progress will be reported.
+        :param annotation_batch_size: Number of annotation scenes to load from the database with a single query
+        :param max_cached_items_in_memory: Number of converted items to cache in memory; the following ones
+            are cached on disk.
         """
         super().__init__(
             dataset_storage_identifier=dataset_storage.identifier,
@@ -628,35 +760,39 @@ class ScExtractorFromDatasetStorage(ScExtractor):
         self._iter_count = -1
         self._total = len(self._identifiers)
 
+        self._annotation_batch_size = annotation_batch_size
+        # Converted annotations by position in self._identifiers; None for unannotated items that are skipped
+        self._converted_cache: ConvertedItemCache[ConvertedAnnotations | None] = ConvertedItemCache(
+            max_items_in_memory=max_cached_items_in_memory
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def close(self) -> None:
+        """Release the cache of the converted items, deleting its temporary file if any."""
+        self._converted_cache.close()
+
     def __iter__(self) -> Iterator[dm_DatasetItem]:
         # It is required to init name mapper for multiple iterators within dm.StreamDataset
         self._set_name_mapper()
-        for i, identifier in enumerate(self._identifiers):
-            if self._progress_config:
-                # Datumaro's export iterates the dataset several times while exporting.
-                # This is tricky, but we need to consider the implementation detail of datumaro here.
-                if i == 0:
-                    self._iter_count += 1
-                    logger.info(
-                        "new iteration started: iter_count = "
-                        f"{self._iter_count + 1} / {self._progress_config.total_iter_count}"
-                    )
-                if 0 <= self._iter_count < self._progress_config.total_iter_count:
-                    self._progress_config.progress_callback(
-                        self._iter_count * self._total + i,
-                        self._total * self._progress_config.total_iter_count,
-                    )
-            if isinstance(identifier, RangeIdentifier):
-                yield self._convert_video_annotation_range(identifier)
-            elif isinstance(identifier, VideoIdentifier):
-                yield self._convert_video_without_annotations(identifier)
-            else:
-                scene = self._annotation_scene_repo.get_latest_annotations_by_kind_and_identifiers(
-                    media_identifiers=[identifier],
-                    annotation_kind=AnnotationSceneKind.ANNOTATION,
-                )[0]
-                if not self._include_unannotated and not scene.annotations:
+        for batch_start in range(0, self._total, self._annotation_batch_size):
+            batch_identifiers = self._identifiers[batch_start : batch_start + self._annotation_batch_size]
+            scenes_by_identifier = self._get_uncached_annotation_scenes(
+                batch_start=batch_start, batch_identifiers=batch_identifiers
+            )
+            for i, identifier in enumerate(batch_identifiers, start=batch_start):
+                self._report_progress(i)
+                if isinstance(identifier, RangeIdentifier):
+                    yield self._convert_video_annotation_range(identifier)
+                    continue
+                if isinstance(identifier, VideoIdentifier):
+                    yield self._convert_video_without_annotations(identifier)
                     continue
+
                 if isinstance(identifier, ImageIdentifier):
                     media = self._images_dict[identifier.media_id]
                 elif isinstance(identifier, VideoFrameIdentifier):
@@ -664,8 +800,80 @@ class ScExtractorFromDatasetStorage(ScExtractor):
                     media = VideoFrame(video=video, frame_index=identifier.frame_index)
                 else:
                     raise ValueError(f"Unexpected media '{identifier}' to export.")
-                dataset_item = DatasetItem(media=media, annotation_scene=scene, id_=DatasetRepo.generate_id())
-                yield self._convert_item(sc_item=dataset_item, video_root=self._video_root)
+
+                if i in self._converted_cache:
+                    converted = self._converted_cache.get(i)
+                    if converted is None:
+                        continue
+                    dataset_item = DatasetItem(
+                        media=media, annotation_scene=NullAnnotationScene(), id_=DatasetRepo.generate_id()
+                    )
+                else:
+                    scene = scenes_by_identifier[identifier]
+                    if not self._include_unannotated and not scene.annotations:
+                        self._converted_cache.put(i, None)
+                        continue
+                    dataset_item = DatasetItem(media=media, annotation_scene=scene, id_=DatasetRepo.generate_id())
+                    annotations, has_empty_label = self._convert_item_annotations(sc_item=dataset_item)
+                    converted = ConvertedAnnotations(
+                        dm_id=self._name_mapper.forward(dataset_item),
+                        annotations=annotations,
+                        has_empty_label=has_empty_label,
+                    )
+                    self._converted_cache.put(i, converted)
+
+                yield dm_DatasetItem(
+                    id=converted.dm_id,
+                    subset=dataset_item.subset.name if self._use_subset else DEFAULT_SUBSET_NAME,
+                    media=self._convert_media(sc_item=dataset_item, video_root=self._video_root),
+                    annotations=converted.annotations,
+                    attributes={"has_empty_label": converted.has_empty_label},
+                )
+
+    def _report_progress(self, i: int) -> None:
+        """
+        Report the progress of the export, given the index of the current item in the iteration.
+
+        Datumaro's export iterates the dataset several times while exporting.
+        This is tricky, but we need to consider the implementation detail of datumaro here.
+        """
+        if not self._progress_config:
+            return
+        if i == 0:
+            self._iter_count += 1
+            logger.info(
+                f"new iteration started: iter_count = {self._iter_count + 1} / {self._progress_config.total_iter_count}"
+            )
+        if 0 <= self._iter_count < self._progress_config.total_iter_count:
+            self._progress_config.progress_callback(
+                self._iter_count * self._total + i,
+                self._total * self._progress_config.total_iter_count,
+            )
+
+    def _get_uncached_annotation_scenes(
+        self,
+        batch_start: int,
+        batch_identifiers: list[ImageIdentifier | VideoIdentifier | VideoFrameIdentifier | RangeIdentifier],
+    ) -> dict[ImageIdentifier | VideoFrameIdentifier, AnnotationScene]:
+        """
+        Load with a single query the latest annotation scenes of the media in the batch that are not cached yet.
+
+        :param batch_start: index of the first identifier of the batch in self._identifiers
+        :param batch_identifiers: identifiers in the batch
+        :return: dict mapping the media identifiers to their latest annotation scene
+        """
+        media_identifiers = [
+            identifier
+            for i, identifier in enumerate(batch_identifiers, start=batch_start)
+            if isinstance(identifier, ImageIdentifier | VideoFrameIdentifier) and i not in self._converted_cache
+        ]
+        if not media_identifiers:
+            return {}
+        scenes = self._annotation_scene_repo.get_latest_annotations_by_kind_and_identifiers(
+            media_identifiers=media_identifiers,
+            annotation_kind=AnnotationSceneKind.ANNOTATION,
+        )
+        return dict(zip(media_identifiers, scenes))
 
     def _convert_video_without_annotations(self, identifier: VideoIdentifier) -> dm_DatasetItem:
         """
@@ -1,9 +1,12 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import os
 from collections import defaultdict
+from collections.abc import Iterable
 
 import numpy as np
 from geti_types import MediaIdentifierEntity
+from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.label import Label
 from iai_core.entities.label_schema import LabelSchema
@@ -23,6 +26,10 @@ from .performance_metric import MetricAverageMethod, PerformanceMetric
 CounterPerLabel = defaultdict[Label | None, int]
 CounterPerMediaPerLabel = defaultdict[MediaIdentifierEntity, CounterPerLabel]
 
+# Maximum size of the largest side of the masks compared to compute the Dice; larger media are downscaled,
+# which approximates the score. Zero means that the masks always have the resolution of the media.
+DICE_MASK_MAX_SIZE = int(os.environ.get("DICE_MASK_MAX_SIZE", 0))
+
 
 class DiceMetric(PerformanceMetric):
     """
@@ -42,6 +49,8 @@ class DiceMetric(PerformanceMetric):
     :param average: can be:
         - MICRO: every pixel has the same weight, regardless of label
         - MACRO: compute score per label, return the average of the per-label scores
+    :param max_mask_size: if positive, the shapes of the media larger than this size are rasterized to masks
+        downscaled so that their largest side is equal to it
     """
 
     metric_name = "Dice"
@@ -52,6 +61,7 @@ class DiceMetric(PerformanceMetric):
         prediction_dataset: Dataset,
         label_schema: LabelSchema,
         average: MetricAverageMethod = MetricAverageMethod.MACRO,
+        max_mask_size: int = DICE_MASK_MAX_SIZE,
     ):
         super().__init__(
             ground_truth_dataset=ground_truth_dataset,
@@ -59,6 +69,7 @@ class DiceMetric(PerformanceMetric):
             label_schema=label_schema,
         )
         self.average = average
+        self.max_mask_size = max_mask_size
         self._media_identifiers = [item.media_identifier for item in self.gt_dataset]
         self.__compute_dice_averaged_over_pixels()
 
@@ -129,11 +140,14 @@ class DiceMetric(PerformanceMetric):
             for label in self.label_schema.get_labels(include_empty=False)
             if label.id_ in evaluation_result_label_ids
         )
-        hard_predictions = []
-        hard_references = []
-        for prediction_item, reference_item in zip(list(self.prediction_dataset), list(self.gt_dataset)):
-            hard_predictions.append(mask_from_dataset_item(prediction_item, labels))
-            hard_references.append(mask_from_dataset_item(reference_item, labels))
+        # The masks are generated lazily, so that only the masks of one item are in memory at a time
+        scales = [self.__get_mask_scale(item) for item in self.gt_dataset]
+        hard_predictions = (
+            mask_from_dataset_item(item, labels, scale=scale) for item, scale in zip(self.prediction_dataset, scales)
+        )
+        hard_references = (
+            mask_from_dataset_item(item, labels, scale=scale) for item, scale in zip(self.gt_dataset, scales)
+        )
 
         (
             all_intersection,
@@ -148,6 +162,13 @@ class DiceMetric(PerformanceMetric):
             average=self.average,
         )
 
+    def __get_mask_scale(self, dataset_item: DatasetItem) -> float:
+        """Get the scale of the masks of a dataset item, so that their largest side is at most max_mask_size"""
+        largest_side = max(dataset_item.width, dataset_item.height)
+        if self.max_mask_size <= 0 or largest_side <= self.max_mask_size:
+            return 1.0
+        return self.max_mask_size / largest_side
+
     @classmethod
     def compute_dice_using_intersection_and_cardinality(
         cls,
@@ -201,8 +222,8 @@ class DiceMetric(PerformanceMetric):
 
     @staticmethod
     def get_intersections_and_cardinalities(
-        references: list[np.ndarray],
-        predictions: list[np.ndarray],
+        references: Iterable[np.ndarray],
+        predictions: Iterable[np.ndarray],
         labels: list[Label],
         media_identifiers: list[MediaIdentifierEntity],
     ) -> tuple[
@@ -215,7 +236,8 @@ class DiceMetric(PerformanceMetric):
         Returns all intersections and cardinalities between reference masks and prediction masks.
 
         Intersections and cardinalities are each returned in a dictionary mapping each label to its corresponding
-        number of intersection/cardinality pixels
+        number of intersection/cardinality pixels. They are derived from the confusion histogram of each pair of
+        masks, counting the pixels for each (reference class, prediction class) pair in a single pass.
 
         :param references: reference masks,s one mask per image
         :param predictions: prediction masks, one mask per image
@@ -226,31 +248,28 @@ class DiceMetric(PerformanceMetric):
         all_cardinalities = CounterPerLabel(int)
         intersections_per_media = CounterPerMediaPerLabel(CounterPerLabel)
         cardinalities_per_media = CounterPerMediaPerLabel(CounterPerLabel)
-        inters = []
+        num_classes = len(labels) + 1  # including the background
 
         for reference, prediction, media_identifier in zip(references, predictions, media_identifiers):
-            intersection = np.where(reference == prediction, reference, 0)
-            all_intersections[None] += np.count_nonzero(intersection)
-            all_cardinalities[None] += np.count_nonzero(reference) + np.count_nonzero(prediction)
-
-            inters.append(
-                (
-                    np.count_nonzero(intersection),
-                    np.count_nonzero(reference) + np.count_nonzero(prediction),
-                )
-            )
+            # confusion[i, j] is the number of pixels of class i in the reference and j in the prediction
+            confusion = np.bincount(
+                reference.ravel().astype(np.intp) * num_classes + prediction.ravel(),
+                minlength=num_classes * num_classes,
+            ).reshape(num_classes, num_classes)
+            intersections = np.diagonal(confusion)
+            reference_areas = confusion.sum(axis=1)
+            prediction_areas = confusion.sum(axis=0)
 
             per_label_intersections = CounterPerLabel()
             per_label_cardinalities = CounterPerLabel()
-            per_label_intersections[None] = np.count_nonzero(intersection)
-            per_label_cardinalities[None] = np.count_nonzero(reference) + np.count_nonzero(prediction)
-            for i, label in enumerate(labels):
-                label_num = i + 1
-                _label_intersection = np.count_nonzero(intersection == label_num)
+            per_label_intersections[None] = int(intersections[1:].sum())
+            per_label_cardinalities[None] = int(reference_areas[1:].sum() + prediction_areas[1:].sum())
+            all_intersections[None] += per_label_intersections[None]
+            all_cardinalities[None] += per_label_cardinalities[None]
+            for label_num, label in enumerate(labels, start=1):
+                _label_intersection = int(intersections[label_num])
+                _label_cardinality = int(reference_areas[label_num] + prediction_areas[label_num])
                 all_intersections[label] += _label_intersection
-                reference_area = np.count_nonzero(reference == label_num)
-                prediction_area = np.count_nonzero(prediction == label_num)
-                _label_cardinality = reference_area + prediction_area
                 all_cardinalities[label] += _label_cardinality
 
                 per_label_intersections[label] = _label_intersection
@@ -0,0 +1,87 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+
+class InferenceStage(Enum):
+    """
+    Stages of the batch inference pipeline for which the time is measured.
+
+    FETCH           Download of the media binary from the object storage
+    DECODE          Decoding of the media binary into a numpy array (and ROI cropping)
+    PREPROCESS      ModelAPI preprocessing of the decoded image (resize, normalization, ...)
+    INFER           Model inference
+    POSTPROCESS     ModelAPI postprocessing and conversion of the raw predictions to annotations
+    """
+
+    FETCH = "fetch"
+    DECODE = "decode"
+    PREPROCESS = "preprocess"
+    INFER = "infer"
+    POSTPROCESS = "postprocess"
+
+
+class InferenceStageTimings:
+    """
+    Thread-safe accumulator of the time spent in each stage of the batch inference pipeline.
+
+    The timings are cumulative over all the items: since stages run concurrently (prefetching threads and
+    asynchronous infer requests), their sum can exceed the wall-clock time of the inference.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._total_seconds: dict[InferenceStage, float] = dict.fromkeys(InferenceStage, 0.0)
+        self._counts: dict[InferenceStage, int] = dict.fromkeys(InferenceStage, 0)
+
+    def add(self, stage: InferenceStage, seconds: float) -> None:
+        """
+        Record the duration of one execution of a stage.
+
+        :param stage: the inference stage
+        :param seconds: time spent in the stage, in seconds
+        """
+        with self._lock:
+            self._total_seconds[stage] += seconds
+            self._counts[stage] += 1
+
+    @contextmanager
+    def measure(self, stage: InferenceStage) -> Iterator[None]:
+        """Context manager that records the time spent in the wrapped block for the given stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage=stage, seconds=time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """Clear all the recorded timings."""
+        with self._lock:
+            self._total_seconds = dict.fromkeys(InferenceStage, 0.0)
+            self._counts = dict.fromkeys(InferenceStage, 0)
+
+    def total_seconds(self, stage: InferenceStage) -> float:
+        """Return the cumulative time spent in the given stage, in seconds."""
+        with self._lock:
+            return self._total_seconds[stage]
+
+    def count(self, stage: InferenceStage) -> int:
+        """Return the number of recorded executions of the given stage."""
+        with self._lock:
+            return self._counts[stage]
+
+    def summary(self) -> str:
+        """Return a human-readable report of the total and average time per stage."""
+        with self._lock:
+            parts = []
+            for stage in InferenceStage:
+                count = self._counts[stage]
+                total = self._total_seconds[stage]
+                avg_ms = total / count * 1000 if count else 0.0
+                parts.append(f"{stage.value}: {total:.2f}s total, {avg_ms:.1f}ms avg over {count}")
+        return "; ".join(parts)
@@ -6,29 +6,37 @@
 import logging
 import os
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 
 from geti_telemetry_tools import unified_tracing
 from geti_telemetry_tools.tracing.common import tracer
 from geti_types import DatasetStorageIdentifier, ProjectIdentifier
-from iai_core.entities.annotation import AnnotationScene
+from iai_core.entities.annotation import AnnotationScene, AnnotationSceneKind
+from iai_core.entities.cached_prediction import CachedPrediction
+from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.evaluation_result import EvaluationPurpose, EvaluationResult
-from iai_core.entities.metadata import IMetadata
+from iai_core.entities.metadata import FloatMetadata, IMetadata
 from iai_core.entities.model import Model, NullModel
 from iai_core.entities.task_node import TaskNode
-from iai_core.repos import EvaluationResultRepo
+from iai_core.entities.tensor import Tensor
+from iai_core.repos import AnnotationSceneRepo, EvaluationResultRepo, PredictionCacheRepo
+from iai_core.repos.storage.packed_tensors import packed_tensor_writing
+from iai_core.utils.iteration import grouper
 from iai_core.utils.post_process_predictions import PostProcessPredictionsUtils
+from iai_core.utils.type_helpers import str2bool
 
 from jobs_common.exceptions import CommandInitializationFailedException
 from jobs_common.tasks.utils.progress import ProgressRange
 from jobs_common.utils.progress_helper import noop_progress_callback
 from jobs_common_extras.evaluation.entities.batch_inference_dataset import BatchInferenceDataset
+from jobs_common_extras.evaluation.entities.inference_stage_timings import InferenceStageTimings
 from jobs_common_extras.evaluation.services.inferencer import (
     AnomalyInferencer,
     ClassificationInferencer,
     InferencerFactory,
 )
+from jobs_common_extras.evaluation.services.media_prefetcher import MediaPrefetcher, PrefetchedItem
 
 ASYNC_INFERENCE_SIZE_MB_THRESHOLD = int(os.environ.get("ASYNC_INFERENCE_SIZE_MB_THRESHOLD", 150))
 ASYNC_INFERENCE_GIGAFLOPS_THRESHOLD = int(os.environ.get("ASYNC_INFERENCE_GIGAFLOPS_THRESHOLD", 400))
@@ -36,6 +44,14 @@ ASYNC_INFERENCE_MODEL_TEMPLATE_ID_BLACKLIST = [
     "Custom_Counting_Instance_Segmentation_MaskRCNN_SwinT_FP16",
     "visual_prompting_model",
 ]
+# Number of threads fetching and decoding the media ahead of the inference
+BATCH_INFERENCE_PREFETCH_WORKERS = int(os.environ.get("BATCH_INFERENCE_PREFETCH_WORKERS", 4))
+# Maximum number of items loaded ahead of the inference; 0 disables prefetching
+BATCH_INFERENCE_PREFETCH_LOOKAHEAD = int(os.environ.get("BATCH_INFERENCE_PREFETCH_LOOKAHEAD", 16))
+# Whether to reuse the predictions cached by earlier inferences of the same model on the same media
+BATCH_INFERENCE_REUSE_PREDICTIONS = str2bool(os.environ.get("BATCH_INFERENCE_REUSE_PREDICTIONS", "true"))
+# Number of dataset items whose cached predictions are looked up with a single query
+PREDICTION_CACHE_LOOKUP_CHUNK_SIZE = int(os.environ.get("PREDICTION_CACHE_LOOKUP_CHUNK_SIZE", 1000))
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +71,12 @@ class BatchInference:
         Defaults to 0 (OpenVINO will try to select an optimal value based on the number of available CPU cores).
     :param progress_start: Start value used for progress reporting. Will start at 0 if unset
     :param progress_end: Start value used for progress reporting. Will end at 100 if unset
+    :param prefetch_workers: Number of threads used to fetch and decode the media of upcoming items
+        while the earlier ones are being inferred.
+    :param prefetch_lookahead: Maximum number of items whose media is loaded ahead of the inference.
+        Set to 0 to disable prefetching and load each media right before inferring it.
+    :param reuse_predictions: Whether to reuse the predictions of the model cached by earlier inferences on the
+        same media and ROI, instead of inferring them again. The new predictions are added to the cache.
     """
 
     def __init__(  # noqa: PLR0913
@@ -67,6 +89,9 @@ class BatchInference:
         progress_message: str = "Inferring on dataset",
         max_async_requests: int = 0,
         progress_range: ProgressRange = ProgressRange(),
+        prefetch_workers: int = BATCH_INFERENCE_PREFETCH_WORKERS,
+        prefetch_lookahead: int = BATCH_INFERENCE_PREFETCH_LOOKAHEAD,
+        reuse_predictions: bool = BATCH_INFERENCE_REUSE_PREDICTIONS,
     ):
         self._set_async_inference_env_vars(max_async_requests=max_async_requests)
         self._validate_model(model)
@@ -85,6 +110,14 @@ class BatchInference:
         self.total_progress_size = sum([len(batch_ds.input_dataset) for batch_ds in batch_inference_datasets])
         self.progress_start = progress_range.start
         self.progress_end = progress_range.end
+        self.prefetch_workers = prefetch_workers
+        self.prefetch_lookahead = prefetch_lookahead
+        self.reuse_predictions = reuse_predictions
+
+    @property
+    def stage_timings(self) -> InferenceStageTimings:
+        """Cumulative time spent in each stage of the inference pipeline during the last run"""
+        return self.inferencer.stage_timings
 
     @property
     def output_datasets(self) -> tuple[Dataset, ...]:
@@ -129,6 +162,7 @@ class BatchInference:
             use_async = False
 
         self._progress = 0  # reset progress
+        self.stage_timings.reset()
         logger.info("Saving evaluation results for datasets.")
         self._create_evaluation_results()
         logger.info(
@@ -138,7 +172,10 @@ class BatchInference:
         )
         for batch_dataset in self.batch_inference_datasets:
             self.infer_dataset(batch_dataset, use_async)
-            with tracer.start_as_current_span("PostProcessPredictionsUtils.post_process_prediction_dataset"):
+            with (
+                tracer.start_as_current_span("PostProcessPredictionsUtils.post_process_prediction_dataset"),
+                packed_tensor_writing(),  # the metadata tensors (e.g. saliency maps) are packed into few containers
+            ):
                 # Make adjustments to complete the annotation scenes in the dataset:
                 # - save the dataset (the input dataset has been modified in memory)
                 # - set the 'purpose' of the dataset as requested
@@ -156,6 +193,11 @@ class BatchInference:
                     save_to_db=True,
                 )
             batch_dataset.output_dataset = output_dataset
+        logger.info(
+            "Batch inference with model ID '%s' completed. Time per stage: %s",
+            self.model.id_,
+            self.stage_timings.summary(),
+        )
 
     @unified_tracing
     def infer_dataset(self, batch_dataset: BatchInferenceDataset, use_async: bool) -> None:
@@ -190,22 +232,52 @@ class BatchInference:
             else:
                 dataset_item.append_annotations(predicted_ann_scene.annotations)
 
-        for idx, dataset_item in enumerate(dataset):
+        new_cached_predictions: list[CachedPrediction] = []
+
+        def add_inferred_prediction(
+            dataset_item_idx: int,
+            predicted_ann_scene: AnnotationScene,
+            metadata: Sequence[IMetadata],
+        ):
+            add_prediction(dataset_item_idx, predicted_ann_scene, metadata)
+            cached_prediction = self._make_cached_prediction(
+                dataset_item=dataset[dataset_item_idx], predicted_ann_scene=predicted_ann_scene, metadata=metadata
+            )
+            if cached_prediction is not None:
+                new_cached_predictions.append(cached_prediction)
+
+        indices_to_infer = (
+            self._add_cached_predictions(
+                dataset_storage_id=dataset_storage_id, dataset=dataset, add_prediction=add_prediction
+            )
+            if self.reuse_predictions
+            else list(range(len(dataset)))
+        )
+        items = self._iterate_items(
+            dataset_items=[dataset[idx] for idx in indices_to_infer],
+            dataset_storage_id=dataset_storage_id,
+            use_async=use_async,
+        )
+        for infer_idx, dataset_item, numpy_image, preprocessed_input in items:
+            idx = indices_to_infer[infer_idx]
             if use_async:
                 self.inferencer.enqueue_prediction(
                     dataset_storage_id=dataset_storage_id,
                     item_idx=idx,
                     media=dataset_item.media,
-                    result_handler=add_prediction,
+                    result_handler=add_inferred_prediction,
                     roi=dataset_item.roi,
+                    numpy_image=numpy_image,
+                    preprocessed_input=preprocessed_input,
                 )
             else:  # use sync API
                 predicted_ann_scene, metadata = self.inferencer.predict(
                     dataset_storage_id=dataset_storage_id,
                     media=dataset_item.media,
                     roi=dataset_item.roi,
+                    numpy_image=numpy_image,
                 )
-                add_prediction(
+                add_inferred_prediction(
                     dataset_item_idx=idx,
                     predicted_ann_scene=predicted_ann_scene,
                     metadata=metadata,
@@ -215,6 +287,9 @@ class BatchInference:
         if use_async:
             self.inferencer.await_all()
 
+        if new_cached_predictions:
+            PredictionCacheRepo(dataset_storage_id).upsert_many(new_cached_predictions)
+
         total_time = time.perf_counter() - total_time
         logger.info(
             "Batch inference on dataset with ID '%s' took %s seconds (avg. per image: %s ms).",
@@ -223,6 +298,107 @@ class BatchInference:
             int(total_time / len(dataset) * 1000),
         )
 
+    def _iterate_items(
+        self, dataset_items: Sequence[DatasetItem], dataset_storage_id: DatasetStorageIdentifier, use_async: bool
+    ) -> Iterator[PrefetchedItem]:
+        """
+        Iterate over the dataset items to infer, together with their media if prefetching is enabled.
+
+        :param dataset_items: items to infer
+        :param dataset_storage_id: identifier of the dataset storage containing the media
+        :param use_async: whether the inference runs asynchronously
+        :return: iterator over the items, whose index is relative to the input sequence
+        """
+        if self.prefetch_lookahead <= 0:
+            return (PrefetchedItem(idx, item, None, None) for idx, item in enumerate(dataset_items))
+        # Load (and, for async inference, preprocess) the upcoming items while the earlier ones are inferred
+        prefetcher = MediaPrefetcher(
+            dataset_storage_identifier=dataset_storage_id,
+            num_workers=self.prefetch_workers,
+            lookahead=self.prefetch_lookahead,
+            preprocess_fn=(
+                self.inferencer.preprocess if use_async and self.inferencer.supports_preprocessed_input else None
+            ),
+            timings=self.stage_timings,
+        )
+        return prefetcher.iterate(dataset_items)
+
+    def _add_cached_predictions(
+        self,
+        dataset_storage_id: DatasetStorageIdentifier,
+        dataset: Dataset,
+        add_prediction: Callable[[int, AnnotationScene, Sequence[IMetadata]], None],
+    ) -> list[int]:
+        """
+        Add the cached predictions of the model to the dataset items, looking them up in chunks of items.
+
+        :param dataset_storage_id: identifier of the dataset storage containing the dataset
+        :param dataset: dataset whose items to look up
+        :param add_prediction: function adding a prediction to the item at the given index
+        :return: indices of the dataset items without cached predictions, which must be inferred
+        """
+        prediction_cache_repo = PredictionCacheRepo(dataset_storage_id)
+        label_schema_id = self.inferencer.label_schema.id_
+        indices_to_infer: list[int] = []
+        for chunk in grouper(enumerate(dataset), chunk_size=PREDICTION_CACHE_LOOKUP_CHUNK_SIZE):
+            cached_predictions = prediction_cache_repo.get_by_model_and_media_identifiers(
+                model_id=self.model.id_,
+                label_schema_id=label_schema_id,
+                media_identifiers={dataset_item.media_identifier for _, dataset_item in chunk},
+            )
+            for idx, dataset_item in chunk:
+                cached_prediction = cached_predictions.get(
+                    (dataset_item.media_identifier, CachedPrediction.roi_key_for(dataset_item.roi))
+                )
+                if cached_prediction is None:
+                    indices_to_infer.append(idx)
+                    continue
+                predicted_ann_scene = AnnotationScene(
+                    kind=AnnotationSceneKind.PREDICTION,
+                    media_identifier=cached_prediction.media_identifier,
+                    media_height=cached_prediction.media_height,
+                    media_width=cached_prediction.media_width,
+                    id_=AnnotationSceneRepo.generate_id(),
+                    annotations=cached_prediction.annotations,
+                )
+                add_prediction(idx, predicted_ann_scene, cached_prediction.metadata)
+                self._update_progress()
+        logger.info(
+            "Reused the cached predictions of %d out of %d items of dataset with ID '%s'.",
+            len(dataset) - len(indices_to_infer),
+            len(dataset),
+            dataset.id_,
+        )
+        return indices_to_infer
+
+    def _make_cached_prediction(
+        self,
+        dataset_item: DatasetItem,
+        predicted_ann_scene: AnnotationScene,
+        metadata: Sequence[IMetadata],
+    ) -> CachedPrediction | None:
+        """
+        Create the cache entry for a new prediction of the model.
+
+        :param dataset_item: dataset item the prediction was made for
+        :param predicted_ann_scene: predicted annotation scene, relative to the ROI of the item
+        :param metadata: metadata generated by the inference
+        :return: the cached prediction, or None if the predictions are not reused or the metadata cannot be cached
+        """
+        if not self.reuse_predictions or not all(isinstance(data, FloatMetadata | Tensor) for data in metadata):
+            return None
+        return CachedPrediction(
+            id_=PredictionCacheRepo.generate_id(),
+            model_id=self.model.id_,
+            label_schema_id=self.inferencer.label_schema.id_,
+            media_identifier=dataset_item.media_identifier,
+            roi_key=CachedPrediction.roi_key_for(dataset_item.roi),
+            media_height=predicted_ann_scene.media_height,
+            media_width=predicted_ann_scene.media_width,
+            annotations=predicted_ann_scene.annotations,
+            metadata=metadata,
+        )
+
     def _update_progress(self) -> None:
         """Update total progress"""
         self._progress += 1
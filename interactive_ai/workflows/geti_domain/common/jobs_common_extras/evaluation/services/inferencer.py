@@ -6,6 +6,7 @@
 import io
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from enum import Enum, auto
@@ -35,6 +36,7 @@ from model_api.models.utils import (
 from model_api.models.visual_prompting import VisualPromptingFeatures
 from model_api.tilers import DetectionTiler, InstanceSegmentationTiler
 
+from jobs_common_extras.evaluation.entities.inference_stage_timings import InferenceStage, InferenceStageTimings
 from jobs_common_extras.evaluation.utils.configuration_utils import get_tiler_configuration, get_tiling_parameters
 from jobs_common_extras.evaluation.utils.detection_utils import get_legacy_detection_inferencer_configuration
 from jobs_common_extras.evaluation.utils.helpers import downscale_image, is_model_legacy_otx_version
@@ -127,6 +129,26 @@ class Inferencer(ABC):
         self.model = ImageModel.create_model(model=self.model_adapter, configuration=self.configuration, preload=True)
         self.model.inference_adapter.set_callback(self._async_callback)
         self.tiling_enabled = False
+        self.stage_timings = InferenceStageTimings()
+
+    @property
+    def supports_preprocessed_input(self) -> bool:
+        """
+        Whether the inferencer can enqueue an image preprocessed outside of it (see `preprocess`).
+
+        This is not the case when tiling is enabled, since the tiler preprocesses each tile independently.
+        """
+        return not self.tiling_enabled
+
+    def preprocess(self, image: np.ndarray) -> tuple[Any, dict]:
+        """
+        Applies the ModelAPI preprocessing to the image. This method is thread-safe, so it can be used to prepare
+        the input of upcoming predictions while others are being inferred.
+
+        :param image: RGB image to preprocess
+        :return: a tuple containing the model input and the preprocessing metadata
+        """
+        return self.model.preprocess(image)
 
     @abstractmethod
     def convert_to_annotations(self, raw_predictions: NamedTuple, **kwargs) -> list[Annotation]:
@@ -180,6 +202,7 @@ class Inferencer(ABC):
         media: Media2D,
         roi: Annotation | None = None,
         annotation_scene: AnnotationScene | None = None,
+        numpy_image: np.ndarray | None = None,
     ) -> tuple[AnnotationScene, Sequence[IMetadata]]:
         """
         Performs inference on the given image and returns the prediction results.
@@ -189,17 +212,23 @@ class Inferencer(ABC):
             The media is expected to be an RGB array of shape (Height, Width, Channels) with uint8 type (0-255).
         :param roi: The region of interest (ROI) to be used for inference. Defaults to None.
         :param annotation_scene: optional annotation scene object to add annotations to
+        :param numpy_image: optional ROI-cropped image of the media, if already loaded by the caller.
+            If not provided, the media is fetched from the storage.
         :return: A tuple containing:
             - AnnotationScene object containing prediction results
             - sequence of metadata generated by the inference
         """
-        numpy_image = get_media_roi_numpy(
-            dataset_storage_identifier=dataset_storage_id,
-            media=media,
-            roi_shape=roi.shape if roi is not None else None,
-        )
-        result, metadata = self._predict_raw(numpy_image)
-        annotations = self.convert_to_annotations(raw_predictions=result, metadata=metadata)
+        if numpy_image is None:
+            numpy_image = get_media_roi_numpy(
+                dataset_storage_identifier=dataset_storage_id,
+                media=media,
+                roi_shape=roi.shape if roi is not None else None,
+            )
+        # ModelAPI pre- and post-processing are part of the synchronous prediction, so they are measured as 'infer'
+        with self.stage_timings.measure(InferenceStage.INFER):
+            result, metadata = self._predict_raw(numpy_image)
+        with self.stage_timings.measure(InferenceStage.POSTPROCESS):
+            annotations = self.convert_to_annotations(raw_predictions=result, metadata=metadata)
         if annotation_scene is None:
             annotation_scene = AnnotationScene(
                 kind=AnnotationSceneKind.PREDICTION,
@@ -209,7 +238,8 @@ class Inferencer(ABC):
                 id_=AnnotationSceneRepo.generate_id(),
             )
         annotation_scene.append_annotations(annotations)
-        result_metadata = self._extract_metadata(raw_predictions=result, annotation_scene=annotation_scene)
+        with self.stage_timings.measure(InferenceStage.POSTPROCESS):
+            result_metadata = self._extract_metadata(raw_predictions=result, annotation_scene=annotation_scene)
         return annotation_scene, result_metadata
 
     def _async_callback(self, request: Any, callback_args: tuple) -> None:
@@ -220,21 +250,26 @@ class Inferencer(ABC):
         :param callback_args: the arguments to the callback function
         """
         try:
-            item_idx, media, preprocessing_meta, result_handler = callback_args
-            raw_prediction = self.model.inference_adapter.get_raw_result(request)
-            processed_prediction = self.model.postprocess(raw_prediction, preprocessing_meta)
-            annotations = self.convert_to_annotations(raw_predictions=processed_prediction, metadata=preprocessing_meta)
-            annotation_scene = AnnotationScene(
-                kind=AnnotationSceneKind.PREDICTION,
-                media_identifier=media.media_identifier,
-                media_height=media.height,
-                media_width=media.width,
-                id_=AnnotationSceneRepo.generate_id(),
-                annotations=annotations,
-            )
-            result_metadata = self._extract_metadata(
-                raw_predictions=processed_prediction, annotation_scene=annotation_scene
-            )
+            item_idx, media, preprocessing_meta, result_handler, submit_time = callback_args
+            # Time from submission to completion of the request, including the wait for a free infer request
+            self.stage_timings.add(InferenceStage.INFER, time.perf_counter() - submit_time)
+            with self.stage_timings.measure(InferenceStage.POSTPROCESS):
+                raw_prediction = self.model.inference_adapter.get_raw_result(request)
+                processed_prediction = self.model.postprocess(raw_prediction, preprocessing_meta)
+                annotations = self.convert_to_annotations(
+                    raw_predictions=processed_prediction, metadata=preprocessing_meta
+                )
+                annotation_scene = AnnotationScene(
+                    kind=AnnotationSceneKind.PREDICTION,
+                    media_identifier=media.media_identifier,
+                    media_height=media.height,
+                    media_width=media.width,
+                    id_=AnnotationSceneRepo.generate_id(),
+                    annotations=annotations,
+                )
+                result_metadata = self._extract_metadata(
+                    raw_predictions=processed_prediction, annotation_scene=annotation_scene
+                )
             result_handler(item_idx, annotation_scene, result_metadata)
         except Exception as e:
             logger.exception(f"Error while processing async callback: {e}")
@@ -247,6 +282,8 @@ class Inferencer(ABC):
         media: Media2D,
         result_handler: Callable[[int, AnnotationScene, Sequence[IMetadata]], None],
         roi: Annotation | None = None,
+        numpy_image: np.ndarray | None = None,
+        preprocessed_input: tuple[Any, dict] | None = None,
     ) -> None:
         """
         Enqueues the prediction request for the given media.
@@ -258,20 +295,30 @@ class Inferencer(ABC):
         :param media: the media (image or video frame) for which predictions are to be made
         :param result_handler: the callback function to handle the prediction results
         :param roi: the region of interest (ROI) to be used for inference. Defaults to None.
+        :param numpy_image: optional ROI-cropped image of the media, if already loaded by the caller.
+            If not provided, the media is fetched from the storage.
+        :param preprocessed_input: optional output of `preprocess` for the media, if already computed by the caller.
+            It is ignored if the inferencer does not support preprocessed inputs (e.g. with tiling).
         """
         # If tiling is enabled, predict using the synchronous method
         # The tiling model runs prediction using the async API for each image tile
         if self.tiling_enabled:
-            pred_ann_scene, metadata = self.predict(dataset_storage_id=dataset_storage_id, media=media, roi=roi)
+            pred_ann_scene, metadata = self.predict(
+                dataset_storage_id=dataset_storage_id, media=media, roi=roi, numpy_image=numpy_image
+            )
             result_handler(item_idx, pred_ann_scene, metadata)
             return
-        numpy_image = get_media_roi_numpy(
-            dataset_storage_identifier=dataset_storage_id,
-            media=media,
-            roi_shape=roi.shape if roi is not None else None,
-        )
-        img, metadata = self.model.preprocess(numpy_image)
-        callback_data = item_idx, media, metadata, result_handler
+        if preprocessed_input is None:
+            if numpy_image is None:
+                numpy_image = get_media_roi_numpy(
+                    dataset_storage_identifier=dataset_storage_id,
+                    media=media,
+                    roi_shape=roi.shape if roi is not None else None,
+                )
+            with self.stage_timings.measure(InferenceStage.PREPROCESS):
+                preprocessed_input = self.preprocess(numpy_image)
+        img, metadata = preprocessed_input
+        callback_data = item_idx, media, metadata, result_handler, time.perf_counter()
         self.model.infer_async_raw(img, callback_data)
 
     def await_all(self) -> None:
@@ -533,6 +580,7 @@ class VisualPromptingInferencer(Inferencer):
         self._openvino_core = create_core()
         self.configuration = self.get_configuration()
         self.tiling_enabled = False
+        self.stage_timings = InferenceStageTimings()
         self._load_sam_model(
             device=device,
             max_async_requests=max_async_requests,
@@ -614,6 +662,11 @@ class VisualPromptingInferencer(Inferencer):
         # Visual prompting models do not require extra config parameters
         return {}
 
+    @property
+    def supports_preprocessed_input(self) -> bool:
+        # The SAM prompter preprocesses the image internally in its encoder
+        return False
+
     def enqueue_prediction(
         self,
         dataset_storage_id: DatasetStorageIdentifier,
@@ -621,6 +674,8 @@ class VisualPromptingInferencer(Inferencer):
         media: Media2D,
         result_handler: Callable[[int, AnnotationScene, Sequence[IMetadata]], None],
         roi: Annotation | None = None,
+        numpy_image: np.ndarray | None = None,
+        preprocessed_input: tuple[Any, dict] | None = None,
     ) -> None:
         raise NotImplementedError("Visual prompting models do not support asynchronous inference.")
 
@@ -0,0 +1,167 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module contains the MediaPrefetcher, which loads the media of upcoming dataset items in background threads"""
+
+import contextvars
+import io
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import numpy as np
+from geti_types import DatasetStorageIdentifier
+from iai_core.adapters.binary_interpreters import NumpyBinaryInterpreter
+from iai_core.entities.annotation import Annotation
+from iai_core.entities.dataset_item import DatasetItem
+from iai_core.entities.image import Image
+from iai_core.entities.media_2d import Media2D
+from iai_core.entities.shapes import Rectangle
+from iai_core.entities.video import VideoFrame
+from media_utils import get_image_bytes, get_video_frame_numpy
+
+from jobs_common_extras.evaluation.entities.inference_stage_timings import InferenceStage, InferenceStageTimings
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchedItem(NamedTuple):
+    """
+    Dataset item whose media has already been loaded by the prefetcher.
+
+    :param item_idx: index of the item in the iterated dataset
+    :param dataset_item: the dataset item
+    :param numpy_image: ROI-cropped RGB image of the item, or None if the media has not been loaded
+    :param preprocessed_input: output of the preprocessing function (model input and preprocessing metadata),
+        or None if no preprocessing function was given to the prefetcher
+    """
+
+    item_idx: int
+    dataset_item: DatasetItem
+    numpy_image: np.ndarray | None
+    preprocessed_input: tuple[Any, dict] | None
+
+
+class MediaPrefetcher:
+    """
+    Loads the media of dataset items in a bounded pool of background threads, so that the download and
+    decoding of the upcoming items overlaps with the inference on the earlier ones.
+
+    At most `lookahead` items are loaded or held in memory at any time; items are yielded in the same order as
+    the input iterable.
+
+    :param dataset_storage_identifier: identifier of the dataset storage containing the media
+    :param num_workers: number of threads used to fetch and decode the media
+    :param lookahead: maximum number of items loaded ahead of the consumer
+    :param preprocess_fn: optional function applied to the decoded image in the worker thread
+        (e.g. the model preprocessing); it must be thread-safe
+    :param timings: accumulator where to record the time spent in each stage
+    """
+
+    def __init__(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        num_workers: int,
+        lookahead: int,
+        preprocess_fn: Callable[[np.ndarray], tuple[Any, dict]] | None = None,
+        timings: InferenceStageTimings | None = None,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError(f"The prefetcher requires at least one worker, got {num_workers}")
+        if lookahead < 1:
+            raise ValueError(f"The prefetcher lookahead must be a positive number, got {lookahead}")
+        self.dataset_storage_identifier = dataset_storage_identifier
+        self.num_workers = num_workers
+        self.lookahead = lookahead
+        self.preprocess_fn = preprocess_fn
+        self.timings = timings if timings is not None else InferenceStageTimings()
+
+    def iterate(self, dataset_items: Iterable[DatasetItem]) -> Iterator[PrefetchedItem]:
+        """
+        Iterate over the dataset items, yielding each of them together with its loaded media.
+
+        :param dataset_items: items to load
+        :return: iterator over the prefetched items, in the same order as the input
+        """
+        items_iter = enumerate(dataset_items)
+        pending: deque[tuple[int, DatasetItem, Future[PrefetchedItem]]] = deque()
+        with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="media-prefetch") as executor:
+
+            def submit_next() -> bool:
+                try:
+                    idx, item = next(items_iter)
+                except StopIteration:
+                    return False
+                # Run the worker in a copy of the current context, so that the session is available to the repos
+                context = contextvars.copy_context()
+                pending.append((idx, item, executor.submit(context.run, self._load_item, idx, item)))
+                return True
+
+            try:
+                while len(pending) < self.lookahead and submit_next():
+                    pass
+                while pending:
+                    _, _, future = pending.popleft()
+                    prefetched_item = future.result()
+                    submit_next()
+                    yield prefetched_item
+            finally:
+                # Do not load the remaining items if the consumer stops early or an error occurs
+                for _, _, future in pending:
+                    future.cancel()
+
+    def _load_item(self, item_idx: int, dataset_item: DatasetItem) -> PrefetchedItem:
+        numpy_image = self.load_media_roi_numpy(
+            media=dataset_item.media,
+            roi=dataset_item.roi,
+        )
+        preprocessed_input = None
+        if self.preprocess_fn is not None:
+            with self.timings.measure(InferenceStage.PREPROCESS):
+                preprocessed_input = self.preprocess_fn(numpy_image)
+        return PrefetchedItem(
+            item_idx=item_idx,
+            dataset_item=dataset_item,
+            numpy_image=numpy_image,
+            preprocessed_input=preprocessed_input,
+        )
+
+    def load_media_roi_numpy(self, media: Media2D, roi: Annotation | None) -> np.ndarray:
+        """
+        Load the ROI-cropped numpy array of a media, recording the fetch and decode time separately.
+
+        Video frames are read directly from the video location by the frame reader, so for them the download
+        cannot be separated from the decoding and the whole operation is recorded as decoding time.
+
+        :param media: image or video frame to load
+        :param roi: region of interest to crop, or None to get the full media
+        :return: RGB numpy array of the media ROI
+        :raises ValueError: when the ROI shape is not a Rectangle or the media is one dimensional
+        """
+        roi_shape = roi.shape if roi is not None else None
+        if roi_shape is not None and not isinstance(roi_shape, Rectangle):
+            raise ValueError(f"ROI shape passed to {str(media)} is not a Rectangle")
+
+        if isinstance(media, VideoFrame):
+            with self.timings.measure(InferenceStage.DECODE):
+                media_numpy = get_video_frame_numpy(
+                    dataset_storage_identifier=self.dataset_storage_identifier, video_frame=media
+                )
+        elif isinstance(media, Image):
+            with self.timings.measure(InferenceStage.FETCH):
+                image_bytes = get_image_bytes(dataset_storage_identifier=self.dataset_storage_identifier, image=media)
+            with self.timings.measure(InferenceStage.DECODE):
+                media_numpy = NumpyBinaryInterpreter().interpret(
+                    data=io.BytesIO(image_bytes), filename=media.data_binary_filename
+                )
+            del image_bytes
+        else:
+            raise ValueError(f"Unsupported media type for prefetching: {type(media).__name__}")
+
+        if roi_shape is None:
+            return media_numpy
+        if len(media_numpy.shape) < 2:
+            raise ValueError(f"{str(media)} is one dimensional, and thus cannot be cropped")
+        return roi_shape.crop_numpy_array(media_numpy)
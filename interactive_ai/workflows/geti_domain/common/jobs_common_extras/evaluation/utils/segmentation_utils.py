@@ -1,5 +1,6 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import itertools
 import logging
 from copy import copy
 from typing import Any, cast
@@ -13,7 +14,7 @@ from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.label import Label
 from iai_core.entities.model import Model
 from iai_core.entities.scored_label import ScoredLabel
-from iai_core.entities.shapes import Point, Polygon
+from iai_core.entities.shapes import Point, Polygon, Rectangle, Shape
 from iai_core.utils.shape_factory import ShapeFactory
 
 from jobs_common_extras.evaluation.utils.helpers import is_model_legacy_otx_version
@@ -196,7 +197,7 @@ def create_annotation_from_segmentation_map(
     return annotations
 
 
-def mask_from_dataset_item(dataset_item: DatasetItem, labels: list[Label]) -> np.ndarray:
+def mask_from_dataset_item(dataset_item: DatasetItem, labels: list[Label], scale: float = 1.0) -> np.ndarray:
     """Creates a mask from dataset item.
 
     The mask will be two dimensional, and the value of each pixel matches the class index with offset 1. The background
@@ -205,12 +206,17 @@ def mask_from_dataset_item(dataset_item: DatasetItem, labels: list[Label]) -> np
 
     :param dataset_item: Item to make mask for
     :param labels: The labels to use for creating the mask. The order of the labels determines the class index.
+    :param scale: Scale of the mask with respect to the media, to rasterize the shapes at a lower resolution
     :return: numpy array of mask
     """
-    return mask_from_annotation(dataset_item.get_annotations(), labels, dataset_item.width, dataset_item.height)
+    return mask_from_annotation(
+        dataset_item.get_annotations(), labels, dataset_item.width, dataset_item.height, scale=scale
+    )
 
 
-def mask_from_annotation(annotations: list[Annotation], labels: list[Label], width: int, height: int) -> np.ndarray:
+def mask_from_annotation(
+    annotations: list[Annotation], labels: list[Label], width: int, height: int, scale: float = 1.0
+) -> np.ndarray:
     """
     Generate a segmentation mask of a numpy image, and a list of shapes.
 
@@ -218,39 +224,124 @@ def mask_from_annotation(annotations: list[Annotation], labels: list[Label], wid
     index with offset 1. The background class index is zero. labels[0] matches pixel
     value 1, etc. The class index is determined based on the order of `labels`:
 
+    The points of all the shapes are converted to pixel coordinates at once, then the shapes are filled in
+    batches (see `_fill_polygons`); the shapes are drawn in the order of the annotations, so the later ones
+    cover the earlier ones.
+
     :param annotations: List of annotations to plot in mask
     :param labels: List of labels. The index position of the label determines the class number in the segmentation mask.
-    :param width: Width of the mask
-    :param height: Height of the mask
+    :param width: Width of the media
+    :param height: Height of the media
+    :param scale: Scale of the mask with respect to the media; a scale lower than 1 rasterizes the shapes at a
+        lower resolution, which is faster but approximates the masks
     :return: 2d numpy array of mask
     """
+    mask_width = max(1, round(width * scale))
+    mask_height = max(1, round(height * scale))
+    mask = np.zeros(shape=(mask_height, mask_width), dtype=np.uint8)
+    class_indices = {label.id_: class_idx for class_idx, label in enumerate(labels, start=1)}
 
-    mask = np.zeros(shape=(height, width), dtype=np.uint8)
-    label_ids = [label.id_ for label in labels]
+    polygons_coordinates: list[list[float]] = []
+    polygons_class_indices: list[int] = []
     for annotation in annotations:
-        shape = annotation.shape
-        if not isinstance(shape, Polygon):
-            shape = ShapeFactory.shape_as_polygon(annotation.shape)
-        known_labels = [
-            label for label in annotation.get_labels() if isinstance(label, ScoredLabel) and label.id_ in label_ids
-        ]
-        if len(known_labels) == 0:
+        class_idx = next(
+            (
+                class_indices[label.id_]
+                for label in annotation.get_labels()
+                if isinstance(label, ScoredLabel) and label.id_ in class_indices
+            ),
+            None,
+        )
+        if class_idx is None:
             # Skip unknown shapes
             continue
+        polygon_coordinates = _get_polygon_coordinates(annotation.shape)
+        if polygon_coordinates:
+            polygons_coordinates.append(polygon_coordinates)
+            polygons_class_indices.append(class_idx)
+
+    if polygons_coordinates:
+        num_points = [len(polygon_coordinates) // 2 for polygon_coordinates in polygons_coordinates]
+        coordinates = np.fromiter(
+            itertools.chain.from_iterable(polygons_coordinates), dtype=np.float64, count=2 * sum(num_points)
+        ).reshape(-1, 2)
+        # Truncate towards zero, like int()
+        pixel_coordinates = (coordinates * (mask_width, mask_height)).astype(np.int32)
+        _fill_polygons(
+            mask=mask,
+            pixel_coordinates=pixel_coordinates,
+            num_points=num_points,
+            class_indices=polygons_class_indices,
+        )
 
-        label_to_compare = known_labels[0].label_id
+    return np.expand_dims(mask, axis=2)
 
-        class_idx = label_ids.index(label_to_compare) + 1
-        contour = []
-        for point in shape.points:
-            contour.append([int(point.x * width), int(point.y * height)])
 
-        mask = cast(
-            "Mask",
-            cv2.drawContours(mask, [np.asarray([contour])], 0, (class_idx, class_idx, class_idx), -1),
-        )
+def _get_polygon_coordinates(shape: Shape) -> list[float]:
+    """
+    Get the flattened normalized coordinates (x0, y0, x1, y1, ...) of the polygon representing a shape, as
+    converted by ShapeFactory.shape_as_polygon; rectangles are converted without creating the points.
+    """
+    if isinstance(shape, Rectangle):
+        x1, y1, x2, y2 = shape.x1, shape.y1, shape.x2, shape.y2
+        return [x1, y1, x2, y1, x2, y2, x1, y2, x1, y1]
+    if not isinstance(shape, Polygon):
+        shape = ShapeFactory.shape_as_polygon(shape)
+    return [coordinate for point in shape.points for coordinate in (point.x, point.y)]
 
-    return np.expand_dims(mask, axis=2)
+
+# Maximum number of polygons filled with a single OpenCV call
+MAX_POLYGONS_PER_FILL = 256
+# Size of the grid used to detect the polygons that may overlap
+OVERLAP_GRID_SIZE = 64
+
+
+def _fill_polygons(mask: Mask, pixel_coordinates: np.ndarray, num_points: list[int], class_indices: list[int]) -> None:
+    """
+    Fill the polygons in the mask, in order, with as few OpenCV calls as possible.
+
+    cv2.fillPoly applies the even-odd rule to the polygons filled together, so a call can only fill polygons
+    that do not overlap: consecutive polygons of the same class are batched as long as their bounding boxes
+    fall in distinct cells of a coarse grid, which produces the same mask as filling them one by one.
+
+    :param mask: mask to fill in place
+    :param pixel_coordinates: array of shape (N, 2) with the pixel coordinates of the points of all the polygons
+    :param num_points: number of points of each polygon
+    :param class_indices: class index of each polygon
+    """
+    starts = np.cumsum([0, *num_points[:-1]])
+    contours = np.split(pixel_coordinates, starts[1:])
+    mask_size = np.array([mask.shape[1], mask.shape[0]])
+    # Grid cells covered by the bounding box of each polygon, as [x_min, y_min] and [x_max, y_max]
+    cells_min = np.clip(
+        np.minimum.reduceat(pixel_coordinates, starts, axis=0) * OVERLAP_GRID_SIZE // mask_size,
+        0,
+        OVERLAP_GRID_SIZE - 1,
+    ).tolist()
+    cells_max = np.clip(
+        np.maximum.reduceat(pixel_coordinates, starts, axis=0) * OVERLAP_GRID_SIZE // mask_size,
+        0,
+        OVERLAP_GRID_SIZE - 1,
+    ).tolist()
+
+    occupied_cells = np.zeros((OVERLAP_GRID_SIZE, OVERLAP_GRID_SIZE), dtype=bool)
+    batch_start = 0
+    for i in range(len(contours) + 1):
+        if i < len(contours):
+            cells = occupied_cells[cells_min[i][1] : cells_max[i][1] + 1, cells_min[i][0] : cells_max[i][0] + 1]
+            if (
+                class_indices[i] == class_indices[batch_start]
+                and i - batch_start < MAX_POLYGONS_PER_FILL
+                and not cells.any()
+            ):
+                cells[...] = True
+                continue
+        class_idx = class_indices[batch_start]
+        cv2.fillPoly(mask, contours[batch_start:i], color=(class_idx, class_idx, class_idx))
+        batch_start = i
+        if i < len(contours):
+            occupied_cells[...] = False
+            cells[...] = True
 
 
 def get_legacy_instance_segmentation_inferencer_configuration(model: Model) -> dict:
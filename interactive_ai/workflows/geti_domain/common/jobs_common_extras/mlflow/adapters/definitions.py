@@ -15,6 +15,7 @@ OPENVINO_BIN_KEY = "openvino.bin"
 ONNX_KEY = "model.onnx"
 CONFIG_JSON_KEY = "config.json"
 LABEL_SCHEMA_KEY = "label_schema.json"
+SHARD_CHECKSUMS_KEY = "shard_checksums.json"
 
 
 class MLFlowRunStatus(str, Enum):
@@ -7,6 +7,7 @@ import io
 import json
 import logging
 import os
+from collections.abc import Sequence
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any
@@ -19,6 +20,7 @@ from iai_core.adapters.binary_interpreters import RAWBinaryInterpreter
 from iai_core.adapters.model_adapter import DataSource
 from iai_core.configuration.elements.configurable_parameters import ConfigurableParameters
 from iai_core.configuration.helper import create
+from iai_core.entities.compiled_dataset_shards import CompiledDatasetShard
 from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.metrics import CurveMetric, LineChartInfo, MetricsGroup, Performance, ScoreMetric
 from iai_core.entities.model import Model, ModelFormat, ModelOptimizationType, ModelStatus
@@ -36,6 +38,7 @@ from jobs_common_extras.mlflow.adapters.definitions import (
     ONNX_KEY,
     OPENVINO_BIN_KEY,
     OPENVINO_XML_KEY,
+    SHARD_CHECKSUMS_KEY,
     ClsSubTaskType,
     MLFlowLifecycleStage,
     MLFlowRunStatus,
@@ -217,6 +220,29 @@ class GetiOTXInterfaceAdapter:
             # It is because iai-core binary repo `save()` function only allows a filename, not a filepath.
             self.binary_repo.save_group(source_directory=root)
 
+    @unified_tracing
+    def push_input_dataset_checksums(self, compiled_shard_files: Sequence[CompiledDatasetShard]) -> None:
+        """Push the SHA-256 checksums of the dataset shard files to the inputs directory.
+
+        The MLFlow tracking store serves them as the digests of the dataset inputs of the run,
+        so that the training workload can verify the downloaded shard files.
+
+        :param compiled_shard_files: Shard files pushed with `push_input_dataset`
+        """
+        checksums = {shard_file.filename: shard_file.checksum for shard_file in compiled_shard_files}
+
+        with TemporaryDirectory() as root:
+            prefix = os.path.join(root, self.dst_path_prefix, "inputs")
+            os.makedirs(prefix)
+
+            with open(os.path.join(prefix, SHARD_CHECKSUMS_KEY), "w") as fp:
+                json.dump(obj=checksums, fp=fp)
+
+            # NOTE: This is a workaround to construct
+            # jobs/<job-id>/... directory structure in the S3 bucket.
+            # It is because iai-core binary repo `save()` function only allows a filename, not a filepath.
+            self.binary_repo.save_group(source_directory=root)
+
     @unified_tracing
     def push_input_configuration(
         self,
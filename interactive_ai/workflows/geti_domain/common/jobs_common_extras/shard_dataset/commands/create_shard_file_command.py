@@ -36,6 +36,8 @@ class CreateShardFileCommand(ICommand):
     :param shard_idx: Integer index of the shard file
     :param total_num_shards: Total number of shard files in the given subset
     :param num_threads: Number of threads for image bytes pulling
+    :param prefetch_window_size: Maximum number of items whose image bytes are pulled ahead of the export.
+        Defaults to twice the number of threads.
     """
 
     def __init__(  # noqa: PLR0913
@@ -48,6 +50,7 @@ class CreateShardFileCommand(ICommand):
         shard_idx: int,
         total_num_shards: int,
         num_threads: int = 10,
+        prefetch_window_size: int | None = None,
     ) -> None:
         super().__init__()
         self.dataset_storage_identifier = dataset_storage_identifier
@@ -60,6 +63,7 @@ class CreateShardFileCommand(ICommand):
         self.shard_idx = shard_idx
         self.total_num_shards = total_num_shards
         self.num_threads = num_threads
+        self.prefetch_window_size = prefetch_window_size
 
         self._fsize: int | None = None
         self._fchecksum: str | None = None
@@ -75,15 +79,16 @@ class CreateShardFileCommand(ICommand):
         try:
             os.makedirs(self.work_dir)
 
-            dm_dataset = dm.Dataset(
-                source=ScExtractorForFlyteJob(
-                    dataset_storage_identifier=self.dataset_storage_identifier,
-                    sc_dataset_or_list_of_sc_items=self.dataset_items,
-                    label_schema=self.label_schema,
-                    num_thread_pools=self.num_threads,
-                )
+            extractor = ScExtractorForFlyteJob(
+                dataset_storage_identifier=self.dataset_storage_identifier,
+                sc_dataset_or_list_of_sc_items=self.dataset_items,
+                label_schema=self.label_schema,
+                num_thread_pools=self.num_threads,
+                prefetch_window_size=self.prefetch_window_size,
             )
-            logger.info("Created dm.Dataset class with ScExtractorForFlyteJob")
+            # A stream dataset does not cache the items, so the exported images can be released right away
+            dm_dataset = dm.StreamDataset(source=extractor)
+            logger.info("Created dm.StreamDataset class with ScExtractorForFlyteJob")
 
             with tracer.start_as_current_span("dm.Dataset.export"):
                 dm_dataset.export(
@@ -92,7 +97,17 @@ class CreateShardFileCommand(ICommand):
                     max_shard_size=len(self.dataset_items),
                     save_media=True,
                 )
-            logger.info("Exported dm.Dataset to 'arrow'")
+            fetch_stats = extractor.fetch_stats
+            logger.info(
+                "Exported dm.Dataset to 'arrow': %d items, %.1f MB of images pulled at %.1f items/s (%.1f MB/s), "
+                "prefetch window size %d (max in flight: %d)",
+                fetch_stats.num_items,
+                fetch_stats.num_bytes / 2**20,
+                fetch_stats.items_per_second,
+                fetch_stats.megabytes_per_second,
+                extractor.prefetch_window_size,
+                fetch_stats.max_in_flight,
+            )
 
             src_fnames = [fname for fname in os.listdir(self.work_dir) if os.path.splitext(fname)[-1] == ".arrow"]
 
@@ -18,8 +18,10 @@ from iai_core.entities.project import Project
 from kubernetes.client.models import V1ResourceRequirements
 
 from jobs_common.tasks.primary_container_task import get_flyte_pod_spec
+from jobs_common.tasks.utils.secrets import JobMetadata
 from jobs_common.utils.annotation_filter import AnnotationFilter
 from jobs_common.utils.progress_helper import noop_progress_callback
+from jobs_common_extras.mlflow.adapters.geti_otx_interface import GetiOTXInterfaceAdapter
 from jobs_common_extras.shard_dataset.commands.create_and_save_compiled_dataset_shards_command import (
     CreateAndSaveCompiledDatasetShardsCommand,
 )
@@ -148,6 +150,11 @@ def shard_dataset(  # noqa: PLR0913
 
         compiled_shard_files = [future.get(timeout=TIMEOUT) for future in futures]
 
+    # The checksums are served as the digests of the shard files, to verify them when they are downloaded
+    GetiOTXInterfaceAdapter(
+        project_identifier=project.identifier, job_metadata=JobMetadata.from_env_vars()
+    ).push_input_dataset_checksums(compiled_shard_files=compiled_shard_files)
+
     command = CreateAndSaveCompiledDatasetShardsCommand(
         dataset_id=dataset_id,
         label_schema=label_schema,
@@ -0,0 +1,57 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import pytest
+
+from jobs_common_extras.datumaro_conversion.converted_item_cache import ConvertedItemCache
+
+
+@pytest.mark.CommonComponent
+class TestConvertedItemCache:
+    def test_put_get_in_memory(self) -> None:
+        cache: ConvertedItemCache[dict] = ConvertedItemCache(max_items_in_memory=10)
+
+        cache.put(0, {"id": "item_0"})
+        cache.put(1, None)
+
+        assert 0 in cache and 1 in cache and 2 not in cache
+        assert cache.get(0) == {"id": "item_0"}
+        assert cache.get(1) is None
+        assert cache.num_items_on_disk == 0
+
+    def test_spill_to_disk(self, tmp_path) -> None:
+        cache: ConvertedItemCache[dict] = ConvertedItemCache(max_items_in_memory=2, spill_dir=str(tmp_path))
+        items = {i: {"id": f"item_{i}", "annotations": list(range(i))} for i in range(5)}
+
+        for key, item in items.items():
+            cache.put(key, item)
+
+        assert len(cache) == 5
+        assert cache.num_items_on_disk == 3
+        assert len(list(tmp_path.iterdir())) == 1
+        # read in a different order than written
+        for key in reversed(items):
+            assert cache.get(key) == items[key]
+
+        cache.close()
+        assert len(cache) == 0
+        assert not list(tmp_path.iterdir())
+
+    def test_context_manager(self, tmp_path) -> None:
+        with ConvertedItemCache(max_items_in_memory=1, spill_dir=str(tmp_path)) as cache:
+            cache.put(0, "item_0")
+            cache.put(1, "item_1")
+            assert cache.get(1) == "item_1"
+            assert len(list(tmp_path.iterdir())) == 1
+
+        assert len(cache) == 0
+        assert not list(tmp_path.iterdir())
+
+    def test_put_twice(self) -> None:
+        cache: ConvertedItemCache[int] = ConvertedItemCache(max_items_in_memory=1)
+        cache.put(0, 0)
+
+        with pytest.raises(KeyError):
+            cache.put(0, 1)
+        with pytest.raises(KeyError):
+            cache.get(1)
@@ -1,6 +1,6 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
-
+from unittest.mock import patch
 
 import datumaro as dm
 import pytest
@@ -8,7 +8,7 @@ from geti_types import DatasetStorageIdentifier
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.label_schema import LabelSchema
 
-from jobs_common_extras.datumaro_conversion.sc_extractor import ScExtractor
+from jobs_common_extras.datumaro_conversion.sc_extractor import ScExtractor, ScExtractorForFlyteJob
 
 
 @pytest.mark.CommonComponent
@@ -29,3 +29,35 @@ class TestScExtractor:
         dm_label_names = {label_category.name for label_category in dm_dataset.categories()[dm.AnnotationType.label]}
         sc_label_names = {label_entity.name for label_entity in label_schema.get_labels(False)}
         assert dm_label_names == sc_label_names
+
+
+@pytest.mark.CommonComponent
+class TestScExtractorForFlyteJob:
+    def test_iter_bounded_window(
+        self,
+        fxt_dataset_storage,
+        fxt_dataset_items_with_image_data,
+        fxt_label_schema,
+    ):
+        img_bytes = b"dummy_image_bytes"
+        with patch(
+            "jobs_common_extras.datumaro_conversion.sc_extractor.get_image_bytes",
+            return_value=img_bytes,
+        ):
+            extractor = ScExtractorForFlyteJob(
+                dataset_storage_identifier=fxt_dataset_storage.identifier,
+                sc_dataset_or_list_of_sc_items=fxt_dataset_items_with_image_data,
+                label_schema=fxt_label_schema,
+                num_thread_pools=2,
+                prefetch_window_size=3,
+            )
+            dm_items = list(extractor)
+            image_bytes = [dm_item.media.bytes for dm_item in dm_items]
+
+        assert len(extractor) == len(fxt_dataset_items_with_image_data) == len(dm_items)
+        assert image_bytes == [img_bytes] * len(dm_items)
+        fetch_stats = extractor.fetch_stats
+        assert extractor.prefetch_window_size == 3
+        assert fetch_stats.max_in_flight == 3
+        assert fetch_stats.num_items == len(dm_items)
+        assert fetch_stats.num_bytes == len(img_bytes) * len(dm_items)
@@ -403,3 +403,29 @@ class TestDiceMetric:
         # Dice score is only computed on non-empty labels and annotated labels
         assert performance.score.score == 0.0
         assert not metric.get_per_label_scores()
+
+    def test_dice_metric_downscaled_masks(
+        self,
+        fxt_ground_truth_dataset,
+        fxt_prediction_dataset,
+        fxt_label_schema,
+        fxt_labels,
+        fxt_overall_scores,
+    ) -> None:
+        # Arrange
+        label_a, label_b, _ = fxt_labels
+
+        # Act
+        # The media are 100x100, so the masks are rasterized at 50x50
+        metric = DiceMetric(
+            ground_truth_dataset=fxt_ground_truth_dataset,
+            prediction_dataset=fxt_prediction_dataset,
+            label_schema=fxt_label_schema,
+            average=MetricAverageMethod.MICRO,
+            max_mask_size=50,
+        )
+
+        # Assert
+        assert metric.overall_dice.score == pytest.approx(fxt_overall_scores[MetricAverageMethod.MICRO], 0.02)
+        assert metric.dice_per_label[label_a].score == pytest.approx(fxt_overall_scores[label_a], 0.02)
+        assert metric.dice_per_label[label_b].score == pytest.approx(fxt_overall_scores[label_b], 0.02)
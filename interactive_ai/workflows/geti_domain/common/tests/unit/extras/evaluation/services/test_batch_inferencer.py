@@ -4,10 +4,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from geti_types import ID, ImageIdentifier
 from iai_core.algorithms import ModelTemplateList
+from iai_core.entities.cached_prediction import FULL_BOX_ROI_KEY, CachedPrediction
+from iai_core.entities.metadata import FloatMetadata, FloatType
 from iai_core.entities.model_template import HyperParameterData, InstantiationType, ModelTemplate, TaskFamily, TaskType
 from iai_core.utils.post_process_predictions import PostProcessPredictionsUtils
 
+from jobs_common_extras.evaluation.services import batch_inference as batch_inference_module
 from jobs_common_extras.evaluation.services.batch_inference import BatchInference
 from jobs_common_extras.evaluation.services.inferencer import InferencerFactory
 
@@ -129,3 +133,65 @@ class TestBatchInference:
         mock_create_inferencer.assert_called_once_with(model=mock_model, max_async_requests=4)
         mock_infer_dataset.assert_called_once_with(mock_dataset, async_enabled)
         mock_post_process.assert_called_once()
+
+    def test_infer_dataset_reuses_cached_predictions(self, fxt_project_identifier) -> None:
+        # Arrange
+        class FakeDataset(list):
+            id_ = ID("dataset")
+
+        dataset_items = [
+            MagicMock(media_identifier=ImageIdentifier(image_id=ID(f"image_{i}")), roi=None) for i in range(3)
+        ]
+        mock_batch_dataset = MagicMock()
+        mock_batch_dataset.input_dataset = FakeDataset(dataset_items)
+        mock_inferencer = MagicMock()
+        mock_inferencer.label_schema.id_ = ID("label_schema")
+        predicted_metadata = [FloatMetadata(name="active_score", value=0.5, float_type=FloatType.ACTIVE_SCORE)]
+        mock_inferencer.predict.return_value = (MagicMock(media_height=480, media_width=640), predicted_metadata)
+        mock_model = MagicMock(id_=ID("model"))
+        cached_prediction = CachedPrediction(
+            id_=ID("cached_prediction"),
+            model_id=mock_model.id_,
+            label_schema_id=ID("label_schema"),
+            media_identifier=dataset_items[1].media_identifier,
+            roi_key=FULL_BOX_ROI_KEY,
+            media_height=480,
+            media_width=640,
+            annotations=[MagicMock()],
+            metadata=[FloatMetadata(name="active_score", value=0.1, float_type=FloatType.ACTIVE_SCORE)],
+        )
+        mock_cache_repo = MagicMock()
+        mock_cache_repo.get_by_model_and_media_identifiers.return_value = {cached_prediction.key: cached_prediction}
+
+        with (
+            patch.object(BatchInference, "_validate_model"),
+            patch.object(InferencerFactory, "create_inferencer", return_value=mock_inferencer),
+            patch.object(batch_inference_module, "PredictionCacheRepo", return_value=mock_cache_repo),
+        ):
+            batch_inference = BatchInference(
+                project_identifier=fxt_project_identifier,
+                task_node=MagicMock(),
+                model=mock_model,
+                batch_inference_datasets=[mock_batch_dataset],
+                prefetch_lookahead=0,
+                reuse_predictions=True,
+            )
+
+            # Act
+            batch_inference.infer_dataset(mock_batch_dataset, use_async=False)
+
+        # Assert
+        inferred_items = [call.kwargs["media"] for call in mock_inferencer.predict.call_args_list]
+        assert inferred_items == [dataset_items[0].media, dataset_items[2].media]
+        dataset_items[1].append_annotations.assert_called_once_with(cached_prediction.annotations)
+        dataset_items[1].append_metadata_item.assert_called_once_with(
+            data=cached_prediction.metadata[0], model=mock_model
+        )
+        mock_cache_repo.upsert_many.assert_called_once()
+        new_cached_predictions = mock_cache_repo.upsert_many.call_args.args[0]
+        assert [prediction.key for prediction in new_cached_predictions] == [
+            (dataset_items[0].media_identifier, FULL_BOX_ROI_KEY),
+            (dataset_items[2].media_identifier, FULL_BOX_ROI_KEY),
+        ]
+        assert all(prediction.model_id == mock_model.id_ for prediction in new_cached_predictions)
+        assert batch_inference._progress == 3
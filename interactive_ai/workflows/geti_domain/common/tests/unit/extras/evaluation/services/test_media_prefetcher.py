@@ -0,0 +1,87 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from jobs_common_extras.evaluation.entities.inference_stage_timings import InferenceStage, InferenceStageTimings
+from jobs_common_extras.evaluation.services.media_prefetcher import MediaPrefetcher
+
+
+@pytest.mark.JobsComponent
+class TestMediaPrefetcher:
+    def test_iterate(self, fxt_dataset_storage_identifier) -> None:
+        # Arrange
+        dataset_items = [MagicMock() for _ in range(10)]
+        images = {id(item.media): np.full((2, 2, 3), i, dtype=np.uint8) for i, item in enumerate(dataset_items)}
+        timings = InferenceStageTimings()
+        prefetcher = MediaPrefetcher(
+            dataset_storage_identifier=fxt_dataset_storage_identifier,
+            num_workers=3,
+            lookahead=4,
+            preprocess_fn=lambda image: (image + 1, {"original_shape": image.shape}),
+            timings=timings,
+        )
+
+        # Act
+        with patch.object(MediaPrefetcher, "load_media_roi_numpy", side_effect=lambda media, roi: images[id(media)]):
+            prefetched_items = list(prefetcher.iterate(dataset_items))
+
+        # Assert
+        assert [item.item_idx for item in prefetched_items] == list(range(10))
+        assert [item.dataset_item for item in prefetched_items] == dataset_items
+        for i, item in enumerate(prefetched_items):
+            assert item.numpy_image[0, 0, 0] == i
+            assert item.preprocessed_input[0][0, 0, 0] == i + 1
+        assert timings.count(InferenceStage.PREPROCESS) == 10
+
+    def test_iterate_bounded_lookahead(self, fxt_dataset_storage_identifier) -> None:
+        # Arrange
+        dataset_items = [MagicMock() for _ in range(20)]
+        lookahead = 3
+        lock = threading.Lock()
+        loaded_count = 0
+
+        def load(media, roi):
+            nonlocal loaded_count
+            with lock:
+                loaded_count += 1
+            return np.zeros((1, 1, 3), dtype=np.uint8)
+
+        prefetcher = MediaPrefetcher(
+            dataset_storage_identifier=fxt_dataset_storage_identifier,
+            num_workers=2,
+            lookahead=lookahead,
+        )
+
+        # Act & Assert
+        with patch.object(MediaPrefetcher, "load_media_roi_numpy", side_effect=load):
+            for consumed, item in enumerate(prefetcher.iterate(dataset_items), start=1):
+                # the consumed items plus the ones in flight never exceed the lookahead window
+                assert loaded_count <= consumed + lookahead
+                assert item.preprocessed_input is None
+
+    def test_iterate_propagates_errors(self, fxt_dataset_storage_identifier) -> None:
+        prefetcher = MediaPrefetcher(
+            dataset_storage_identifier=fxt_dataset_storage_identifier,
+            num_workers=2,
+            lookahead=2,
+        )
+
+        with (
+            patch.object(MediaPrefetcher, "load_media_roi_numpy", side_effect=RuntimeError("download failed")),
+            pytest.raises(RuntimeError, match="download failed"),
+        ):
+            list(prefetcher.iterate([MagicMock(), MagicMock()]))
+
+    @pytest.mark.parametrize("num_workers, lookahead", ((0, 4), (4, 0)))
+    def test_invalid_parameters(self, num_workers, lookahead, fxt_dataset_storage_identifier) -> None:
+        with pytest.raises(ValueError):
+            MediaPrefetcher(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                num_workers=num_workers,
+                lookahead=lookahead,
+            )
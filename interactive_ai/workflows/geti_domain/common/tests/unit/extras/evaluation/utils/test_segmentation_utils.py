@@ -0,0 +1,76 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import cv2
+import numpy as np
+import pytest
+from geti_types import ID
+from iai_core.entities.annotation import Annotation
+from iai_core.entities.label import Domain, Label
+from iai_core.entities.scored_label import ScoredLabel
+from iai_core.entities.shapes import Point, Polygon, Rectangle
+
+from jobs_common_extras.evaluation.utils.segmentation_utils import mask_from_annotation
+
+
+@pytest.fixture
+def fxt_labels():
+    yield [
+        Label(name="label_a", domain=Domain.SEGMENTATION, id_=ID("label_a_id")),
+        Label(name="label_b", domain=Domain.SEGMENTATION, id_=ID("label_b_id")),
+    ]
+
+
+def make_annotation(shape: Polygon | Rectangle, label: Label) -> Annotation:
+    return Annotation(shape=shape, labels=[ScoredLabel(label_id=label.id_, is_empty=False, probability=1.0)])
+
+
+def make_square(x: float, y: float, size: float) -> Polygon:
+    return Polygon(points=[Point(x, y), Point(x + size, y), Point(x + size, y + size), Point(x, y + size)])
+
+
+@pytest.mark.JobsComponent
+class TestSegmentationUtils:
+    def test_mask_from_annotation(self, fxt_labels) -> None:
+        label_a, label_b = fxt_labels
+        unknown_label = Label(name="unknown", domain=Domain.SEGMENTATION, id_=ID("unknown_id"))
+        # Overlapping squares of the same label, some far apart, then a rectangle of another label on top
+        annotations = [
+            make_annotation(make_square(0.1, 0.1, 0.3), label_a),
+            make_annotation(make_square(0.2, 0.2, 0.3), label_a),
+            make_annotation(make_square(0.7, 0.7, 0.2), label_a),
+            make_annotation(make_square(0.7, 0.1, 0.2), label_a),
+            make_annotation(Rectangle(x1=0.3, y1=0.0, x2=0.6, y2=0.5), label_b),
+            make_annotation(make_square(0.0, 0.6, 0.3), unknown_label),
+        ]
+        width, height = 200, 100
+        # Draw the shapes one by one
+        expected_mask = np.zeros((height, width), dtype=np.uint8)
+        for annotation, class_idx in zip(annotations[:5], (1, 1, 1, 1, 2)):
+            shape = annotation.shape
+            corners = (
+                [(shape.x1, shape.y1), (shape.x2, shape.y1), (shape.x2, shape.y2), (shape.x1, shape.y2)]
+                if isinstance(shape, Rectangle)
+                else [(point.x, point.y) for point in shape.points]
+            )
+            contour = np.array([[int(x * width), int(y * height)] for x, y in corners], dtype=np.int32)
+            cv2.drawContours(expected_mask, [contour[None]], 0, (class_idx,), -1)
+
+        mask = mask_from_annotation(annotations=annotations, labels=fxt_labels, width=width, height=height)
+
+        assert mask.shape == (height, width, 1)
+        np.testing.assert_array_equal(mask[:, :, 0], expected_mask)
+
+    def test_mask_from_annotation_downscaled(self, fxt_labels) -> None:
+        label_a, label_b = fxt_labels
+        annotations = [
+            make_annotation(make_square(0.0, 0.0, 0.5), label_a),
+            make_annotation(make_square(0.5, 0.5, 0.5), label_b),
+        ]
+
+        mask = mask_from_annotation(annotations=annotations, labels=fxt_labels, width=400, height=200, scale=0.25)
+
+        assert mask.shape == (50, 100, 1)
+        assert mask[10, 10, 0] == 1
+        assert mask[40, 80, 0] == 2
+        assert mask[10, 80, 0] == 0
@@ -2,6 +2,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 """This module tests GetiOTXInterfaceAdapter."""
 
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -10,6 +11,7 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 from iai_core.adapters.model_adapter import DataSource
 from iai_core.configuration.helper import convert
+from iai_core.entities.compiled_dataset_shards import CompiledDatasetShard
 from iai_core.entities.metrics import CurveMetric, LineChartInfo, LineMetricsGroup, Performance, ScoreMetric
 from iai_core.entities.model import Model, ModelFormat, ModelOptimizationType, ModelPrecision, ModelStatus
 from iai_core.repos.model_repo import ModelRepo
@@ -286,6 +288,48 @@ class TestGetiOTXInterfaceAdapter:
         saved_file_names = {str(path.relative_to(upload_tmp_dir)) for path in upload_tmp_dir.glob("**/*.arrow")}
         assert saved_file_names == {os.path.join("jobs", fxt_job_metadata.id, "inputs", fname)}
 
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.TemporaryDirectory")
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.ProjectRepo")
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.MLFlowExperimentBinaryRepo")
+    def test_push_input_dataset_checksums(
+        self,
+        mock_repo,
+        mock_project_repo,
+        mock_tmp_dir,
+        fxt_project,
+        fxt_project_identifier,
+        fxt_job_metadata,
+        fxt_organization_id,
+        tmp_path: Path,
+    ) -> None:
+        # Arrange
+        mock_project_repo.return_value.get_by_id.return_value = fxt_project
+        mock_repo.return_value.organization_id = fxt_organization_id
+        mock_tmp_dir.return_value.__enter__.return_value = str(tmp_path)
+        compiled_shard_files = [
+            CompiledDatasetShard(
+                filename=f"datum-{idx}-of-2.arrow",
+                binary_filename=f"datum-{idx}-of-2.arrow",
+                size=4,
+                checksum=hashlib.sha256(f"data {idx}".encode()).hexdigest(),
+            )
+            for idx in range(2)
+        ]
+
+        # Act
+        adapter = GetiOTXInterfaceAdapter(project_identifier=fxt_project_identifier, job_metadata=fxt_job_metadata)
+        adapter.push_input_dataset_checksums(compiled_shard_files=compiled_shard_files)
+
+        # Assert
+        mock_repo.return_value.save_group.assert_called_once_with(source_directory=str(tmp_path))
+        expected_path = Path(tmp_path) / "jobs" / fxt_job_metadata.id / "inputs" / "shard_checksums.json"
+        assert set(tmp_path.glob("**/*.json")) == {expected_path}
+        with expected_path.open("r") as fp:
+            assert json.load(fp) == {
+                "datum-0-of-2.arrow": hashlib.sha256(b"data 0").hexdigest(),
+                "datum-1-of-2.arrow": hashlib.sha256(b"data 1").hexdigest(),
+            }
+
     @pytest.mark.parametrize("has_additional_model_artifacts", [True, False])
     @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.ModelRepo")
     @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.ProjectRepo")
@@ -1,13 +1,16 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import copy
 from unittest.mock import ANY, call, patch
 
 import pytest
+from iai_core.entities.annotation import AnnotationSceneKind
 from iai_core.entities.dataset_entities import TaskDataset
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset, DatasetPurpose
 from iai_core.entities.project import Project
-from iai_core.repos import DatasetRepo, LabelSchemaRepo
+from iai_core.entities.subset import Subset
+from iai_core.repos import AnnotationSceneRepo, DatasetRepo, LabelSchemaRepo
 
 from jobs_common.utils.dataset_helpers import DatasetHelpers
 from jobs_common.utils.subset_management.subset_manager import TaskSubsetManager
@@ -37,14 +40,20 @@ class TestDatasetHelpers:
             for video_frame in video_frames
         ]
         input_dataset = Dataset(items=input_dataset_items, id=DatasetRepo.generate_id())
+        # Only the first 10 items are assigned to a new subset by the split
+        input_dataset_items[10].subset = Subset.TRAINING
+
+        def assign_subsets(dataset_items, **kwargs) -> None:
+            for item in list(dataset_items)[:11]:
+                item.subset = Subset.TRAINING
 
         with (
             patch.object(LabelSchemaRepo, "get_latest_view_by_task") as mock_get_label_schema,
             patch.object(TaskDataset, "get_dataset", return_value=input_dataset) as mock_get_dataset,
-            patch.object(TaskSubsetManager, "split") as mock_split,
+            patch.object(TaskSubsetManager, "split", side_effect=assign_subsets) as mock_split,
             patch.object(TaskDataset, "save_subsets") as mock_save_subsets,
             patch("jobs_common.utils.dataset_helpers.publish_event") as mock_publish_event,
-            patch.object(DatasetRepo, "save_deep") as mock_save_deep,
+            patch.object(DatasetRepo, "save_snapshot") as mock_save_snapshot,
         ):
             train_dataset = DatasetHelpers.construct_and_save_train_dataset_for_task(
                 task_dataset_entity=TaskDataset(
@@ -62,9 +71,10 @@ class TestDatasetHelpers:
         mock_get_label_schema.assert_called_once_with(task_node_id=task_node.id_)
         mock_get_dataset.assert_called_once_with(dataset_storage=project.get_training_dataset_storage())
         mock_split.assert_called_once()
-        mock_save_subsets.assert_called_once_with(
-            dataset=input_dataset, dataset_storage_identifier=dataset_storage.identifier
-        )
+        mock_save_subsets.assert_called_once_with(dataset=ANY, dataset_storage_identifier=dataset_storage.identifier)
+        reassigned_dataset = mock_save_subsets.call_args.kwargs["dataset"]
+        assert reassigned_dataset.id_ == input_dataset.id_
+        assert list(reassigned_dataset) == input_dataset_items[:10]
         mock_publish_event.assert_has_calls(
             [
                 # two calls to dataset_updated because the dataset size is 25 and the max chunk size is 20
@@ -82,6 +92,45 @@ class TestDatasetHelpers:
                 ),
             ]
         )
-        mock_save_deep.assert_called_once_with(train_dataset)
+        mock_save_snapshot.assert_called_once_with(train_dataset)
         assert train_dataset.purpose == DatasetPurpose.TRAINING
         assert len(train_dataset) == len(input_dataset)
+
+    def test_construct_testing_dataset_chunks(self, fxt_detection_project, fxt_annotation_scene) -> None:
+        project: Project = fxt_detection_project
+        task_node = project.get_trainable_task_nodes()[0]
+        dataset_storage = project.get_training_dataset_storage()
+        annotation_scenes = [copy.deepcopy(fxt_annotation_scene) for _ in range(3)]
+        original_scene_ids = [annotation_scene.id_ for annotation_scene in annotation_scenes]
+        scene_chunks = [annotation_scenes[:2], annotation_scenes[2:]]
+        dataset_chunks = [Dataset(id=DatasetRepo.generate_id()) for _ in scene_chunks]
+
+        with (
+            patch.object(
+                AnnotationSceneRepo, "get_all_non_empty_by_kind", return_value=iter(scene_chunks)
+            ) as mock_get_scenes,
+            patch.object(
+                DatasetHelpers, "construct_dataset_from_annotation_scenes", side_effect=dataset_chunks
+            ) as mock_construct_dataset,
+        ):
+            chunks = list(
+                DatasetHelpers.construct_testing_dataset_chunks(
+                    project=project,
+                    dataset_storage=dataset_storage,
+                    task_node_id=task_node.id_,
+                    create_new_annotations=True,
+                    chunk_size=2,
+                )
+            )
+
+        mock_get_scenes.assert_called_once_with(kind=AnnotationSceneKind.ANNOTATION, chunk_size=2)
+        mock_construct_dataset.assert_has_calls(
+            [
+                call(annotation_scenes=scene_chunk, dataset_storage=dataset_storage, subset=Subset.TESTING)
+                for scene_chunk in scene_chunks
+            ]
+        )
+        assert chunks == dataset_chunks
+        for annotation_scene, original_scene_id in zip(annotation_scenes, original_scene_ids):
+            assert annotation_scene.kind == AnnotationSceneKind.INTERMEDIATE
+            assert annotation_scene.id_ != original_scene_id
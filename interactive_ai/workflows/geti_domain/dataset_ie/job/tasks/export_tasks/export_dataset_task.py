@@ -138,45 +138,44 @@ def export_dataset_task(  # noqa: PLR0915
             total_iter_count=1 if export_format in ["coco", "yolo"] else 2,
         )
         progress_reporter.start_step()
-        dm_dataset = StreamDataset(
-            ScExtractorFromDatasetStorage(
-                dataset_storage=dataset_storage,
-                label_schema=label_schema,
-                include_unannotated=include_unannotated,
-                video_export_config=video_export_config,
-                progress_config=progress_config,
-            ),
-            media_type=dm_Image if save_video_as_images else dm_MediaElement,
-        )
-
-        progress_reporter.finish_step()
-        logger.info(f"Dataset with ID `{str(export_id)}` is built for export.")
-
-        # Add extra metadata to dm dataset
-        export_options: dict[str, Any] = {"save_media": True}
-        if dm_fmt == "voc":
-            dm_dataset.transform("polygons_to_masks")
-            export_options["label_map"] = ExportUtils.create_voc_label_map(label_schema)
-        if store_project_metadata:
-            dm_infos = dm_dataset.infos()
-            dm_infos["GetiProjectTask"] = ImportUtils.project_type_to_rest_api_string(project_type)
-            if project_type in ANOMALY_PROJECT_TYPES:
-                if label_schema is None:
-                    anomaly_labels = []
-                else:
-                    anomaly_labels = [
-                        label.name for label in label_schema.get_labels(include_empty=False) if label.is_anomalous
-                    ]
-                dm_infos["GetiAnomalyLabels"] = anomaly_labels
-            dm_infos["GetiTaskTypeLabels"] = ExportUtils.get_task_type_with_labels(project=project)
-            dm_dataset.transform("project_infos", dst_infos=dm_infos, overwrite=False)
-
-        progress_reporter.reset_step(_Steps.IDX_EXPORT_DATASET, f"Exporting a dataset to {export_format} format")
-        progress_reporter.start_step()
-        # Export dataset to filesystem in needed format
-        dm_dataset.export(path, dm_fmt, **export_options)
-        progress_reporter.finish_step()
-        logger.info(f"Dataset with ID `{str(export_id)}` is exported to {dm_fmt} format.")
+        # The extractor caches the converted items across the iterations of the export, and is closed afterwards
+        with ScExtractorFromDatasetStorage(
+            dataset_storage=dataset_storage,
+            label_schema=label_schema,
+            include_unannotated=include_unannotated,
+            video_export_config=video_export_config,
+            progress_config=progress_config,
+        ) as extractor:
+            dm_dataset = StreamDataset(extractor, media_type=dm_Image if save_video_as_images else dm_MediaElement)
+
+            progress_reporter.finish_step()
+            logger.info(f"Dataset with ID `{str(export_id)}` is built for export.")
+
+            # Add extra metadata to dm dataset
+            export_options: dict[str, Any] = {"save_media": True}
+            if dm_fmt == "voc":
+                dm_dataset.transform("polygons_to_masks")
+                export_options["label_map"] = ExportUtils.create_voc_label_map(label_schema)
+            if store_project_metadata:
+                dm_infos = dm_dataset.infos()
+                dm_infos["GetiProjectTask"] = ImportUtils.project_type_to_rest_api_string(project_type)
+                if project_type in ANOMALY_PROJECT_TYPES:
+                    if label_schema is None:
+                        anomaly_labels = []
+                    else:
+                        anomaly_labels = [
+                            label.name for label in label_schema.get_labels(include_empty=False) if label.is_anomalous
+                        ]
+                    dm_infos["GetiAnomalyLabels"] = anomaly_labels
+                dm_infos["GetiTaskTypeLabels"] = ExportUtils.get_task_type_with_labels(project=project)
+                dm_dataset.transform("project_infos", dst_infos=dm_infos, overwrite=False)
+
+            progress_reporter.reset_step(_Steps.IDX_EXPORT_DATASET, f"Exporting a dataset to {export_format} format")
+            progress_reporter.start_step()
+            # Export dataset to filesystem in needed format
+            dm_dataset.export(path, dm_fmt, **export_options)
+            progress_reporter.finish_step()
+            logger.info(f"Dataset with ID `{str(export_id)}` is exported to {dm_fmt} format.")
 
         progress_reporter.reset_step(_Steps.IDX_ARCHIVE_DATASET, "Archiving exported dataset")
         progress_reporter.start_step()
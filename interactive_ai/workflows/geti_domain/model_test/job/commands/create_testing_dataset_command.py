@@ -45,20 +45,27 @@ class CreateTaskTestingDatasetCommand(CreateDatasetCommand):
         try:
             create_new_annotations = self.max_number_of_annotations is not None or self.min_annotation_size is not None
 
-            self.dataset = DatasetHelpers.construct_testing_dataset(
+            dataset_repo = DatasetRepo(self.dataset_storage.identifier)
+            dataset = Dataset(id=DatasetRepo.generate_id())
+            # The items are built, filtered and saved one chunk at a time
+            for dataset_chunk in DatasetHelpers.construct_testing_dataset_chunks(
                 project=self.project,
                 dataset_storage=self.dataset_storage,
                 task_node_id=self.task_node_id,
                 create_new_annotations=create_new_annotations,
-            )
-
-            AnnotationFilter.apply_annotation_filters(
-                dataset=self.dataset,
-                max_number_of_annotations=self.max_number_of_annotations,
-                min_annotation_size=self.min_annotation_size,
-            )
-            dataset_repo = DatasetRepo(self.dataset_storage.identifier)
-            dataset_repo.save_deep(self.dataset)
+            ):
+                AnnotationFilter.apply_annotation_filters(
+                    dataset=dataset_chunk,
+                    max_number_of_annotations=self.max_number_of_annotations,
+                    min_annotation_size=self.min_annotation_size,
+                )
+                chunk_items = list(dataset_chunk)
+                if not chunk_items:
+                    continue
+                dataset_repo.add_items_to_dataset(dataset_id=dataset.id_, dataset_items=chunk_items, deep=True)
+                dataset.append_many(chunk_items)
+            dataset_repo.save_without_items(dataset)
+            self.dataset = dataset
         except Exception as exc:
             logger.exception(
                 "Could not create an evaluation dataset from dataset storage '%s' for task node '%s' ",
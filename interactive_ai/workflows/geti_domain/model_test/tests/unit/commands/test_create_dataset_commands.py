@@ -19,21 +19,30 @@ class TestCreateDatasetCommand:
         # Arrange
         project = fxt_project_with_anomaly_classification_task
 
+        dataset_chunk = fxt_dataset_non_empty_2
+
         # Act
         with (
             patch.object(
                 DatasetHelpers,
-                "construct_testing_dataset",
-                return_value=fxt_dataset_non_empty_2,
-            ) as mock_dataset_factory_testing_dataset,
+                "construct_testing_dataset_chunks",
+                return_value=iter([dataset_chunk]),
+            ) as mock_construct_testing_dataset_chunks,
             patch.object(DatasetRepo, "__init__", return_value=None),
-            patch.object(DatasetRepo, "save_deep", return_value=None),
+            patch.object(DatasetRepo, "add_items_to_dataset", return_value=None) as mock_add_items,
+            patch.object(DatasetRepo, "save_without_items", return_value=None) as mock_save_dataset,
         ):
-            CreateTaskTestingDatasetCommand(
+            command = CreateTaskTestingDatasetCommand(
                 project,
                 project.get_training_dataset_storage(),
                 project.task_ids[0],
-            ).execute()
+            )
+            command.execute()
 
         # Assert
-        mock_dataset_factory_testing_dataset.assert_called_once()
+        mock_construct_testing_dataset_chunks.assert_called_once()
+        mock_add_items.assert_called_once_with(
+            dataset_id=command.dataset.id_, dataset_items=list(dataset_chunk), deep=True
+        )
+        mock_save_dataset.assert_called_once_with(command.dataset)
+        assert list(command.dataset) == list(dataset_chunk)
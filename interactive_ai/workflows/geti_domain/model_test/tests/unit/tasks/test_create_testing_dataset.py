@@ -27,10 +27,11 @@ class TestCreateTestingDataset:
             patch.object(ProjectRepo, "get_by_id", return_value=fxt_empty_project),
             patch.object(ModelTestResultRepo, "get_by_id", return_value=fxt_model_test_result),
             patch.object(ModelTestResultRepo, "save", return_value=None),
-            patch.object(DatasetHelpers, "construct_testing_dataset", return_value=fxt_dataset),
+            patch.object(DatasetHelpers, "construct_testing_dataset_chunks", return_value=iter([fxt_dataset])),
             patch.object(ProjectRepo, "__init__", return_value=None),
             patch.object(DatasetRepo, "__init__", return_value=None),
-            patch.object(DatasetRepo, "save_deep", return_value=None),
+            patch.object(DatasetRepo, "add_items_to_dataset", return_value=None),
+            patch.object(DatasetRepo, "save_without_items", return_value=None),
             patch.object(
                 ModelTestResultRepo,
                 "__init__",
@@ -44,4 +45,4 @@ class TestCreateTestingDataset:
             )
 
         mock_lock_project.assert_called_once()
-        assert result == fxt_dataset
+        assert list(result) == list(fxt_dataset)
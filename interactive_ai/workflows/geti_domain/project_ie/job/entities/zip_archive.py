@@ -11,7 +11,8 @@ import tempfile
 from collections.abc import Generator, Iterable, Sequence
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from zipfile import ZipFile
+from typing import IO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 from bson import ObjectId, json_util
 from iai_core.repos.storage.storage_client import BinaryObjectType
@@ -177,6 +178,8 @@ class ProjectZipArchive(ZipArchive):
     MANIFEST_NAME = "manifest.json"
     DOCUMENTS_FOLDER = "documents"
     BINARIES_FOLDER = "binaries"
+    # Extensions of the binary objects that are compressed in the archive
+    DEFLATED_EXTENSIONS = frozenset((".xml", ".json", ".txt", ".yaml", ".csv"))
 
     def __init__(self, zip_file_path: str, readonly: bool = False) -> None:
         super().__init__(zip_file_path=zip_file_path, readonly=readonly)
@@ -268,7 +271,7 @@ class ProjectZipArchive(ZipArchive):
 
         try:
             with self._zip_file.open(collection_path) as coll_fp:
-                yield from (str(x, "utf-8").strip() for x in coll_fp.readlines())
+                yield from (str(x, "utf-8").strip() for x in coll_fp)
         except KeyError as ke:
             raise CollectionNotFoundError from ke
 
@@ -295,6 +298,48 @@ class ProjectZipArchive(ZipArchive):
         except Exception as exc:
             raise CollectionWriteError from exc
 
+    def get_object_entries_by_type(self, object_type: BinaryObjectType) -> Generator[tuple[ZipInfo, str], None, None]:
+        """
+        Get the entries of the binary objects of a given type in the project archive, without extracting them.
+
+        :param object_type: Type of the binary objects
+        :return: Generator of tuples (zip entry, remote path) where the remote path is the relative location that
+            the file should have in the S3 storage w.r.t. the project root folder.
+        """
+        zip_objects_folder = os.path.join(self.BINARIES_FOLDER, object_type.name.lower())
+        for zip_info in self._zip_file.infolist():
+            if zip_info.filename.startswith(zip_objects_folder + os.sep) and not zip_info.is_dir():
+                yield zip_info, zip_info.filename.removeprefix(zip_objects_folder + os.sep)
+
+    def open_object(self, zip_info: ZipInfo) -> IO[bytes]:
+        """
+        Open a binary object of the archive for reading, decompressing it on the fly.
+
+        Multiple objects can be read concurrently from different threads.
+
+        :param zip_info: Zip entry of the object, as returned by get_object_entries_by_type
+        :return: File-like object to read the object content
+        """
+        return self._zip_file.open(zip_info)
+
+    def extract_object(self, zip_info: ZipInfo, target_folder: str) -> str:
+        """
+        Extract a binary object of the archive to the local filesystem.
+
+        :param zip_info: Zip entry of the object, as returned by get_object_entries_by_type
+        :param target_folder: Local folder where to extract the object, preserving its path within the archive
+        :return: Local path of the extracted object
+        """
+        local_object_path = self._zip_file.extract(zip_info, target_folder)
+        if not os.path.exists(local_object_path):  # sanity check on local_object_path before returning it
+            logger.error(
+                f"File extracted from the zip cannot be found. "
+                f"zip_object_path={zip_info.filename} target_folder={target_folder} "
+                f"local_object_path={local_object_path}"
+            )
+            raise RuntimeError("Zip file was not extracted to the expected path")
+        return local_object_path
+
     def get_objects_by_type(self, object_type: BinaryObjectType) -> Generator[tuple[str, str], None, None]:
         """
         Get the binary objects of a given type from the project archive.
@@ -308,36 +353,15 @@ class ProjectZipArchive(ZipArchive):
             of the binary in the filesystem, and remote is the relative location that the file should have in the
             S3 storage w.r.t. the project root folder.
         """
-
-        zip_objects_folder = os.path.join(self.BINARIES_FOLDER, object_type.name.lower())
-
         # Create a temporary folder in the local FS to extract the files
         with tempfile.TemporaryDirectory() as local_tmp_folder:
-            # Iterate over the zipped binary files of the given type
-            for zip_object_path in self._zip_file.namelist():
-                if zip_object_path.startswith(zip_objects_folder) and zip_object_path != zip_objects_folder:
-                    # Compute the path where to put the file in the local FS and in the remote storage
-                    remote_object_path_from_project_root = zip_object_path.removeprefix(zip_objects_folder + os.sep)
-                    local_object_path = os.path.join(
-                        local_tmp_folder,
-                        self.BINARIES_FOLDER,
-                        object_type.name.lower(),
-                        remote_object_path_from_project_root,
-                    )
-                    # Extract the file locally
-                    self._zip_file.extract(zip_object_path, local_tmp_folder)
-                    if not os.path.exists(local_object_path):  # sanity check on local_object_path before returning it
-                        logger.error(
-                            f"File extracted from the zip cannot be found. "
-                            f"zip_object_path={zip_object_path} local_tmp_folder={local_tmp_folder} "
-                            f"local_object_path={local_object_path}"
-                        )
-                        raise RuntimeError("Zip file was not extracted to the expected path")
-                    # Yield the local and remote paths
-                    yield local_object_path, remote_object_path_from_project_root
-                    # Destroy the local file if it still exists (could be removed by the caller)
-                    if os.path.exists(local_object_path):
-                        os.remove(local_object_path)
+            for zip_info, remote_object_path_from_project_root in self.get_object_entries_by_type(object_type):
+                local_object_path = self.extract_object(zip_info=zip_info, target_folder=local_tmp_folder)
+                # Yield the local and remote paths
+                yield local_object_path, remote_object_path_from_project_root
+                # Destroy the local file if it still exists (could be removed by the caller)
+                if os.path.exists(local_object_path):
+                    os.remove(local_object_path)
 
     def add_objects_by_type(
         self,
@@ -352,17 +376,42 @@ class ProjectZipArchive(ZipArchive):
             path is the location of the binary in the filesystem, and remote is the
             relative location in the S3 storage w.r.t. the project root folder.
         """
-        zip_objects_folder = os.path.join(self.BINARIES_FOLDER, object_type.name.lower())
-
         for (
             local_object_path,
             remote_object_path_from_project_root,
         ) in local_and_remote_paths:
-            if not os.path.exists(local_object_path):
-                logger.error(f"Local object file {local_object_path} not found")
-                raise RuntimeError("Object to add to the archive cannot be found locally")
-            zip_object_path = os.path.join(zip_objects_folder, remote_object_path_from_project_root)
-            self._zip_file.write(local_object_path, zip_object_path)
+            self.add_object(
+                object_type=object_type,
+                local_object_path=local_object_path,
+                remote_object_path_from_project_root=remote_object_path_from_project_root,
+            )
+
+    def add_object(
+        self,
+        object_type: BinaryObjectType,
+        local_object_path: str,
+        remote_object_path_from_project_root: str,
+    ) -> None:
+        """
+        Write a binary object to the project archive.
+
+        Text files (e.g. model XML and JSON configurations) are deflated, while the other objects are stored
+        as they are: media and model weights are already compressed or barely compressible, and keeping them stored
+        keeps the compression ratio of the archive within the zip bomb detection threshold of the import.
+
+        :param object_type: Type of the binary object
+        :param local_object_path: Location of the binary in the filesystem
+        :param remote_object_path_from_project_root: Relative location of the binary in the S3 storage w.r.t.
+            the project root folder
+        """
+        if not os.path.exists(local_object_path):
+            logger.error(f"Local object file {local_object_path} not found")
+            raise RuntimeError("Object to add to the archive cannot be found locally")
+        zip_objects_folder = os.path.join(self.BINARIES_FOLDER, object_type.name.lower())
+        zip_object_path = os.path.join(zip_objects_folder, remote_object_path_from_project_root)
+        extension = os.path.splitext(local_object_path)[1].lower()
+        compress_type = ZIP_DEFLATED if extension in self.DEFLATED_EXTENSIONS else ZIP_STORED
+        self._zip_file.write(local_object_path, zip_object_path, compress_type=compress_type)
 
 
 class ProjectZipArchiveWrapper(ZipArchive):
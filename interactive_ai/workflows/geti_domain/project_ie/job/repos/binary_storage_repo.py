@@ -6,6 +6,7 @@
 import logging
 import os
 from collections.abc import Iterable, Iterator
+from typing import BinaryIO
 
 from geti_types import ID
 from iai_core.repos.storage.storage_client import BinaryObjectType
@@ -83,43 +84,70 @@ class BinaryStorageRepo(StorageRepo):
             - The local path where the object is downloaded to
             - The remote path from the project root onward where the object was downloaded from
         """
-        bucket_name = object_type.bucket_name()
-        if not self.minio_client.bucket_exists(bucket_name=bucket_name):
-            raise FileNotFoundError(f"Bucket {bucket_name} does not exist.")
         logger.info(
             "Storing project-related files at %s from bucket %s to temporary local folder %s.",
             self.s3_project_root,
-            bucket_name,
+            object_type.bucket_name(),
             target_folder,
         )
+        for object_name_from_project_root in self.get_object_names_by_type(object_type=object_type):
+            local_path = self.download_object(
+                object_type=object_type,
+                object_name_from_project_root=object_name_from_project_root,
+                target_folder=target_folder,
+            )
+
+            yield local_path, object_name_from_project_root
+
+            if os.path.exists(local_path):
+                os.remove(local_path)
+
+    def get_object_names_by_type(self, object_type: BinaryObjectType) -> Iterator[str]:
+        """
+        Iterates over the names of the objects of a specific project and type.
+
+        :param object_type: The type of the binary objects to list, corresponds to a bucket
+        :return: An iterator yielding the remote path of each object from the project root onward
+        """
+        bucket_name = object_type.bucket_name()
+        if not self.minio_client.bucket_exists(bucket_name=bucket_name):
+            raise FileNotFoundError(f"Bucket {bucket_name} does not exist.")
 
         objects_to_fetch = self.minio_client.list_objects(
             bucket_name=bucket_name, prefix=self.s3_project_root + "/", recursive=True
         )
-
         for s3_object in objects_to_fetch:
-            object_name = s3_object.object_name
-            object_name_from_project_root = object_name.replace(self.s3_project_root + "/", "")
-            local_path = os.path.join(target_folder, object_name_from_project_root)
-            try:
-                self.minio_client.fget_object(
-                    bucket_name=bucket_name,
-                    file_path=local_path,
-                    object_name=object_name,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to fetch object from location %s in bucket %s to local temporary path %s.",
-                    object_name,
-                    bucket_name,
-                    local_path,
-                )
-                raise
+            yield s3_object.object_name.replace(self.s3_project_root + "/", "")
 
-            yield local_path, object_name_from_project_root
+    def download_object(
+        self, object_type: BinaryObjectType, object_name_from_project_root: str, target_folder: str
+    ) -> str:
+        """
+        Download an object of the project to a local folder. This method is thread-safe.
 
-            if os.path.exists(local_path):
-                os.remove(local_path)
+        :param object_type: The type of the binary object to download, corresponds to a bucket
+        :param object_name_from_project_root: Remote path of the object from the project root onward
+        :param target_folder: Folder in the local filesystem where to download the object
+        :return: The local path where the object is downloaded to
+        """
+        bucket_name = object_type.bucket_name()
+        object_name = os.path.join(self.s3_project_root, object_name_from_project_root)
+        local_path = os.path.join(target_folder, object_name_from_project_root)
+        try:
+            self.minio_client.fget_object(
+                bucket_name=bucket_name,
+                file_path=local_path,
+                object_name=object_name,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to fetch object from location %s in bucket %s to local temporary path %s.",
+                object_name,
+                bucket_name,
+                local_path,
+            )
+            raise
+        return local_path
 
     def store_objects_by_type(
         self,
@@ -139,24 +167,68 @@ class BinaryStorageRepo(StorageRepo):
             logger.info(f"Skipping storing objects of type {object_type} because the object type is blacklisted.")
             return
         for local_path, object_name_from_project_root in local_and_remote_paths:
-            bucket_name = object_type.bucket_name()
-
-            # The rest of the structure will be the object name from the project root onward.
-            object_name = os.path.join(self.s3_project_root, object_name_from_project_root)
-            try:
-                self.minio_client.fput_object(
-                    bucket_name=bucket_name,
-                    object_name=object_name,
-                    file_path=local_path,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to store object at %s to location %s in bucket %s.",
-                    local_path,
-                    object_name,
-                    bucket_name,
-                )
-                raise
+            self.store_object(
+                object_type=object_type,
+                local_path=local_path,
+                object_name_from_project_root=object_name_from_project_root,
+            )
+
+    def store_object(self, object_type: BinaryObjectType, local_path: str, object_name_from_project_root: str) -> None:
+        """
+        Store a local file at the specified remote path. This method is thread-safe.
+
+        :param object_type: The type of the binary object to be stored, corresponds to a bucket.
+        :param local_path: The local path where the file can be found that should be uploaded
+        :param object_name_from_project_root: Target path of the object inside the bucket, from the project root onward
+        """
+        bucket_name = object_type.bucket_name()
+        object_name = os.path.join(self.s3_project_root, object_name_from_project_root)
+        try:
+            self.minio_client.fput_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                file_path=local_path,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to store object at %s to location %s in bucket %s.",
+                local_path,
+                object_name,
+                bucket_name,
+            )
+            raise
+
+    def store_object_from_stream(
+        self,
+        object_type: BinaryObjectType,
+        data: BinaryIO,
+        length: int,
+        object_name_from_project_root: str,
+    ) -> None:
+        """
+        Store the content of a stream at the specified remote path, without any local copy. This method is thread-safe.
+
+        :param object_type: The type of the binary object to be stored, corresponds to a bucket.
+        :param data: Stream to read the object content from
+        :param length: Size of the object content, in bytes
+        :param object_name_from_project_root: Target path of the object inside the bucket, from the project root onward
+        """
+        bucket_name = object_type.bucket_name()
+        object_name = os.path.join(self.s3_project_root, object_name_from_project_root)
+        try:
+            self.minio_client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=data,
+                length=length,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to store streamed object to location %s in bucket %s.",
+                object_name,
+                bucket_name,
+            )
+            raise
 
     def delete_all_objects_by_type(self, object_type: BinaryObjectType) -> None:
         """
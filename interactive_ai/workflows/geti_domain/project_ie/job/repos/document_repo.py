@@ -4,6 +4,7 @@
 """Repos to interact to fetch/store documents from/to MongoDB collections"""
 
 import logging
+import os
 from collections.abc import Callable, Iterable, Iterator
 
 from geti_types import ProjectIdentifier, Session
@@ -20,6 +21,9 @@ from pymongo.cursor import Cursor
 
 logger = logging.getLogger(__name__)
 
+# Number of documents written to the DB with a single query on project import
+DOCUMENT_INSERTION_BATCH_SIZE = int(os.environ.get("DOCUMENT_INSERTION_BATCH_SIZE", 1000))
+
 
 class DocumentRepo(ProjectBasedSessionRepo[None]):  # type: ignore[type-var]
     """
@@ -134,10 +138,13 @@ class DocumentRepo(ProjectBasedSessionRepo[None]):  # type: ignore[type-var]
         self,
         collection_name: str,
         documents: Iterable[dict],
-        insertion_batch_size: int = 100,
+        insertion_batch_size: int = DOCUMENT_INSERTION_BATCH_SIZE,
     ) -> None:
         """
-        Insert one or more documents to a given MongoDB collection
+        Insert one or more documents to a given MongoDB collection.
+
+        The documents are inserted in ordered batches, so a failure leaves the collection with a prefix of the stream.
+        This method is thread-safe, so multiple collections can be written concurrently.
 
         :param collection_name: Name of the database collection
         :param documents: Stream of documents to insert in the DB
@@ -153,7 +160,7 @@ class DocumentRepo(ProjectBasedSessionRepo[None]):  # type: ignore[type-var]
         for batch_of_docs in grouper(documents, chunk_size=insertion_batch_size):
             for doc in batch_of_docs:
                 doc.update(write_filter)
-            collection.insert_many(batch_of_docs)
+            collection.insert_many(batch_of_docs, ordered=True)
 
     def delete_all_documents(self) -> None:
         query_filter = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
@@ -5,26 +5,58 @@ This module is responsible for data redaction during the import and export proce
 """
 
 import logging
+import multiprocessing
 import os
 import random
 import re
 import shutil
+import threading
 from abc import ABC
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import cast
+from functools import partial
+from typing import Any, TypeVar, cast
 from uuid import UUID
 from zipfile import ZipFile
 
 from bson import ObjectId, UuidRepresentation
-from bson.json_util import JSONOptions, dumps
+from bson.json_util import JSONOptions, dumps, loads
 from defusedxml import ElementTree
 from iai_core.repos.mappers import DatetimeToMongo, MediaIdentifierToMongo
+from iai_core.utils.iteration import grouper
 from iai_core.utils.time_utils import now
 
 from job.entities.exceptions import ExportDataRedactionFailedException, ImportDataRedactionFailedException
 
 logger = logging.getLogger(__name__)
 
+# Number of worker processes redacting the documents of large collections; if 0, all the documents are redacted
+# in the calling process
+DOCUMENT_REDACTION_PROCESSES = int(os.environ.get("DOCUMENT_REDACTION_PROCESSES", 0))
+# Number of documents redacted by each task; only collections with more documents are sent to the worker processes
+DOCUMENT_REDACTION_CHUNK_SIZE = int(os.environ.get("DOCUMENT_REDACTION_CHUNK_SIZE", 2000))
+# Maximum number of transformed ObjectIds memoized by a redaction use case
+OBJECTID_SHIFT_CACHE_SIZE = 1 << 16
+
+_ChunkResultT = TypeVar("_ChunkResultT")
+
+_redaction_process_pool: ProcessPoolExecutor | None = None
+_redaction_process_pool_lock = threading.Lock()
+
+
+def _get_redaction_process_pool() -> ProcessPoolExecutor:
+    """Get the pool of processes redacting the documents, creating it on first use"""
+    global _redaction_process_pool  # noqa: PLW0603
+    with _redaction_process_pool_lock:
+        if _redaction_process_pool is None:
+            # 'spawn' because forking is unsafe while other threads (e.g. the collection importers) are running
+            _redaction_process_pool = ProcessPoolExecutor(
+                max_workers=DOCUMENT_REDACTION_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _redaction_process_pool
+
 
 def get_random_objectid_between_dates(min_date: datetime, max_date: datetime) -> ObjectId:
     """
@@ -77,6 +109,79 @@ class BaseDataRedactionUseCase(ABC):
             return False
         return "reference_features" in file_basename
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The memoized ObjectIds are not sent to the worker processes
+        state = self.__dict__.copy()
+        state["_shifted_objectids"] = {}
+        return state
+
+    @staticmethod
+    def _map_chunks(
+        process_chunk: Callable[[list[Any]], _ChunkResultT], items: Iterable[Any]
+    ) -> Iterator[_ChunkResultT]:
+        """
+        Process a stream of items in chunks of DOCUMENT_REDACTION_CHUNK_SIZE, preserving their order.
+
+        The first chunk is processed in the calling process; if there are more and DOCUMENT_REDACTION_PROCESSES > 0,
+        the following chunks are processed concurrently by the pool of redaction processes, so the function and
+        its arguments must be picklable.
+
+        :param process_chunk: Function to apply to each chunk of items
+        :param items: Stream of items to process
+        :return: Stream of the results of the chunks
+        """
+        chunks = grouper(items, chunk_size=DOCUMENT_REDACTION_CHUNK_SIZE)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return
+        yield process_chunk(first_chunk)
+        if DOCUMENT_REDACTION_PROCESSES <= 0:
+            yield from map(process_chunk, chunks)
+            return
+        pool = _get_redaction_process_pool()
+        pending: deque[Future[_ChunkResultT]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(process_chunk, chunk))
+            if len(pending) >= 2 * DOCUMENT_REDACTION_PROCESSES:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    @classmethod
+    def is_file_content_redacted(cls, file_basename: str) -> bool:
+        """
+        Determine if the content of a binary file embeds ObjectIds, which must be redacted on import/export.
+
+        Files for which this method returns False are transferred as they are.
+
+        :param file_basename: Base name of the file
+        :return: True if the file content is redacted, False otherwise
+        """
+        return (
+            cls._is_file_label_schema_json(file_basename)
+            or cls._is_file_model_xml(file_basename)
+            or cls._is_file_exportable_code(file_basename)
+            or cls._is_file_reference_features_json(file_basename)
+        )
+
+
+_USER_RELATED_KEYS_REGEX = "|".join(re.escape(k) for k in BaseDataRedactionUseCase.USER_RELATED_KEYS)
+# Combination of the patterns of the export redaction methods, to redact a document in a single pass.
+# The alternatives match disjoint tokens, so the result is the same as applying the methods one after the other.
+_EXPORT_DOCUMENT_PATTERN = re.compile(
+    r"\"\$oid\": \"(?P<oid>[0-9a-fA-F]{24})\""
+    r"|\"binary_filename\": \"(?P<filename_oid>[0-9a-fA-F]{24})\.(?P<extension>[0-9a-zA-Z]{3,4})\""
+    r"|\"(?P<user_key>(?:" + _USER_RELATED_KEYS_REGEX + r")(?:_id|_name|_uid)?)\": "
+    r"(?:\"[^\"]*\"|(?P<user_uuid>\{\"\$binary\": \{\"base64\": \"[A-Za-z0-9+/]*={0,2}\", \"subType\": \"04\"}}))"
+)
+# Combination of the patterns of the import redaction methods, to restore a document in a single pass
+_IMPORT_DOCUMENT_PATTERN = re.compile(
+    r"\"\$sid\": \"(?P<sid>[0-9a-fA-F]{24})\""
+    r"|\"binary_filename\": \"(?P<filename_sid>[0-9a-fA-F]{24})\.(?P<extension>[0-9a-zA-Z]{3,4})\""
+    r"|\"(?P<user_key>(?:" + _USER_RELATED_KEYS_REGEX + r")(?:_id|_name)?)\": "
+    r"\"\$user_id_(?:str|(?P<user_uuid>uuid4))\""
+)
+
 
 class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
     """
@@ -92,6 +197,18 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
         self.objectid_replacement_base_oid: ObjectId = self._generate_random_base_oid()
         self.objectid_replacement_base_int = int(str(self.objectid_replacement_base_oid), 16)
         self.objectid_replacement_min_int: int | None = None  # this attribute is updated during the redaction
+        # Files may be redacted concurrently by the export workers
+        self._objectid_replacement_min_lock = threading.Lock()
+        self._shifted_objectids: dict[str, str] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        del state["_objectid_replacement_min_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._objectid_replacement_min_lock = threading.Lock()
 
     @staticmethod
     def _generate_random_base_oid() -> ObjectId:
@@ -116,6 +233,10 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
         :param: Hex string representing the ObjectId to transform
         :return: Hex string representing the transformed (back-shifted) ObjectId
         """
+        objectid_hex_shifted = self._shifted_objectids.get(objectid_hex)
+        if objectid_hex_shifted is not None:
+            return objectid_hex_shifted
+
         objectid_int = int(objectid_hex, 16)
         if objectid_int < self.objectid_replacement_base_int:
             logger.error(
@@ -130,11 +251,24 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
         objectid_hex_shifted = f"{objectid_int_shifted:024x}"
 
         # Cache the minimum transformed value
-        if self.objectid_replacement_min_int is None or objectid_int_shifted < self.objectid_replacement_min_int:
-            self.objectid_replacement_min_int = objectid_int_shifted
+        self._update_objectid_replacement_min(objectid_int_shifted)
 
+        if len(self._shifted_objectids) < OBJECTID_SHIFT_CACHE_SIZE:
+            self._shifted_objectids[objectid_hex] = objectid_hex_shifted
         return objectid_hex_shifted
 
+    def _update_objectid_replacement_min(self, objectid_int_shifted: int | None) -> None:
+        """
+        Update the minimum transformed id with a new value, if lower
+
+        :param objectid_int_shifted: Transformed id, as integer
+        """
+        if objectid_int_shifted is None:
+            return
+        with self._objectid_replacement_min_lock:
+            if self.objectid_replacement_min_int is None or objectid_int_shifted < self.objectid_replacement_min_int:
+                self.objectid_replacement_min_int = objectid_int_shifted
+
     @property
     def objectid_replacement_min_id(self) -> str:
         """Value of the minimum transformed id (ObjectId) as a hex string"""
@@ -160,6 +294,46 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
 
         return re.sub(r"\"\$oid\": \"([0-9a-fA-F]{24})\"", objectid_replacer, bson_doc)
 
+    def redact_mongodb_doc(self, bson_doc: str) -> str:
+        """
+        Redact a document in a single pass, with the same result as applying 'replace_objectid_in_mongodb_doc',
+        'replace_objectid_based_binary_filename_in_mongodb_doc' and 'mask_user_info_in_mongodb_doc' in sequence.
+
+        :param bson_doc: MongoDB document encoded as BSON
+        :return: Document after the redaction
+        """
+
+        def replacer(match: re.Match) -> str:
+            match match.lastgroup:
+                case "oid":
+                    return f'"$sid": "{self.__shift_back_objectid_hex(match.group("oid"))}"'
+                case "extension":
+                    objectid_hex_shifted = self.__shift_back_objectid_hex(match.group("filename_oid"))
+                    return f'"binary_filename": "{objectid_hex_shifted}.{match.group("extension")}"'
+                case "user_uuid":
+                    return f'"{match.group("user_key")}": "$user_id_uuid4"'
+                case _:
+                    return f'"{match.group("user_key")}": "$user_id_str"'
+
+        return _EXPORT_DOCUMENT_PATTERN.sub(replacer, bson_doc)
+
+    def redact_mongodb_docs(self, docs: Iterable[dict], json_options: JSONOptions) -> Iterator[str]:
+        """
+        Encode a stream of documents as BSON and redact them (see 'redact_mongodb_doc').
+
+        Large streams are redacted by the pool of redaction processes if DOCUMENT_REDACTION_PROCESSES > 0.
+
+        :param docs: Stream of MongoDB documents
+        :param json_options: Options to encode the documents
+        :return: Stream of redacted documents encoded as BSON, in the same order as the input
+        """
+        for redacted_docs, objectid_replacement_min_int in self._map_chunks(
+            partial(_redact_export_chunk, self, json_options), docs
+        ):
+            # The minimum transformed id must also account for the documents redacted in other processes
+            self._update_objectid_replacement_min(objectid_replacement_min_int)
+            yield from redacted_docs
+
     def replace_media_based_objectid_in_mongodb_doc(self, doc: dict) -> dict:
         """
         Replace (in-place) the _id field of a document where such an ObjectId was generated from the media identifier,
@@ -441,6 +615,7 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
             else None
         )
         self.import_date = DatetimeToMongo.forward(now())  # Used to overwrite old dates in imported project
+        self._shifted_objectids: dict[str, str] = {}
 
     @staticmethod
     def _generate_random_seed_oid() -> ObjectId:
@@ -464,10 +639,13 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
         :param: Hex string representing the ObjectId to transform
         :return: Hex string representing the transformed (forward-shifted) ObjectId
         """
-        objectid_int = int(objectid_hex, 16)
-        return (
-            f"{self.objectid_replacement_seed_int + objectid_int - cast('int', self.objectid_replacement_min_int):024x}"
-        )
+        objectid_hex_shifted = self._shifted_objectids.get(objectid_hex)
+        if objectid_hex_shifted is None:
+            objectid_int = int(objectid_hex, 16) - cast("int", self.objectid_replacement_min_int)
+            objectid_hex_shifted = f"{self.objectid_replacement_seed_int + objectid_int:024x}"
+            if len(self._shifted_objectids) < OBJECTID_SHIFT_CACHE_SIZE:
+                self._shifted_objectids[objectid_hex] = objectid_hex_shifted
+        return objectid_hex_shifted
 
     def recreate_objectid_in_mongodb_doc(self, bson_doc: str) -> str:
         """
@@ -490,6 +668,48 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
 
         return re.sub(r"\"\$sid\": \"([0-9a-fA-F]{24})\"", objectid_maker, bson_doc)
 
+    def restore_mongodb_doc(self, bson_doc: str) -> str:
+        """
+        Restore a document in a single pass, with the same result as applying 'update_user_info_in_mongodb_doc',
+        'recreate_objectid_based_binary_filename_in_mongodb_doc' and 'recreate_objectid_in_mongodb_doc' in sequence.
+
+        :param bson_doc: MongoDB document encoded as BSON
+        :return: Document after the replacement
+        """
+
+        def replacer(match: re.Match) -> str:
+            match match.lastgroup:
+                case "sid":
+                    return f'"$oid": "{self.__shift_forward_objectid_hex(match.group("sid"))}"'
+                case "extension":
+                    objectid_hex_shifted = self.__shift_forward_objectid_hex(match.group("filename_sid"))
+                    return f'"binary_filename": "{objectid_hex_shifted}.{match.group("extension")}"'
+                case "user_uuid":
+                    return f'"{match.group("user_key")}": {self.user_replacement_new_id_encoded}'
+                case _:
+                    return f'"{match.group("user_key")}": "{str(self.user_replacement_new_id)}"'
+
+        if self.objectid_replacement_min_int is None:
+            logger.error("Cannot reconstruct ObjectIds for imported docs if the minimum transformed id is not provided")
+            raise ImportDataRedactionFailedException
+        if self.user_replacement_new_id is None:
+            logger.error("Cannot update user-relative info in imported docs because the new user id is not provided")
+            raise ImportDataRedactionFailedException
+        return _IMPORT_DOCUMENT_PATTERN.sub(replacer, bson_doc)
+
+    def restore_mongodb_docs(self, bson_docs: Iterable[str], json_options: JSONOptions) -> Iterator[dict]:
+        """
+        Restore a stream of documents (see 'restore_mongodb_doc') and decode them.
+
+        Large streams are restored by the pool of redaction processes if DOCUMENT_REDACTION_PROCESSES > 0.
+
+        :param bson_docs: Stream of MongoDB documents encoded as BSON
+        :param json_options: Options to decode the documents
+        :return: Stream of restored documents, in the same order as the input
+        """
+        for restored_docs in self._map_chunks(partial(_restore_import_chunk, self, json_options), bson_docs):
+            yield from restored_docs
+
     def recreate_media_based_objectid_in_mongodb_doc(self, doc: dict) -> dict:
         """
         Recreate (in-place) the _id field of a document where such an ObjectId was generated from the media identifier,
@@ -724,3 +944,21 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
         """
         name, extension = os.path.splitext(filename)
         return name + extension.lower()
+
+
+def _redact_export_chunk(
+    data_redaction_use_case: ExportDataRedactionUseCase, json_options: JSONOptions, docs: list[dict]
+) -> tuple[list[str], int | None]:
+    """Encode and redact a chunk of documents, returning them with the minimum transformed id"""
+    redacted_docs = [data_redaction_use_case.redact_mongodb_doc(dumps(doc, json_options=json_options)) for doc in docs]
+    return redacted_docs, data_redaction_use_case.objectid_replacement_min_int
+
+
+def _restore_import_chunk(
+    data_redaction_use_case: ImportDataRedactionUseCase, json_options: JSONOptions, bson_docs: list[str]
+) -> list[dict]:
+    """Restore and decode a chunk of documents"""
+    return [
+        loads(data_redaction_use_case.restore_mongodb_doc(bson_doc), json_options=json_options)
+        for bson_doc in bson_docs
+    ]
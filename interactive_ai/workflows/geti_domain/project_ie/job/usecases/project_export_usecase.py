@@ -4,18 +4,22 @@
 This module implements the project export usecase.
 """
 
+import itertools
 import logging
 import os
 import tempfile
+import time
 import uuid
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timezone
-from functools import partial
 
 from bson.binary import UuidRepresentation
-from bson.json_util import DatetimeRepresentation, JSONOptions, dumps
+from bson.json_util import DatetimeRepresentation, JSONOptions
 from geti_types import CTX_SESSION_VAR, ID, ProjectIdentifier, Session
 from iai_core.repos.base import SessionBasedRepo
+from iai_core.repos.storage.storage_client import BinaryObjectType
 from iai_core.utils.iteration import multi_map
 from iai_core.versioning import DataVersion
 from jobs_common.tasks.utils.progress import publish_metadata_update
@@ -31,6 +35,12 @@ from job.utils.file_utils import read_file_in_chunks
 
 logger = logging.getLogger(__name__)
 
+# Number of threads downloading and redacting the binary objects to export
+PROJECT_EXPORT_WORKERS = int(os.environ.get("PROJECT_EXPORT_WORKERS", 8))
+# Maximum number of binary objects downloaded ahead of the archive writer, bounding the local disk usage
+PROJECT_EXPORT_MAX_PENDING_OBJECTS = int(os.environ.get("PROJECT_EXPORT_MAX_PENDING_OBJECTS", 32))
+PROGRESS_REPORT_INTERVAL_SECONDS = 5
+
 
 class ProjectExportUseCase:
     """The ProjectExportUseCase coordinates the main operations for the export process"""
@@ -39,6 +49,91 @@ class ProjectExportUseCase:
     COLLECTIONS_FOR_EVALUATION_RESULTS = ["model_test_result", "evaluation_result"]
     COLLECTIONS_WITH_LOCKS = ["project"]
 
+    @staticmethod
+    def __export_binaries(
+        binary_storage_repo: BinaryStorageRepo,
+        data_redaction_use_case: ExportDataRedactionUseCase,
+        zip_archive: ProjectZipArchive,
+        tmp_folder: str,
+        progress_callback: Callable[[float, str], None],
+    ) -> None:
+        """
+        Download the binary objects of the project, redact them and add them to the zip archive.
+
+        Objects are downloaded and redacted by a pool of workers, while the calling thread writes the finished ones
+        to the archive in order. At most PROJECT_EXPORT_MAX_PENDING_OBJECTS objects are downloaded ahead of the
+        writer, which bounds the local disk usage.
+
+        :param binary_storage_repo: Repo of the binary objects of the project
+        :param data_redaction_use_case: Use case to redact the files and their paths
+        :param zip_archive: Archive to add the objects to
+        :param tmp_folder: Temporary local folder where the objects are downloaded
+        :param progress_callback: callback function to report progress, between 50 and 75
+        """
+
+        def download_and_redact(object_type: BinaryObjectType, object_name: str) -> tuple[str, str, int]:
+            local_path = binary_storage_repo.download_object(
+                object_type=object_type,
+                object_name_from_project_root=object_name,
+                target_folder=os.path.join(tmp_folder, "binaries", object_type.name.lower()),
+            )
+            size = os.path.getsize(local_path)
+            return (
+                data_redaction_use_case.replace_objectid_in_file(local_path),  # redact the file
+                data_redaction_use_case.replace_objectid_in_url(object_name),  # redact the path
+                size,
+            )
+
+        objects_to_export = [
+            (object_type, object_name)
+            for object_type in binary_storage_repo.get_object_types()
+            for object_name in binary_storage_repo.get_object_names_by_type(object_type=object_type)
+        ]
+        start_time = last_report_time = time.monotonic()
+        exported_bytes = 0
+        pending: deque[tuple[BinaryObjectType, Future[tuple[str, str, int]]]] = deque()
+        objects_iter = iter(objects_to_export)
+        with ThreadPoolExecutor(max_workers=PROJECT_EXPORT_WORKERS, thread_name_prefix="export_download") as pool:
+            try:
+                for object_type, object_name in itertools.islice(objects_iter, PROJECT_EXPORT_MAX_PENDING_OBJECTS):
+                    pending.append((object_type, pool.submit(download_and_redact, object_type, object_name)))
+                exported_count = 0
+                while pending:
+                    object_type, future = pending.popleft()
+                    local_path, redacted_object_name, size = future.result()
+                    zip_archive.add_object(
+                        object_type=object_type,
+                        local_object_path=local_path,
+                        remote_object_path_from_project_root=redacted_object_name,
+                    )
+                    os.remove(local_path)
+                    exported_count += 1
+                    exported_bytes += size
+                    # Replace the written object with the next one to download
+                    for next_object_type, next_object_name in itertools.islice(objects_iter, 1):
+                        pending.append(
+                            (next_object_type, pool.submit(download_and_redact, next_object_type, next_object_name))
+                        )
+                    now = time.monotonic()
+                    if now - last_report_time >= PROGRESS_REPORT_INTERVAL_SECONDS:
+                        last_report_time = now
+                        throughput_mb_s = exported_bytes / (now - start_time) / (1024 * 1024)
+                        progress_callback(
+                            50 + 25 * exported_count / len(objects_to_export),
+                            f"Exporting project binary files ({exported_count}/{len(objects_to_export)}, "
+                            f"{throughput_mb_s:.1f} MB/s)",
+                        )
+            except Exception:
+                for _, future in pending:
+                    future.cancel()
+                raise
+        logger.info(
+            "Exported %d binary objects (%d bytes) in %.1f seconds",
+            len(objects_to_export),
+            exported_bytes,
+            time.monotonic() - start_time,
+        )
+
     @classmethod
     def __export_as_zip(
         cls,
@@ -98,16 +193,15 @@ class ProjectExportUseCase:
                     if collection_name in ProjectExportUseCase.COLLECTIONS_WITH_MEDIA_BASED_ID
                     else []
                 )
-                redacted_docs = multi_map(
-                    db_raw_documents,
-                    data_redaction_use_case.remove_container_info_in_mongodb_doc,
-                    data_redaction_use_case.remove_job_id_in_mongodb_doc,
-                    *lock_redaction,
-                    *media_based_id_redaction,
-                    partial(dumps, json_options=json_options),
-                    data_redaction_use_case.replace_objectid_in_mongodb_doc,
-                    data_redaction_use_case.replace_objectid_based_binary_filename_in_mongodb_doc,
-                    data_redaction_use_case.mask_user_info_in_mongodb_doc,
+                redacted_docs = data_redaction_use_case.redact_mongodb_docs(
+                    multi_map(
+                        db_raw_documents,
+                        data_redaction_use_case.remove_container_info_in_mongodb_doc,
+                        data_redaction_use_case.remove_job_id_in_mongodb_doc,
+                        *lock_redaction,
+                        *media_based_id_redaction,
+                    ),
+                    json_options=json_options,
                 )
                 # Note: 'db_raw_documents' and 'redacted_docs' are generators, piped and lazily evaluated,
                 # so any error raised while fetching/redacting documents is actually thrown in the next write stage
@@ -123,21 +217,13 @@ class ProjectExportUseCase:
             progress_callback(50, "Exporting project binary files")
             # Fetch binary objects from S3, adjust their paths and finally add them to the zip archive
             logger.info("Exporting binary objects from S3 storage for project '%s'", project_id)
-            for object_type in binary_storage_repo.get_object_types():
-                objects_local_and_remote_paths = binary_storage_repo.get_all_objects_by_type(
-                    object_type=object_type, target_folder=tmp_folder
-                )
-                redacted_objects_paths = (
-                    (
-                        data_redaction_use_case.replace_objectid_in_file(lp),  # redact the file
-                        data_redaction_use_case.replace_objectid_in_url(rp),  # redact the path
-                    )
-                    for lp, rp in objects_local_and_remote_paths
-                )
-                zip_archive.add_objects_by_type(
-                    object_type=object_type,
-                    local_and_remote_paths=redacted_objects_paths,
-                )
+            cls.__export_binaries(
+                binary_storage_repo=binary_storage_repo,
+                data_redaction_use_case=data_redaction_use_case,
+                zip_archive=zip_archive,
+                tmp_folder=tmp_folder,
+                progress_callback=progress_callback,
+            )
 
             # Add the manifest
             logger.info("Adding manifest to the archive of exported project '%s'", project_id)
@@ -4,14 +4,18 @@
 This module implements the project import usecase.
 """
 
+import itertools
 import logging
 import os
 import tempfile
+import time
 import uuid
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timezone
 from functools import partial
+from zipfile import ZipInfo
 
 from bson.binary import UuidRepresentation
 from bson.json_util import DatetimeRepresentation, JSONOptions, loads
@@ -44,6 +48,14 @@ from job.utils.model_registration_utils import ModelMapper, ProjectMapper
 
 logger = logging.getLogger(__name__)
 
+# Number of threads uploading the binary objects of the imported project
+PROJECT_IMPORT_WORKERS = int(os.environ.get("PROJECT_IMPORT_WORKERS", 8))
+# Maximum number of binary objects being uploaded at the same time, bounding memory and local disk usage
+PROJECT_IMPORT_MAX_PENDING_OBJECTS = int(os.environ.get("PROJECT_IMPORT_MAX_PENDING_OBJECTS", 32))
+# Number of threads inserting the documents of different collections to the DB
+PROJECT_IMPORT_COLLECTION_WORKERS = int(os.environ.get("PROJECT_IMPORT_COLLECTION_WORKERS", 4))
+PROGRESS_REPORT_INTERVAL_SECONDS = 5
+
 
 class ProjectImportUseCase:
     """
@@ -251,6 +263,25 @@ class ProjectImportUseCase:
         :param json_options: json options for loading documents
         """
         document_repo = DocumentRepo(project_identifier)
+
+        def store_collection(collection_name: str) -> None:
+            documents_from_zip = zip_archive.get_documents_by_collection(collection_name=collection_name)
+            media_based_id_redaction: list[Callable] = (
+                [data_redaction_use_case.recreate_media_based_objectid_in_mongodb_doc]
+                if collection_name in ProjectImportUseCase.COLLECTIONS_WITH_MEDIA_BASED_ID
+                else []
+            )
+            document_reductions: list[Callable] = []
+            if not self.keep_original_dates:
+                document_reductions.append(data_redaction_use_case.update_creation_time_in_mongodb_doc)
+            restored_docs = multi_map(
+                data_redaction_use_case.restore_mongodb_docs(documents_from_zip, json_options=json_options),
+                *document_reductions,
+                *media_based_id_redaction,
+            )
+            document_repo.insert_documents_to_db_collection(collection_name=collection_name, documents=restored_docs)
+
+        collection_names = []
         for collection_name in zip_archive.get_collection_names():
             if collection_name in DocumentRepo.BLACKLISTED_COLLECTIONS:
                 logger.warning(
@@ -265,22 +296,102 @@ class ProjectImportUseCase:
                     documents=[project_document],
                 )
                 continue
-            documents_from_zip = zip_archive.get_documents_by_collection(collection_name=collection_name)
-            media_based_id_redaction: list[Callable] = (
-                [data_redaction_use_case.recreate_media_based_objectid_in_mongodb_doc]
-                if collection_name in ProjectImportUseCase.COLLECTIONS_WITH_MEDIA_BASED_ID
-                else []
+            collection_names.append(collection_name)
+
+        # The collections are independent of each other, so they can be decoded and inserted concurrently
+        with ThreadPoolExecutor(
+            max_workers=PROJECT_IMPORT_COLLECTION_WORKERS, thread_name_prefix="import_collection"
+        ) as executor:
+            futures = [executor.submit(store_collection, collection_name) for collection_name in collection_names]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _store_all_objects(
+        zip_archive: ProjectZipArchive,
+        binary_storage_repo: BinaryStorageRepo,
+        data_redaction_use_case: ImportDataRedactionUseCase,
+        tmp_folder: str,
+        progress_callback: Callable[[float, str], None],
+    ) -> None:
+        """
+        Upload the binary objects of the project archive to the object storage.
+
+        The objects are streamed directly from the archive to the storage by a pool of workers, without any local
+        copy; only the objects whose content must be redacted (model XML, label schemas, ...) are extracted first,
+        which is fine since these files are small. At most PROJECT_IMPORT_MAX_PENDING_OBJECTS objects are uploaded
+        at the same time.
+
+        :param zip_archive: Archive to read the objects from
+        :param binary_storage_repo: Repo where to store the objects
+        :param data_redaction_use_case: Use case to redact the files and their paths
+        :param tmp_folder: Temporary local folder where the objects to redact are extracted
+        :param progress_callback: callback function to report progress, between 50 and 75
+        """
+
+        def store_object(object_type: BinaryObjectType, zip_info: ZipInfo, object_name: str) -> int:
+            redacted_object_name = data_redaction_use_case.recreate_objectid_in_url(
+                ImportDataRedactionUseCase.sanitize_extension(object_name)
             )
-            document_reductions: list[Callable] = [
-                data_redaction_use_case.update_user_info_in_mongodb_doc,
-                data_redaction_use_case.recreate_objectid_based_binary_filename_in_mongodb_doc,
-                data_redaction_use_case.recreate_objectid_in_mongodb_doc,
-                partial(loads, json_options=json_options),
-            ]
-            if not self.keep_original_dates:
-                document_reductions.append(data_redaction_use_case.update_creation_time_in_mongodb_doc)
-            restored_docs = multi_map(documents_from_zip, *document_reductions, *media_based_id_redaction)
-            document_repo.insert_documents_to_db_collection(collection_name=collection_name, documents=restored_docs)
+            if ImportDataRedactionUseCase.is_file_content_redacted(os.path.basename(zip_info.filename)):
+                local_path = zip_archive.extract_object(zip_info=zip_info, target_folder=tmp_folder)
+                try:
+                    binary_storage_repo.store_object(
+                        object_type=object_type,
+                        local_path=data_redaction_use_case.recreate_objectid_in_file(local_path),
+                        object_name_from_project_root=redacted_object_name,
+                    )
+                finally:
+                    os.remove(local_path)
+            else:
+                with zip_archive.open_object(zip_info=zip_info) as data:
+                    binary_storage_repo.store_object_from_stream(
+                        object_type=object_type,
+                        data=data,
+                        length=zip_info.file_size,
+                        object_name_from_project_root=redacted_object_name,
+                    )
+            return zip_info.file_size
+
+        objects_to_import = [
+            (object_type, zip_info, object_name)
+            for object_type in BinaryStorageRepo.get_object_types()
+            for zip_info, object_name in zip_archive.get_object_entries_by_type(object_type=object_type)
+        ]
+        start_time = last_report_time = time.monotonic()
+        imported_bytes = 0
+        pending: deque[Future[int]] = deque()
+        objects_iter = iter(objects_to_import)
+        with ThreadPoolExecutor(max_workers=PROJECT_IMPORT_WORKERS, thread_name_prefix="import_upload") as pool:
+            try:
+                for object_to_import in itertools.islice(objects_iter, PROJECT_IMPORT_MAX_PENDING_OBJECTS):
+                    pending.append(pool.submit(store_object, *object_to_import))
+                imported_count = 0
+                while pending:
+                    imported_bytes += pending.popleft().result()
+                    imported_count += 1
+                    # Replace the uploaded object with the next one
+                    for object_to_import in itertools.islice(objects_iter, 1):
+                        pending.append(pool.submit(store_object, *object_to_import))
+                    now = time.monotonic()
+                    if now - last_report_time >= PROGRESS_REPORT_INTERVAL_SECONDS:
+                        last_report_time = now
+                        throughput_mb_s = imported_bytes / (now - start_time) / (1024 * 1024)
+                        progress_callback(
+                            50 + 25 * imported_count / len(objects_to_import),
+                            f"Importing project binary files ({imported_count}/{len(objects_to_import)}, "
+                            f"{throughput_mb_s:.1f} MB/s).",
+                        )
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
+        logger.info(
+            "Imported %d binary objects (%d bytes) in %.1f seconds",
+            len(objects_to_import),
+            imported_bytes,
+            time.monotonic() - start_time,
+        )
 
     @staticmethod
     def _verify_signature(project_archive_path: str, signature: bytes, public_key: PublicKeyBytes) -> None:
@@ -327,7 +438,7 @@ class ProjectImportUseCase:
         elif project_archive_version.major > server_data_version.major:
             raise ImportProjectUnsupportedVersionException(version=project_archive_version.version_string)
 
-    def __import_zip(  # noqa: PLR0915
+    def __import_zip(
         self,
         file_id: ID,
         creator_id: ID,
@@ -441,34 +552,13 @@ class ProjectImportUseCase:
                 workspace_id=session.workspace_id,
                 project_id=project_identifier.project_id,
             )
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-
-                for object_type in BinaryObjectType:
-                    if object_type == BinaryObjectType.UNDEFINED:
-                        continue
-                    objects_local_and_remote_paths = zip_archive.get_objects_by_type(
-                        object_type=object_type,
-                    )
-                    objects_recreated_paths = (
-                        (
-                            data_redaction_use_case.recreate_objectid_in_file(lp),  # redact the file
-                            data_redaction_use_case.recreate_objectid_in_url(
-                                ImportDataRedactionUseCase.sanitize_extension(rp)
-                            ),  # redact the path
-                        )
-                        for lp, rp in objects_local_and_remote_paths
-                    )
-                    futures.append(
-                        executor.submit(
-                            binary_storage_repo.store_objects_by_type,
-                            object_type=object_type,
-                            local_and_remote_paths=objects_recreated_paths,
-                        )
-                    )
-
-                for future in futures:
-                    future.result()
+            ProjectImportUseCase._store_all_objects(
+                zip_archive=zip_archive,
+                binary_storage_repo=binary_storage_repo,
+                data_redaction_use_case=data_redaction_use_case,
+                tmp_folder=tmp_folder,
+                progress_callback=progress_callback,
+            )
 
         # Migrate the documents and objects to the latest version
         self._upgrade_project_data(project_archive_version=DataVersion(manifest.version))
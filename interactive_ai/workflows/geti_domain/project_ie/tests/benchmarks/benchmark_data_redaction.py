@@ -0,0 +1,115 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the redaction of the MongoDB documents on project export.
+
+The benchmark generates documents shaped like annotation scenes and media (ObjectIds, binary filenames, user fields)
+and compares:
+  - the chain of redaction methods, each one applying a separate regex pass to the document
+  - the single pass redaction (ExportDataRedactionUseCase.redact_mongodb_docs), in the calling process
+  - the single pass redaction with a pool of worker processes
+
+Usage:
+    python tests/benchmarks/benchmark_data_redaction.py --num-docs 200000 --processes 4
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+
+from bson import ObjectId, UuidRepresentation
+from bson.json_util import DatetimeRepresentation, JSONOptions, dumps
+from iai_core.utils.iteration import multi_map
+
+from job.usecases import ExportDataRedactionUseCase, data_redaction_usecase
+
+JSON_OPTIONS = JSONOptions(
+    uuid_representation=UuidRepresentation.STANDARD,
+    datetime_representation=DatetimeRepresentation.ISO8601,
+    tz_aware=True,
+    tzinfo=timezone.utc,
+)
+
+
+def make_documents(num_docs: int, num_labels: int = 20) -> list[dict]:
+    """Generate documents with the typical content of annotation scenes and media"""
+    label_ids = [ObjectId() for _ in range(num_labels)]
+    dataset_storage_id = ObjectId()
+    user_id = uuid.uuid4()
+    docs = []
+    for _ in range(num_docs):
+        media_id = ObjectId()
+        docs.append(
+            {
+                "_id": ObjectId(),
+                "dataset_storage_id": dataset_storage_id,
+                "media_identifier": {"type": "image", "media_id": media_id},
+                "binary_filename": f"{media_id}.jpg",
+                "creation_date": datetime.now(tz=timezone.utc),
+                "editor_name": user_id,
+                "user_id": str(user_id),
+                "annotations": [
+                    {
+                        "_id": ObjectId(),
+                        "shape": {"type": "RECTANGLE", "x1": random.random(), "y1": random.random()},
+                        "labels": [{"label_id": random.choice(label_ids), "probability": 1.0}],
+                    }
+                    for _ in range(random.randint(1, 10))
+                ],
+            }
+        )
+    return docs
+
+
+def redact_with_chain(data_redaction_use_case: ExportDataRedactionUseCase, docs: list[dict]) -> list[str]:
+    return list(
+        multi_map(
+            docs,
+            partial(dumps, json_options=JSON_OPTIONS),
+            data_redaction_use_case.replace_objectid_in_mongodb_doc,
+            data_redaction_use_case.replace_objectid_based_binary_filename_in_mongodb_doc,
+            data_redaction_use_case.mask_user_info_in_mongodb_doc,
+        )
+    )
+
+
+def redact_in_single_pass(data_redaction_use_case: ExportDataRedactionUseCase, docs: list[dict]) -> list[str]:
+    return list(data_redaction_use_case.redact_mongodb_docs(docs, json_options=JSON_OPTIONS))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-docs", type=int, default=200_000, help="Number of documents to redact")
+    parser.add_argument("--processes", type=int, default=4, help="Number of worker processes")
+    args = parser.parse_args()
+
+    docs = make_documents(num_docs=args.num_docs)
+    print(f"Generated {len(docs)} documents")
+
+    baseline_use_case = ExportDataRedactionUseCase()
+    expected_docs: list[str] = []
+    for name, redact_fn, processes in (
+        ("regex chain", redact_with_chain, 0),
+        ("single pass", redact_in_single_pass, 0),
+        (f"single pass ({args.processes} processes)", redact_in_single_pass, args.processes),
+    ):
+        data_redaction_use_case = ExportDataRedactionUseCase()
+        # Use the same base ObjectId to compare the outputs
+        data_redaction_use_case.objectid_replacement_base_oid = baseline_use_case.objectid_replacement_base_oid
+        data_redaction_use_case.objectid_replacement_base_int = baseline_use_case.objectid_replacement_base_int
+        data_redaction_usecase.DOCUMENT_REDACTION_PROCESSES = processes
+        start_time = time.perf_counter()
+        redacted_docs = redact_fn(data_redaction_use_case, docs)
+        elapsed = time.perf_counter() - start_time
+        if not expected_docs:
+            expected_docs = redacted_docs
+        elif redacted_docs != expected_docs:
+            raise RuntimeError(f"The output of '{name}' differs from the regex chain")
+        print(f"{name:>32}: {elapsed:7.2f} s, {len(docs) / elapsed:10.0f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
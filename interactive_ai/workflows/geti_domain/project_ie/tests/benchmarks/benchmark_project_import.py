@@ -0,0 +1,161 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Benchmark of the upload of the binary objects on project import.
+
+The benchmark builds a synthetic project archive containing media files, then imports its binaries to a local folder
+acting as object storage, comparing:
+  - the sequential extraction, where each object is extracted to a temporary file before being uploaded
+  - the streamed import (ProjectImportUseCase._store_all_objects), where the objects are uploaded concurrently
+    straight from the archive
+
+The storage can simulate the per-object latency of a remote storage with '--latency-ms'.
+
+Usage:
+    python tests/benchmarks/benchmark_project_import.py --size-gb 2 --object-size-mb 8 --latency-ms 20
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from functools import partial
+from typing import BinaryIO
+from zipfile import ZIP_STORED, ZipFile
+
+from bson import ObjectId
+from iai_core.repos.storage.storage_client import BinaryObjectType
+
+from job.entities import ProjectZipArchive
+from job.repos import BinaryStorageRepo
+from job.usecases import ImportDataRedactionUseCase, ProjectImportUseCase
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class LocalFolderStorageClient:
+    """Minimal replacement of the Minio client storing the objects in a local folder"""
+
+    def __init__(self, root_folder: str, latency_ms: float) -> None:
+        self.root_folder = root_folder
+        self.latency_s = latency_ms / 1000
+
+    def _object_path(self, bucket_name: str, object_name: str) -> str:
+        object_path = os.path.join(self.root_folder, bucket_name, object_name)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        return object_path
+
+    def fput_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        time.sleep(self.latency_s)
+        shutil.copyfile(file_path, self._object_path(bucket_name, object_name))
+
+    def put_object(self, bucket_name: str, object_name: str, data: BinaryIO, length: int) -> None:
+        time.sleep(self.latency_s)
+        with open(self._object_path(bucket_name, object_name), "wb") as object_file:
+            shutil.copyfileobj(data, object_file, CHUNK_SIZE)
+
+
+def make_synthetic_archive(archive_path: str, size_gb: float, object_size_mb: float) -> int:
+    """Create a project archive with random media files, returning the number of objects"""
+    object_size = int(object_size_mb * 1024 * 1024)
+    num_objects = max(1, int(size_gb * 1024 / object_size_mb))
+    dataset_storage_id = str(ObjectId())
+    chunk = os.urandom(CHUNK_SIZE)
+    with ZipFile(archive_path, "w", compression=ZIP_STORED) as zip_file:
+        for _ in range(num_objects):
+            zip_path = os.path.join(
+                ProjectZipArchive.BINARIES_FOLDER,
+                BinaryObjectType.IMAGES.name.lower(),
+                "dataset_storages",
+                dataset_storage_id,
+                f"{ObjectId()}.jpg",
+            )
+            with zip_file.open(zip_path, mode="w", force_zip64=True) as object_file:
+                for offset in range(0, object_size, CHUNK_SIZE):
+                    object_file.write(chunk[: min(CHUNK_SIZE, object_size - offset)])
+    return num_objects
+
+
+def make_binary_storage_repo(root_folder: str, latency_ms: float) -> BinaryStorageRepo:
+    """Create a binary storage repo backed by a local folder instead of S3"""
+    binary_storage_repo = BinaryStorageRepo.__new__(BinaryStorageRepo)
+    binary_storage_repo.s3_project_root = os.path.join("organizations", "workspaces", "projects", str(uuid.uuid4()))
+    binary_storage_repo.minio_client = LocalFolderStorageClient(  # type: ignore[assignment]
+        root_folder=root_folder, latency_ms=latency_ms
+    )
+    return binary_storage_repo
+
+
+def import_sequentially(
+    zip_archive: ProjectZipArchive,
+    binary_storage_repo: BinaryStorageRepo,
+    data_redaction_use_case: ImportDataRedactionUseCase,
+) -> None:
+    """Import the binaries by extracting each object to a temporary file before uploading it"""
+    for object_type in BinaryStorageRepo.get_object_types():
+        binary_storage_repo.store_objects_by_type(
+            object_type=object_type,
+            local_and_remote_paths=(
+                (
+                    data_redaction_use_case.recreate_objectid_in_file(local_path),
+                    data_redaction_use_case.recreate_objectid_in_url(
+                        ImportDataRedactionUseCase.sanitize_extension(remote_path)
+                    ),
+                )
+                for local_path, remote_path in zip_archive.get_objects_by_type(object_type=object_type)
+            ),
+        )
+
+
+def import_streamed(
+    zip_archive: ProjectZipArchive,
+    binary_storage_repo: BinaryStorageRepo,
+    data_redaction_use_case: ImportDataRedactionUseCase,
+    tmp_folder: str,
+) -> None:
+    """Import the binaries by streaming them concurrently from the archive to the storage"""
+    ProjectImportUseCase._store_all_objects(
+        zip_archive=zip_archive,
+        binary_storage_repo=binary_storage_repo,
+        data_redaction_use_case=data_redaction_use_case,
+        tmp_folder=tmp_folder,
+        progress_callback=lambda progress, message: None,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-gb", type=float, default=2.0, help="Total size of the synthetic media")
+    parser.add_argument("--object-size-mb", type=float, default=8.0, help="Size of each media file")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency of each upload")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        archive_path = os.path.join(tmp_folder, "project.zip")
+        num_objects = make_synthetic_archive(
+            archive_path=archive_path, size_gb=args.size_gb, object_size_mb=args.object_size_mb
+        )
+        total_mb = os.path.getsize(archive_path) / (1024 * 1024)
+        print(f"Synthetic archive: {num_objects} objects, {total_mb:.0f} MB")
+
+        data_redaction_use_case = ImportDataRedactionUseCase(
+            objectid_replacement_min_int=0, user_replacement_new_id=uuid.uuid4()
+        )
+        with ProjectZipArchive(zip_file_path=archive_path, readonly=True) as zip_archive:
+            for name, import_fn in (
+                ("sequential extraction", import_sequentially),
+                ("streamed import", partial(import_streamed, tmp_folder=tmp_folder)),
+            ):
+                storage_folder = os.path.join(tmp_folder, "storage")
+                binary_storage_repo = make_binary_storage_repo(root_folder=storage_folder, latency_ms=args.latency_ms)
+                start_time = time.perf_counter()
+                import_fn(zip_archive, binary_storage_repo, data_redaction_use_case)
+                elapsed = time.perf_counter() - start_time
+                print(f"{name:>24}: {elapsed:7.2f} s, {total_mb / elapsed:8.1f} MB/s")
+                shutil.rmtree(storage_folder)
+
+
+if __name__ == "__main__":
+    main()
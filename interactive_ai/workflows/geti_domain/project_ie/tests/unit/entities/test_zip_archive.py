@@ -187,6 +187,18 @@ class TestZipArchive:
                 )
         assert num_found_objects == 1
 
+    def test_open_object(self, fxt_project_archive_file_path) -> None:
+        with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path, readonly=True) as zip_archive:
+            entries = list(zip_archive.get_object_entries_by_type(BinaryObjectType.IMAGES))
+            assert len(entries) == 1
+            zip_info, obj_remote_rel_path = entries[0]
+            with zip_archive.open_object(zip_info=zip_info) as obj_fp:
+                obj_data = obj_fp.read()
+
+        assert obj_data == b"binary_data"
+        assert zip_info.file_size == len(obj_data)
+        assert obj_remote_rel_path == DUMMY_BINARY_NAME_1.removeprefix(f"{BinaryObjectType.IMAGES.name.lower()}/")
+
     def test_add_objects_by_type(self, fxt_project_archive_file_path) -> None:
         # Arrange: create a few binary objects
         local_and_remote_paths: list[tuple[str, str]] = []
@@ -220,3 +232,31 @@ class TestZipArchive:
                         assert obj_fp.read() == b"video_data"
                     assert obj_remote_rel_path in remote_paths
             assert num_found_objs == len(video_names)
+
+    def test_add_object_compression(self, fxt_project_archive_file_path) -> None:
+        # Arrange: create a model configuration and model weights
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, "model.xml")
+            weights_path = os.path.join(tmp_dir, "model.bin")
+            with open(config_path, "w") as config_file:
+                config_file.write("<net>" * 100)
+            with open(weights_path, "wb") as weights_file:
+                weights_file.write(b"\x00" * 500)
+
+            # Act
+            with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path) as zip_archive:
+                for local_path in (config_path, weights_path):
+                    zip_archive.add_object(
+                        object_type=BinaryObjectType.MODELS,
+                        local_object_path=local_path,
+                        remote_object_path_from_project_root=f"models/123/{os.path.basename(local_path)}",
+                    )
+
+        # Assert: only the text file is deflated
+        with zipfile.ZipFile(fxt_project_archive_file_path) as zip_file:
+            compress_types = {
+                os.path.basename(info.filename): info.compress_type
+                for info in zip_file.infolist()
+                if info.filename.startswith(f"{ProjectZipArchive.BINARIES_FOLDER}/models/")
+            }
+        assert compress_types == {"model.xml": zipfile.ZIP_DEFLATED, "model.bin": zipfile.ZIP_STORED}
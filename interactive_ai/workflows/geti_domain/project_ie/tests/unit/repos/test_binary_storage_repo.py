@@ -1,5 +1,6 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import io
 import os
 from unittest.mock import ANY, MagicMock, patch
 
@@ -250,6 +251,43 @@ class TestBinaryStorageRepo:
                 file_path=local_path,
             )
 
+    def test_store_object_from_stream(self, request: FixtureRequest, fxt_ote_id) -> None:
+        # Arrange
+        self.__set_env_variables(request=request)
+        organization_id = fxt_ote_id(0)
+        workspace_id = fxt_ote_id(1)
+        project_id = fxt_ote_id(2)
+        project_root = f"organizations/{str(organization_id)}/workspaces/{str(workspace_id)}/projects/{str(project_id)}"
+        object_name_from_project_root = f"dataset_storages/{str(fxt_ote_id(3))}/foo.jpg"
+        data = io.BytesIO(b"image_data")
+
+        with (
+            patch("boto3.client", return_value=None),
+            patch.object(Minio, "__init__", return_value=None),
+            patch.object(Minio, "put_object", return_value=None) as mock_put_object,
+        ):
+            storage_repo = BinaryStorageRepo(
+                organization_id=organization_id,
+                workspace_id=workspace_id,
+                project_id=project_id,
+            )
+
+            # Act
+            storage_repo.store_object_from_stream(
+                object_type=BinaryObjectType.IMAGES,
+                data=data,
+                length=10,
+                object_name_from_project_root=object_name_from_project_root,
+            )
+
+        # Assert
+        mock_put_object.assert_called_once_with(
+            bucket_name=BinaryObjectType.IMAGES.bucket_name(),
+            object_name=f"{project_root}/{object_name_from_project_root}",
+            data=data,
+            length=10,
+        )
+
     def test_delete_all_objects_by_type(self, request: FixtureRequest, fxt_ote_id) -> None:
         # Arrange
         self.__set_env_variables(request=request)
@@ -2,6 +2,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import json
 import os
+import pickle
 import re
 import tempfile
 import uuid
@@ -41,6 +42,12 @@ class TestBaseDataRedactionUseCase:
             "reference_features_0d032323-336c-4881-be5c.json"
         )
 
+    def test_is_file_content_redacted(self) -> None:
+        assert not BaseDataRedactionUseCase.is_file_content_redacted("659bb180c7d3a5f9a02be30b.mp4")
+        assert not BaseDataRedactionUseCase.is_file_content_redacted("model_fp16_non-xai_8619c552-5c5d-4095-9012.bin")
+        assert BaseDataRedactionUseCase.is_file_content_redacted("model_fp16_non-xai_8619c552-5c5d-4095-9012.xml")
+        assert BaseDataRedactionUseCase.is_file_content_redacted("label_schema_0d032323-336c-4881-be5c.json")
+
 
 @pytest.mark.ProjectIEMsComponent
 class TestExportDataRedactionUseCase:
@@ -465,6 +472,61 @@ class TestExportDataRedactionUseCase:
         assert out_doc["_id"] == doc["_id"]
         assert out_doc["some_id"] == doc["some_id"]
 
+    def test_redact_mongodb_doc(self, fxt_mongo_id) -> None:
+        sequential_redaction_use_case = ExportDataRedactionUseCase()
+        data_redaction_use_case = ExportDataRedactionUseCase()
+        data_redaction_use_case.objectid_replacement_base_oid = (
+            sequential_redaction_use_case.objectid_replacement_base_oid
+        )
+        data_redaction_use_case.objectid_replacement_base_int = (
+            sequential_redaction_use_case.objectid_replacement_base_int
+        )
+        doc = {
+            "_id": ObjectId(fxt_mongo_id(2)),
+            "binary_filename": f"{fxt_mongo_id(2)}.jpg",
+            "user_id": "1234",
+            "author": uuid.uuid4(),
+            "creator_name": "$oid",
+            "labels": [{"id": ObjectId(fxt_mongo_id(1)), "name": 'tricky "$oid": "label"'}],
+        }
+        bson_doc = dumps(doc, json_options=JSONOptions(uuid_representation=UuidRepresentation.STANDARD))
+
+        out_bson_doc = data_redaction_use_case.redact_mongodb_doc(bson_doc)
+
+        assert out_bson_doc == sequential_redaction_use_case.mask_user_info_in_mongodb_doc(
+            sequential_redaction_use_case.replace_objectid_based_binary_filename_in_mongodb_doc(
+                sequential_redaction_use_case.replace_objectid_in_mongodb_doc(bson_doc)
+            )
+        )
+        assert (
+            data_redaction_use_case.objectid_replacement_min_int
+            == sequential_redaction_use_case.objectid_replacement_min_int
+        )
+
+    def test_redact_mongodb_docs(self, fxt_mongo_id) -> None:
+        data_redaction_use_case = ExportDataRedactionUseCase()
+        docs = [{"_id": ObjectId(fxt_mongo_id(i)), "user_id": "1234"} for i in range(1, 6)]
+        json_options = JSONOptions(uuid_representation=UuidRepresentation.STANDARD)
+
+        with patch("job.usecases.data_redaction_usecase.DOCUMENT_REDACTION_CHUNK_SIZE", 2):
+            out_bson_docs = list(data_redaction_use_case.redact_mongodb_docs(docs, json_options=json_options))
+
+        assert out_bson_docs == [
+            data_redaction_use_case.redact_mongodb_doc(dumps(doc, json_options=json_options)) for doc in docs
+        ]
+        assert data_redaction_use_case.objectid_replacement_min_int == int(loads(out_bson_docs[0])["_id"]["$sid"], 16)
+
+    def test_pickle(self, fxt_mongo_id) -> None:
+        # The use case is sent to the redaction worker processes
+        data_redaction_use_case = ExportDataRedactionUseCase()
+        data_redaction_use_case.replace_objectid_in_mongodb_doc(dumps({"_id": ObjectId(fxt_mongo_id(1))}))
+
+        unpickled_use_case = pickle.loads(pickle.dumps(data_redaction_use_case))
+
+        assert unpickled_use_case.objectid_replacement_base_int == data_redaction_use_case.objectid_replacement_base_int
+        assert unpickled_use_case.objectid_replacement_min_int == data_redaction_use_case.objectid_replacement_min_int
+        unpickled_use_case.replace_objectid_in_mongodb_doc(dumps({"_id": ObjectId(fxt_mongo_id(2))}))
+
     def test_remove_container_info_in_mongodb_doc(self) -> None:
         data_redaction_use_case = ExportDataRedactionUseCase()
         doc = {
@@ -506,6 +568,35 @@ class TestImportDataRedactionUseCase:
         assert isinstance(out_doc["some_id"], ObjectId)
         assert int(str(out_doc["some_id"]), 16) - int(str(out_doc["_id"]), 16) == 1
 
+    def test_restore_mongodb_doc(self) -> None:
+        user_id = uuid.uuid4()
+        sequential_redaction_use_case = ImportDataRedactionUseCase(
+            objectid_replacement_min_int=0, user_replacement_new_id=user_id
+        )
+        data_redaction_use_case = ImportDataRedactionUseCase(
+            objectid_replacement_min_int=0, user_replacement_new_id=user_id
+        )
+        data_redaction_use_case.objectid_replacement_seed_int = (
+            sequential_redaction_use_case.objectid_replacement_seed_int
+        )
+        bson_doc = (
+            '{"_id": {"$sid": "30c98a73d5f1fb7e6e3c1a51"}, "binary_filename": "30c98a73d5f1fb7e6e3c1a51.jpg", '
+            '"user_id": "$user_id_str", "author": "$user_id_uuid4", "some_id": {"$sid": "30c98a73d5f1fb7e6e3c1a52"}}'
+        )
+
+        out_bson_doc = data_redaction_use_case.restore_mongodb_doc(bson_doc)
+
+        assert out_bson_doc == sequential_redaction_use_case.recreate_objectid_in_mongodb_doc(
+            sequential_redaction_use_case.recreate_objectid_based_binary_filename_in_mongodb_doc(
+                sequential_redaction_use_case.update_user_info_in_mongodb_doc(bson_doc)
+            )
+        )
+        json_options = JSONOptions(uuid_representation=UuidRepresentation.STANDARD)
+        out_doc = loads(out_bson_doc, json_options=json_options)
+        assert out_doc["binary_filename"] == f"{str(out_doc['_id'])}.jpg"
+        assert out_doc["user_id"] == str(user_id)
+        assert out_doc["author"] == user_id
+
     def test_recreate_media_based_objectid_in_mongodb_doc(self, fxt_ote_id) -> None:
         data_redaction_use_case = ImportDataRedactionUseCase()
         media_identifier_doc = {
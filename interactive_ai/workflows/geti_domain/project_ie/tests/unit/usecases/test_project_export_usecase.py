@@ -23,6 +23,14 @@ def identity_map(self, x):
     return x
 
 
+def mocked_download_object(self, object_type, object_name_from_project_root: str, target_folder: str) -> str:
+    local_path = os.path.join(target_folder, object_name_from_project_root)
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    with open(local_path, "wb") as f:
+        f.write(b"dummy_binary_data")
+    return local_path
+
+
 @pytest.mark.JobsComponent
 class TestProjectExportUseCase:
     def test_export_as_zip(self, request, fxt_ote_id) -> None:
@@ -50,11 +58,8 @@ class TestProjectExportUseCase:
         mocks = [
             patch.object(SessionBasedRepo, "generate_id", return_value=export_id),
             patch.object(BinaryStorageRepo, "__init__", new=do_nothing),
-            patch.object(
-                BinaryStorageRepo,
-                "get_all_objects_by_type",
-                return_value=[("local_path_1", "remote_path_1")],
-            ),
+            patch.object(BinaryStorageRepo, "get_object_names_by_type", return_value=["remote_path_1"]),
+            patch.object(BinaryStorageRepo, "download_object", new=mocked_download_object),
             patch.object(ZipStorageRepo, "__init__", new=do_nothing),
             patch.object(
                 ZipStorageRepo,
@@ -92,6 +97,7 @@ class TestProjectExportUseCase:
                 "replace_objectid_based_binary_filename_in_mongodb_doc",
                 new=identity_map,
             ),
+            patch.object(ExportDataRedactionUseCase, "redact_mongodb_doc", new=identity_map),
             patch.object(ExportDataRedactionUseCase, "replace_objectid_in_url", new=identity_map),
             patch.object(ExportDataRedactionUseCase, "replace_objectid_in_file", new=identity_map),
             patch.object(
@@ -113,7 +119,7 @@ class TestProjectExportUseCase:
         with (
             contextlib.ExitStack() as stack,
             patch.object(ProjectZipArchive, "add_collection_with_documents") as mock_add_collection,
-            patch.object(ProjectZipArchive, "add_objects_by_type") as mock_add_objects,
+            patch.object(ProjectZipArchive, "add_object") as mock_add_object,
             patch.object(ProjectZipArchive, "add_manifest") as mock_add_manifest,
             patch.object(ProjectZipArchiveWrapper, "add_signature") as mock_add_signature,
             patch.object(ProjectZipArchiveWrapper, "add_public_key") as mock_add_public_key,
@@ -129,7 +135,7 @@ class TestProjectExportUseCase:
 
         request.addfinalizer(lambda: os.remove(exported_zip_path))
         mock_add_collection.assert_called_once_with(collection_name="collection_1", documents=ANY)
-        mock_add_objects.assert_called()
+        assert mock_add_object.call_count == len(BinaryStorageRepo.get_object_types())
         mock_get_version.assert_called_once_with()
         mock_add_manifest.assert_called_once_with(version="1.0", min_id=ANY)
         mocked_progress.assert_called()
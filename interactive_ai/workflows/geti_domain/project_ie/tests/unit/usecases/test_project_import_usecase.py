@@ -1,13 +1,14 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import contextlib
+import io
 import os.path
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import ANY, MagicMock, _Call, call, patch
 from uuid import uuid4
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 import pytest
 from geti_spicedb_tools import SpiceDB
@@ -90,6 +91,7 @@ class TestProjectImportUseCase:
                 ImportDataRedactionUseCase, "recreate_objectid_based_binary_filename_in_mongodb_doc", new=identity_map
             ),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_mongodb_doc", new=identity_map),
+            patch.object(ImportDataRedactionUseCase, "restore_mongodb_doc", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_file", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_url", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "update_creation_time_in_mongodb_doc", new=identity_map),
@@ -102,7 +104,12 @@ class TestProjectImportUseCase:
                 "get_documents_by_collection",
                 return_value=[f'{{"_id": {{"$oid": "{str(project_id)}"}}, "name": "bar"}}'],
             ),
-            patch.object(ProjectZipArchive, "get_objects_by_type", return_value=[("local_path_1", "remote_path_1")]),
+            patch.object(
+                ProjectZipArchive,
+                "get_object_entries_by_type",
+                return_value=[(ZipInfo("binaries/images/remote_path_1.jpg"), "remote_path_1.jpg")],
+            ),
+            patch.object(ProjectZipArchive, "open_object", side_effect=lambda zip_info: io.BytesIO(b"data")),
             patch.object(ProjectZipArchive, "close", return_value=None),
             patch.object(ProjectZipArchive, "get_collection_names", return_value=["coll_1", "project", "job"]),
             patch.object(BinaryStorageRepo, "__init__", new=do_nothing),
@@ -110,7 +117,7 @@ class TestProjectImportUseCase:
         ]
         with (
             contextlib.ExitStack() as stack,
-            patch.object(BinaryStorageRepo, "store_objects_by_type", return_value=None) as mock_store_objects,
+            patch.object(BinaryStorageRepo, "store_object_from_stream", return_value=None) as mock_store_object,
             patch.object(SpiceDB, "create_project", return_value=None) as mock_spicedb_create_project,
             patch.object(DocumentRepo, "insert_documents_to_db_collection", return_value=None) as mock_insert_documents,
             patch.object(ZipStorageRepo, "__init__", new=do_nothing),
@@ -128,8 +135,9 @@ class TestProjectImportUseCase:
                 file_id=file_id, creator_id=creator_id, progress_callback=fxt_mock_progress_callback
             )
 
-        mock_insert_documents.assert_called_with(collection_name=DocumentRepo.PROJECTS_COLLECTION, documents=ANY)
-        mock_store_objects.assert_called()
+        mock_insert_documents.assert_any_call(collection_name=DocumentRepo.PROJECTS_COLLECTION, documents=ANY)
+        mock_insert_documents.assert_any_call(collection_name="coll_1", documents=ANY)
+        assert mock_store_object.call_count == len(BinaryStorageRepo.get_object_types())
         mock_register_active_models.assert_called_once_with(project_identifier=project_identifier)
         fxt_mock_progress_callback.assert_called()
         mock_metadata_update.assert_called_once_with(
@@ -376,6 +384,7 @@ class TestProjectImportUseCase:
                 ImportDataRedactionUseCase, "recreate_objectid_based_binary_filename_in_mongodb_doc", new=identity_map
             ),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_mongodb_doc", new=identity_map),
+            patch.object(ImportDataRedactionUseCase, "restore_mongodb_doc", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_file", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_url", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "update_creation_time_in_mongodb_doc", new=identity_map),
@@ -386,7 +395,12 @@ class TestProjectImportUseCase:
                 "get_documents_by_collection",
                 return_value=[f'{{"_id": {{"$oid": "{str(project_id)}"}}, "name": "bar"}}'],
             ),
-            patch.object(ProjectZipArchive, "get_objects_by_type", return_value=[("local_path_1", "remote_path_1")]),
+            patch.object(
+                ProjectZipArchive,
+                "get_object_entries_by_type",
+                return_value=[(ZipInfo("binaries/images/remote_path_1.jpg"), "remote_path_1.jpg")],
+            ),
+            patch.object(ProjectZipArchive, "open_object", side_effect=lambda zip_info: io.BytesIO(b"data")),
             patch.object(ProjectZipArchive, "close", return_value=None),
             patch.object(ProjectZipArchive, "get_collection_names", return_value=["collection_1", "project"]),
             patch.object(BinaryStorageRepo, "__init__", new=do_nothing),
@@ -396,7 +410,7 @@ class TestProjectImportUseCase:
         with (
             contextlib.ExitStack() as stack,
             pytest.raises(ImportProjectUnsupportedVersionException),
-            patch.object(BinaryStorageRepo, "store_objects_by_type", return_value=None),
+            patch.object(BinaryStorageRepo, "store_object_from_stream", return_value=None),
             patch.object(DocumentRepo, "insert_documents_to_db_collection", return_value=None),
             patch.object(ZipStorageRepo, "__init__", new=do_nothing),
             patch.object(ProjectImportUseCase, "_download_import_zip", new=mocked_download_import_zip),
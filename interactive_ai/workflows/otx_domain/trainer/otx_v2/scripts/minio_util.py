@@ -12,6 +12,9 @@ from minio.error import S3Error
 
 logger = logging.getLogger("mlflow_job")
 
+# Size of the chunks streamed from the HTTP response to the file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def download_file_from_url(client: Minio, bucket_name: str, object_name: str, file_path: str) -> None:
     """
@@ -20,10 +23,10 @@ def download_file_from_url(client: Minio, bucket_name: str, object_name: str, fi
     try:
         # Try to download the file from the Internet
         url = f"{os.environ.get('WEIGHTS_URL')}/{object_name}"
-        resp = requests.get(url, timeout=600)
+        resp = requests.get(url, timeout=600, stream=True)
         if resp.status_code == 200:
             with open(file_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=512):
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
             logger.info(f"File '{object_name}' downloaded successfully from {url} to '{file_path}'")
@@ -83,10 +86,10 @@ def download_file(bucket_name, object_name, file_path, endpoint):  # noqa: ANN00
             logger.warning("Trying to get object using presigned URL")
             url = presigned_urls_client.presigned_get_object(bucket_name, object_name)
             try:
-                resp = requests.get(url, timeout=600)
+                resp = requests.get(url, timeout=600, stream=True)
                 if resp.status_code == 200:
                     with open(file_path, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=512):
+                        for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                             if chunk:
                                 f.write(chunk)
                     logger.info(f"File '{object_name}' downloaded successfully to '{file_path}' using presigned URL")
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import shutil
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from functools import partial, wraps
 from pathlib import Path
 from queue import Queue
@@ -20,13 +24,22 @@ from utils import BASE_MODEL_FILENAME, logging_elapsed_time
 
 if TYPE_CHECKING:
     import io
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from mlflow import MlflowClient
     from mlflow.entities import Run
 
 PRESIGNED_URL_SUFFIX = ".presigned_url"
 TIMEOUT = 300.0
+# Number of shard files downloaded in parallel
+SHARD_DOWNLOAD_WORKERS = int(os.environ.get("SHARD_DOWNLOAD_WORKERS", "4"))
+# Size of the chunks streamed from the HTTP response to the shard file
+SHARD_DOWNLOAD_CHUNK_SIZE = int(os.environ.get("SHARD_DOWNLOAD_CHUNK_SIZE", str(4 * 1024 * 1024)))
+# Number of attempts to download a shard file; the later attempts resume from the bytes already received
+SHARD_DOWNLOAD_MAX_ATTEMPTS = int(os.environ.get("SHARD_DOWNLOAD_MAX_ATTEMPTS", "5"))
+# Timeout to connect to the server and to receive each chunk of data, in seconds
+SHARD_DOWNLOAD_TIMEOUT = float(os.environ.get("SHARD_DOWNLOAD_TIMEOUT", "60"))
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
 
 logger = logging.getLogger(__name__)
 
@@ -85,24 +98,159 @@ def get_shard_files_dir() -> Path:
     return Path(os.environ["SHARD_FILES_DIR"])
 
 
-@logging_elapsed_time(logger=logger, log_level=logging.INFO)
-def download_shard_files(run: Run) -> Path:
-    """Download shard files from mlflow.Run.inputs.dataset_inputs."""
+class IncompleteDownloadError(OSError):
+    """Raised when the downloaded file does not match the expected size or checksum"""
+
+
+def _sha256_checksum(fpath: Path, chunk_size: int = SHARD_DOWNLOAD_CHUNK_SIZE) -> str:
+    """Compute the SHA-256 checksum of a file, reading it in chunks."""
+    sha256 = hashlib.sha256()
+    with fpath.open("rb") as fp:
+        while chunk := fp.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _stream_to_file(url: str, part_path: Path, chunk_size: int, timeout: float) -> None:
+    """Stream the content of the URL to the partial file, resuming after its current size.
+
+    :raises IncompleteDownloadError: if the connection ends before the whole content is received.
+    """
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset > 0 else {}
+    with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+        if response.status_code == requests.codes.requested_range_not_satisfiable:
+            # The partial file is not a prefix of the content (e.g. it is already complete): start over
+            part_path.unlink()
+            raise IncompleteDownloadError(f"Cannot resume the download of {part_path.name} at byte {offset}")
+        response.raise_for_status()
+        if response.status_code != requests.codes.partial_content:
+            offset = 0  # the server sent the whole content
+        # The length of an encoded (e.g. gzip) content is not the size of the decoded file
+        content_length = response.headers.get("Content-Length")
+        is_encoded = "Content-Encoding" in response.headers
+        expected_size = offset + int(content_length) if content_length is not None and not is_encoded else None
+        with part_path.open("ab" if offset > 0 else "wb") as fp:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fp.write(chunk)
+
+    if expected_size is not None and part_path.stat().st_size != expected_size:
+        msg = f"Received {part_path.stat().st_size} bytes of {part_path.name}, expected {expected_size}"
+        raise IncompleteDownloadError(msg)
+
+
+def download_file(
+    url: str,
+    fpath: Path,
+    checksum: str | None = None,
+    chunk_size: int = SHARD_DOWNLOAD_CHUNK_SIZE,
+    max_attempts: int = SHARD_DOWNLOAD_MAX_ATTEMPTS,
+    timeout: float = SHARD_DOWNLOAD_TIMEOUT,
+) -> Path:
+    """Download a file by streaming it in chunks, resuming the download if the connection fails.
+
+    The content is written to a partial file, which is renamed to the destination path only once
+    the download is complete and verified.
+
+    :param url: URL of the file to download
+    :param fpath: destination path of the file
+    :param checksum: expected SHA-256 checksum (hex) of the file; if empty, the checksum is not verified
+    :param chunk_size: size of the chunks streamed from the response to the file
+    :param max_attempts: maximum number of attempts to download the file
+    :param timeout: timeout to connect and to receive each chunk, in seconds
+    :return: destination path of the file
+    """
+    part_path = fpath.with_name(fpath.name + PARTIAL_DOWNLOAD_SUFFIX)
+    part_path.unlink(missing_ok=True)
+    for attempt in range(1, max_attempts + 1):
+        try:
+            _stream_to_file(url=url, part_path=part_path, chunk_size=chunk_size, timeout=timeout)
+            if checksum and (actual_checksum := _sha256_checksum(part_path)) != checksum:
+                # The content cannot be trusted, including the part received by the earlier attempts
+                part_path.unlink()
+                msg = f"Checksum mismatch for {fpath.name}: expected {checksum}, got {actual_checksum}"
+                raise IncompleteDownloadError(msg)
+            break
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            IncompleteDownloadError,
+        ):
+            if attempt == max_attempts:
+                part_path.unlink(missing_ok=True)
+                raise
+            logger.warning("Attempt %d to download %s failed, retrying", attempt, fpath.name, exc_info=True)
+            time.sleep(min(2 ** (attempt - 1), 30))
+
+    part_path.replace(fpath)
+    return fpath
+
+
+class ShardFilesDownload:
+    """Concurrent download of the shard files of a run, running in the background.
+
+    The shard files are available in the shard files directory as soon as they are downloaded,
+    see :meth:`iter_completed`.
+
+    :param run: MLFlow run whose dataset inputs are the shard files
+    :param shard_files_dir: directory where to save the shard files
+    :param num_workers: number of shard files downloaded in parallel
+    """
+
+    def __init__(self, run: Run, shard_files_dir: Path, num_workers: int = SHARD_DOWNLOAD_WORKERS) -> None:
+        self.shard_files_dir = shard_files_dir
+        self._executor = ThreadPoolExecutor(max_workers=max(num_workers, 1), thread_name_prefix="shard-download")
+        self._futures: list[Future[Path]] = [
+            self._executor.submit(
+                download_file,
+                url=inp.dataset.source,
+                fpath=shard_files_dir / inp.dataset.name,
+                checksum=inp.dataset.digest or None,
+            )
+            for inp in run.inputs.dataset_inputs
+        ]
+
+    def close(self) -> None:
+        """Cancel the pending downloads and wait for the running ones to terminate."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_completed(self) -> Iterator[Path]:
+        """Iterate over the paths of the shard files, in order of completion of their download."""
+        for future in as_completed(self._futures):
+            yield future.result()
+
+    def wait(self) -> Path:
+        """Wait for the download of all the shard files.
+
+        :return: shard files directory path
+        """
+        for _ in tqdm(self.iter_completed(), total=len(self._futures), desc="Downloading shard files"):
+            pass
+        return self.shard_files_dir
+
+
+@contextmanager
+def start_shard_files_download(run: Run) -> Iterator[ShardFilesDownload]:
+    """Start downloading the shard files from mlflow.Run.inputs.dataset_inputs in the background.
+
+    The pending downloads are cancelled when leaving the context.
+    """
     shard_files_dir = get_shard_files_dir()
     msg = f"Shard files directory path: {shard_files_dir}"
     logger.info(msg)
+    shard_files_download = ShardFilesDownload(run=run, shard_files_dir=shard_files_dir)
+    try:
+        yield shard_files_download
+    finally:
+        shard_files_download.close()
 
-    for inp in tqdm(run.inputs.dataset_inputs, desc="Downloading shard files"):
-        fpath = shard_files_dir / inp.dataset.name
-        with open(fpath, "wb") as fp:
-            try:
-                response = requests.get(inp.dataset.source, timeout=10.0, stream=False)
-                response.raise_for_status()
-                fp.write(response.content)
-            finally:
-                response.close()
 
-    return Path(shard_files_dir)
+@logging_elapsed_time(logger=logger, log_level=logging.INFO)
+def download_shard_files(run: Run) -> Path:
+    """Download shard files from mlflow.Run.inputs.dataset_inputs."""
+    with start_shard_files_download(run) as shard_files_download:
+        return shard_files_download.wait()
 
 
 @logging_elapsed_time(logger=logger, log_level=logging.INFO)
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 import mlflow
 from minio_util import download_file
-from mlflow_io import AsyncCaller, download_config_file, download_shard_files, log_error, log_full
+from mlflow_io import AsyncCaller, download_config_file, log_error, log_full, start_shard_files_download
 from optimize import optimize
 from train import train
 from utils import JobType, MLFlowTrackerAccessInfo, OTXConfig, logging_elapsed_time
@@ -74,13 +74,14 @@ def download_pretrained_weights(template_id: str) -> None:
 def execute(client: mlflow.MlflowClient, run: Run, work_dir: Path) -> None:
     """Execute an OTX job by dispatching according to the given job type."""
 
-    config_file_path = download_config_file(client, run)
-    shard_files_dir = download_shard_files(run)
-
-    config = OTXConfig.from_json_file(config_file_path=config_file_path)
+    # Download the shard files in the background, while the config and the pretrained weights are downloaded
+    with start_shard_files_download(run) as shard_files_download:
+        config_file_path = download_config_file(client, run)
+        config = OTXConfig.from_json_file(config_file_path=config_file_path)
+        download_pretrained_weights(config.model_template_id)
+        shard_files_dir = shard_files_download.wait()
 
     job_type = config.job_type
-    download_pretrained_weights(config.model_template_id)
 
     if job_type == JobType.TRAIN:
         logger.debug("Starting training job.")
@@ -0,0 +1,131 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from mlflow.entities import Dataset, DatasetInput, RunInputs
+
+from scripts.mlflow_io import IncompleteDownloadError, download_file, download_shard_files
+
+
+class FakeResponse:
+    """Response streaming the content after the requested range, optionally failing after some bytes"""
+
+    def __init__(self, content: bytes, headers: dict, fail_after: int | None = None) -> None:
+        range_header = headers.get("Range")
+        offset = int(range_header.removeprefix("bytes=").removesuffix("-")) if range_header else 0
+        self.status_code = 206 if offset else 200
+        self.headers = {"Content-Length": str(len(content) - offset)}
+        self._content = content[offset:]
+        self._fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self._content), chunk_size):
+            if self._fail_after is not None and start >= self._fail_after:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield self._content[start : start + chunk_size]
+
+
+def make_fake_get(contents: dict[str, bytes], fail_after: dict[str, int] | None = None) -> MagicMock:
+    """Mock of requests.get serving the given contents; the first request of a URL can fail after some bytes"""
+    fail_after = dict(fail_after or {})
+
+    def fake_get(url, headers, timeout, stream):
+        return FakeResponse(content=contents[url], headers=headers, fail_after=fail_after.pop(url, None))
+
+    return MagicMock(side_effect=fake_get)
+
+
+@patch("scripts.mlflow_io.time.sleep", new=MagicMock())
+class TestDownload:
+    def test_download_file_resumes(self, tmpdir) -> None:
+        content = bytes(range(256)) * 40
+        fake_get = make_fake_get(contents={"url": content}, fail_after={"url": 3000})
+        fpath = Path(tmpdir) / "datum-0-of-1.arrow"
+
+        with patch("scripts.mlflow_io.requests.get", new=fake_get):
+            download_file(
+                url="url", fpath=fpath, checksum=hashlib.sha256(content).hexdigest(), chunk_size=1000, max_attempts=2
+            )
+
+        assert fpath.read_bytes() == content
+        assert not fpath.with_name(fpath.name + ".part").exists()
+        assert fake_get.call_args_list[1].kwargs["headers"] == {"Range": "bytes=3000-"}
+
+    def test_download_file_checksum_mismatch(self, tmpdir) -> None:
+        fpath = Path(tmpdir) / "datum-0-of-1.arrow"
+
+        with (
+            patch("scripts.mlflow_io.requests.get", new=make_fake_get(contents={"url": b"corrupted"})),
+            pytest.raises(IncompleteDownloadError),
+        ):
+            download_file(url="url", fpath=fpath, checksum=hashlib.sha256(b"content").hexdigest(), max_attempts=2)
+
+        assert not fpath.exists()
+        assert not fpath.with_name(fpath.name + ".part").exists()
+
+    def test_download_shard_files(self, tmpdir) -> None:
+        contents = {f"url_{i}": f"shard {i}".encode() * 100 for i in range(5)}
+        run = MagicMock()
+        run.inputs.dataset_inputs = [
+            MagicMock(dataset=MagicMock(source=f"url_{i}", digest="")) for i in range(len(contents))
+        ]
+        for i, inp in enumerate(run.inputs.dataset_inputs):
+            inp.dataset.name = f"datum-{i}-of-{len(contents)}.arrow"
+        fake_get = make_fake_get(contents=contents, fail_after={"url_2": 0})
+
+        with patch("scripts.mlflow_io.requests.get", new=fake_get):
+            shard_files_dir = download_shard_files(run)
+
+        assert shard_files_dir == Path(tmpdir)
+        for i in range(len(contents)):
+            assert (shard_files_dir / f"datum-{i}-of-{len(contents)}.arrow").read_bytes() == contents[f"url_{i}"]
+
+    @pytest.mark.parametrize("corrupted", [False, True])
+    def test_download_shard_files_verifies_digests(self, tmpdir, corrupted) -> None:
+        # Dataset inputs as served by the tracking store: the digests are the SHA-256 checksums of the shard files
+        contents = {f"url_{i}": f"shard {i}".encode() * 100 for i in range(3)}
+        run = SimpleNamespace(
+            inputs=RunInputs(
+                dataset_inputs=[
+                    DatasetInput(
+                        dataset=Dataset(
+                            name=f"datum-{i}-of-{len(contents)}.arrow",
+                            digest=hashlib.sha256(contents[f"url_{i}"]).hexdigest(),
+                            source_type="http",
+                            source=f"url_{i}",
+                        )
+                    )
+                    for i in range(len(contents))
+                ]
+            )
+        )
+        served_contents = {**contents, "url_1": b"corrupted"} if corrupted else contents
+
+        with patch("scripts.mlflow_io.requests.get", new=make_fake_get(contents=served_contents)):
+            if corrupted:
+                with pytest.raises(IncompleteDownloadError):
+                    download_shard_files(run)
+            else:
+                shard_files_dir = download_shard_files(run)
+
+        if corrupted:
+            # The other downloads are cancelled on failure
+            assert not (Path(tmpdir) / f"datum-1-of-{len(contents)}.arrow").exists()
+        else:
+            for i in range(len(contents)):
+                assert (shard_files_dir / f"datum-{i}-of-{len(contents)}.arrow").read_bytes() == contents[f"url_{i}"]
@@ -4,7 +4,7 @@
 import json
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import datetime
 from functools import wraps
 from typing import Any, TypeVar, cast
@@ -24,6 +24,8 @@ from .pb.job_service_pb2 import (
     JobResponse,
     ListJobsResponse,
     SubmitJobRequest,
+    SubmitJobsBulkRequest,
+    SubmitJobsBulkResponse,
 )
 from .pb.job_service_pb2_grpc import JobServiceStub
 
@@ -66,7 +68,7 @@ def grpc_requester(acquire_lock: bool = True):  # noqa: ANN201
             for _ in range(max_retries):
                 try:
                     if acquire_lock:
-                        if method.__name__ in ["submit", "cancel"]:
+                        if method.__name__ in ["submit", "submit_bulk", "cancel"]:
                             with self._GRPCJobsClient__init_lock.gen_wlock():
                                 return method(self, *args, **kwargs)
                         else:
@@ -172,6 +174,71 @@ class GRPCJobsClient:
         :return: the id of the submitted job
         :raises: ValueError if the payload is not serializable
         """
+        session = self.metadata_getter()
+        submit_message = self._build_submit_message(
+            workspace_id=dict(session)["workspace_id"],
+            priority=priority,
+            job_name=job_name,
+            job_type=job_type,
+            key=key,
+            payload=payload,
+            metadata=metadata,
+            duplicate_policy=duplicate_policy,
+            author=author,
+            cancellable=cancellable,
+            project_id=project_id,
+            gpu_num_required=gpu_num_required,
+            cost=cost,
+        )
+        reply: JobIdResponse = self.job_service_stub.submit(
+            submit_message,
+            metadata=session,
+            wait_for_ready=True,
+        )
+        return ID(reply.id)
+
+    @grpc_requester()
+    def submit_bulk(self, jobs: Sequence[dict[str, Any]]) -> list[SubmitJobsBulkResponse.Outcome]:
+        """
+        Sends a request to submit a batch of jobs to the job scheduler through the gRPC server, in a single call.
+
+        The jobs are submitted as if they were submitted one by one in the given order. The failure of a job
+        (i.e. duplicate job or insufficient credits) does not prevent the other jobs to be submitted.
+
+        :param jobs: the jobs to submit, each one described by the keyword arguments of the submit method
+        :return: the outcome of each job, in the same order as the jobs. Each outcome has a status (SUBMITTED,
+            OMITTED, REPLACED, DUPLICATE, INSUFFICIENT_CREDITS or INVALID), the id of the submitted job
+            (or of its duplicate if the job was omitted) and the details of the failure, if any.
+        :raises: ValueError if the payload or the metadata of a job is not serializable
+        """
+        session = self.metadata_getter()
+        workspace_id = dict(session)["workspace_id"]
+        submit_bulk_message = SubmitJobsBulkRequest(
+            jobs=[self._build_submit_message(workspace_id=workspace_id, **job) for job in jobs]
+        )
+        reply: SubmitJobsBulkResponse = self.job_service_stub.submit_bulk(
+            submit_bulk_message,
+            metadata=session,
+            wait_for_ready=True,
+        )
+        return list(reply.outcomes)
+
+    @staticmethod
+    def _build_submit_message(  # noqa: PLR0913
+        workspace_id: str,
+        priority: int,
+        job_name: str,
+        job_type: str,
+        key: str,
+        payload: dict,
+        metadata: dict,
+        duplicate_policy: str,
+        author: ID,
+        cancellable: bool = True,
+        project_id: ID | None = None,
+        gpu_num_required: int | None = None,
+        cost: list[SubmitJobRequest.CostRequest] | None = None,
+    ) -> SubmitJobRequest:
         try:
             payload_serial = json.dumps(payload)
         except TypeError:
@@ -181,10 +248,9 @@ class GRPCJobsClient:
         except TypeError:
             raise ValueError("Unable to serialize metadata.")
 
-        session = self.metadata_getter()
-        submit_message: SubmitJobRequest = SubmitJobRequest(
+        return SubmitJobRequest(
             priority=priority,
-            workspace_id=dict(session)["workspace_id"],
+            workspace_id=workspace_id,
             job_name=job_name,
             type=job_type,
             key=key,
@@ -198,12 +264,6 @@ class GRPCJobsClient:
             cost=cost,
             cancellable=cancellable,
         )
-        reply: JobIdResponse = self.job_service_stub.submit(
-            submit_message,
-            metadata=session,
-            wait_for_ready=True,
-        )
-        return ID(reply.id)
 
     @grpc_requester()
     def find(  # noqa: PLR0913
@@ -18,7 +18,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11job_service.proto"\xb9\x03\n\x10SubmitJobRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08priority\x18\x02 \x01(\x05\x12\x10\n\x08job_name\x18\x03 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x04 \x01(\t\x12\x12\n\nproject_id\x18\x05 \x01(\t\x12\x0b\n\x03key\x18\x06 \x01(\t\x12\x0f\n\x07payload\x18\x07 \x01(\t\x12\x18\n\x10\x64uplicate_policy\x18\x08 \x01(\t\x12\x0e\n\x06\x61uthor\x18\t \x01(\t\x12\x10\n\x08metadata\x18\n \x01(\t\x12.\n\ttelemetry\x18\x0b \x01(\x0b\x32\x1b.SubmitJobRequest.Telemetry\x12\x1d\n\x10gpu_num_required\x18\x0c \x01(\x05H\x00\x88\x01\x01\x12+\n\x04\x63ost\x18\r \x03(\x0b\x32\x1d.SubmitJobRequest.CostRequest\x12\x13\n\x0b\x63\x61ncellable\x18\x0e \x01(\x08\x1a\x1c\n\tTelemetry\x12\x0f\n\x07\x63ontext\x18\x01 \x01(\t\x1a+\n\x0b\x43ostRequest\x12\x0c\n\x04unit\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x42\x13\n\x11_gpu_num_required"5\n\x11GetJobByIdRequest\x12\x14\n\x0cworkspace_id\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t"F\n\x10\x43\x61ncelJobRequest\x12\x14\n\x0cworkspace_id\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x10\n\x08user_uid\x18\x03 \x01(\t"\xc9\x01\n\x13GetJobsCountRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x0b\n\x03key\x18\x05 \x01(\t\x12\x12\n\nauthor_uid\x18\x06 \x01(\t\x12\x17\n\x0fstart_time_from\x18\x07 \x01(\t\x12\x15\n\rstart_time_to\x18\x08 \x01(\t\x12\x1a\n\x12\x61ll_permitted_jobs\x18\t \x01(\x08"\x8b\x02\n\x0f\x46indJobsRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x0b\n\x03key\x18\x05 \x01(\t\x12\x12\n\nauthor_uid\x18\x06 \x01(\t\x12\x17\n\x0fstart_time_from\x18\x07 \x01(\t\x12\x15\n\rstart_time_to\x18\x08 \x01(\t\x12\x0c\n\x04skip\x18\t \x01(\x05\x12\r\n\x05limit\x18\n \x01(\x05\x12\x0f\n\x07sort_by\x18\x0b \x01(\t\x12\x16\n\x0esort_direction\x18\x0c \x01(\t\x12\x1a\n\x12\x61ll_permitted_jobs\x18\r \x01(\x08"\x1b\n\rJobIdResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xc3\x06\n\x0bJobResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x15\n\rcreation_time\x18\x04 \x01(\t\x12\x12\n\nstart_time\x18\x06 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x07 \x01(\t\x12\x10\n\x08job_name\x18\t \x01(\t\x12\x0e\n\x06\x61uthor\x18\n \x01(\t\x12\x14\n\x0cworkspace_id\x18\x0b \x01(\t\x12\x12\n\nproject_id\x18\x0c \x01(\t\x12\r\n\x05state\x18\r \x01(\t\x12\x13\n\x0bstate_group\x18\x0e \x01(\t\x12.\n\x0cstep_details\x18\x0f \x03(\x0b\x32\x18.JobResponse.StepDetails\x12\x0b\n\x03key\x18\x10 \x01(\t\x12\x0f\n\x07payload\x18\x11 \x01(\t\x12\x38\n\x11\x63\x61ncellation_info\x18\x12 \x01(\x0b\x32\x1d.JobResponse.CancellationInfo\x12\x10\n\x08metadata\x18\x13 \x01(\t\x12\'\n\x04\x63ost\x18\x14 \x01(\x0b\x32\x14.JobResponse.JobCostH\x00\x88\x01\x01\x1a\x83\x01\n\x0bStepDetails\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x01(\x05\x12\x10\n\x08progress\x18\x03 \x01(\x01\x12\r\n\x05state\x18\x04 \x01(\t\x12\x0f\n\x07task_id\x18\x05 \x01(\t\x12\x11\n\tstep_name\x18\x06 \x01(\t\x12\x0f\n\x07warning\x18\x07 \x01(\t\x1ay\n\x10\x43\x61ncellationInfo\x12\x14\n\x0cis_cancelled\x18\x01 \x01(\x08\x12\x10\n\x08user_uid\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61ncel_time\x18\x03 \x01(\t\x12\x14\n\x0crequest_time\x18\x04 \x01(\t\x12\x12\n\ndelete_job\x18\x05 \x01(\x08\x1a+\n\x0bJobResource\x12\x0c\n\x04unit\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x1a\x61\n\x07JobCost\x12*\n\x08requests\x18\x01 \x03(\x0b\x32\x18.JobResponse.JobResource\x12*\n\x08\x63onsumed\x18\x02 \x03(\x0b\x32\x18.JobResponse.JobResourceB\x07\n\x05_cost"\xc5\x01\n\x10ListJobsResponse\x12\x1a\n\x04jobs\x18\x01 \x03(\x0b\x32\x0c.JobResponse\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\x12\x15\n\rhas_next_page\x18\x03 \x01(\x08\x12\x32\n\tnext_page\x18\x04 \x01(\x0b\x32\x1a.ListJobsResponse.NextPageH\x00\x88\x01\x01\x1a\'\n\x08NextPage\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x42\x0c\n\n_next_page"\x0f\n\rEmptyResponse"%\n\x14GetJobsCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x32\x86\x02\n\nJobService\x12-\n\x06submit\x12\x11.SubmitJobRequest\x1a\x0e.JobIdResponse"\x00\x12/\n\tget_by_id\x12\x12.GetJobByIdRequest\x1a\x0c.JobResponse"\x00\x12-\n\x06\x63\x61ncel\x12\x11.CancelJobRequest\x1a\x0e.EmptyResponse"\x00\x12:\n\tget_count\x12\x14.GetJobsCountRequest\x1a\x15.GetJobsCountResponse"\x00\x12-\n\x04\x66ind\x12\x10.FindJobsRequest\x1a\x11.ListJobsResponse"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11job_service.proto"\xb9\x03\n\x10SubmitJobRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08priority\x18\x02 \x01(\x05\x12\x10\n\x08job_name\x18\x03 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x04 \x01(\t\x12\x12\n\nproject_id\x18\x05 \x01(\t\x12\x0b\n\x03key\x18\x06 \x01(\t\x12\x0f\n\x07payload\x18\x07 \x01(\t\x12\x18\n\x10\x64uplicate_policy\x18\x08 \x01(\t\x12\x0e\n\x06\x61uthor\x18\t \x01(\t\x12\x10\n\x08metadata\x18\n \x01(\t\x12.\n\ttelemetry\x18\x0b \x01(\x0b\x32\x1b.SubmitJobRequest.Telemetry\x12\x1d\n\x10gpu_num_required\x18\x0c \x01(\x05H\x00\x88\x01\x01\x12+\n\x04\x63ost\x18\r \x03(\x0b\x32\x1d.SubmitJobRequest.CostRequest\x12\x13\n\x0b\x63\x61ncellable\x18\x0e \x01(\x08\x1a\x1c\n\tTelemetry\x12\x0f\n\x07\x63ontext\x18\x01 \x01(\t\x1a+\n\x0b\x43ostRequest\x12\x0c\n\x04unit\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x42\x13\n\x11_gpu_num_required"8\n\x15SubmitJobsBulkRequest\x12\x1f\n\x04jobs\x18\x01 \x03(\x0b\x32\x11.SubmitJobRequest"\x83\x01\n\x16SubmitJobsBulkResponse\x12\x31\n\x08outcomes\x18\x01 \x03(\x0b\x32\x1f.SubmitJobsBulkResponse.Outcome\x1a\x36\n\x07Outcome\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x03 \x01(\t"5\n\x11GetJobByIdRequest\x12\x14\n\x0cworkspace_id\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t"F\n\x10\x43\x61ncelJobRequest\x12\x14\n\x0cworkspace_id\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12\x10\n\x08user_uid\x18\x03 \x01(\t"\xc9\x01\n\x13GetJobsCountRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x0b\n\x03key\x18\x05 \x01(\t\x12\x12\n\nauthor_uid\x18\x06 \x01(\t\x12\x17\n\x0fstart_time_from\x18\x07 \x01(\t\x12\x15\n\rstart_time_to\x18\x08 \x01(\t\x12\x1a\n\x12\x61ll_permitted_jobs\x18\t \x01(\x08"\x8b\x02\n\x0f\x46indJobsRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\x12\x14\n\x0cworkspace_id\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\x12\x0b\n\x03key\x18\x05 \x01(\t\x12\x12\n\nauthor_uid\x18\x06 \x01(\t\x12\x17\n\x0fstart_time_from\x18\x07 \x01(\t\x12\x15\n\rstart_time_to\x18\x08 \x01(\t\x12\x0c\n\x04skip\x18\t \x01(\x05\x12\r\n\x05limit\x18\n \x01(\x05\x12\x0f\n\x07sort_by\x18\x0b \x01(\t\x12\x16\n\x0esort_direction\x18\x0c \x01(\t\x12\x1a\n\x12\x61ll_permitted_jobs\x18\r \x01(\x08"\x1b\n\rJobIdResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xc3\x06\n\x0bJobResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x03 \x01(\x05\x12\x15\n\rcreation_time\x18\x04 \x01(\t\x12\x12\n\nstart_time\x18\x06 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x07 \x01(\t\x12\x10\n\x08job_name\x18\t \x01(\t\x12\x0e\n\x06\x61uthor\x18\n \x01(\t\x12\x14\n\x0cworkspace_id\x18\x0b \x01(\t\x12\x12\n\nproject_id\x18\x0c \x01(\t\x12\r\n\x05state\x18\r \x01(\t\x12\x13\n\x0bstate_group\x18\x0e \x01(\t\x12.\n\x0cstep_details\x18\x0f \x03(\x0b\x32\x18.JobResponse.StepDetails\x12\x0b\n\x03key\x18\x10 \x01(\t\x12\x0f\n\x07payload\x18\x11 \x01(\t\x12\x38\n\x11\x63\x61ncellation_info\x18\x12 \x01(\x0b\x32\x1d.JobResponse.CancellationInfo\x12\x10\n\x08metadata\x18\x13 \x01(\t\x12\'\n\x04\x63ost\x18\x14 \x01(\x0b\x32\x14.JobResponse.JobCostH\x00\x88\x01\x01\x1a\x83\x01\n\x0bStepDetails\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x01(\x05\x12\x10\n\x08progress\x18\x03 \x01(\x01\x12\r\n\x05state\x18\x04 \x01(\t\x12\x0f\n\x07task_id\x18\x05 \x01(\t\x12\x11\n\tstep_name\x18\x06 \x01(\t\x12\x0f\n\x07warning\x18\x07 \x01(\t\x1ay\n\x10\x43\x61ncellationInfo\x12\x14\n\x0cis_cancelled\x18\x01 \x01(\x08\x12\x10\n\x08user_uid\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61ncel_time\x18\x03 \x01(\t\x12\x14\n\x0crequest_time\x18\x04 \x01(\t\x12\x12\n\ndelete_job\x18\x05 \x01(\x08\x1a+\n\x0bJobResource\x12\x0c\n\x04unit\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\x1a\x61\n\x07JobCost\x12*\n\x08requests\x18\x01 \x03(\x0b\x32\x18.JobResponse.JobResource\x12*\n\x08\x63onsumed\x18\x02 \x03(\x0b\x32\x18.JobResponse.JobResourceB\x07\n\x05_cost"\xc5\x01\n\x10ListJobsResponse\x12\x1a\n\x04jobs\x18\x01 \x03(\x0b\x32\x0c.JobResponse\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\x12\x15\n\rhas_next_page\x18\x03 \x01(\x08\x12\x32\n\tnext_page\x18\x04 \x01(\x0b\x32\x1a.ListJobsResponse.NextPageH\x00\x88\x01\x01\x1a\'\n\x08NextPage\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x42\x0c\n\n_next_page"\x0f\n\rEmptyResponse"%\n\x14GetJobsCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x32\xc8\x02\n\nJobService\x12-\n\x06submit\x12\x11.SubmitJobRequest\x1a\x0e.JobIdResponse"\x00\x12@\n\x0bsubmit_bulk\x12\x16.SubmitJobsBulkRequest\x1a\x17.SubmitJobsBulkResponse"\x00\x12/\n\tget_by_id\x12\x12.GetJobByIdRequest\x1a\x0c.JobResponse"\x00\x12-\n\x06\x63\x61ncel\x12\x11.CancelJobRequest\x1a\x0e.EmptyResponse"\x00\x12:\n\tget_count\x12\x14.GetJobsCountRequest\x1a\x15.GetJobsCountResponse"\x00\x12-\n\x04\x66ind\x12\x10.FindJobsRequest\x1a\x11.ListJobsResponse"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -31,34 +31,40 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals["_SUBMITJOBREQUEST_TELEMETRY"]._serialized_end=397
   _globals["_SUBMITJOBREQUEST_COSTREQUEST"]._serialized_start=399
   _globals["_SUBMITJOBREQUEST_COSTREQUEST"]._serialized_end=442
-  _globals["_GETJOBBYIDREQUEST"]._serialized_start=465
-  _globals["_GETJOBBYIDREQUEST"]._serialized_end=518
-  _globals["_CANCELJOBREQUEST"]._serialized_start=520
-  _globals["_CANCELJOBREQUEST"]._serialized_end=590
-  _globals["_GETJOBSCOUNTREQUEST"]._serialized_start=593
-  _globals["_GETJOBSCOUNTREQUEST"]._serialized_end=794
-  _globals["_FINDJOBSREQUEST"]._serialized_start=797
-  _globals["_FINDJOBSREQUEST"]._serialized_end=1064
-  _globals["_JOBIDRESPONSE"]._serialized_start=1066
-  _globals["_JOBIDRESPONSE"]._serialized_end=1093
-  _globals["_JOBRESPONSE"]._serialized_start=1096
-  _globals["_JOBRESPONSE"]._serialized_end=1931
-  _globals["_JOBRESPONSE_STEPDETAILS"]._serialized_start=1524
-  _globals["_JOBRESPONSE_STEPDETAILS"]._serialized_end=1655
-  _globals["_JOBRESPONSE_CANCELLATIONINFO"]._serialized_start=1657
-  _globals["_JOBRESPONSE_CANCELLATIONINFO"]._serialized_end=1778
-  _globals["_JOBRESPONSE_JOBRESOURCE"]._serialized_start=1780
-  _globals["_JOBRESPONSE_JOBRESOURCE"]._serialized_end=1823
-  _globals["_JOBRESPONSE_JOBCOST"]._serialized_start=1825
-  _globals["_JOBRESPONSE_JOBCOST"]._serialized_end=1922
-  _globals["_LISTJOBSRESPONSE"]._serialized_start=1934
-  _globals["_LISTJOBSRESPONSE"]._serialized_end=2131
-  _globals["_LISTJOBSRESPONSE_NEXTPAGE"]._serialized_start=2078
-  _globals["_LISTJOBSRESPONSE_NEXTPAGE"]._serialized_end=2117
-  _globals["_EMPTYRESPONSE"]._serialized_start=2133
-  _globals["_EMPTYRESPONSE"]._serialized_end=2148
-  _globals["_GETJOBSCOUNTRESPONSE"]._serialized_start=2150
-  _globals["_GETJOBSCOUNTRESPONSE"]._serialized_end=2187
-  _globals["_JOBSERVICE"]._serialized_start=2190
-  _globals["_JOBSERVICE"]._serialized_end=2452
+  _globals["_SUBMITJOBSBULKREQUEST"]._serialized_start=465
+  _globals["_SUBMITJOBSBULKREQUEST"]._serialized_end=521
+  _globals["_SUBMITJOBSBULKRESPONSE"]._serialized_start=524
+  _globals["_SUBMITJOBSBULKRESPONSE"]._serialized_end=655
+  _globals["_SUBMITJOBSBULKRESPONSE_OUTCOME"]._serialized_start=601
+  _globals["_SUBMITJOBSBULKRESPONSE_OUTCOME"]._serialized_end=655
+  _globals["_GETJOBBYIDREQUEST"]._serialized_start=657
+  _globals["_GETJOBBYIDREQUEST"]._serialized_end=710
+  _globals["_CANCELJOBREQUEST"]._serialized_start=712
+  _globals["_CANCELJOBREQUEST"]._serialized_end=782
+  _globals["_GETJOBSCOUNTREQUEST"]._serialized_start=785
+  _globals["_GETJOBSCOUNTREQUEST"]._serialized_end=986
+  _globals["_FINDJOBSREQUEST"]._serialized_start=989
+  _globals["_FINDJOBSREQUEST"]._serialized_end=1256
+  _globals["_JOBIDRESPONSE"]._serialized_start=1258
+  _globals["_JOBIDRESPONSE"]._serialized_end=1285
+  _globals["_JOBRESPONSE"]._serialized_start=1288
+  _globals["_JOBRESPONSE"]._serialized_end=2123
+  _globals["_JOBRESPONSE_STEPDETAILS"]._serialized_start=1716
+  _globals["_JOBRESPONSE_STEPDETAILS"]._serialized_end=1847
+  _globals["_JOBRESPONSE_CANCELLATIONINFO"]._serialized_start=1849
+  _globals["_JOBRESPONSE_CANCELLATIONINFO"]._serialized_end=1970
+  _globals["_JOBRESPONSE_JOBRESOURCE"]._serialized_start=1972
+  _globals["_JOBRESPONSE_JOBRESOURCE"]._serialized_end=2015
+  _globals["_JOBRESPONSE_JOBCOST"]._serialized_start=2017
+  _globals["_JOBRESPONSE_JOBCOST"]._serialized_end=2114
+  _globals["_LISTJOBSRESPONSE"]._serialized_start=2126
+  _globals["_LISTJOBSRESPONSE"]._serialized_end=2323
+  _globals["_LISTJOBSRESPONSE_NEXTPAGE"]._serialized_start=2270
+  _globals["_LISTJOBSRESPONSE_NEXTPAGE"]._serialized_end=2309
+  _globals["_EMPTYRESPONSE"]._serialized_start=2325
+  _globals["_EMPTYRESPONSE"]._serialized_end=2340
+  _globals["_GETJOBSCOUNTRESPONSE"]._serialized_start=2342
+  _globals["_GETJOBSCOUNTRESPONSE"]._serialized_end=2379
+  _globals["_JOBSERVICE"]._serialized_start=2382
+  _globals["_JOBSERVICE"]._serialized_end=2710
 # @@protoc_insertion_point(module_scope)
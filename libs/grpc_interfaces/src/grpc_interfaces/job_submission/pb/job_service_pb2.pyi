@@ -102,6 +102,57 @@ class SubmitJobRequest(google.protobuf.message.Message):
 
 global___SubmitJobRequest = SubmitJobRequest
 
+@typing.final
+class SubmitJobsBulkRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    JOBS_FIELD_NUMBER: builtins.int
+    @property
+    def jobs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SubmitJobRequest]: ...
+    def __init__(
+        self,
+        *,
+        jobs: collections.abc.Iterable[global___SubmitJobRequest] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["jobs", b"jobs"]) -> None: ...
+
+global___SubmitJobsBulkRequest = SubmitJobsBulkRequest
+
+@typing.final
+class SubmitJobsBulkResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing.final
+    class Outcome(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        STATUS_FIELD_NUMBER: builtins.int
+        ID_FIELD_NUMBER: builtins.int
+        DETAILS_FIELD_NUMBER: builtins.int
+        status: builtins.str
+        id: builtins.str
+        details: builtins.str
+        def __init__(
+            self,
+            *,
+            status: builtins.str = ...,
+            id: builtins.str = ...,
+            details: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing.Literal["details", b"details", "id", b"id", "status", b"status"]) -> None: ...
+
+    OUTCOMES_FIELD_NUMBER: builtins.int
+    @property
+    def outcomes(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SubmitJobsBulkResponse.Outcome]: ...
+    def __init__(
+        self,
+        *,
+        outcomes: collections.abc.Iterable[global___SubmitJobsBulkResponse.Outcome] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["outcomes", b"outcomes"]) -> None: ...
+
+global___SubmitJobsBulkResponse = SubmitJobsBulkResponse
+
 @typing.final
 class GetJobByIdRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
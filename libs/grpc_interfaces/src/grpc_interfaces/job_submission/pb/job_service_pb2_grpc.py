@@ -22,6 +22,11 @@ class JobServiceStub:
                 request_serializer=job__service__pb2.SubmitJobRequest.SerializeToString,
                 response_deserializer=job__service__pb2.JobIdResponse.FromString,
                 )
+        self.submit_bulk = channel.unary_unary(
+                "/JobService/submit_bulk",
+                request_serializer=job__service__pb2.SubmitJobsBulkRequest.SerializeToString,
+                response_deserializer=job__service__pb2.SubmitJobsBulkResponse.FromString,
+                )
         self.get_by_id = channel.unary_unary(
                 "/JobService/get_by_id",
                 request_serializer=job__service__pb2.GetJobByIdRequest.SerializeToString,
@@ -54,6 +59,13 @@ class JobServiceServicer:
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def submit_bulk(self, request, context):
+        """Submit a batch of jobs to the job service, returning the outcome of each job.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def get_by_id(self, request, context):
         """Returns the job given its id.
         """
@@ -90,6 +102,11 @@ def add_JobServiceServicer_to_server(servicer, server):
                     request_deserializer=job__service__pb2.SubmitJobRequest.FromString,
                     response_serializer=job__service__pb2.JobIdResponse.SerializeToString,
             ),
+            "submit_bulk": grpc.unary_unary_rpc_method_handler(
+                    servicer.submit_bulk,
+                    request_deserializer=job__service__pb2.SubmitJobsBulkRequest.FromString,
+                    response_serializer=job__service__pb2.SubmitJobsBulkResponse.SerializeToString,
+            ),
             "get_by_id": grpc.unary_unary_rpc_method_handler(
                     servicer.get_by_id,
                     request_deserializer=job__service__pb2.GetJobByIdRequest.FromString,
@@ -137,6 +154,23 @@ class JobService:
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def submit_bulk(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, "/JobService/submit_bulk",
+            job__service__pb2.SubmitJobsBulkRequest.SerializeToString,
+            job__service__pb2.SubmitJobsBulkResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def get_by_id(request,
             target,
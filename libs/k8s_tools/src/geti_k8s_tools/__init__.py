@@ -7,5 +7,12 @@ from .calculate_cluster_resources import (
     k8s_cpu_to_millicpus,
     k8s_memory_to_kibibytes,
 )
+from .cluster_resource_tracker import ClusterResourceTracker, NodeResources
 
-__all__ = ["calculate_available_resources_per_node", "k8s_cpu_to_millicpus", "k8s_memory_to_kibibytes"]
+__all__ = [
+    "ClusterResourceTracker",
+    "NodeResources",
+    "calculate_available_resources_per_node",
+    "k8s_cpu_to_millicpus",
+    "k8s_memory_to_kibibytes",
+]
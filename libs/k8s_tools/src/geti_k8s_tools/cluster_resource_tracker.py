@@ -0,0 +1,291 @@
+"""In-memory model of the cluster resources, kept up to date by watching the nodes and the pods"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from kubernetes_asyncio import watch
+from kubernetes_asyncio.client.exceptions import ApiException
+
+from .calculate_cluster_resources import (
+    ClusterCapacity,
+    ClusterResources,
+    k8s_cpu_to_millicpus,
+    k8s_memory_to_kibibytes,
+)
+
+logger = logging.getLogger(__name__)
+
+# Server-side timeout of each watch request; the watch is restarted from the last seen resource version
+WATCH_TIMEOUT_SECONDS = int(os.environ.get("K8S_WATCH_TIMEOUT_SECONDS", "300"))
+# Delay before watching again after an unexpected error
+WATCH_RETRY_DELAY_SECONDS = float(os.environ.get("K8S_WATCH_RETRY_DELAY_SECONDS", "5"))
+
+HTTP_GONE = 410
+
+
+@dataclass(frozen=True)
+class NodeResources:
+    """
+    Resources of a node
+
+    :param name: name of the node
+    :param allocatable: allocatable resources of the node, as reported by k8s
+    :param cpu_capacity: allocatable CPU, in millicpus
+    :param memory_capacity: allocatable memory, in kibibytes
+    :param cpu_available: CPU not requested by the running pods, in millicpus
+    :param memory_available: memory not reserved by the limits of the running pods, in kibibytes
+    """
+
+    name: str
+    allocatable: dict[str, str]
+    cpu_capacity: int
+    memory_capacity: int
+    cpu_available: int
+    memory_available: int
+
+
+@dataclass(frozen=True)
+class _PodUsage:
+    """Resources reserved by a running pod on its node, computed like calculate_available_resources_per_node"""
+
+    node_name: str
+    cpu: int  # sum of the CPU requests, in millicpus
+    memory: int  # sum of the memory limits, in kibibytes
+
+    @classmethod
+    def from_pod(cls, pod: Any) -> "_PodUsage | None":
+        if pod.status is None or pod.status.phase != "Running" or not pod.spec.node_name:
+            return None
+        cpu = sum(
+            k8s_cpu_to_millicpus(container.resources.requests.get("cpu", "0m"))
+            for container in pod.spec.containers
+            if container.resources.requests
+        )
+        memory = sum(
+            k8s_memory_to_kibibytes(container.resources.limits.get("memory", "0Ki"))
+            for container in pod.spec.containers
+            if container.resources.limits
+        )
+        return cls(node_name=pod.spec.node_name, cpu=cpu, memory=memory)
+
+
+class ClusterResourceTracker:
+    """
+    In-memory model of the allocatable resources of the nodes and of the resources reserved by the pods.
+
+    The model is built with one list of the nodes and of the pods, then updated incrementally from the
+    events of a watch on each of them; the usage is aggregated per node on every event, so that the capacity
+    queries take O(nodes) instead of listing and filtering all the pods of the cluster. When a watch expires
+    (HTTP 410 Gone), the corresponding resources are listed again to resync the model. On any other error, the
+    model is marked as not synced and the resources are listed again after WATCH_RETRY_DELAY_SECONDS.
+
+    The watches run in an asyncio event loop (see :meth:`run`), while the queries may come from any thread.
+
+    :param core_api: kubernetes_asyncio CoreV1Api client
+    :param watch_factory: factory of the watch objects streaming the events, replaceable in tests
+    :param watch_timeout_seconds: server-side timeout of each watch request
+    """
+
+    def __init__(
+        self,
+        core_api: Any,
+        watch_factory: Callable[[], Any] = watch.Watch,
+        watch_timeout_seconds: int = WATCH_TIMEOUT_SECONDS,
+    ) -> None:
+        self.core_api = core_api
+        self.watch_factory = watch_factory
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self._lock = threading.Lock()
+        self._nodes: dict[str, tuple[dict[str, str], int, int]] = {}  # name -> (allocatable, cpu, memory)
+        self._pods: dict[str, _PodUsage] = {}  # uid -> usage, only for the running pods
+        self._node_usage: dict[str, list[int]] = {}  # name -> [cpu, memory]
+        self._nodes_synced = asyncio.Event()
+        self._pods_synced = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the nodes and the pods have been listed and their watches have not failed since"""
+        return self._nodes_synced.is_set() and self._pods_synced.is_set()
+
+    async def wait_until_synced(self) -> None:
+        """Wait until the nodes and the pods have been listed and their watches are running"""
+        await self._nodes_synced.wait()
+        await self._pods_synced.wait()
+
+    async def run(self) -> None:
+        """Watch the nodes and the pods until :meth:`stop` is called"""
+        self._stop_event.clear()
+        await asyncio.gather(
+            self._watch(
+                list_fn=self.core_api.list_node,
+                resync_fn=self.resync_nodes,
+                apply_fn=self.apply_node_event,
+                synced=self._nodes_synced,
+            ),
+            self._watch(
+                list_fn=self.core_api.list_pod_for_all_namespaces,
+                resync_fn=self.resync_pods,
+                apply_fn=self.apply_pod_event,
+                synced=self._pods_synced,
+            ),
+        )
+
+    def stop(self) -> None:
+        """Stop watching, once the current watch requests terminate"""
+        self._stop_event.set()
+
+    async def _watch(
+        self,
+        list_fn: Callable,
+        resync_fn: Callable[[Iterable[Any]], None],
+        apply_fn: Callable[[str, Any], None],
+        synced: asyncio.Event,
+    ) -> None:
+        """List the resources, then apply the events of a watch starting from the resource version of the list"""
+        resource_version: str | None = None
+        while not self._stop_event.is_set():
+            try:
+                if resource_version is None:
+                    resource_list = await list_fn()
+                    resync_fn(resource_list.items)
+                    resource_version = resource_list.metadata.resource_version
+                    synced.set()
+                resource_version = await self._apply_events(
+                    list_fn=list_fn, apply_fn=apply_fn, resource_version=resource_version
+                )
+            except Exception as exc:
+                if isinstance(exc, ApiException) and exc.status == HTTP_GONE:
+                    logger.info("Watch of '%s' expired, listing the resources again", list_fn.__name__)
+                else:
+                    await self._wait_before_retry(list_fn=list_fn, synced=synced)
+                resource_version = None
+
+    async def _wait_before_retry(self, list_fn: Callable, synced: asyncio.Event) -> None:
+        """Mark the resources as not synced after an unexpected error, then wait before listing them again"""
+        synced.clear()
+        logger.exception(
+            "Failed to watch '%s', listing the resources again in %s seconds",
+            list_fn.__name__,
+            WATCH_RETRY_DELAY_SECONDS,
+        )
+        await asyncio.sleep(WATCH_RETRY_DELAY_SECONDS)
+
+    async def _apply_events(
+        self, list_fn: Callable, apply_fn: Callable[[str, Any], None], resource_version: str
+    ) -> str:
+        """
+        Apply the events of one watch request.
+
+        :return: resource version to watch from
+        :raises ApiException: if the watch reports an error, with status 410 if it expired
+        """
+        resource_watch = self.watch_factory()
+        try:
+            async for event in resource_watch.stream(
+                list_fn, resource_version=resource_version, timeout_seconds=self.watch_timeout_seconds
+            ):
+                if event["type"] == "ERROR":
+                    raw_object = event.get("raw_object") or {}
+                    raise ApiException(status=raw_object.get("code"), reason=raw_object.get("reason"))
+                apply_fn(event["type"], event["object"])
+                resource_version = event["object"].metadata.resource_version
+                if self._stop_event.is_set():
+                    break
+        finally:
+            resource_watch.stop()
+        return resource_version
+
+    def resync_nodes(self, nodes: Iterable[Any]) -> None:
+        """Replace the nodes of the model with the listed ones"""
+        with self._lock:
+            self._nodes.clear()
+            for node in nodes:
+                self._set_node(node)
+
+    def resync_pods(self, pods: Iterable[Any]) -> None:
+        """Replace the pods of the model with the listed ones, recomputing the usage of the nodes"""
+        with self._lock:
+            self._pods.clear()
+            self._node_usage.clear()
+            for pod in pods:
+                self._set_pod(pod.metadata.uid, _PodUsage.from_pod(pod))
+
+    def apply_node_event(self, event_type: str, node: Any) -> None:
+        """Update the model with an event of the watch on the nodes"""
+        with self._lock:
+            if event_type == "DELETED":
+                self._nodes.pop(node.metadata.name, None)
+            else:
+                self._set_node(node)
+
+    def apply_pod_event(self, event_type: str, pod: Any) -> None:
+        """Update the model with an event of the watch on the pods"""
+        with self._lock:
+            usage = None if event_type == "DELETED" else _PodUsage.from_pod(pod)
+            self._set_pod(pod.metadata.uid, usage)
+
+    def _set_node(self, node: Any) -> None:
+        allocatable = dict(node.status.allocatable)
+        self._nodes[node.metadata.name] = (
+            allocatable,
+            k8s_cpu_to_millicpus(allocatable["cpu"]),
+            k8s_memory_to_kibibytes(allocatable["memory"]),
+        )
+
+    def _set_pod(self, uid: str, usage: _PodUsage | None) -> None:
+        """Replace the usage of a pod, updating the aggregated usage of the nodes"""
+        previous_usage = self._pods.pop(uid, None)
+        if previous_usage is not None:
+            node_usage = self._node_usage[previous_usage.node_name]
+            node_usage[0] -= previous_usage.cpu
+            node_usage[1] -= previous_usage.memory
+        if usage is not None:
+            self._pods[uid] = usage
+            node_usage = self._node_usage.setdefault(usage.node_name, [0, 0])
+            node_usage[0] += usage.cpu
+            node_usage[1] += usage.memory
+
+    def get_node_resources(self) -> list[NodeResources]:
+        """Get the capacity and the available resources of every node"""
+        with self._lock:
+            result = []
+            for name, (allocatable, cpu_capacity, memory_capacity) in self._nodes.items():
+                cpu_usage, memory_usage = self._node_usage.get(name, (0, 0))
+                result.append(
+                    NodeResources(
+                        name=name,
+                        allocatable=allocatable,
+                        cpu_capacity=cpu_capacity,
+                        memory_capacity=memory_capacity,
+                        cpu_available=cpu_capacity - cpu_usage,
+                        memory_available=memory_capacity - memory_usage,
+                    )
+                )
+            return result
+
+    def get_cluster_resources(self, accelerator_type: str, accelerator_name: str) -> ClusterResources:
+        """Get the resources per node, in the format of calculate_available_resources_per_node"""
+        nodes = self.get_node_resources()
+        return ClusterResources(
+            [node.cpu_available for node in nodes],
+            [node.memory_available for node in nodes],
+            [node.cpu_capacity for node in nodes],
+            [node.memory_capacity for node in nodes],
+            accelerator_type,
+            accelerator_name,
+        )
+
+    def get_cluster_capacity(self, gpu_label: str) -> ClusterCapacity:
+        """Get the capacity per node, in the format of get_resource_capacity_per_node"""
+        nodes = self.get_node_resources()
+        return ClusterCapacity(
+            cpu_capacity=[node.cpu_capacity for node in nodes],
+            memory_capacity=[node.memory_capacity for node in nodes],
+            gpu_capacity=[int(node.allocatable.get(gpu_label, 0)) for node in nodes],
+        )
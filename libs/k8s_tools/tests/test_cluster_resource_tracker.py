@@ -0,0 +1,226 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from kubernetes_asyncio.client.exceptions import ApiException
+
+from geti_k8s_tools import ClusterResourceTracker, cluster_resource_tracker
+
+
+def make_node(name: str, cpu: str = "8", memory: str = "16Gi", resource_version: str = "1", **extra) -> SimpleNamespace:
+    """Make a V1Node-like object with the given allocatable resources"""
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, resource_version=resource_version),
+        status=SimpleNamespace(allocatable={"cpu": cpu, "memory": memory, **extra}),
+    )
+
+
+def make_pod(
+    uid: str,
+    node_name: str | None = "node-1",
+    phase: str = "Running",
+    cpu: str = "500m",
+    memory: str = "1Gi",
+    resource_version: str = "1",
+) -> SimpleNamespace:
+    """Make a V1Pod-like object with one container requesting the given CPU and limited to the given memory"""
+    container = SimpleNamespace(resources=SimpleNamespace(requests={"cpu": cpu}, limits={"memory": memory}))
+    return SimpleNamespace(
+        metadata=SimpleNamespace(uid=uid, resource_version=resource_version),
+        spec=SimpleNamespace(node_name=node_name, containers=[container]),
+        status=SimpleNamespace(phase=phase),
+    )
+
+
+class FakeCoreApi:
+    """
+    CoreV1Api listing the given nodes and pods; each list returns the next listing of the resource.
+    Whether the tracker was synced is recorded at each list.
+    """
+
+    def __init__(self, node_lists: list[list], pod_lists: list[list]) -> None:
+        self.node_lists = node_lists
+        self.pod_lists = pod_lists
+        self.list_calls = {"list_node": 0, "list_pod_for_all_namespaces": 0}
+        self.tracker: ClusterResourceTracker | None = None
+        self.synced_at_list: list[bool] = []
+
+    async def _list(self, name: str, lists: list[list]) -> SimpleNamespace:
+        self.synced_at_list.append(self.tracker.is_synced)
+        items = lists[min(self.list_calls[name], len(lists) - 1)]
+        self.list_calls[name] += 1
+        return SimpleNamespace(items=items, metadata=SimpleNamespace(resource_version=f"list-{self.list_calls[name]}"))
+
+    async def list_node(self) -> SimpleNamespace:
+        return await self._list("list_node", self.node_lists)
+
+    async def list_pod_for_all_namespaces(self) -> SimpleNamespace:
+        return await self._list("list_pod_for_all_namespaces", self.pod_lists)
+
+
+class FakeEventStream:
+    """
+    Scripted watch events, per listing function: each watch request consumes the next batch of events.
+    A batch may be an exception to raise instead of streaming. When the batches of all the resources are
+    exhausted, the tracker is stopped so that the test terminates.
+    """
+
+    def __init__(self, events: dict[str, list]) -> None:
+        self.events = events
+        self.tracker: ClusterResourceTracker | None = None
+        self.watch_calls: dict[str, list[dict]] = {name: [] for name in events}
+        self.consumed = asyncio.Event()
+
+    def __call__(self) -> "FakeEventStream":
+        return self
+
+    async def stream(self, func: Callable, **kwargs) -> AsyncIterator[dict]:
+        name = func.__name__
+        self.watch_calls[name].append(kwargs)
+        batches = self.events[name]
+        if not batches:
+            # Idle watch, until the events of the other resources are consumed too
+            if not any(self.events.values()):
+                self.consumed.set()
+            await self.consumed.wait()
+            self.tracker.stop()
+            return
+        batch = batches.pop(0)
+        if isinstance(batch, Exception):
+            raise batch
+        for event in batch:
+            yield event
+            await asyncio.sleep(0)
+
+    def stop(self) -> None:
+        pass
+
+
+def run_tracker(core_api: FakeCoreApi, events: dict[str, list]) -> tuple[ClusterResourceTracker, FakeEventStream]:
+    """Run the tracker until the scripted events are consumed"""
+    event_stream = FakeEventStream(events)
+    tracker = ClusterResourceTracker(core_api=core_api, watch_factory=event_stream)
+    event_stream.tracker = tracker
+    core_api.tracker = tracker
+    asyncio.run(asyncio.wait_for(tracker.run(), timeout=5))
+    return tracker, event_stream
+
+
+class TestClusterResourceTracker:
+    def test_events_update_available_resources(self) -> None:
+        core_api = FakeCoreApi(
+            node_lists=[[make_node("node-1"), make_node("node-2", cpu="4", memory="8Gi")]],
+            pod_lists=[[make_pod("pod-1"), make_pod("pod-2", phase="Pending")]],
+        )
+        events = {
+            "list_node": [
+                [
+                    {"type": "ADDED", "object": make_node("node-3", cpu="2", resource_version="5")},
+                    {"type": "DELETED", "object": make_node("node-2", resource_version="6")},
+                ]
+            ],
+            "list_pod_for_all_namespaces": [
+                [
+                    {"type": "MODIFIED", "object": make_pod("pod-2", cpu="1", resource_version="2")},
+                    {"type": "ADDED", "object": make_pod("pod-3", node_name="node-3", resource_version="3")},
+                    {"type": "MODIFIED", "object": make_pod("pod-1", phase="Succeeded", resource_version="4")},
+                    {"type": "ADDED", "object": make_pod("pod-4", node_name=None, resource_version="5")},
+                ],
+                [{"type": "DELETED", "object": make_pod("pod-3", node_name="node-3", resource_version="7")}],
+            ],
+        }
+
+        tracker, event_stream = run_tracker(core_api, events)
+
+        nodes = {node.name: node for node in tracker.get_node_resources()}
+        assert set(nodes) == {"node-1", "node-3"}
+        assert (nodes["node-1"].cpu_available, nodes["node-1"].memory_available) == (7000, 15 * 1024**2)
+        assert (nodes["node-3"].cpu_available, nodes["node-3"].memory_available) == (2000, 16 * 1024**2)
+        assert core_api.list_calls == {"list_node": 1, "list_pod_for_all_namespaces": 1}
+        pod_watches = event_stream.watch_calls["list_pod_for_all_namespaces"]
+        assert [call["resource_version"] for call in pod_watches] == ["list-1", "5", "7"]
+
+    @pytest.mark.parametrize(
+        "expired_batch",
+        [
+            ApiException(status=410, reason="Gone"),
+            [{"type": "ERROR", "object": None, "raw_object": {"code": 410, "reason": "Expired"}}],
+        ],
+        ids=["api_exception", "error_event"],
+    )
+    def test_resync_on_watch_expiry(self, expired_batch: ApiException | list[dict]) -> None:
+        core_api = FakeCoreApi(
+            node_lists=[[make_node("node-1")]],
+            pod_lists=[[make_pod("pod-1"), make_pod("pod-2")], [make_pod("pod-2", cpu="2")]],
+        )
+        events = {
+            "list_node": [],
+            "list_pod_for_all_namespaces": [
+                [{"type": "ADDED", "object": make_pod("pod-3", resource_version="2")}],
+                expired_batch,
+            ],
+        }
+
+        tracker, event_stream = run_tracker(core_api, events)
+
+        (node,) = tracker.get_node_resources()
+        assert (node.cpu_available, node.memory_available) == (6000, 15 * 1024**2)
+        assert core_api.list_calls["list_pod_for_all_namespaces"] == 2
+        pod_watches = event_stream.watch_calls["list_pod_for_all_namespaces"]
+        assert [call["resource_version"] for call in pod_watches] == ["list-1", "2", "list-2"]
+
+    @pytest.mark.parametrize(
+        "failed_batch",
+        [
+            ApiException(status=500, reason="Internal Server Error"),
+            [{"type": "ERROR", "object": None, "raw_object": {"code": 500, "reason": "InternalError"}}],
+            aiohttp.ClientConnectionError("Connection reset"),
+            asyncio.TimeoutError(),
+        ],
+        ids=["api_exception", "error_event", "client_error", "timeout"],
+    )
+    def test_resync_after_watch_error(
+        self, failed_batch: Exception | list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(cluster_resource_tracker, "WATCH_RETRY_DELAY_SECONDS", 0)
+        core_api = FakeCoreApi(
+            node_lists=[[make_node("node-1")]],
+            pod_lists=[[make_pod("pod-1")], [make_pod("pod-1"), make_pod("pod-2", cpu="2")]],
+        )
+        events = {
+            "list_node": [],
+            "list_pod_for_all_namespaces": [
+                [{"type": "ADDED", "object": make_pod("pod-3", resource_version="2")}],
+                failed_batch,
+            ],
+        }
+
+        tracker, event_stream = run_tracker(core_api, events)
+
+        (node,) = tracker.get_node_resources()
+        assert (node.cpu_available, node.memory_available) == (5500, 14 * 1024**2)
+        assert tracker.is_synced
+        assert core_api.list_calls["list_pod_for_all_namespaces"] == 2
+        # The tracker is not synced at the initial lists, nor at the list of the pods after the error
+        assert core_api.synced_at_list == [False, False, False]
+        pod_watches = event_stream.watch_calls["list_pod_for_all_namespaces"]
+        assert [call["resource_version"] for call in pod_watches] == ["list-1", "2", "list-2"]
+
+    def test_cluster_capacity_and_resources(self) -> None:
+        tracker = ClusterResourceTracker(core_api=None)
+        tracker.resync_nodes([make_node("node-1", **{"gpu.intel.com/i915": "2"}), make_node("node-2", cpu="4")])
+        tracker.resync_pods([make_pod("pod-1", node_name="node-2", cpu="1500m", memory="512Mi")])
+
+        capacity = tracker.get_cluster_capacity(gpu_label="gpu.intel.com/i915")
+        resources = tracker.get_cluster_resources(accelerator_type="gpu", accelerator_name="intel")
+
+        assert capacity.cpu_capacity == [8000, 4000]
+        assert capacity.gpu_capacity == [2, 0]
+        assert resources.cpu_available == [8000, 2500]
+        assert resources.memory_available == [16 * 1024**2, 16 * 1024**2 - 512 * 1024]
+        assert (resources.accelerator_type, resources.accelerator_name) == ("gpu", "intel")
@@ -1,9 +1,17 @@
-from .event_consuming import BaseKafkaHandler, CallbackT, KafkaEventConsumer, KafkaRawMessage, TopicSubscription
+from .event_consuming import (
+    BaseKafkaHandler,
+    BatchCallbackT,
+    CallbackT,
+    KafkaEventConsumer,
+    KafkaRawMessage,
+    TopicSubscription,
+)
 from .event_production import EventProducer, json_string_serializer, publish_event
 from .exceptions import TopicAlreadySubscribedException, TopicNotSubscribedException
 
 __all__ = [
     "BaseKafkaHandler",
+    "BatchCallbackT",
     "CallbackT",
     "EventProducer",
     "KafkaEventConsumer",
@@ -5,6 +5,7 @@ import signal
 import threading
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable, Sequence
+from itertools import groupby
 from json import loads
 from types import FrameType
 from typing import Any, NamedTuple
@@ -41,6 +42,7 @@ class KafkaRawMessage(NamedTuple):
 CallbackT = Callable[[KafkaRawMessage], None]
 # same as CallbackT but with self argument
 CallbackMethodT = Callable[[Any, KafkaRawMessage], None]
+BatchCallbackT = Callable[[list[KafkaRawMessage]], None]
 
 Deserializer = Callable[[str | bytes | None], Any | None]
 
@@ -49,6 +51,7 @@ class TopicSubscription(NamedTuple):
     topic: str
     callback: CallbackT
     deserializer: Deserializer | None = None
+    batch_callback: BatchCallbackT | None = None
 
 
 def json_deserializer(value: str | bytes | None) -> dict | None:
@@ -64,7 +67,7 @@ def json_deserializer(value: str | bytes | None) -> dict | None:
 
 
 class KafkaEventConsumer:
-    def __init__(self, group_id: str, deserializer: Deserializer = json_deserializer) -> None:
+    def __init__(self, group_id: str, deserializer: Deserializer = json_deserializer, batch_size: int = 1) -> None:
         """
         KafkaEventConsumer is responsible to receive Kafka events on the subscribed
         topics and consume them, calling the appropriate callbacks.
@@ -73,12 +76,16 @@ class KafkaEventConsumer:
         the lines of "{microservice_name}_consumer".
         :param deserializer: function to deserialize Kafka event value, applies by default to all
         subscribed topics if no deserializer defined, by default json_string_deserializer
+        :param batch_size: maximum number of events polled at once. If greater than 1, the consecutive events of
+        a topic subscribed with a batch callback are passed together to that callback.
         """
         self.group_id = group_id
+        self.batch_size = batch_size
         self._deserializer = deserializer
 
         self._topic_to_callback: dict[str, CallbackT] = {}
         self._topic_to_deserializer: dict[str, Deserializer] = {}
+        self._topic_to_batch_callback: dict[str, BatchCallbackT] = {}
         self._should_stop = False
 
         logger.info(f"Creating Kafka consumer ({group_id}).")
@@ -149,6 +156,7 @@ class KafkaEventConsumer:
         """
         _topic_to_callback = {}
         _topic_to_deserializer = {}
+        _topic_to_batch_callback = {}
         for topics_subscription in topics_subscriptions:
             prefixed_topic = f"{self._topic_prefix}{topics_subscription.topic}"
             if prefixed_topic in self._topic_to_callback:
@@ -157,9 +165,12 @@ class KafkaEventConsumer:
             _topic_to_callback[prefixed_topic] = topics_subscription.callback
             if topics_subscription.deserializer is not None:
                 _topic_to_deserializer[prefixed_topic] = topics_subscription.deserializer
+            if topics_subscription.batch_callback is not None:
+                _topic_to_batch_callback[prefixed_topic] = topics_subscription.batch_callback
 
         self._topic_to_callback = self._topic_to_callback | _topic_to_callback
         self._topic_to_deserializer = self._topic_to_deserializer | _topic_to_deserializer
+        self._topic_to_batch_callback = self._topic_to_batch_callback | _topic_to_batch_callback
 
         topics_names = list(self._topic_to_callback.keys())
         logger.info(
@@ -195,6 +206,7 @@ class KafkaEventConsumer:
 
         self._topic_to_callback.pop(prefixed_topic, None)
         self._topic_to_deserializer.pop(prefixed_topic, None)
+        self._topic_to_batch_callback.pop(prefixed_topic, None)
 
         self._consumer.unsubscribe()
         self._consumer.subscribe(topics=list(self._topic_to_callback.keys()), on_assign=on_assign)
@@ -202,13 +214,18 @@ class KafkaEventConsumer:
     def _consume(self) -> None:
         """
         Runs a message polling loop. Each iteration of the loop
-        :func:`~geti_kafka_tools.event_consuming.KafkaEventConsumer._poll_and_consume_message` is being invoked.
+        :func:`~geti_kafka_tools.event_consuming.KafkaEventConsumer._poll_and_consume_message` is being invoked,
+        or :func:`~geti_kafka_tools.event_consuming.KafkaEventConsumer._poll_and_consume_message_batch` if the
+        consumer polls the events in batches.
         Loop stops if _should_stop flag is triggered.
         """
         while True:
             if self._should_stop:
                 break
-            self._poll_and_consume_message()
+            if self.batch_size > 1:
+                self._poll_and_consume_message_batch()
+            else:
+                self._poll_and_consume_message()
 
     def _poll_and_consume_message(self) -> None:
         """
@@ -233,6 +250,55 @@ class KafkaEventConsumer:
         except Exception:
             logger.exception("Failed to consume an event (group_id `%s`)", self.group_id)
 
+    def _poll_and_consume_message_batch(self) -> None:
+        """
+        Polls up to 'batch_size' messages from the consumer. The consecutive messages of a topic subscribed with
+        a batch callback are consumed together by
+        :func:`~geti_kafka_tools.event_consuming.KafkaEventConsumer._consume_message_batch`, the other ones are
+        consumed one by one. If a batch callback fails, the messages of that batch are consumed again one by one,
+        so that only the messages that cannot be processed are dropped, like in
+        :func:`~geti_kafka_tools.event_consuming.KafkaEventConsumer._poll_and_consume_message`.
+        The offsets are committed to the broker once the whole batch has been processed.
+        """
+        try:
+            messages: list[Message] = []
+            for message in self._consumer.consume(num_messages=self.batch_size, timeout=1.0):
+                if message.error():
+                    logger.warning(f"Error occurred polling for a message {message.error()}")
+                    continue
+                messages.append(message)
+            if not messages:
+                return
+
+            for topic, topic_messages_iter in groupby(messages, key=lambda message: message.topic()):
+                topic_messages = list(topic_messages_iter)
+                if topic in self._topic_to_batch_callback:
+                    try:
+                        self._consume_message_batch(topic_messages)
+                        continue
+                    except Exception:
+                        logger.exception(
+                            "Failed to consume a batch of events (group_id `%s`, topic `%s`), "
+                            "consuming the events one by one",
+                            self.group_id,
+                            topic,
+                        )
+                for message in topic_messages:
+                    try:
+                        self._consume_message(message)
+                    except Exception:
+                        logger.exception(
+                            "Failed to consume an event (group_id `%s`, topic `%s`, partition `%s`, offset `%s`)",
+                            self.group_id,
+                            topic,
+                            message.partition(),
+                            message.offset(),
+                        )
+            self._consumer.commit()
+
+        except Exception:
+            logger.exception("Failed to consume a batch of events (group_id `%s`)", self.group_id)
+
     def _deserialize_message_value(self, topic: str, value: str | bytes | None) -> Any | None:
         """
         Deserializes event value.
@@ -252,29 +318,11 @@ class KafkaEventConsumer:
         """
         topic = message.topic()
 
-        deserialized_value = self._deserialize_message_value(topic=topic, value=message.value())
-        logger.info(
-            "Kafka event received (group_id: `%s`, topic: `%s`, partition: `%s`, offset: `%s`, value `%s`)",
-            self.group_id,
-            topic,
-            message.partition(),
-            message.offset(),
-            str(deserialized_value)[:1000],
-        )
+        raw_message = self._build_raw_message(message)
 
         # Execute the callback
         callback: CallbackT | None = self._topic_to_callback.get(topic)
         if callback is not None:
-            raw_message = KafkaRawMessage(
-                topic=message.topic(),
-                partition=message.partition(),
-                offset=message.offset(),
-                timestamp_type=message.timestamp()[0],
-                timestamp=message.timestamp()[1],
-                key=message.key(),
-                value=deserialized_value,
-                headers=message.headers(),
-            )
             callback(raw_message)
         else:
             raise RuntimeError(f"Callback not found for topic {topic}")
@@ -287,6 +335,58 @@ class KafkaEventConsumer:
             message.offset(),
         )
 
+    def _consume_message_batch(self, messages: list[Message]) -> None:
+        """
+        Processes a batch of Kafka events of the same topic. Deserializes the event values, builds the
+        KafkaRawMessage instances and invokes the batch callback registered for the topic.
+        :param messages: Kafka events, all from the same topic
+        :raises: RuntimeError if the batch callback cannot be found for the topic
+        """
+        topic = messages[0].topic()
+
+        raw_messages = [self._build_raw_message(message) for message in messages]
+
+        # Execute the batch callback
+        batch_callback: BatchCallbackT | None = self._topic_to_batch_callback.get(topic)
+        if batch_callback is not None:
+            batch_callback(raw_messages)
+        else:
+            raise RuntimeError(f"Batch callback not found for topic {topic}")
+
+        logger.info(
+            "Kafka event batch processed (group_id: `%s`, topic: `%s`, events: `%s`)",
+            self.group_id,
+            topic,
+            len(messages),
+        )
+
+    def _build_raw_message(self, message: Message) -> KafkaRawMessage:
+        """
+        Deserializes the event value and builds the KafkaRawMessage instance passed to the callbacks.
+        :param message: Kafka event
+        :return: KafkaRawMessage of the event
+        """
+        topic = message.topic()
+        deserialized_value = self._deserialize_message_value(topic=topic, value=message.value())
+        logger.info(
+            "Kafka event received (group_id: `%s`, topic: `%s`, partition: `%s`, offset: `%s`, value `%s`)",
+            self.group_id,
+            topic,
+            message.partition(),
+            message.offset(),
+            str(deserialized_value)[:1000],
+        )
+        return KafkaRawMessage(
+            topic=topic,
+            partition=message.partition(),
+            offset=message.offset(),
+            timestamp_type=message.timestamp()[0],
+            timestamp=message.timestamp()[1],
+            key=message.key(),
+            value=deserialized_value,
+            headers=message.headers(),
+        )
+
     def stop(self) -> None:
         """
         Stop the event consumer.
@@ -309,11 +409,12 @@ class BaseKafkaHandler(metaclass=ABCMeta):
     Base class to handle incoming Kafka events for microservices.
 
     :param group_id: The group id of the Kafka consumer
+    :param batch_size: Maximum number of events polled at once, see KafkaEventConsumer
     """
 
-    def __init__(self, group_id: str) -> None:
+    def __init__(self, group_id: str, batch_size: int = 1) -> None:
         self.group_id = group_id
-        self.event_consumer = KafkaEventConsumer(group_id=group_id)
+        self.event_consumer = KafkaEventConsumer(group_id=group_id, batch_size=batch_size)
         self.subscribed = False
         self.__setup_events()
 
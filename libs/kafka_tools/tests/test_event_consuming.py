@@ -1,7 +1,7 @@
 import datetime
 import os
 from json import JSONDecodeError
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import confluent_kafka
 import pytest
@@ -449,3 +449,124 @@ class TestKafkaEventConsumer:
         assert kafka_event_consumer._should_stop
         kafka_event_consumer._consumer_thread.join.assert_called_once_with()
         kafka_event_consumer._consumer.close.assert_called_once_with()
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_consume_message_batch(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+
+        timestamp = int(datetime.datetime.now().timestamp())
+        messages = []
+        for offset in range(2):
+            message = MagicMock(spec=Message)
+            message.topic.return_value = "test_topic"
+            message.partition.return_value = 0
+            message.offset.return_value = offset
+            message.timestamp.return_value = (0, timestamp)
+            message.key.return_value = b"event_key"
+            message.headers.return_value = [("foo_header", b"bar_header")]
+            messages.append(message)
+
+        callback = MagicMock()
+        batch_callback = MagicMock()
+        kafka_event_consumer._topic_to_callback = {"test_topic": callback}
+        kafka_event_consumer._topic_to_batch_callback = {"test_topic": batch_callback}
+
+        # Act
+        with patch.object(kafka_event_consumer, "_deserialize_message_value", return_value={"foo": "bar"}):
+            kafka_event_consumer._consume_message_batch(messages)
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        callback.assert_not_called()
+        batch_callback.assert_called_once_with(
+            [
+                KafkaRawMessage(
+                    topic="test_topic",
+                    partition=0,
+                    offset=offset,
+                    timestamp=timestamp,
+                    timestamp_type=0,
+                    key=b"event_key",
+                    value={"foo": "bar"},
+                    headers=[("foo_header", b"bar_header")],
+                )
+                for offset in range(2)
+            ]
+        )
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_poll_and_consume_message_batch(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=10)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        kafka_event_consumer._topic_to_batch_callback = {"batch_topic": MagicMock()}
+
+        messages = []
+        for topic, is_error in (
+            ("batch_topic", False),
+            ("batch_topic", False),
+            ("batch_topic", True),
+            ("other_topic", False),
+            ("batch_topic", False),
+        ):
+            message = MagicMock(spec=Message)
+            message.topic.return_value = topic
+            message.error.return_value = is_error
+            messages.append(message)
+        kafka_event_consumer._consumer.consume.return_value = messages
+
+        # Act
+        with (
+            patch.object(kafka_event_consumer, "_consume_message") as mock_consume_message,
+            patch.object(kafka_event_consumer, "_consume_message_batch") as mock_consume_message_batch,
+        ):
+            kafka_event_consumer._poll_and_consume_message_batch()
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        kafka_event_consumer._consumer.consume.assert_called_once_with(num_messages=10, timeout=1.0)
+        mock_consume_message.assert_called_once_with(messages[3])
+        mock_consume_message_batch.assert_has_calls([call([messages[0], messages[1]]), call([messages[4]])])
+        kafka_event_consumer._consumer.commit.assert_called_once_with()
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_poll_and_consume_message_batch_failures(
+        self, mock_start_consume_thread, fxt_consumer
+    ) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=10)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        kafka_event_consumer._topic_to_batch_callback = {"batch_topic": MagicMock()}
+
+        messages = []
+        for topic in ("batch_topic", "batch_topic", "other_topic", "other_topic"):
+            message = MagicMock(spec=Message)
+            message.topic.return_value = topic
+            message.error.return_value = False
+            messages.append(message)
+        kafka_event_consumer._consumer.consume.return_value = messages
+
+        def consume_message(message) -> None:
+            if message in (messages[0], messages[2]):
+                raise ValueError("Invalid event")
+
+        # Act
+        with (
+            patch.object(kafka_event_consumer, "_consume_message", side_effect=consume_message) as mock_consume_message,
+            patch.object(
+                kafka_event_consumer, "_consume_message_batch", side_effect=ValueError("Invalid event")
+            ) as mock_consume_message_batch,
+        ):
+            kafka_event_consumer._poll_and_consume_message_batch()
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        mock_consume_message_batch.assert_called_once_with([messages[0], messages[1]])
+        mock_consume_message.assert_has_calls([call(message) for message in messages])
+        assert mock_consume_message.call_count == len(messages)
+        kafka_event_consumer._consumer.commit.assert_called_once_with()